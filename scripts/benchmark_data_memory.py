@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Measure memory held by the fully loaded SRD dataset.
+
+Usage:
+    python scripts/benchmark_data_memory.py [--top N]
+
+Imports every SRD data module under tracemalloc and reports the memory
+still allocated afterwards:
+
+- in total, which includes the modules' code objects and classes,
+- allocated by the data modules themselves while building their records
+  (record instances, their containers and derived strings),
+- per allocating file,
+- as the deep size of every object reachable from the module globals,
+  with a census of the record types.
+
+Run it in a fresh interpreter; modules imported before tracing starts are
+not counted.
+"""
+
+import argparse
+import gc
+import importlib
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import is_dataclass
+from pathlib import Path
+
+DATA_MODULES = [
+    "dnd_manager.data.spells",
+    "dnd_manager.data.items",
+    "dnd_manager.data.monsters",
+    "dnd_manager.data.magic_items",
+    "dnd_manager.data.feats",
+    "dnd_manager.data.species",
+    "dnd_manager.data.subclasses",
+    "dnd_manager.data.classes",
+    "dnd_manager.data.backgrounds",
+]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=10, help="Files to list in the breakdown")
+    args = parser.parse_args()
+
+    # Import the package and its non-data dependencies before tracing
+    import dnd_manager.data.catalog  # noqa: F401
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    modules = [importlib.import_module(name) for name in DATA_MODULES]
+    elapsed = (time.perf_counter() - start) * 1000
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Python {sys.version.split()[0]}")
+    print(f"Loaded {len(modules)} data modules in {elapsed:.1f} ms")
+    print(f"Retained: {current / 1024:,.0f} KiB   Peak: {peak / 1024:,.0f} KiB")
+
+    stats = snapshot.statistics("filename")
+    data_files = {module.__file__ for module in modules}
+    records_module = sys.modules.get("dnd_manager.data.records")
+    if records_module is not None:
+        data_files.add(records_module.__file__)
+    built = sum(stat.size for stat in stats if stat.traceback[0].filename in data_files)
+    print(f"Allocated by data modules: {built / 1024:,.0f} KiB")
+    print()
+
+    print(f"{'KiB':>10}  allocated in")
+    for stat in stats[:args.top]:
+        print(f"{stat.size / 1024:>10,.0f}  {Path(stat.traceback[0].filename).name}")
+    print()
+
+    # Census of record instances reachable from the data modules
+    seen: set[int] = set()
+    deep_size = 0
+    census: Counter[str] = Counter()
+    slotted: dict[str, bool] = {}
+    stack = [value for module in modules for value in vars(module).values()]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, (type, type(sys), type(main))):
+            continue
+        deep_size += sys.getsizeof(obj)
+        if isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif isinstance(obj, dict):
+            stack.extend(obj)
+            stack.extend(obj.values())
+        elif is_dataclass(obj) and not isinstance(obj, type):
+            name = type(obj).__name__
+            census[name] += 1
+            slotted[name] = not hasattr(obj, "__dict__")
+            if hasattr(obj, "__dict__"):
+                stack.append(obj.__dict__)
+            else:
+                stack.extend(getattr(obj, f) for f in obj.__dataclass_fields__)
+
+    print(f"Reachable from module globals: {deep_size / 1024:,.0f} KiB")
+    print()
+    print(f"{'records':>10}  {'slots':>5}  type")
+    for name, count in census.most_common():
+        print(f"{count:>10,}  {'yes' if slotted[name] else 'no':>5}  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
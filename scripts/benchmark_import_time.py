@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Track module import cost of each ccvault CLI command.
+
+Usage:
+    python scripts/benchmark_import_time.py [--repeat N] [--top K] [--json]
+                                            [--command NAME ...]
+
+Runs each command in a fresh interpreter under ``python -X importtime`` and
+reports the total import time (sum of the cumulative times of top-level
+imports), the number of modules imported, wall-clock run time, and whether
+the heavy dependencies (Textual, numpy, the SRD spell list, ...) were
+loaded. Commands run against an empty temporary home directory so they do
+not read or modify real characters, notes, or settings.
+
+The best of ``--repeat`` runs is reported to reduce noise from the OS
+file cache. ``--json`` prints machine-readable results for tracking over
+time.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Command label -> CLI arguments. Only commands that finish without network
+# access or user input.
+COMMANDS: dict[str, list[str]] = {
+    "help": ["--help"],
+    "roll": ["roll", "1d20"],
+    "list": ["list"],
+    "show": ["show", "Nobody"],
+    "config": ["config", "path"],
+    "custom": ["custom", "path"],
+    "guidelines": ["guidelines", "list"],
+    "notes": ["notes", "stats"],
+    "library": ["library", "stats"],
+}
+
+# Modules worth calling out when a command imports them
+HEAVY_MODULES = [
+    "textual",
+    "numpy",
+    "pydantic",
+    "yaml",
+    "dnd_manager.app",
+    "dnd_manager.data.spells",
+    "dnd_manager.data.monsters",
+    "dnd_manager.storage.notes",
+    "dnd_manager.ai",
+]
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+def parse_importtime(stderr: str) -> tuple[float, dict[str, float], int]:
+    """Parse ``-X importtime`` output.
+
+    Returns:
+        (total ms, {top-level module: cumulative ms}, modules imported)
+    """
+    top_level: dict[str, float] = {}
+    count = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "| imported package" in line:
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            cumulative_us = int(cumulative)
+        except ValueError:
+            continue
+        count += 1
+        # Nested imports are indented under their importer
+        if not name.startswith("  ") and name.strip():
+            top_level[name.strip()] = top_level.get(name.strip(), 0.0) + cumulative_us / 1000
+    return sum(top_level.values()), top_level, count
+
+
+def run_command(args: list[str], home: Path) -> dict:
+    """Run one CLI command under ``-X importtime`` and summarize it."""
+    env = dict(os.environ)
+    env.update({
+        "HOME": str(home),
+        "XDG_CONFIG_HOME": str(home / ".config"),
+        "XDG_DATA_HOME": str(home / ".local" / "share"),
+        "XDG_CACHE_HOME": str(home / ".cache"),
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")])),
+    })
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "dnd_manager.main", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        stdin=subprocess.DEVNULL,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    total_ms, top_level, count = parse_importtime(proc.stderr)
+    loaded = {
+        line.rsplit("|", 1)[-1].strip()
+        for line in proc.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    return {
+        "exit_code": proc.returncode,
+        "import_ms": round(total_ms, 1),
+        "wall_ms": round(wall_ms, 1),
+        "modules": count,
+        "heavy": [m for m in HEAVY_MODULES if m in loaded],
+        "top": sorted(top_level.items(), key=lambda item: -item[1]),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", "-n", type=int, default=3)
+    parser.add_argument("--top", type=int, default=0, help="Show the K slowest top-level imports")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--command", "-c", action="append", choices=sorted(COMMANDS))
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="ccvault-importtime-") as tmp:
+        for label in args.command or COMMANDS:
+            runs = [run_command(COMMANDS[label], Path(tmp)) for _ in range(max(1, args.repeat))]
+            best = min(runs, key=lambda r: r["import_ms"])
+            best["wall_ms"] = min(r["wall_ms"] for r in runs)
+            results[label] = best
+
+    if args.json:
+        for result in results.values():
+            result["top"] = result["top"][:args.top]
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"Best of {args.repeat} runs per command")
+    print()
+    print(f"{'command':<12} {'imports ms':>11} {'wall ms':>9} {'modules':>8}  heavy")
+    for label, result in results.items():
+        status = "" if result["exit_code"] == 0 else f"  (exit {result['exit_code']})"
+        print(
+            f"{label:<12} {result['import_ms']:>11.1f} {result['wall_ms']:>9.1f} "
+            f"{result['modules']:>8}  {', '.join(result['heavy']) or '-'}{status}"
+        )
+        for name, ms in result["top"][:args.top]:
+            print(f"{'':<14}{ms:>8.1f} ms  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Compare the local query classifier with the remote (Flash-Lite) one.
+
+Usage:
+    python scripts/benchmark_query_classifier.py [--queries FILE] [--split S] [--min-confidence C]
+    python scripts/benchmark_query_classifier.py --sweep
+    GEMINI_API_KEY=your-key python scripts/benchmark_query_classifier.py --record
+
+The query set is a JSONL file of {"query": ..., "label": ..., "split": ...}
+records (default: tests/fixtures/classifier_queries.jsonl). The classifier
+weights were tuned by hand on the "tune" split; the "holdout" split was
+labelled afterwards and never used for tuning, so its accuracy is the one to
+quote. ``--split`` restricts the run to one split. ``--record`` asks the
+remote classifier about every query once and stores its answer and latency
+in the file as "remote" and "remote_ms"; later runs are offline and compare
+against those recordings.
+
+Reports accuracy against the labels and per-query latency for the local
+classifier, the recorded remote one, and the hybrid mode the router uses
+by default (local, remote below --min-confidence). ``--sweep`` instead
+lists, per split and confidence threshold, how many queries hybrid mode
+would send to the remote classifier and how many local misses it would
+keep; it needs no recordings, so the threshold can be tuned offline.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from dnd_manager.ai.classifier import classify_complexity
+
+DEFAULT_QUERIES = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "classifier_queries.jsonl"
+
+
+def load(path: Path) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+async def record(path: Path, records: list[dict]) -> None:
+    """Classify every query remotely and store the answers and latencies."""
+    from dnd_manager.ai.router import GeminiRouter
+
+    router = GeminiRouter(classifier="remote")
+    if not router.is_configured():
+        raise SystemExit("Gemini API key not configured (GEMINI_API_KEY or dnd config set ai.gemini.api_key)")
+    for i, rec in enumerate(records, 1):
+        start = time.perf_counter()
+        rec["remote"] = (await router.classify_query_remote(rec["query"])).value
+        rec["remote_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        print(f"\r{i}/{len(records)}", end="", file=sys.stderr)
+    print(file=sys.stderr)
+    with open(path, "w", encoding="utf-8") as f:
+        for rec in records:
+            f.write(json.dumps(rec) + "\n")
+
+
+def row(name: str, correct: int, total: int, latencies: list[float]) -> str:
+    p95 = sorted(latencies)[max(0, int(len(latencies) * 0.95) - 1)]
+    return (f"{name:<8} {correct / total:>9.1%} {statistics.mean(latencies):>12.3f} "
+            f"{p95:>12.3f} {total:>6}")
+
+
+def sweep(records: list[dict]) -> None:
+    """Print remote calls and kept local misses per split and threshold."""
+    results = [classify_complexity(rec["query"]) for rec in records]
+    splits = sorted({rec.get("split", "") for rec in records})
+    print(f"{'':>9} " + " ".join(f"{split or 'all':>14}" for split in splits))
+    print(f"{'threshold':>9} " + " ".join(f"{'remote  miss':>14}" for _ in splits))
+    for threshold in (0.4, 0.45, 0.5, 0.55, 0.6, 0.65, 0.7, 0.8):
+        cells = []
+        for split in splits:
+            pairs = [(rec, r) for rec, r in zip(records, results) if rec.get("split", "") == split]
+            calls = sum(r.confidence < threshold for _, r in pairs)
+            kept = sum(r.confidence >= threshold and r.complexity.value != rec["label"]
+                       for rec, r in pairs)
+            cells.append(f"{calls:>3}/{len(pairs):<3} {kept:>4}")
+        print(f"{threshold:>9.2f} " + " ".join(f"{cell:>14}" for cell in cells))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=Path, default=DEFAULT_QUERIES)
+    parser.add_argument("--min-confidence", type=float, default=0.5)
+    parser.add_argument("--split", help="Only use records of this split (e.g. holdout)")
+    parser.add_argument("--record", action="store_true", help="Record remote answers first (needs an API key)")
+    parser.add_argument("--sweep", action="store_true", help="Tabulate hybrid thresholds per split")
+    args = parser.parse_args()
+
+    records = load(args.queries)
+    if args.record:
+        asyncio.run(record(args.queries, records))
+    if args.split:
+        records = [rec for rec in records if rec.get("split") == args.split]
+        if not records:
+            raise SystemExit(f"No records in split {args.split!r}")
+    if args.sweep:
+        sweep(records)
+        return 0
+
+    local = []
+    for rec in records:
+        start = time.perf_counter()
+        result = classify_complexity(rec["query"])
+        local.append((result, (time.perf_counter() - start) * 1000))
+
+    print(f"{len(records)} queries from {args.queries}" + (f" (split {args.split})" if args.split else ""))
+    print()
+    print(f"{'method':<8} {'accuracy':>9} {'mean ms':>12} {'p95 ms':>12} {'n':>6}")
+    print(row("local", sum(r.complexity.value == rec["label"] for rec, (r, _) in zip(records, local)),
+              len(records), [ms for _, ms in local]))
+    splits = sorted({rec.get("split", "") for rec in records} - {""})
+    if len(splits) > 1:
+        for split in splits:
+            pairs = [(rec, item) for rec, item in zip(records, local) if rec.get("split") == split]
+            print(row(f" {split}", sum(r.complexity.value == rec["label"] for rec, (r, _) in pairs),
+                      len(pairs), [ms for _, (_, ms) in pairs]))
+
+    recorded = [rec for rec in records if "remote" in rec]
+    if recorded:
+        print(row("remote", sum(rec["remote"] == rec["label"] for rec in recorded),
+                  len(recorded), [rec["remote_ms"] for rec in recorded]))
+    if len(recorded) == len(records):
+        correct, latencies, fallbacks = 0, [], 0
+        for rec, (result, ms) in zip(records, local):
+            if result.confidence >= args.min_confidence:
+                correct += result.complexity.value == rec["label"]
+                latencies.append(ms)
+            else:
+                fallbacks += 1
+                correct += rec["remote"] == rec["label"]
+                latencies.append(ms + rec["remote_ms"])
+        print(row("hybrid", correct, len(records), latencies))
+        agree = sum(r.complexity.value == rec["remote"] for rec, (r, _) in zip(records, local))
+        print()
+        print(f"hybrid remote calls: {fallbacks}/{len(records)} "
+              f"(confidence < {args.min_confidence})")
+        print(f"local/remote agreement: {agree / len(records):.1%}")
+    else:
+        unsure = sum(r.confidence < args.min_confidence for r, _ in local)
+        print()
+        print(f"no remote answers recorded for {len(records) - len(recorded)} queries; run with --record")
+        print(f"hybrid would call the remote classifier for {unsure}/{len(records)} queries "
+              f"(confidence < {args.min_confidence})")
+
+    misses = [(rec, r) for rec, (r, _) in zip(records, local) if r.complexity.value != rec["label"]]
+    if misses:
+        print()
+        print("local misses:")
+        for rec, r in misses:
+            print(f"  {rec['label']:>8} -> {r.complexity.value:<8} ({r.confidence:.2f}) "
+                  f"[{rec.get('split', '')}] {rec['query']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Benchmark character YAML load/save with pure-Python vs libyaml codecs.
+
+Usage:
+    python scripts/benchmark_yaml_io.py [--iterations N]
+
+Measures the per-character cost of the two halves of character I/O:
+- save: model_dump + YAML serialization
+- load: YAML parsing + Pydantic validation
+
+once with PyYAML's pure-Python SafeLoader/SafeDumper (the old path) and once
+with the CSafeLoader/CSafeDumper used by dnd_manager.storage.serialization.
+"""
+
+import argparse
+import sys
+import time
+
+import yaml
+
+from dnd_manager.models.character import Character, Note, RulesetId
+from dnd_manager.storage.serialization import HAS_LIBYAML, dump_yaml, load_yaml
+
+
+def build_sample_character() -> Character:
+    """Build a reasonably populated character for benchmarking."""
+    char = Character.create_new(
+        name="Benchmark Hero",
+        ruleset_id=RulesetId.DND_2024,
+        class_name="Wizard",
+    )
+    char.primary_class.level = 10
+    char.backstory = "Lorem ipsum dolor sit amet. " * 40
+    char.spellcasting.cantrips = ["Fire Bolt", "Mage Hand", "Prestidigitation", "Light"]
+    char.spellcasting.prepared = [f"Spell {i}" for i in range(20)]
+    char.notes = [Note(title=f"Session {i}", content="Things happened. " * 10) for i in range(10)]
+    return char
+
+
+def time_per_call(func, iterations: int) -> float:
+    """Return mean milliseconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def bench(char: Character, loader: type, dumper: type, iterations: int) -> tuple[float, float]:
+    """Benchmark save and load for one loader/dumper pair."""
+    dump_kwargs = dict(default_flow_style=False, allow_unicode=True, sort_keys=False, width=100)
+    text = dump_yaml(char.model_dump(mode="json"), dumper=dumper, **dump_kwargs)
+
+    def save():
+        dump_yaml(char.model_dump(mode="json"), dumper=dumper, **dump_kwargs)
+
+    def load():
+        Character.model_validate(load_yaml(text, loader=loader))
+
+    return time_per_call(save, iterations), time_per_call(load, iterations)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", "-n", type=int, default=200)
+    args = parser.parse_args()
+
+    char = build_sample_character()
+    size = len(dump_yaml(char.model_dump(mode="json"), sort_keys=False))
+    print(f"Character YAML size: {size} bytes, {args.iterations} iterations")
+    print()
+
+    rows = [("pure-Python", yaml.SafeLoader, yaml.SafeDumper)]
+    if HAS_LIBYAML:
+        rows.append(("libyaml", yaml.CSafeLoader, yaml.CSafeDumper))
+    else:
+        print("PyYAML was built without libyaml; only the fallback path is measured.")
+
+    print(f"{'codec':<12} {'save ms/char':>14} {'load ms/char':>14}")
+    results = {}
+    for label, loader, dumper in rows:
+        save_ms, load_ms = bench(char, loader, dumper, args.iterations)
+        results[label] = (save_ms, load_ms)
+        print(f"{label:<12} {save_ms:>14.3f} {load_ms:>14.3f}")
+
+    if "libyaml" in results:
+        base_save, base_load = results["pure-Python"]
+        fast_save, fast_load = results["libyaml"]
+        print()
+        print(f"speedup: save {base_save / fast_save:.1f}x, load {base_load / fast_load:.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,13 @@
 """AI integration for D&D character assistance."""
 
-from dnd_manager.ai.base import AIProvider, AIResponse, AIMessage, MessageRole
+from dnd_manager.ai.base import AIProvider, AIResponse, AIMessage, MessageRole, TokenUsage
 from dnd_manager.ai.context import CharacterContext, build_system_prompt
+from dnd_manager.ai.history import CompactionReport, HistoryManager
 from dnd_manager.ai.providers import get_provider, list_providers
 from dnd_manager.ai.semantic import (
     SemanticLayer,
     QueryResult,
+    NameLookup,
     get_semantic_layer,
     query_game_data,
 )
@@ -15,13 +17,17 @@ __all__ = [
     "AIResponse",
     "AIMessage",
     "MessageRole",
+    "TokenUsage",
     "CharacterContext",
     "build_system_prompt",
+    "HistoryManager",
+    "CompactionReport",
     "get_provider",
     "list_providers",
     # Semantic layer
     "SemanticLayer",
     "QueryResult",
+    "NameLookup",
     "get_semantic_layer",
     "query_game_data",
 ]
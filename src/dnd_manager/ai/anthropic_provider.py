@@ -1,18 +1,75 @@
-"""Anthropic Claude AI provider."""
+"""Anthropic Claude AI provider.
+
+Requests use prompt caching: cache breakpoints are placed on the tool
+list, the system prompt and the end of the conversation. Within a tool
+loop each call then re-reads the previous call's prefix from cache (system
+prompt, tool schemas and history) instead of processing it again. Prompts
+below the model's minimum cacheable length are simply not cached.
+"""
 
 import os
-from typing import AsyncIterator, Optional
+from typing import Any, AsyncIterator, Optional
 
 from dnd_manager.ai.base import (
     AIMessage,
     AIProvider,
     AIResponse,
     MessageRole,
+    StreamEvent,
+    StreamEventType,
     ToolChoice,
     ToolUseBlock,
     ToolResultBlock,
 )
 
+# Marks the end of a cacheable prompt prefix (5 minute lifetime)
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _with_cache_control(block: Any) -> dict:
+    """Copy of a content block (or plain text) carrying a cache breakpoint."""
+    if isinstance(block, str):
+        block = {"type": "text", "text": block}
+    return {**block, "cache_control": CACHE_CONTROL}
+
+
+def add_cache_breakpoints(kwargs: dict) -> dict:
+    """Add prompt cache breakpoints to Messages API request arguments.
+
+    Marks the last tool, the system prompt and the last block of the last
+    message (three of the four breakpoints the API allows). The prefix up to
+    each breakpoint is cached, so the next request in a conversation reads
+    everything but the newest messages from cache. The caller's tool and
+    message dicts are not modified.
+    """
+    if kwargs.get("tools"):
+        tools = list(kwargs["tools"])
+        tools[-1] = _with_cache_control(tools[-1])
+        kwargs["tools"] = tools
+    if kwargs.get("system"):
+        kwargs["system"] = [_with_cache_control(kwargs["system"])]
+    messages = kwargs.get("messages")
+    if messages:
+        last = messages[-1]
+        content = last["content"]
+        if isinstance(content, str):
+            content = [content]
+        if content:
+            content = [*content[:-1], _with_cache_control(content[-1])]
+            kwargs["messages"] = [*messages[:-1], {**last, "content": content}]
+    return kwargs
+
+
+def _cache_usage(usage: Any) -> tuple[int, Optional[int], Optional[int]]:
+    """(total prompt tokens, cache reads, cache writes) from response usage.
+
+    Anthropic's input_tokens excludes cached tokens; they are added back so
+    input_tokens means the whole prompt for every provider.
+    """
+    read = getattr(usage, "cache_read_input_tokens", None)
+    written = getattr(usage, "cache_creation_input_tokens", None)
+    return usage.input_tokens + (read or 0) + (written or 0), read, written
+
 
 class AnthropicProvider(AIProvider):
     """Anthropic Claude AI provider."""
@@ -24,11 +81,13 @@ class AnthropicProvider(AIProvider):
         "claude-3-5-haiku-20241022",  # Fast and cheap
     ]
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, prompt_caching: Optional[bool] = None):
         """Initialize the Anthropic provider.
 
         Args:
             api_key: API key (uses config/env if not provided)
+            prompt_caching: Whether to set cache breakpoints (uses config if
+                not provided)
         """
         # Get API key from config or environment
         if api_key is None:
@@ -36,7 +95,10 @@ class AnthropicProvider(AIProvider):
             manager = get_config_manager()
             api_key = manager.get_api_key("anthropic")
 
+        prompt_caching = self._prompt_caching_enabled(prompt_caching)
+
         self._api_key = api_key
+        self._prompt_caching = prompt_caching
         self._client = None
 
     def _get_client(self):
@@ -105,15 +167,20 @@ class AnthropicProvider(AIProvider):
         }
         if system_prompt:
             kwargs["system"] = system_prompt
+        if self._prompt_caching:
+            add_cache_breakpoints(kwargs)
 
         response = await client.messages.create(**kwargs)
+        input_tokens, cache_read, cache_write = _cache_usage(response.usage)
 
         return AIResponse(
             content=response.content[0].text,
             model=model_name,
             provider=self.name,
-            input_tokens=response.usage.input_tokens,
+            input_tokens=input_tokens,
             output_tokens=response.usage.output_tokens,
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write,
             finish_reason=response.stop_reason,
         )
 
@@ -138,6 +205,8 @@ class AnthropicProvider(AIProvider):
         }
         if system_prompt:
             kwargs["system"] = system_prompt
+        if self._prompt_caching:
+            add_cache_breakpoints(kwargs)
 
         async with client.messages.stream(**kwargs) as stream:
             async for text in stream.text_stream:
@@ -170,6 +239,52 @@ class AnthropicProvider(AIProvider):
             AIResponse which may include tool_use requests
         """
         client = self._get_client()
+        kwargs = self._tool_request(messages, tools, model, max_tokens, temperature, tool_choice)
+        response = await client.messages.create(**kwargs)
+        return self._tool_response(response, kwargs["model"])
+
+    async def chat_with_tools_stream(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict],
+        model: Optional[str] = None,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        tool_choice: ToolChoice = ToolChoice.AUTO,
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream a chat request with tools to Claude.
+
+        The SDK accumulates each tool_use block's input_json deltas; the
+        block is yielded when its content_block_stop arrives.
+        """
+        client = self._get_client()
+        kwargs = self._tool_request(messages, tools, model, max_tokens, temperature, tool_choice)
+
+        async with client.messages.stream(**kwargs) as stream:
+            async for event in stream:
+                if event.type == "text":
+                    yield StreamEvent(StreamEventType.TEXT, text=event.text)
+                elif event.type == "content_block_stop" and event.content_block.type == "tool_use":
+                    block = event.content_block
+                    yield StreamEvent(StreamEventType.TOOL_USE, tool_use=ToolUseBlock(
+                        id=block.id,
+                        name=block.name,
+                        input=block.input,
+                    ))
+            message = await stream.get_final_message()
+
+        yield StreamEvent(StreamEventType.DONE, response=self._tool_response(message, kwargs["model"]))
+
+    def _tool_request(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict],
+        model: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        tool_choice: ToolChoice,
+    ) -> dict:
+        """Messages API arguments for a request with tools."""
         model_name = model or self.default_model
 
         system_prompt, converted_messages = self._convert_messages_with_tools(messages)
@@ -191,8 +306,13 @@ class AnthropicProvider(AIProvider):
             # Don't pass tools if NONE is specified
             del kwargs["tools"]
         # AUTO is the default, no need to specify
+        if self._prompt_caching:
+            add_cache_breakpoints(kwargs)
+        return kwargs
 
-        response = await client.messages.create(**kwargs)
+    def _tool_response(self, response: Any, model_name: str) -> AIResponse:
+        """Convert a Messages API response that may contain tool use."""
+        input_tokens, cache_read, cache_write = _cache_usage(response.usage)
 
         # Parse response for tool use blocks
         tool_use_blocks = []
@@ -212,8 +332,10 @@ class AnthropicProvider(AIProvider):
             content=text_content,
             model=model_name,
             provider=self.name,
-            input_tokens=response.usage.input_tokens,
+            input_tokens=input_tokens,
             output_tokens=response.usage.output_tokens,
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write,
             finish_reason=response.stop_reason,
             tool_use=tool_use_blocks,
         )
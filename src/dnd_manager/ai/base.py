@@ -156,12 +156,18 @@ class AIMessage:
 
 @dataclass
 class AIResponse:
-    """Response from an AI provider."""
+    """Response from an AI provider.
+
+    ``input_tokens`` counts the whole prompt, including any part served
+    from or written to the provider's prompt cache.
+    """
     content: str
     model: str
     provider: str
     input_tokens: Optional[int] = None
     output_tokens: Optional[int] = None
+    cache_read_tokens: Optional[int] = None  # Prompt tokens served from cache
+    cache_write_tokens: Optional[int] = None  # Prompt tokens written to cache
     finish_reason: Optional[str] = None  # "end_turn", "tool_use", "max_tokens"
     timestamp: datetime = field(default_factory=datetime.now)
     tool_use: list[ToolUseBlock] = field(default_factory=list)  # Tool calls from AI
@@ -179,6 +185,60 @@ class AIResponse:
         return len(self.tool_use) > 0
 
 
+class StreamEventType(str, Enum):
+    """Kinds of events in a streamed tool-use turn."""
+    TEXT = "text"  # A chunk of response text
+    TOOL_USE = "tool_use"  # A tool_use block whose input is complete
+    TOOL_RESULT = "tool_result"  # Result of an executed tool (ToolSession only)
+    DONE = "done"  # End of the model turn, with the complete response
+
+
+@dataclass
+class StreamEvent:
+    """One event from a streamed tool-use turn."""
+    type: StreamEventType
+    text: str = ""  # TEXT: the new chunk
+    tool_use: Optional[ToolUseBlock] = None  # TOOL_USE and TOOL_RESULT
+    result: Any = None  # TOOL_RESULT: the ToolExecutionResult
+    response: Optional[AIResponse] = None  # DONE: text, tool_use blocks and usage
+
+
+@dataclass
+class TokenUsage:
+    """Token counts accumulated over several responses."""
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    def add(self, response: AIResponse) -> None:
+        """Add a response's token counts (missing counts are skipped)."""
+        self.requests += 1
+        self.input_tokens += response.input_tokens or 0
+        self.output_tokens += response.output_tokens or 0
+        self.cache_read_tokens += response.cache_read_tokens or 0
+        self.cache_write_tokens += response.cache_write_tokens or 0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of prompt tokens served from cache."""
+        if not self.input_tokens:
+            return 0.0
+        return self.cache_read_tokens / self.input_tokens
+
+    def to_dict(self) -> dict[str, Any]:
+        """Counts for display or logging."""
+        return {
+            "requests": self.requests,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+            "cache_hit_rate": round(self.cache_hit_rate, 3),
+        }
+
+
 class AIProvider(ABC):
     """Abstract base class for AI providers."""
 
@@ -205,6 +265,14 @@ class AIProvider(ABC):
         """Check if provider is properly configured (API key, etc.)."""
         pass
 
+    @staticmethod
+    def _prompt_caching_enabled(prompt_caching: Optional[bool] = None) -> bool:
+        """Resolve a provider's prompt_caching argument (None reads ai.prompt_caching)."""
+        if prompt_caching is None:
+            from dnd_manager.config import get_config_manager
+            prompt_caching = get_config_manager().get("ai.prompt_caching")
+        return True if prompt_caching is None else bool(prompt_caching)
+
     @abstractmethod
     async def chat(
         self,
@@ -283,6 +351,36 @@ class AIProvider(ABC):
         # Default: fall back to regular chat without tools
         return await self.chat(messages, model, max_tokens, temperature)
 
+    async def chat_with_tools_stream(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict],
+        model: Optional[str] = None,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        tool_choice: ToolChoice = ToolChoice.AUTO,
+    ) -> AsyncIterator[StreamEvent]:
+        """Streaming version of chat_with_tools.
+
+        Yields TEXT events as text arrives and a TOOL_USE event as soon as
+        each tool_use block's input is complete, so callers can start
+        running a tool while the model is still generating. The last event
+        is DONE, carrying the same AIResponse chat_with_tools would return.
+
+        Note:
+            Default implementation runs chat_with_tools and replays the
+            complete response as events. Providers that can stream tool
+            calls should override this method.
+        """
+        response = await self.chat_with_tools(
+            messages, tools, model, max_tokens, temperature, tool_choice
+        )
+        if response.content:
+            yield StreamEvent(StreamEventType.TEXT, text=response.content)
+        for block in response.tool_use:
+            yield StreamEvent(StreamEventType.TOOL_USE, tool_use=block)
+        yield StreamEvent(StreamEventType.DONE, response=response)
+
     async def simple_chat(
         self,
         prompt: str,
@@ -0,0 +1,128 @@
+"""Local query complexity classifier for model routing.
+
+``GeminiRouter`` used to ask Flash-Lite to label every query as simple,
+moderate or complex before answering it, which added a full network round
+trip to each request. ``classify_complexity`` decides locally in a few
+microseconds with a small linear model: each class has a bias, and each
+feature that fires (a keyword pattern, the query length, the number of
+questions) adds its weights to the class scores. A softmax over the scores
+gives the confidence, so callers can fall back to the remote classifier
+when the local one is unsure.
+
+The weights are hand-set from the guidelines in the router's
+classification prompt and tuned on the "tune" split of
+``tests/fixtures/classifier_queries.jsonl``; the "holdout" split was never
+used for tuning. ``scripts/benchmark_query_classifier.py`` reports accuracy
+per split and compares against recorded answers of the remote classifier.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from enum import Enum
+
+
+class QueryComplexity(str, Enum):
+    """Query complexity levels."""
+    SIMPLE = "simple"      # Basic questions, lookups
+    MODERATE = "moderate"  # Rules clarifications, character advice
+    COMPLEX = "complex"    # Multi-step reasoning, strategy, creativity
+
+
+_SIMPLE = QueryComplexity.SIMPLE
+_MODERATE = QueryComplexity.MODERATE
+_COMPLEX = QueryComplexity.COMPLEX
+
+# Class scores before any feature fires; ties go to moderate
+BIAS = {_SIMPLE: 0.0, _MODERATE: 0.2, _COMPLEX: -0.4}
+
+# (pattern, weights) - the weights of every matching pattern are added
+KEYWORD_FEATURES: list[tuple[re.Pattern, dict[QueryComplexity, float]]] = [
+    (re.compile(pattern, re.IGNORECASE), weights)
+    for pattern, weights in [
+        # Lookups, stats and actions on the character
+        (r"\b(what'?s|what is|what are) (my|the|a|an)\b", {_SIMPLE: 1.2}),
+        (r"\bhow (much|many|far|long)\b", {_SIMPLE: 1.4}),
+        (r"\b(roll|rolls?|add|remove|set|use|cast|equip|heal|take|deal|spend|long rest|short rest)\b",
+         {_SIMPLE: 0.6}),
+        (r"\b(ac|armor class|hp|hit points|initiative|speed|proficiency bonus|spell slots?|"
+         r"saving throw|modifier|gold|level|range|damage|duration|cost|weight)\b", {_SIMPLE: 0.6}),
+        (r"\b(look ?up|show|list|tell me about|describe|stats? for|stat block)\b", {_SIMPLE: 0.8}),
+        (r"\bwhat does .{1,40} do\b", {_SIMPLE: 0.8}),
+        (r"^\s*(roll|add|remove|set|cast|equip|heal|show|list)\b", {_SIMPLE: 1.0}),
+        (r"\b\d*d(4|6|8|10|12|20|100)\b", {_SIMPLE: 0.8}),
+        # Rules questions and advice
+        (r"\bhow (does|do|did|would|can|should)\b", {_MODERATE: 1.2}),
+        (r"\b(should i|should my|is it worth|worth it|better|best|recommend|suggest|advice|tips?)\b",
+         {_MODERATE: 1.8}),
+        (r"\b(can i|can my|can you|am i allowed|is it legal|does .{1,30} (stack|work|apply|count))\b",
+         {_MODERATE: 1.0}),
+        (r"\b(rules?|ruling|interact|interaction|stack|stacking|concentration|opportunity attack|"
+         r"advantage|disadvantage|multiclass(ing)?|feat|asi|subclass)\b", {_MODERATE: 0.8}),
+        (r"\b(why|explain|clarify)\b", {_MODERATE: 0.8}),
+        (r"\b(difference|differ|compare|comparison|versus|vs)\b", {_MODERATE: 1.2}),
+        (r"\b(tactic|tactics|tactical|in this situation|what should|which (spell|feat|weapon|option))\b",
+         {_MODERATE: 1.0}),
+        # Planning, design and creative work
+        (r"\b(plan|design|create|build|write|generate|come up with|brainstorm|flesh out|outline)\b",
+         {_COMPLEX: 1.4, _SIMPLE: -0.4}),
+        (r"\b(encounter|campaign|adventure|dungeon|session|story|backstory|plot|npc|villain|"
+         r"world|setting|quest)\b", {_COMPLEX: 0.8}),
+        (r"\b(roleplay|role-play|in character|react|feel|personality|motivation|betray\w*|"
+         r"relationship|moral|dilemma)\b", {_COMPLEX: 2.0}),
+        (r"\b(strategy|strategies|optimi[sz]e|optimal|progression|step by step|long-term|synerg\w*)\b",
+         {_COMPLEX: 1.4}),
+        (r"\blevels? \d+\s*(-|to|through|–)\s*\d+\b", {_COMPLEX: 1.6}),
+        (r"\b(party|whole party|entire party|each (player|character))\b", {_COMPLEX: 0.6}),
+        (r"\b(all|every) (my |the )?(spells|options|combinations|choices)\b", {_COMPLEX: 0.6}),
+    ]
+]
+
+# Word counts at which length starts to count towards a class
+SHORT_QUERY_WORDS = 7
+LONG_QUERY_WORDS = 25
+SHORT_WEIGHTS = {_SIMPLE: 0.8}
+LONG_WEIGHTS = {_COMPLEX: 1.2, _SIMPLE: -0.8}
+# Weights per question after the first, and per "and then"/"also" clause
+EXTRA_QUESTION_WEIGHTS = {_MODERATE: 0.3, _COMPLEX: 0.5}
+CLAUSE_PATTERN = re.compile(r"\b(and then|also|as well as|while also|and how)\b", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Classification:
+    """Result of classifying a query."""
+    complexity: QueryComplexity
+    confidence: float  # Softmax probability of ``complexity``, 1/3 to 1
+    scores: dict[QueryComplexity, float]
+
+
+def complexity_scores(query: str) -> dict[QueryComplexity, float]:
+    """Linear class scores for a query."""
+    scores = dict(BIAS)
+
+    def add(weights: dict[QueryComplexity, float], times: float = 1.0) -> None:
+        for level, weight in weights.items():
+            scores[level] += weight * times
+
+    for pattern, weights in KEYWORD_FEATURES:
+        if pattern.search(query):
+            add(weights)
+
+    words = len(query.split())
+    if words <= SHORT_QUERY_WORDS:
+        add(SHORT_WEIGHTS)
+    elif words >= LONG_QUERY_WORDS:
+        add(LONG_WEIGHTS, min(2.0, words / LONG_QUERY_WORDS))
+
+    extra = max(0, query.count("?") - 1) + len(CLAUSE_PATTERN.findall(query))
+    if extra:
+        add(EXTRA_QUESTION_WEIGHTS, min(extra, 3))
+    return scores
+
+
+def classify_complexity(query: str) -> Classification:
+    """Classify a query without calling a model."""
+    scores = complexity_scores(query)
+    best = max(scores, key=lambda level: (scores[level], level == _MODERATE))
+    total = sum(math.exp(score - scores[best]) for score in scores.values())
+    return Classification(best, 1.0 / total, scores)
@@ -616,14 +616,16 @@ LOOKUP TOOLS (use these BEFORE answering questions about game mechanics):
 - lookup_feat: Get feat prerequisites and benefits
 - lookup_magic_item: Get item properties and attunement requirements
 - lookup_monster: Get monster stats for encounters
+  (Lookups tolerate misspellings: check matched_name, or try one of the suggestions if not found)
 
 SEARCH TOOLS (find content matching criteria):
-- search_spells: Find spells by level, school, class, or name
+- search_spells: Find spells by level, school, class, name, or material cost
 - get_class_spells: Get all spells available to a class
 - search_feats: Find feats by category
 - search_magic_items: Find items by rarity or type
 - search_monsters: Find monsters by CR or type
 - get_encounter_monsters: Get suitable monsters for a party level
+- search_srd: Ranked text search across spells, monsters, feats, items and subclasses ("quoted phrases" supported)
 
 CHARACTER TOOLS (modify the character):
 - get_character_summary: Get full character state before making changes
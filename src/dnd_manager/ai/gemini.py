@@ -1,6 +1,18 @@
-"""Google Gemini AI provider using the new google-genai SDK."""
-
+"""Google Gemini AI provider using the new google-genai SDK.
+
+Tool requests use Gemini context caching: the system instruction and tool
+declarations are stored once as cached content and later requests refer to
+it by name, so the tool loop does not resend dozens of tool schemas on
+every call. Gemini 2.5 models additionally cache repeated prompt prefixes
+implicitly; both show up as cached tokens in the response usage.
+"""
+
+import hashlib
+import json
+import logging
 import os
+import time
+import uuid
 from typing import Any, AsyncIterator, Optional
 
 from dnd_manager.ai.base import (
@@ -8,11 +20,215 @@ from dnd_manager.ai.base import (
     AIProvider,
     AIResponse,
     MessageRole,
+    StreamEvent,
+    StreamEventType,
     ToolChoice,
     ToolUseBlock,
     ToolResultBlock,
 )
 
+logger = logging.getLogger(__name__)
+
+
+def usage_counts(response: Any) -> tuple[Optional[int], Optional[int], Optional[int]]:
+    """(prompt tokens, output tokens, cached prompt tokens) from a response."""
+    usage = getattr(response, "usage_metadata", None)
+    if not usage:
+        return None, None, None
+    return (
+        getattr(usage, "prompt_token_count", None),
+        getattr(usage, "candidates_token_count", None),
+        getattr(usage, "cached_content_token_count", None),
+    )
+
+
+class GeminiContextCache:
+    """Explicit context caches holding a system instruction and tools.
+
+    A cache is created per distinct (model, system instruction, tools, tool
+    mode) and reused until shortly before its TTL runs out. Prompts under
+    the model's minimum cacheable size are not cached, and a model whose
+    cache creation is rejected as unsupported (a 4xx for the model, tier or
+    prompt size) is not tried again; those requests are sent in full as
+    before. Other failures (network, 5xx, rate limits) only skip caching
+    for the request at hand.
+    """
+
+    TTL_SECONDS = 600
+    # Minimum cacheable prompt size in tokens, estimated at 4 chars/token
+    MIN_TOKENS = 1024
+    MIN_TOKENS_PRO = 4096
+    # Don't hand out a cache this close to expiring
+    EXPIRY_MARGIN = 30.0
+    # Client errors that don't mean caching is unsupported (timeout, rate limit)
+    TRANSIENT_CODES = frozenset({408, 429})
+
+    def __init__(self, ttl_seconds: int = TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[str, float]] = {}  # key -> (name, expires)
+        self._disabled_models: set[str] = set()
+
+    def _min_tokens(self, model: str) -> int:
+        return self.MIN_TOKENS_PRO if "-pro" in model else self.MIN_TOKENS
+
+    async def get(
+        self,
+        client: Any,
+        model: str,
+        system_instruction: Optional[str],
+        function_declarations: list[dict],
+        tool_config: Any = None,
+    ) -> tuple[Optional[str], int]:
+        """Get or create the cache for this request prefix.
+
+        Returns:
+            Tuple of (cached content name or None, tokens written to the
+            cache by this call)
+        """
+        from google.genai import errors, types
+
+        if model in self._disabled_models:
+            return None, 0
+        mode = None
+        if tool_config is not None:
+            mode = str(tool_config.function_calling_config.mode)
+        serialized = json.dumps(
+            [model, system_instruction, function_declarations, mode], sort_keys=True
+        )
+        if len(serialized) // 4 < self._min_tokens(model):
+            return None, 0
+        key = hashlib.sha256(serialized.encode()).hexdigest()
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] - self.EXPIRY_MARGIN > time.monotonic():
+            return entry[0], 0
+        try:
+            cache = await client.aio.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=system_instruction,
+                    tools=[types.Tool(function_declarations=function_declarations)]
+                    if function_declarations else None,
+                    tool_config=tool_config,
+                    ttl=f"{self.ttl_seconds}s",
+                ),
+            )
+        except Exception as e:
+            if isinstance(e, errors.ClientError) and e.code not in self.TRANSIENT_CODES:
+                # Unsupported model, tier or size: retrying won't help
+                logger.info("Context caching unavailable for %s: %s", model, e)
+                self._disabled_models.add(model)
+            else:
+                logger.debug("Context cache creation failed for %s, sending in full: %s", model, e)
+            return None, 0
+        self._entries[key] = (cache.name, time.monotonic() + self.ttl_seconds)
+        usage = getattr(cache, "usage_metadata", None)
+        return cache.name, getattr(usage, "total_token_count", None) or 0
+
+
+async def tool_request_config(
+    client: Any,
+    context_cache: Optional[GeminiContextCache],
+    model: str,
+    system_instruction: Optional[str],
+    function_declarations: list[dict],
+    tool_choice: ToolChoice,
+    max_tokens: int,
+    temperature: float,
+) -> tuple[Any, int]:
+    """Build the GenerateContentConfig for a request with tools.
+
+    Returns:
+        Tuple of (config, tokens written to a new context cache)
+    """
+    from google.genai import types
+
+    if tool_choice == ToolChoice.NONE or not function_declarations:
+        return types.GenerateContentConfig(
+            system_instruction=system_instruction,
+            max_output_tokens=max_tokens,
+            temperature=temperature,
+        ), 0
+
+    # Set tool config based on tool_choice
+    mode = "ANY" if tool_choice == ToolChoice.ANY else "AUTO"
+    tool_config = types.ToolConfig(
+        function_calling_config=types.FunctionCallingConfig(mode=mode)
+    )
+
+    cache_name, cache_write = None, 0
+    if context_cache is not None:
+        cache_name, cache_write = await context_cache.get(
+            client, model, system_instruction, function_declarations, tool_config
+        )
+    if cache_name:
+        # System instruction, tools and tool config live in the cache
+        return types.GenerateContentConfig(
+            cached_content=cache_name,
+            max_output_tokens=max_tokens,
+            temperature=temperature,
+        ), cache_write
+    return types.GenerateContentConfig(
+        system_instruction=system_instruction,
+        max_output_tokens=max_tokens,
+        temperature=temperature,
+        tools=[types.Tool(function_declarations=function_declarations)],
+        tool_config=tool_config,
+    ), 0
+
+
+def function_call_block(function_call: Any) -> ToolUseBlock:
+    """ToolUseBlock for a Gemini function call (which has no ID of its own)."""
+    # Full UUID for collision safety
+    return ToolUseBlock(
+        id=f"toolu_{uuid.uuid4().hex}",
+        name=function_call.name,
+        input=dict(function_call.args) if function_call.args else {},
+    )
+
+
+async def stream_tool_events(
+    stream: AsyncIterator[Any],
+    model: str,
+    provider: str,
+    cache_write: int = 0,
+) -> AsyncIterator[StreamEvent]:
+    """Convert a generate_content_stream into tool-use stream events.
+
+    Gemini sends each function call complete within a single chunk.
+    """
+    text_content = ""
+    tool_use_blocks: list[ToolUseBlock] = []
+    last = None
+    async for chunk in stream:
+        last = chunk
+        if not (chunk.candidates and chunk.candidates[0].content):
+            continue
+        for part in chunk.candidates[0].content.parts or []:
+            if getattr(part, "text", None):
+                text_content += part.text
+                yield StreamEvent(StreamEventType.TEXT, text=part.text)
+            elif getattr(part, "function_call", None):
+                block = function_call_block(part.function_call)
+                tool_use_blocks.append(block)
+                yield StreamEvent(StreamEventType.TOOL_USE, tool_use=block)
+
+    input_tokens, output_tokens, cache_read = usage_counts(last)
+    finish_reason = None
+    if last is not None and last.candidates and last.candidates[0].finish_reason:
+        finish_reason = last.candidates[0].finish_reason.name
+    yield StreamEvent(StreamEventType.DONE, response=AIResponse(
+        content=text_content,
+        model=model,
+        provider=provider,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cache_read_tokens=cache_read,
+        cache_write_tokens=cache_write or None,
+        finish_reason=finish_reason,
+        tool_use=tool_use_blocks,
+    ))
+
 
 class GeminiProvider(AIProvider):
     """Google Gemini AI provider.
@@ -29,11 +245,13 @@ class GeminiProvider(AIProvider):
         "gemini-3-pro-preview",   # Newest pro (paid only)
     ]
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, prompt_caching: Optional[bool] = None):
         """Initialize the Gemini provider.
 
         Args:
             api_key: API key (uses config/env if not provided)
+            prompt_caching: Whether to use context caching for tool requests
+                (uses config if not provided)
         """
         # Get API key from config or environment
         if api_key is None:
@@ -45,8 +263,11 @@ class GeminiProvider(AIProvider):
         if api_key is None:
             api_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
 
+        prompt_caching = self._prompt_caching_enabled(prompt_caching)
+
         self._api_key = api_key
         self._client = None
+        self._context_cache = GeminiContextCache() if prompt_caching else None
 
     def _get_client(self):
         """Lazy-load the Gemini client."""
@@ -157,12 +378,7 @@ class GeminiProvider(AIProvider):
             config=config,
         )
 
-        # Extract usage info if available
-        input_tokens = None
-        output_tokens = None
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            input_tokens = getattr(response.usage_metadata, "prompt_token_count", None)
-            output_tokens = getattr(response.usage_metadata, "candidates_token_count", None)
+        input_tokens, output_tokens, cache_read = usage_counts(response)
 
         return AIResponse(
             content=response.text or "",
@@ -170,6 +386,7 @@ class GeminiProvider(AIProvider):
             provider=self.name,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
+            cache_read_tokens=cache_read,
             finish_reason=response.candidates[0].finish_reason.name if response.candidates else None,
         )
 
@@ -194,7 +411,7 @@ class GeminiProvider(AIProvider):
             temperature=temperature,
         )
 
-        async for chunk in client.aio.models.generate_content_stream(
+        async for chunk in await client.aio.models.generate_content_stream(
             model=model_name,
             contents=contents,
             config=config,
@@ -248,8 +465,6 @@ class GeminiProvider(AIProvider):
         Returns:
             AIResponse which may include tool_use requests
         """
-        from google.genai import types
-
         client = self._get_client()
         model_name = model or self.default_model
 
@@ -258,31 +473,10 @@ class GeminiProvider(AIProvider):
         # Convert tools to Gemini format
         gemini_func_decls = self._convert_tools_to_gemini(tools)
 
-        # Build config with tools
-        if tool_choice == ToolChoice.NONE or not tools:
-            config = types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                max_output_tokens=max_tokens,
-                temperature=temperature,
-            )
-        else:
-            # Set tool config based on tool_choice
-            if tool_choice == ToolChoice.ANY:
-                tool_config = types.ToolConfig(
-                    function_calling_config=types.FunctionCallingConfig(mode="ANY")
-                )
-            else:  # AUTO
-                tool_config = types.ToolConfig(
-                    function_calling_config=types.FunctionCallingConfig(mode="AUTO")
-                )
-
-            config = types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                max_output_tokens=max_tokens,
-                temperature=temperature,
-                tools=[types.Tool(function_declarations=gemini_func_decls)],
-                tool_config=tool_config,
-            )
+        config, cache_write = await tool_request_config(
+            client, self._context_cache, model_name, system_instruction,
+            gemini_func_decls, tool_choice, max_tokens, temperature,
+        )
 
         response = await client.aio.models.generate_content(
             model=model_name,
@@ -299,21 +493,9 @@ class GeminiProvider(AIProvider):
                 if hasattr(part, "text") and part.text:
                     text_content += part.text
                 elif hasattr(part, "function_call") and part.function_call:
-                    fc = part.function_call
-                    # Generate a unique ID for the tool use (full UUID for collision safety)
-                    import uuid
-                    tool_use_blocks.append(ToolUseBlock(
-                        id=f"toolu_{uuid.uuid4().hex}",
-                        name=fc.name,
-                        input=dict(fc.args) if fc.args else {},
-                    ))
+                    tool_use_blocks.append(function_call_block(part.function_call))
 
-        # Extract usage info if available
-        input_tokens = None
-        output_tokens = None
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            input_tokens = getattr(response.usage_metadata, "prompt_token_count", None)
-            output_tokens = getattr(response.usage_metadata, "candidates_token_count", None)
+        input_tokens, output_tokens, cache_read = usage_counts(response)
 
         # Determine finish reason
         finish_reason = None
@@ -326,10 +508,39 @@ class GeminiProvider(AIProvider):
             provider=self.name,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write or None,
             finish_reason=finish_reason,
             tool_use=tool_use_blocks,
         )
 
+    async def chat_with_tools_stream(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict],
+        model: Optional[str] = None,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        tool_choice: ToolChoice = ToolChoice.AUTO,
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream a chat request with tools from Gemini."""
+        client = self._get_client()
+        model_name = model or self.default_model
+
+        system_instruction, contents = self._build_contents(messages)
+        config, cache_write = await tool_request_config(
+            client, self._context_cache, model_name, system_instruction,
+            self._convert_tools_to_gemini(tools), tool_choice, max_tokens, temperature,
+        )
+
+        stream = await client.aio.models.generate_content_stream(
+            model=model_name,
+            contents=contents,
+            config=config,
+        )
+        async for event in stream_tool_events(stream, model_name, self.name, cache_write):
+            yield event
+
     def supports_vision(self) -> bool:
         """Gemini supports vision/image input."""
         return True
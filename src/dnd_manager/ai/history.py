@@ -0,0 +1,185 @@
+"""Token-budgeted compaction of tool session history.
+
+Every model call resends the whole conversation, including the JSON of
+every earlier tool result, so long sessions get slower and more expensive
+turn by turn. ``HistoryManager`` keeps the history under a per-provider
+token budget:
+
+- the system prompt and the most recent turns (a turn starts at each user
+  message) are pinned and never changed,
+- when the history exceeds the budget, large tool results in older turns
+  are replaced, oldest first, by short stubs that keep the success flag
+  and the list of changes but drop the payload,
+- if that is not enough, the oldest turns are dropped whole, so every
+  tool_use keeps its matching tool_result.
+
+Compaction stops at a target below the budget, so it runs once in a while
+rather than on every call; that also keeps the history prefix stable for
+provider prompt caching in between. Token counts are estimated from text
+length.
+"""
+
+import json
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from dnd_manager.ai.base import AIMessage, MessageRole, ToolResultBlock, ToolUseBlock
+
+# Rough characters per token for English text and JSON
+CHARS_PER_TOKEN = 4
+
+# History budgets in tokens by provider name, well inside each context window
+PROVIDER_BUDGETS = {
+    "anthropic": 50_000,
+    "openai": 50_000,
+    "gemini": 100_000,
+    "gemini-router": 100_000,
+    "ollama": 6_000,  # Local models often run with small contexts
+}
+DEFAULT_BUDGET = 30_000
+
+
+def estimate_tokens(message: AIMessage) -> int:
+    """Approximate token count of a message."""
+    if isinstance(message.content, str):
+        chars = len(message.content)
+    else:
+        chars = 0
+        for block in message.content:
+            if isinstance(block, ToolUseBlock):
+                chars += len(block.name) + len(json.dumps(block.input, default=str))
+            elif isinstance(block, ToolResultBlock):
+                chars += len(block.content)
+    # Per-message overhead for role and framing
+    return chars // CHARS_PER_TOKEN + 4
+
+
+@dataclass
+class CompactionReport:
+    """What one compaction did."""
+    tokens_before: int
+    tokens_after: int
+    stubbed_results: int  # Tool results replaced with stubs
+    dropped_messages: int  # Messages removed with their turns
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+
+class HistoryManager:
+    """Keeps a conversation within a token budget."""
+
+    # Tool results shorter than this (in characters) are left alone
+    STUB_MIN_CHARS = 300
+    # Compact down to this fraction of the budget
+    TARGET_RATIO = 0.75
+
+    def __init__(self, budget: int = DEFAULT_BUDGET, keep_recent_turns: int = 3):
+        """
+        Args:
+            budget: Maximum estimated tokens for the whole history
+            keep_recent_turns: Number of latest turns never compacted
+        """
+        self.budget = budget
+        self.keep_recent_turns = max(1, keep_recent_turns)
+
+    @classmethod
+    def for_provider(cls, provider_name: str, keep_recent_turns: int = 3) -> "HistoryManager":
+        """Manager with the budget for a provider."""
+        return cls(PROVIDER_BUDGETS.get(provider_name, DEFAULT_BUDGET), keep_recent_turns)
+
+    def _pinned_from(self, messages: list[AIMessage]) -> int:
+        """Index where the pinned recent turns start."""
+        turn_starts = [
+            i for i, msg in enumerate(messages)
+            if msg.role == MessageRole.USER and isinstance(msg.content, str)
+        ]
+        if len(turn_starts) <= self.keep_recent_turns:
+            return turn_starts[0] if turn_starts else 0
+        return turn_starts[-self.keep_recent_turns]
+
+    def compact(
+        self,
+        messages: list[AIMessage],
+    ) -> tuple[list[AIMessage], Optional[CompactionReport]]:
+        """Compact ``messages`` if they exceed the budget.
+
+        Returns:
+            Tuple of (messages to use, report or None if nothing was done).
+            The input list and its messages are not modified.
+        """
+        sizes = [estimate_tokens(msg) for msg in messages]
+        before = sum(sizes)
+        if before <= self.budget:
+            return messages, None
+
+        target = int(self.budget * self.TARGET_RATIO)
+        pinned_from = self._pinned_from(messages)
+        compacted = list(messages)
+        total = before
+        tool_names = {
+            block.id: block.name
+            for msg in messages if msg.role == MessageRole.ASSISTANT and not isinstance(msg.content, str)
+            for block in msg.content if isinstance(block, ToolUseBlock)
+        }
+
+        # Stub large tool results in older turns, oldest first
+        stubbed = 0
+        for i in range(pinned_from):
+            if total <= target:
+                break
+            msg = compacted[i]
+            if msg.role != MessageRole.TOOL_RESULT or isinstance(msg.content, str):
+                continue
+            blocks = []
+            for block in msg.content:
+                if isinstance(block, ToolResultBlock) and len(block.content) >= self.STUB_MIN_CHARS:
+                    block = replace(block, content=self._stub(block, tool_names.get(block.tool_use_id)))
+                    stubbed += 1
+                blocks.append(block)
+            compacted[i] = replace(msg, content=blocks)
+            size = estimate_tokens(compacted[i])
+            total -= sizes[i] - size
+            sizes[i] = size
+
+        # Drop the oldest whole turns (system messages stay)
+        dropped = 0
+        if total > target:
+            turn_starts = [
+                i for i in range(pinned_from)
+                if compacted[i].role == MessageRole.USER and isinstance(compacted[i].content, str)
+            ] + [pinned_from]
+            drop: set[int] = set()
+            for start, end in zip(turn_starts, turn_starts[1:]):
+                if total <= target:
+                    break
+                for i in range(start, end):
+                    if compacted[i].role != MessageRole.SYSTEM:
+                        drop.add(i)
+                        total -= sizes[i]
+            compacted = [msg for i, msg in enumerate(compacted) if i not in drop]
+            dropped = len(drop)
+
+        if not stubbed and not dropped:
+            return messages, None
+        return compacted, CompactionReport(before, total, stubbed, dropped)
+
+    @staticmethod
+    def _stub(block: ToolResultBlock, tool_name: Optional[str]) -> str:
+        """Short replacement for an old tool result."""
+        stub: dict = {"omitted": f"Earlier {tool_name or 'tool'} result removed to save context; "
+                                  "call the tool again if it is needed."}
+        try:
+            original = json.loads(block.content)
+        except ValueError:
+            return json.dumps(stub)
+        if isinstance(original, dict):
+            if "success" in original:
+                stub["success"] = original["success"]
+            # Changes are short and record what the tool did to the character
+            if original.get("changes"):
+                stub["changes"] = original["changes"]
+            if original.get("error"):
+                stub["error"] = original["error"]
+        return json.dumps(stub, default=str)
@@ -2,9 +2,20 @@
 
 import logging
 import os
-from typing import AsyncIterator, Optional
+import uuid
+from typing import Any, AsyncIterator, Optional
 
-from dnd_manager.ai.base import AIMessage, AIProvider, AIResponse, MessageRole
+from dnd_manager.ai.base import (
+    AIMessage,
+    AIProvider,
+    AIResponse,
+    MessageRole,
+    StreamEvent,
+    StreamEventType,
+    ToolChoice,
+    ToolUseBlock,
+    ToolResultBlock,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -148,3 +159,147 @@ class OllamaProvider(AIProvider):
         async for chunk in stream:
             if chunk.get("message", {}).get("content"):
                 yield chunk["message"]["content"]
+
+    def _convert_messages_with_tools(self, messages: list[AIMessage]) -> list[dict]:
+        """Convert messages including tool use and results to Ollama format."""
+        names = {
+            block.id: block.name
+            for msg in messages if msg.role == MessageRole.ASSISTANT and not isinstance(msg.content, str)
+            for block in msg.content if isinstance(block, ToolUseBlock)
+        }
+        converted = []
+        for msg in messages:
+            if isinstance(msg.content, str):
+                converted.append({"role": msg.role.value, "content": msg.content})
+            elif msg.role == MessageRole.ASSISTANT:
+                tool_calls = [
+                    {"function": {"name": block.name, "arguments": block.input}}
+                    for block in msg.content if isinstance(block, ToolUseBlock)
+                ]
+                if tool_calls:
+                    converted.append({"role": "assistant", "content": "", "tool_calls": tool_calls})
+            elif msg.role == MessageRole.TOOL_RESULT:
+                for block in msg.content:
+                    if isinstance(block, ToolResultBlock):
+                        converted.append({
+                            "role": "tool",
+                            "content": block.content,
+                            "tool_name": names.get(block.tool_use_id, "unknown"),
+                        })
+        return converted
+
+    def _tool_request(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict],
+        model: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        tool_choice: ToolChoice,
+    ) -> dict:
+        """Chat arguments for a request with tools.
+
+        Ollama cannot force tool use, so ANY is treated as AUTO.
+        """
+        kwargs = {
+            "model": model or self.default_model,
+            "messages": self._convert_messages_with_tools(messages),
+            "options": {
+                "num_predict": max_tokens,
+                "temperature": temperature,
+            },
+        }
+        if tools and tool_choice != ToolChoice.NONE:
+            kwargs["tools"] = [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": tool["name"],
+                        "description": tool.get("description", ""),
+                        "parameters": tool.get("input_schema", {"type": "object", "properties": {}}),
+                    },
+                }
+                for tool in tools
+            ]
+        return kwargs
+
+    @staticmethod
+    def _tool_use_blocks(message: Any) -> list[ToolUseBlock]:
+        """Tool calls in a response message (Ollama gives them no IDs)."""
+        return [
+            ToolUseBlock(
+                id=f"toolu_{uuid.uuid4().hex}",
+                name=call["function"]["name"],
+                input=dict(call["function"]["arguments"] or {}),
+            )
+            for call in message.get("tool_calls") or []
+        ]
+
+    async def chat_with_tools(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict],
+        model: Optional[str] = None,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        tool_choice: ToolChoice = ToolChoice.AUTO,
+    ) -> AIResponse:
+        """Send a chat request with tools to Ollama.
+
+        Requires a model with tool support (e.g. llama3.2, qwen2.5).
+        """
+        client = self._get_client()
+        kwargs = self._tool_request(messages, tools, model, max_tokens, temperature, tool_choice)
+
+        response = await client.chat(**kwargs)
+
+        return AIResponse(
+            content=response["message"].get("content") or "",
+            model=kwargs["model"],
+            provider=self.name,
+            input_tokens=response.get("prompt_eval_count"),
+            output_tokens=response.get("eval_count"),
+            finish_reason=response.get("done_reason") or "stop",
+            tool_use=self._tool_use_blocks(response["message"]),
+        )
+
+    async def chat_with_tools_stream(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict],
+        model: Optional[str] = None,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        tool_choice: ToolChoice = ToolChoice.AUTO,
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream a chat request with tools from Ollama.
+
+        Ollama sends each tool call complete within a single chunk.
+        """
+        client = self._get_client()
+        kwargs = self._tool_request(messages, tools, model, max_tokens, temperature, tool_choice)
+
+        stream = await client.chat(**kwargs, stream=True)
+
+        text_content = ""
+        tool_use_blocks: list[ToolUseBlock] = []
+        last = None
+        async for chunk in stream:
+            last = chunk
+            message = chunk.get("message") or {}
+            if message.get("content"):
+                text_content += message["content"]
+                yield StreamEvent(StreamEventType.TEXT, text=message["content"])
+            for block in self._tool_use_blocks(message):
+                tool_use_blocks.append(block)
+                yield StreamEvent(StreamEventType.TOOL_USE, tool_use=block)
+
+        yield StreamEvent(StreamEventType.DONE, response=AIResponse(
+            content=text_content,
+            model=kwargs["model"],
+            provider=self.name,
+            input_tokens=last.get("prompt_eval_count") if last else None,
+            output_tokens=last.get("eval_count") if last else None,
+            finish_reason=(last.get("done_reason") if last else None) or "stop",
+            tool_use=tool_use_blocks,
+        ))
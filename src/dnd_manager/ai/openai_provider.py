@@ -1,9 +1,41 @@
 """OpenAI GPT AI provider."""
 
+import json
+import logging
 import os
-from typing import AsyncIterator, Optional
+from typing import Any, AsyncIterator, Optional
 
-from dnd_manager.ai.base import AIMessage, AIProvider, AIResponse, MessageRole
+from dnd_manager.ai.base import (
+    AIMessage,
+    AIProvider,
+    AIResponse,
+    MessageRole,
+    StreamEvent,
+    StreamEventType,
+    ToolChoice,
+    ToolUseBlock,
+    ToolResultBlock,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_arguments(arguments: Optional[str]) -> dict:
+    """Decode a function call's JSON arguments ({} if empty or invalid)."""
+    if not arguments:
+        return {}
+    try:
+        parsed = json.loads(arguments)
+    except ValueError:
+        logger.warning("Invalid tool call arguments: %r", arguments)
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def _cached_tokens(usage: Any) -> Optional[int]:
+    """Prompt tokens OpenAI served from its automatic prompt cache."""
+    details = getattr(usage, "prompt_tokens_details", None)
+    return getattr(details, "cached_tokens", None) if details else None
 
 
 class OpenAIProvider(AIProvider):
@@ -114,6 +146,197 @@ class OpenAIProvider(AIProvider):
             if chunk.choices and chunk.choices[0].delta.content:
                 yield chunk.choices[0].delta.content
 
+    def _convert_tools(self, tools: list[dict]) -> list[dict]:
+        """Convert Anthropic-format tool definitions to OpenAI functions."""
+        return [
+            {
+                "type": "function",
+                "function": {
+                    "name": tool["name"],
+                    "description": tool.get("description", ""),
+                    "parameters": tool.get("input_schema", {"type": "object", "properties": {}}),
+                },
+            }
+            for tool in tools
+        ]
+
+    def _convert_messages_with_tools(self, messages: list[AIMessage]) -> list[dict]:
+        """Convert messages including tool use and results to OpenAI format.
+
+        Tool use blocks become the assistant message's tool_calls, and each
+        tool result becomes a separate "tool" message.
+        """
+        converted = []
+        for msg in messages:
+            if isinstance(msg.content, str):
+                converted.append({"role": msg.role.value, "content": msg.content})
+            elif msg.role == MessageRole.ASSISTANT:
+                tool_calls = [
+                    {
+                        "id": block.id,
+                        "type": "function",
+                        "function": {"name": block.name, "arguments": json.dumps(block.input)},
+                    }
+                    for block in msg.content if isinstance(block, ToolUseBlock)
+                ]
+                if tool_calls:
+                    converted.append({"role": "assistant", "content": None, "tool_calls": tool_calls})
+            elif msg.role == MessageRole.TOOL_RESULT:
+                for block in msg.content:
+                    if isinstance(block, ToolResultBlock):
+                        converted.append({
+                            "role": "tool",
+                            "tool_call_id": block.tool_use_id,
+                            "content": block.content,
+                        })
+        return converted
+
+    def _tool_request(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict],
+        model: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        tool_choice: ToolChoice,
+    ) -> dict:
+        """Chat completion arguments for a request with tools."""
+        kwargs = {
+            "model": model or self.default_model,
+            "messages": self._convert_messages_with_tools(messages),
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if tools and tool_choice != ToolChoice.NONE:
+            kwargs["tools"] = self._convert_tools(tools)
+            if tool_choice == ToolChoice.ANY:
+                kwargs["tool_choice"] = "required"
+        return kwargs
+
+    async def chat_with_tools(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict],
+        model: Optional[str] = None,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        tool_choice: ToolChoice = ToolChoice.AUTO,
+    ) -> AIResponse:
+        """Send a chat request with tools to OpenAI.
+
+        Args:
+            messages: Conversation history (may include tool results)
+            tools: List of tool definitions in Anthropic format (will be converted)
+            model: Model to use (defaults to default_model)
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature
+            tool_choice: Controls tool usage (AUTO, ANY, NONE)
+
+        Returns:
+            AIResponse which may include tool_use requests
+        """
+        client = self._get_client()
+        kwargs = self._tool_request(messages, tools, model, max_tokens, temperature, tool_choice)
+
+        response = await client.chat.completions.create(**kwargs)
+
+        choice = response.choices[0]
+        usage = response.usage
+        tool_use_blocks = [
+            ToolUseBlock(
+                id=call.id,
+                name=call.function.name,
+                input=_parse_arguments(call.function.arguments),
+            )
+            for call in choice.message.tool_calls or []
+        ]
+
+        return AIResponse(
+            content=choice.message.content or "",
+            model=kwargs["model"],
+            provider=self.name,
+            input_tokens=usage.prompt_tokens if usage else None,
+            output_tokens=usage.completion_tokens if usage else None,
+            cache_read_tokens=_cached_tokens(usage),
+            finish_reason=choice.finish_reason,
+            tool_use=tool_use_blocks,
+        )
+
+    async def chat_with_tools_stream(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict],
+        model: Optional[str] = None,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        tool_choice: ToolChoice = ToolChoice.AUTO,
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream a chat request with tools to OpenAI.
+
+        Tool calls stream one after another, their arguments in fragments;
+        a call is complete when the next call's index appears or the stream
+        ends.
+        """
+        client = self._get_client()
+        kwargs = self._tool_request(messages, tools, model, max_tokens, temperature, tool_choice)
+
+        stream = await client.chat.completions.create(
+            **kwargs,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+
+        text_content = ""
+        tool_use_blocks: list[ToolUseBlock] = []
+        pending: Optional[dict] = None  # Call being received: index, id, name, arguments
+        finish_reason = None
+        usage = None
+
+        def complete(call: dict) -> StreamEvent:
+            block = ToolUseBlock(
+                id=call["id"],
+                name=call["name"],
+                input=_parse_arguments(call["arguments"]),
+            )
+            tool_use_blocks.append(block)
+            return StreamEvent(StreamEventType.TOOL_USE, tool_use=block)
+
+        async for chunk in stream:
+            if chunk.usage:
+                usage = chunk.usage
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            delta = choice.delta
+            if delta.content:
+                text_content += delta.content
+                yield StreamEvent(StreamEventType.TEXT, text=delta.content)
+            for call in delta.tool_calls or []:
+                if pending is None or call.index != pending["index"]:
+                    if pending is not None:
+                        yield complete(pending)
+                    pending = {"index": call.index, "id": "", "name": "", "arguments": ""}
+                if call.id:
+                    pending["id"] = call.id
+                if call.function:
+                    pending["name"] += call.function.name or ""
+                    pending["arguments"] += call.function.arguments or ""
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+        if pending is not None:
+            yield complete(pending)
+
+        yield StreamEvent(StreamEventType.DONE, response=AIResponse(
+            content=text_content,
+            model=kwargs["model"],
+            provider=self.name,
+            input_tokens=usage.prompt_tokens if usage else None,
+            output_tokens=usage.completion_tokens if usage else None,
+            cache_read_tokens=_cached_tokens(usage),
+            finish_reason=finish_reason,
+            tool_use=tool_use_blocks,
+        ))
+
     def supports_vision(self) -> bool:
         """GPT-4o supports vision/image input."""
         return True
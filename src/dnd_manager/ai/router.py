@@ -1,10 +1,11 @@
 """Intelligent AI router for Gemini models.
 
-Uses Gemini 2.5 Flash-Lite to classify query complexity and routes to the
-most appropriate model while respecting rate limits and falling back gracefully.
+Classifies query complexity locally (asking Gemini 2.5 Flash-Lite only when
+the local classifier is unsure) and routes to the most appropriate model
+while respecting rate limits and falling back gracefully.
 
 Routing strategy:
-1. Flash-Lite classifies the query complexity (simple/moderate/complex)
+1. Classify the query complexity (simple/moderate/complex)
 2. Complex -> Gemini 3 Flash Preview (best reasoning)
 3. Moderate -> Gemini 2.5 Flash (good balance)
 4. Simple -> Gemini 2.5 Flash-Lite (fast, high quota)
@@ -17,8 +18,7 @@ import os
 import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from enum import Enum
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Literal, Optional
 
 from dnd_manager.ai.base import (
     AIError,
@@ -27,21 +27,23 @@ from dnd_manager.ai.base import (
     AIRateLimitError,
     AIResponse,
     MessageRole,
+    StreamEvent,
     ToolChoice,
     ToolUseBlock,
     ToolResultBlock,
 )
+from dnd_manager.ai.classifier import QueryComplexity, classify_complexity
+from dnd_manager.ai.gemini import (
+    GeminiContextCache,
+    function_call_block,
+    stream_tool_events,
+    tool_request_config,
+    usage_counts,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class QueryComplexity(str, Enum):
-    """Query complexity levels."""
-    SIMPLE = "simple"      # Basic questions, lookups
-    MODERATE = "moderate"  # Rules clarifications, character advice
-    COMPLEX = "complex"    # Multi-step reasoning, strategy, creativity
-
-
 @dataclass
 class QuotaTracker:
     """Track rate limit state for a model.
@@ -153,12 +155,23 @@ Classification:"""
 class GeminiRouter(AIProvider):
     """Intelligent router for Gemini models with automatic fallback.
 
-    Uses Flash-Lite to classify queries and routes to appropriate model:
+    Classifies queries and routes to appropriate model:
     - Complex queries -> Gemini 3 Flash (best reasoning)
     - Moderate queries -> Gemini 2.5 Flash (balanced)
     - Simple queries -> Gemini 2.5 Flash-Lite (fast)
 
     Falls back gracefully when rate limits are hit.
+
+    Classification accuracy trade-off: the local classifier scores 72.5% on
+    the held-out split of ``tests/fixtures/classifier_queries.jsonl`` (98.3%
+    on the split it was tuned on). Its misses mostly underrate a query
+    (moderate -> simple, complex -> moderate), so the answer comes from a
+    cheaper model rather than failing. In hybrid mode the default
+    ``classifier_min_confidence`` of 0.5 is the lowest threshold with no
+    misses on the tune split; it sends 7 of 40 holdout queries to Flash-Lite
+    but 6 of the 11 holdout misses are confident enough to skip it. A
+    threshold of 0.65 leaves one confident miss at the cost of 19 remote
+    calls. Re-measure with ``scripts/benchmark_query_classifier.py --sweep``.
     """
 
     # Model tiers in order of capability
@@ -179,12 +192,27 @@ class GeminiRouter(AIProvider):
 
     CLASSIFIER_MODEL = "gemini-2.5-flash-lite"
 
-    def __init__(self, api_key: Optional[str] = None, auto_classify: Optional[bool] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        auto_classify: Optional[bool] = None,
+        prompt_caching: Optional[bool] = None,
+        classifier: Optional[Literal["local", "remote", "hybrid"]] = None,
+        classifier_min_confidence: Optional[float] = None,
+    ):
         """Initialize the router.
 
         Args:
             api_key: Gemini API key (uses config/env if not provided)
             auto_classify: Whether to auto-classify queries (uses config if not provided)
+            prompt_caching: Whether to use context caching for tool requests
+                (uses config if not provided)
+            classifier: "local" (no network call), "remote" (Flash-Lite), or
+                "hybrid" (local, Flash-Lite when unsure); uses config if not
+                provided
+            classifier_min_confidence: In hybrid mode, local results below
+                this confidence are sent to Flash-Lite (uses config if not
+                provided)
         """
         # Get API key from config or environment
         if api_key is None:
@@ -206,6 +234,20 @@ class GeminiRouter(AIProvider):
 
         self._auto_classify = auto_classify
 
+        prompt_caching = self._prompt_caching_enabled(prompt_caching)
+        self._context_cache = GeminiContextCache() if prompt_caching else None
+
+        if classifier is None:
+            from dnd_manager.config import get_config_manager
+            classifier = get_config_manager().get("ai.gemini.classifier") or "hybrid"
+        if classifier_min_confidence is None:
+            from dnd_manager.config import get_config_manager
+            classifier_min_confidence = get_config_manager().get("ai.gemini.classifier_min_confidence")
+            if classifier_min_confidence is None:
+                classifier_min_confidence = 0.5
+        self._classifier = classifier
+        self._classifier_min_confidence = classifier_min_confidence
+
     def _get_client(self):
         """Lazy-load the Gemini client."""
         if self._client is None:
@@ -236,10 +278,24 @@ class GeminiRouter(AIProvider):
         return self._api_key is not None
 
     async def classify_query(self, query: str) -> QueryComplexity:
-        """Classify query complexity using Flash-Lite.
+        """Classify query complexity for routing.
 
-        This is cheap (high quota) so we can afford to call it for every query.
+        The local classifier answers without a network call; Flash-Lite is
+        only asked in "remote" mode, or in "hybrid" mode when the local
+        result's confidence is below the threshold.
         """
+        if self._classifier != "remote":
+            local = classify_complexity(query)
+            if self._classifier == "local" or local.confidence >= self._classifier_min_confidence:
+                return local.complexity
+            logger.debug(
+                "Local classification %s has low confidence (%.2f), asking %s",
+                local.complexity.value, local.confidence, self.CLASSIFIER_MODEL,
+            )
+        return await self.classify_query_remote(query)
+
+    async def classify_query_remote(self, query: str) -> QueryComplexity:
+        """Classify query complexity using Flash-Lite (one network call)."""
         try:
             client = self._get_client()
             prompt = CLASSIFICATION_PROMPT.format(query=query)
@@ -447,9 +503,6 @@ class GeminiRouter(AIProvider):
         tool_choice: ToolChoice,
     ) -> AIResponse:
         """Call a specific model with tools and rate limit handling."""
-        from google.genai import types
-        import uuid
-
         client = self._get_client()
         quota = self._state.get_quota(model)
 
@@ -459,31 +512,10 @@ class GeminiRouter(AIProvider):
         # Convert tools to Gemini format
         gemini_func_decls = self._convert_tools_to_gemini(tools)
 
-        # Build config with tools
-        if tool_choice == ToolChoice.NONE or not tools:
-            config = types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                max_output_tokens=max_tokens,
-                temperature=temperature,
-            )
-        else:
-            # Set tool config based on tool_choice
-            if tool_choice == ToolChoice.ANY:
-                tool_config = types.ToolConfig(
-                    function_calling_config=types.FunctionCallingConfig(mode="ANY")
-                )
-            else:  # AUTO
-                tool_config = types.ToolConfig(
-                    function_calling_config=types.FunctionCallingConfig(mode="AUTO")
-                )
-
-            config = types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                max_output_tokens=max_tokens,
-                temperature=temperature,
-                tools=[types.Tool(function_declarations=gemini_func_decls)],
-                tool_config=tool_config,
-            )
+        config, cache_write = await tool_request_config(
+            client, self._context_cache, model, system_instruction,
+            gemini_func_decls, tool_choice, max_tokens, temperature,
+        )
 
         try:
             response = await client.aio.models.generate_content(
@@ -502,19 +534,9 @@ class GeminiRouter(AIProvider):
                     if hasattr(part, "text") and part.text:
                         text_content += part.text
                     elif hasattr(part, "function_call") and part.function_call:
-                        fc = part.function_call
-                        tool_use_blocks.append(ToolUseBlock(
-                            id=f"toolu_{uuid.uuid4().hex}",
-                            name=fc.name,
-                            input=dict(fc.args) if fc.args else {},
-                        ))
-
-            # Extract usage info if available
-            input_tokens = None
-            output_tokens = None
-            if hasattr(response, "usage_metadata") and response.usage_metadata:
-                input_tokens = getattr(response.usage_metadata, "prompt_token_count", None)
-                output_tokens = getattr(response.usage_metadata, "candidates_token_count", None)
+                        tool_use_blocks.append(function_call_block(part.function_call))
+
+            input_tokens, output_tokens, cache_read = usage_counts(response)
 
             # Determine finish reason
             finish_reason = None
@@ -527,6 +549,8 @@ class GeminiRouter(AIProvider):
                 provider=self.name,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
+                cache_read_tokens=cache_read,
+                cache_write_tokens=cache_write or None,
                 finish_reason=finish_reason,
                 tool_use=tool_use_blocks,
             )
@@ -538,6 +562,67 @@ class GeminiRouter(AIProvider):
                 raise RateLimitError(model, str(e))
             raise
 
+    async def chat_with_tools_stream(
+        self,
+        messages: list[AIMessage],
+        tools: list[dict],
+        model: Optional[str] = None,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        tool_choice: ToolChoice = ToolChoice.AUTO,
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream chat with tools, routed like chat_with_tools.
+
+        Falls back to the next model only if a model fails before yielding
+        anything; errors after output has started are raised.
+        """
+        if model:
+            candidates = [model]
+        else:
+            user_messages = [m for m in messages if m.role == MessageRole.USER]
+            query = user_messages[-1].content if user_messages else ""
+            if self._auto_classify and query:
+                complexity = await self.classify_query(query)
+            else:
+                complexity = QueryComplexity.MODERATE
+            candidates = [m for m in self.MODEL_TIERS[complexity] if self._state.is_model_available(m)]
+
+        client = self._get_client()
+        system_instruction, contents = self._build_contents_with_tools(messages)
+        gemini_func_decls = self._convert_tools_to_gemini(tools)
+        last_error: Optional[Exception] = None
+
+        for candidate_model in candidates:
+            started = False
+            try:
+                config, cache_write = await tool_request_config(
+                    client, self._context_cache, candidate_model, system_instruction,
+                    gemini_func_decls, tool_choice, max_tokens, temperature,
+                )
+                stream = await client.aio.models.generate_content_stream(
+                    model=candidate_model,
+                    contents=contents,
+                    config=config,
+                )
+                async for event in stream_tool_events(stream, candidate_model, self.name, cache_write):
+                    started = True
+                    yield event
+                self._state.record_request(candidate_model)
+                return
+            except Exception as e:
+                error_str = str(e).lower()
+                if "429" in error_str or "rate" in error_str or "quota" in error_str:
+                    self._state.record_rate_limit(candidate_model)
+                    e = RateLimitError(candidate_model, str(e))
+                if started or model:
+                    raise e
+                last_error = e
+
+        # All models failed, raise the last error
+        if last_error:
+            raise last_error
+        raise RuntimeError("All models exhausted")
+
     def _build_contents_with_tools(
         self, messages: list[AIMessage]
     ) -> tuple[Optional[str], list[dict]]:
@@ -656,7 +741,7 @@ class GeminiRouter(AIProvider):
 
         try:
             chunk_count = 0
-            async for chunk in client.aio.models.generate_content_stream(
+            async for chunk in await client.aio.models.generate_content_stream(
                 model=selected_model,
                 contents=contents,
                 config=config,
@@ -4,8 +4,18 @@ Provides structured access to D&D content (spells, items, monsters, classes, etc
 that can be used to enhance AI responses with accurate game information.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+import sqlite3
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from dnd_manager.data.catalog import get_catalog, names_first
+from dnd_manager.data.custom import get_custom_content_store
+from dnd_manager.data.fuzzy import NameIndex, NameMatch, best_match
+from dnd_manager.data.library import ContentType, get_homebrew_library
+from dnd_manager.data.query import Page, Query
+from dnd_manager.data.srd_fts import COLLECTIONS as FTS_COLLECTIONS, get_srd_fts
 
 
 @dataclass
@@ -16,6 +26,28 @@ class QueryResult:
     total_count: int
     has_more: bool
     summary: str
+    offset: int = 0  # Position of data[0] among all matches
+
+
+@dataclass
+class NameLookup:
+    """Result of looking up an entry by a possibly misspelled name."""
+    data: Optional[dict]  # None if no name matched confidently
+    name: Optional[str] = None  # Name of the entry found
+    exact: bool = True  # False if resolved by fuzzy matching
+    suggestions: list[str] = field(default_factory=list)  # Similar names
+
+
+# Homebrew library content type -> SemanticLayer collection
+_LIBRARY_COLLECTIONS = {
+    ContentType.SPELL: "spells",
+    ContentType.MAGIC_ITEM: "magic_items",
+    ContentType.ITEM: "magic_items",
+    ContentType.FEAT: "feats",
+    ContentType.MONSTER: "monsters",
+    ContentType.RACE: "species",
+    ContentType.CLASS: "classes",
+}
 
 
 class SemanticLayer:
@@ -30,6 +62,12 @@ class SemanticLayer:
         self._species = None
         self._feats = None
         self._subclasses = None
+        # Fuzzy name indexes: built-in names, and homebrew keyed by its version
+        self._name_indexes: dict[str, NameIndex[Optional[dict]]] = {}
+        self._homebrew_names: dict[str, NameIndex[Optional[dict]]] = {}
+        self._homebrew_version: Optional[tuple] = None
+        # Lookup tools may run in worker threads concurrently
+        self._homebrew_lock = threading.Lock()
 
     def _load_spells(self):
         if self._spells is None:
@@ -72,6 +110,212 @@ class SemanticLayer:
             from dnd_manager.data.subclasses import ALL_SUBCLASSES
             self._subclasses = ALL_SUBCLASSES
 
+    # Full-text search
+    def search_records(self, collection: str, query: str, limit: Optional[int] = None) -> list:
+        """Records of a collection matching ``query``, most relevant first.
+
+        Records whose name contains ``query`` come first. The rest are
+        ranked by the SQLite FTS5 mirror of the SRD when it is available,
+        which adds "quoted phrase" matching, and the in-memory index
+        otherwise. Every other word matches as a prefix either way.
+
+        Args:
+            collection: spells, monsters, feats, magic_items, subclasses
+                or species (species always use the in-memory index)
+            query: Free text
+            limit: Maximum number of results
+
+        Returns:
+            The data records (e.g. ``Spell``), not dicts
+        """
+        index = get_srd_fts() if collection in FTS_COLLECTIONS else None
+        if index is None:
+            return get_catalog().search(collection, query, limit)
+        catalog = get_catalog()
+        records = getattr(catalog, collection).records
+        # Ask for enough rows that dropping the name matches still fills limit
+        names = catalog.name_matches(collection, query)
+        fts_limit = None if limit is None else limit + len(names)
+        ranked = (records[match.position] for match in index.search(query, [collection], fts_limit))
+        return names_first(names, ranked, limit)
+
+    def full_text_search(
+        self,
+        query: str,
+        collections: Optional[list[str]] = None,
+        limit: int = 10,
+    ) -> QueryResult:
+        """Ranked search across spells, monsters, feats, magic items and subclasses.
+
+        Each result names its collection and includes a description snippet
+        with the matched words in [brackets].
+        """
+        wanted = [c for c in (collections or FTS_COLLECTIONS) if c in FTS_COLLECTIONS]
+        index = get_srd_fts()
+        if index is not None:
+            matches = [
+                {"type": m.collection, "name": m.name, "snippet": m.snippet, "score": round(m.score, 2)}
+                for m in index.search(query, wanted, None)
+            ]
+        else:
+            catalog = get_catalog()
+            matches = [
+                {"type": collection, "name": record.name,
+                 "snippet": record.description[:120], "score": round(score, 2)}
+                for collection in wanted
+                for record, score in catalog.text_index(collection).ranked(query)
+            ]
+            matches.sort(key=lambda m: -m["score"])
+
+        total = len(matches)
+        return QueryResult(
+            query_type="srd_search",
+            data=matches[:limit],
+            total_count=total,
+            has_more=total > limit,
+            summary=f"Found {total} entries matching '{query}'",
+        )
+
+    # Name resolution
+    def _getter(self, collection: str):
+        return {
+            "spells": self.get_spell,
+            "monsters": self.get_monster,
+            "magic_items": self.get_magic_item,
+            "feats": self.get_feat,
+            "species": self.get_species,
+            "classes": self.get_class_info,
+        }[collection]
+
+    def _builtin_names(self, collection: str) -> Iterable[str]:
+        if collection == "spells":
+            self._load_spells()
+            return (spell.name for spell in self._spells)
+        if collection == "monsters":
+            self._load_monsters()
+            return (monster.name for monster in self._monsters)
+        if collection == "magic_items":
+            self._load_items()
+            return (item.name for item in self._items["magic"])
+        if collection == "feats":
+            self._load_feats()
+            return (feat.name for feat in self._feats)
+        if collection == "species":
+            self._load_species()
+            species = self._species.values() if isinstance(self._species, dict) else self._species
+            return (s.name for s in species)
+        self._load_classes()
+        if isinstance(self._classes, dict):
+            return iter(self._classes)
+        return (cls.name for cls in self._classes)
+
+    def _name_index(self, collection: str) -> NameIndex[Optional[dict]]:
+        """Built-in names of a collection; values are None (use the getter)."""
+        index = self._name_indexes.get(collection)
+        if index is None:
+            names = self._builtin_names(collection)
+            index = self._name_indexes.setdefault(collection, NameIndex((n, None) for n in names))
+        return index
+
+    def _homebrew_index(self, collection: str) -> Optional[NameIndex[Optional[dict]]]:
+        """Custom and installed library content names, rebuilt when either changes."""
+        with self._homebrew_lock:
+            try:
+                store = get_custom_content_store()
+                library = get_homebrew_library()
+                version = (
+                    tuple(sorted((p.name, p.stat().st_mtime_ns) for p in store.content_dir.glob("*.yaml"))),
+                    library.get_installed_version(),
+                )
+                if version != self._homebrew_version:
+                    self._homebrew_names = self._build_homebrew_names(store, library)
+                    self._homebrew_version = version
+            except (OSError, sqlite3.Error):
+                return None
+            return self._homebrew_names.get(collection)
+
+    def _build_homebrew_names(self, store, library) -> dict[str, NameIndex[Optional[dict]]]:
+        entries: dict[str, list[tuple[str, dict]]] = {}
+        content = store.load_all()
+        for spell in content.spells:
+            data = {**self._spell_to_dict(spell.to_spell()), "source": spell.source}
+            entries.setdefault("spells", []).append((spell.name, data))
+        for item in content.items:
+            data = {
+                "name": item.name,
+                "type": item.item_type,
+                "rarity": item.rarity,
+                "description": item.description,
+                "requires_attunement": item.requires_attunement,
+                "attunement_requirements": item.attunement_requirements,
+                "source": item.source,
+            }
+            entries.setdefault("magic_items", []).append((item.name, data))
+        for feat in content.feats:
+            data = {**self._feat_to_dict(feat), "source": feat.source}
+            entries.setdefault("feats", []).append((feat.name, data))
+        for installed in library.get_installed():
+            collection = _LIBRARY_COLLECTIONS.get(installed.content_type)
+            if collection:
+                data = {
+                    "name": installed.name,
+                    "description": installed.description,
+                    **installed.content_data,
+                    "source": "homebrew library",
+                }
+                entries.setdefault(collection, []).append((installed.name, data))
+        return {collection: NameIndex(pairs) for collection, pairs in entries.items()}
+
+    def find_names(self, collection: str, name: str, limit: int = 5) -> list[NameMatch[Optional[dict]]]:
+        """Built-in and homebrew names similar to ``name``, most similar first.
+
+        Match values are the homebrew entry's dict, or None for built-in
+        entries.
+        """
+        matches = self._name_index(collection).matches(name, limit)
+        homebrew = self._homebrew_index(collection)
+        if homebrew is not None:
+            matches = sorted(matches + homebrew.matches(name, limit), key=lambda m: -m.score)
+        return matches[:limit]
+
+    def lookup(self, collection: str, name: str) -> NameLookup:
+        """Look up an entry by name, tolerating typos and extra words.
+
+        Tries an exact built-in match, then the closest built-in or homebrew
+        name if it is clearly the best. Otherwise ``data`` is None and
+        ``suggestions`` lists similar names.
+
+        Args:
+            collection: spells, monsters, magic_items, feats, species or classes
+            name: The name as given, e.g. "Magic Misile" or "Fireball spell"
+        """
+        getter = self._getter(collection)
+        data = getter(name)
+        if data is not None:
+            return NameLookup(data, data["name"])
+
+        matches = self.find_names(collection, name)
+        suggestions = [m.name for m in matches]
+        match = best_match(matches)
+        if match is None:
+            return NameLookup(None, suggestions=suggestions)
+        data = match.value if match.value is not None else getter(match.name)
+        return NameLookup(data, match.name, exact=match.score == 1.0, suggestions=suggestions)
+
+    def _page_result(self, query_type: str, page: Page) -> QueryResult:
+        noun = query_type.replace("_", " ")
+        summary = f"Found {page.total} {noun} matching criteria"
+        if page.items and (page.offset or page.has_more):
+            summary += f" (showing {page.offset + 1}-{page.offset + len(page.items)})"
+        return QueryResult(
+            query_type=query_type,
+            data=page.items,
+            total_count=page.total,
+            has_more=page.has_more,
+            summary=summary,
+            offset=page.offset,
+        )
+
     # Spell queries
     def get_spell(self, name: str) -> Optional[dict]:
         """Get a spell by exact name (case-insensitive)."""
@@ -90,38 +334,37 @@ class SemanticLayer:
         class_name: Optional[str] = None,
         concentration: Optional[bool] = None,
         ritual: Optional[bool] = None,
+        min_cost: Optional[int] = None,
+        max_cost: Optional[int] = None,
         limit: int = 10,
+        offset: int = 0,
     ) -> QueryResult:
-        """Search spells with various filters."""
-        self._load_spells()
-        results = []
-
-        for spell in self._spells:
-            # Apply filters
-            if query and query.lower() not in spell.name.lower():
-                continue
-            if level is not None and spell.level != level:
-                continue
-            if school and school.lower() not in spell.school.lower():
-                continue
-            if class_name and class_name not in spell.classes:
-                continue
-            if concentration is not None and spell.concentration != concentration:
-                continue
-            if ritual is not None and spell.ritual != ritual:
-                continue
-
-            results.append(self._spell_to_dict(spell))
-
-        total = len(results)
-        limited = results[:limit]
-        return QueryResult(
-            query_type="spells",
-            data=limited,
-            total_count=total,
-            has_more=total > limit,
-            summary=f"Found {total} spells matching criteria",
-        )
+        """Search spells with various filters.
+
+        A ``query`` is matched against names and descriptions and results
+        are ranked by relevance. Otherwise, with ``min_cost`` or
+        ``max_cost``, only spells whose material component has a gold cost
+        in that range match, cheapest first.
+        """
+        catalog = get_catalog()
+        spells = Query(catalog.spells, self.search_records("spells", query) if query else None)
+        spells.where("level", level).where("class", class_name or None)
+        if school:
+            spells.filter(lambda s: school.lower() in s.school.lower())
+        if concentration is not None:
+            spells.filter(lambda s: s.concentration == concentration)
+        if ritual is not None:
+            spells.filter(lambda s: s.ritual == ritual)
+        if min_cost is not None or max_cost is not None:
+            spells.within(catalog.spell_materials.between(
+                "cost",
+                min_cost if min_cost is not None else 0,
+                max_cost if max_cost is not None else float("inf"),
+            ))
+            if not query:
+                spells.order_by(lambda s: s.material_component().cost)
+
+        return self._page_result("spells", spells.page(offset, limit, self._spell_to_dict))
 
     def get_spells_for_class(self, class_name: str, max_level: int = 9) -> QueryResult:
         """Get all spells available to a class up to a certain level."""
@@ -141,7 +384,7 @@ class SemanticLayer:
         )
 
     def _spell_to_dict(self, spell) -> dict:
-        return {
+        result = {
             "name": spell.name,
             "level": spell.level,
             "school": spell.school,
@@ -154,6 +397,11 @@ class SemanticLayer:
             "concentration": spell.concentration,
             "ritual": spell.ritual,
         }
+        material = spell.material_component()
+        if material is not None and material.cost is not None:
+            result["material_cost_gp"] = material.cost
+            result["material_consumed"] = material.consumed
+        return result
 
     # Monster queries
     def get_monster(self, name: str) -> Optional[dict]:
@@ -172,55 +420,42 @@ class SemanticLayer:
         cr_max: Optional[float] = None,
         monster_type: Optional[str] = None,
         limit: int = 10,
+        offset: int = 0,
     ) -> QueryResult:
-        """Search monsters with filters."""
-        self._load_monsters()
-        results = []
-
-        for monster in self._monsters:
-            if query and query.lower() not in monster.name.lower():
-                continue
-            cr = monster.cr_numeric
-            if cr_min is not None and cr < cr_min:
-                continue
-            if cr_max is not None and cr > cr_max:
-                continue
-            if monster_type and monster_type.lower() != monster.monster_type.value.lower():
-                continue
-
-            results.append(self._monster_to_dict(monster))
-
-        total = len(results)
-        limited = results[:limit]
-        return QueryResult(
-            query_type="monsters",
-            data=limited,
-            total_count=total,
-            has_more=total > limit,
-            summary=f"Found {total} monsters matching criteria",
+        """Search monsters with filters; a query is ranked by relevance."""
+        monsters = Query(
+            get_catalog().monsters,
+            self.search_records("monsters", query) if query else None,
         )
+        monsters.between("cr", cr_min, cr_max).where("type", monster_type or None)
+        return self._page_result("monsters", monsters.page(offset, limit, self._monster_to_dict))
 
-    def get_monsters_for_encounter(self, party_level: int, party_size: int = 4) -> QueryResult:
-        """Get monsters suitable for an encounter based on party level."""
-        self._load_monsters()
-
+    def get_monsters_for_encounter(
+        self,
+        party_level: int,
+        party_size: int = 4,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> QueryResult:
+        """Get monsters suitable for an encounter based on party level, lowest CR first."""
         # Simple CR recommendation: party level / 4 to party level for challenging fights
         min_cr = max(0, party_level / 4 - 1)
         max_cr = party_level + 2
 
-        suitable = []
-        for monster in self._monsters:
-            cr = monster.cr_numeric
-            if min_cr <= cr <= max_cr:
-                suitable.append(self._monster_to_dict(monster))
-
-        suitable.sort(key=lambda m: m["cr_numeric"])
+        # The CR range index is already sorted by CR
+        page = (
+            Query(get_catalog().monsters)
+            .between("cr", min_cr, max_cr)
+            .order_by("cr")
+            .page(offset, limit, self._monster_to_dict)
+        )
         return QueryResult(
             query_type="encounter_monsters",
-            data=suitable,
-            total_count=len(suitable),
-            has_more=False,
-            summary=f"{len(suitable)} monsters suitable for a level {party_level} party (CR {min_cr:.1f}-{max_cr:.1f})",
+            data=page.items,
+            total_count=page.total,
+            has_more=page.has_more,
+            summary=f"{page.total} monsters suitable for a level {party_level} party (CR {min_cr:.1f}-{max_cr:.1f})",
+            offset=page.offset,
         )
 
     def _monster_to_dict(self, monster) -> dict:
@@ -260,32 +495,20 @@ class SemanticLayer:
         item_type: Optional[str] = None,
         requires_attunement: Optional[bool] = None,
         limit: int = 10,
+        offset: int = 0,
     ) -> QueryResult:
-        """Search magic items with filters."""
-        self._load_items()
-        results = []
-
-        for item in self._items["magic"]:
-            if query and query.lower() not in item.name.lower():
-                continue
-            if rarity and rarity.lower() != item.rarity.lower():
-                continue
-            if item_type and item_type.lower() not in item.item_type.lower():
-                continue
-            if requires_attunement is not None and item.requires_attunement != requires_attunement:
-                continue
-
-            results.append(self._magic_item_to_dict(item))
-
-        total = len(results)
-        limited = results[:limit]
-        return QueryResult(
-            query_type="magic_items",
-            data=limited,
-            total_count=total,
-            has_more=total > limit,
-            summary=f"Found {total} magic items matching criteria",
+        """Search magic items with filters; a query is ranked by relevance."""
+        items = Query(
+            get_catalog().magic_items,
+            self.search_records("magic_items", query) if query else None,
         )
+        # Rarities are stored as e.g. "very_rare"
+        items.where("rarity", rarity.replace(" ", "_") if rarity else None)
+        if item_type:
+            items.filter(lambda i: item_type.lower() in i.item_type.lower())
+        if requires_attunement is not None:
+            items.filter(lambda i: i.requires_attunement == requires_attunement)
+        return self._page_result("magic_items", items.page(offset, limit, self._magic_item_to_dict))
 
     def _magic_item_to_dict(self, item) -> dict:
         return {
@@ -378,32 +601,14 @@ class SemanticLayer:
         category: Optional[str] = None,
         has_prerequisites: Optional[bool] = None,
         limit: int = 10,
+        offset: int = 0,
     ) -> QueryResult:
-        """Search feats with filters."""
-        self._load_feats()
-        results = []
-
-        for feat in self._feats:
-            if query and query.lower() not in feat.name.lower():
-                continue
-            if category and feat.category.lower() != category.lower():
-                continue
-            if has_prerequisites is not None:
-                has_prereq = bool(feat.prerequisites)
-                if has_prereq != has_prerequisites:
-                    continue
-
-            results.append(self._feat_to_dict(feat))
-
-        total = len(results)
-        limited = results[:limit]
-        return QueryResult(
-            query_type="feats",
-            data=limited,
-            total_count=total,
-            has_more=total > limit,
-            summary=f"Found {total} feats matching criteria",
-        )
+        """Search feats with filters; a query is ranked by relevance."""
+        feats = Query(get_catalog().feats, self.search_records("feats", query) if query else None)
+        feats.where("category", category or None)
+        if has_prerequisites is not None:
+            feats.filter(lambda f: bool(f.prerequisites) == has_prerequisites)
+        return self._page_result("feats", feats.page(offset, limit, self._feat_to_dict))
 
     def _feat_to_dict(self, feat) -> dict:
         return {
@@ -476,38 +681,34 @@ class SemanticLayer:
 
     # Data summary for AI context
     def get_data_summary(self) -> str:
-        """Get a summary of available data for AI context."""
-        self._load_spells()
-        self._load_monsters()
-        self._load_items()
-        self._load_classes()
-        self._load_species()
-        self._load_feats()
-        self._load_subclasses()
+        """Get a summary of available data for AI context.
 
-        spell_levels = {}
-        for spell in self._spells:
-            level = spell.level
-            spell_levels[level] = spell_levels.get(level, 0) + 1
+        Counts come from the precompiled SRD snapshot, so building a prompt
+        does not import every data module.
+        """
+        from dnd_manager.data.snapshot import get_snapshot
 
-        monster_crs = {}
-        for monster in self._monsters:
-            cr = monster.challenge_rating
-            monster_crs[cr] = monster_crs.get(cr, 0) + 1
+        data = get_snapshot()
+        spells = data["spells"]
+        monsters = data["monsters"]
+        magic_items = data["magic_items"]
 
-        item_rarities = {}
-        for item in self._items["magic"]:
-            rarity = item.rarity
-            item_rarities[rarity] = item_rarities.get(rarity, 0) + 1
+        spell_levels = Counter(spell["level"] for spell in spells)
+        monster_crs = Counter(monster["challenge_rating"] for monster in monsters)
+        item_rarities = Counter(item["rarity"] for item in magic_items)
+
+        def cr_value(cr: str) -> float:
+            num, _, denom = cr.partition("/")
+            return float(num) / float(denom) if denom else float(num)
 
         summary = f"""Game Data Available:
-- Spells: {len(self._spells)} total ({', '.join(f'L{k}: {v}' for k, v in sorted(spell_levels.items()))})
-- Monsters: {len(self._monsters)} total (CR range: {', '.join(f'{k}: {v}' for k, v in sorted(monster_crs.items(), key=lambda x: float(x[0].replace('/', '.')) if '/' in x[0] else float(x[0])))})
-- Magic Items: {len(self._items['magic'])} total ({', '.join(f'{k}: {v}' for k, v in item_rarities.items())})
-- Classes: {len(self._classes)} ({', '.join(c.name for c in self._classes)})
-- Subclasses: {len(self._subclasses)} total
-- Species: {len(self._species)} ({', '.join(s.name for s in self._species)})
-- Feats: {len(self._feats)} total"""
+- Spells: {len(spells)} total ({', '.join(f'L{k}: {v}' for k, v in sorted(spell_levels.items()))})
+- Monsters: {len(monsters)} total (CR range: {', '.join(f'{k}: {v}' for k, v in sorted(monster_crs.items(), key=lambda x: cr_value(x[0])))})
+- Magic Items: {len(magic_items)} total ({', '.join(f'{k}: {v}' for k, v in item_rarities.items())})
+- Classes: {len(data["classes"])} ({', '.join(c["name"] for c in data["classes"])})
+- Subclasses: {len(data["subclasses"])} total
+- Species: {len(data["species"])} ({', '.join(s["key"] for s in data["species"])})
+- Feats: {len(data["feats"])} total"""
 
         return summary
 
@@ -12,6 +12,8 @@ from dnd_manager.ai.tools.registry import (
 from dnd_manager.ai.tools.executor import (
     ToolExecutor,
     ToolExecutionResult,
+    ToolRequest,
+    ToolScheduler,
 )
 from dnd_manager.ai.tools.session import (
     ToolSession,
@@ -28,6 +30,8 @@ __all__ = [
     # Executor
     "ToolExecutor",
     "ToolExecutionResult",
+    "ToolRequest",
+    "ToolScheduler",
     # Session
     "ToolSession",
 ]
@@ -23,13 +23,13 @@ LOOKUP_SPELL = ToolDefinition(
 
 SEARCH_SPELLS = ToolDefinition(
     name="search_spells",
-    description="Search for spells by level, school, class availability, or other criteria. Use this to find spells that match specific requirements.",
+    description="Search for spells by level, school, class availability, material component cost, or other criteria. Use this to find spells that match specific requirements.",
     input_schema={
         "type": "object",
         "properties": {
             "query": {
                 "type": "string",
-                "description": "Text to search for in spell names",
+                "description": "Words to search for in spell names and descriptions (partial words match; results are ranked by relevance)",
             },
             "level": {
                 "type": "integer",
@@ -51,10 +51,22 @@ SEARCH_SPELLS = ToolDefinition(
                 "type": "boolean",
                 "description": "Whether the spell can be cast as a ritual",
             },
+            "min_cost": {
+                "type": "integer",
+                "description": "Minimum gold piece cost of the spell's material component. Setting min_cost or max_cost returns only spells with a priced component, cheapest first",
+            },
+            "max_cost": {
+                "type": "integer",
+                "description": "Maximum gold piece cost of the spell's material component",
+            },
             "limit": {
                 "type": "integer",
                 "description": "Maximum number of results to return (default 10)",
             },
+            "offset": {
+                "type": "integer",
+                "description": "Number of results to skip, for fetching the next page when has_more is true (default 0)",
+            },
         },
         "required": [],
     },
@@ -181,7 +193,7 @@ SEARCH_FEATS = ToolDefinition(
         "properties": {
             "query": {
                 "type": "string",
-                "description": "Text to search for in feat names",
+                "description": "Words to search for in feat names and descriptions (partial words match; results are ranked by relevance)",
             },
             "category": {
                 "type": "string",
@@ -195,6 +207,10 @@ SEARCH_FEATS = ToolDefinition(
                 "type": "integer",
                 "description": "Maximum number of results to return (default 10)",
             },
+            "offset": {
+                "type": "integer",
+                "description": "Number of results to skip, for fetching the next page when has_more is true (default 0)",
+            },
         },
         "required": [],
     },
@@ -230,7 +246,7 @@ SEARCH_MAGIC_ITEMS = ToolDefinition(
         "properties": {
             "query": {
                 "type": "string",
-                "description": "Text to search for in item names",
+                "description": "Words to search for in item names, types and descriptions (partial words match; results are ranked by relevance)",
             },
             "rarity": {
                 "type": "string",
@@ -248,6 +264,10 @@ SEARCH_MAGIC_ITEMS = ToolDefinition(
                 "type": "integer",
                 "description": "Maximum number of results to return (default 10)",
             },
+            "offset": {
+                "type": "integer",
+                "description": "Number of results to skip, for fetching the next page when has_more is true (default 0)",
+            },
         },
         "required": [],
     },
@@ -283,7 +303,7 @@ SEARCH_MONSTERS = ToolDefinition(
         "properties": {
             "query": {
                 "type": "string",
-                "description": "Text to search for in monster names",
+                "description": "Words to search for in monster names, types and descriptions (partial words match; results are ranked by relevance)",
             },
             "cr_min": {
                 "type": "number",
@@ -301,6 +321,10 @@ SEARCH_MONSTERS = ToolDefinition(
                 "type": "integer",
                 "description": "Maximum number of results to return (default 10)",
             },
+            "offset": {
+                "type": "integer",
+                "description": "Number of results to skip, for fetching the next page when has_more is true (default 0)",
+            },
         },
         "required": [],
     },
@@ -331,6 +355,37 @@ GET_ENCOUNTER_MONSTERS = ToolDefinition(
     requires_character=False,
 )
 
+# Full-text search
+SEARCH_SRD = ToolDefinition(
+    name="search_srd",
+    description="Ranked full-text search across spells, monsters, feats, magic items and subclasses at once. Use this when you don't know which kind of entry answers a question, e.g. which options mention 'bonus action' healing. Returns names with matching description snippets; follow up with the lookup tools for full details.",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Words to search for (partial words match). Put exact phrases in double quotes, e.g. \"bonus action\" heal",
+            },
+            "collections": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": ["spells", "monsters", "feats", "magic_items", "subclasses"],
+                },
+                "description": "Limit the search to these kinds of entries (default: all)",
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of results to return (default 10)",
+            },
+        },
+        "required": ["query"],
+    },
+    category=ToolCategory.QUERY,
+    risk_level=ToolRiskLevel.SAFE,
+    requires_character=False,
+)
+
 # All ruleset tools
 RULESET_TOOLS = [
     # Spells
@@ -353,4 +408,6 @@ RULESET_TOOLS = [
     LOOKUP_MONSTER,
     SEARCH_MONSTERS,
     GET_ENCOUNTER_MONSTERS,
+    # Full-text search
+    SEARCH_SRD,
 ]
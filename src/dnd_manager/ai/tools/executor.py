@@ -1,12 +1,15 @@
 """Tool executor with validation and safety checks."""
 
+import asyncio
+import inspect
 import json
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Callable, Optional
+from functools import lru_cache
+from typing import Any, Callable, Optional, Sequence
 
 from dnd_manager.models.character import Character
-from dnd_manager.ai.tools.schema import ToolDefinition, ToolRiskLevel
+from dnd_manager.ai.tools.schema import ToolCategory, ToolDefinition, ToolRiskLevel
 from dnd_manager.ai.tools.registry import get_tool_registry
 
 logger = logging.getLogger(__name__)
@@ -78,6 +81,21 @@ class ToolExecutionResult:
         )
 
 
+@dataclass
+class ToolRequest:
+    """One tool call requested by the AI."""
+    tool_name: str
+    tool_input: dict[str, Any]
+    tool_use_id: str
+
+
+@lru_cache(maxsize=None)
+def _takes_character(handler: Callable) -> bool:
+    """Whether a handler's first parameter is the character (possibly None)."""
+    params = list(inspect.signature(handler).parameters)
+    return bool(params) and params[0] == "character"
+
+
 class ToolExecutor:
     """Executes tools with validation and safety checks.
 
@@ -86,6 +104,7 @@ class ToolExecutor:
     - Safety confirmation for destructive operations
     - Handler invocation with character context
     - Error handling and logging
+    - Running batches of calls, with read-only tools concurrently
     """
 
     def __init__(
@@ -146,6 +165,42 @@ class ToolExecutor:
         # Execute the tool
         return await self._execute_handler(tool, tool_input)
 
+    def is_read_only(self, tool_name: str) -> bool:
+        """Whether a tool only reads data (safe query tools).
+
+        Read-only tools may run concurrently with each other.
+        """
+        tool = self._registry.get_tool(tool_name)
+        return (
+            tool is not None
+            and tool.category == ToolCategory.QUERY
+            and tool.risk_level == ToolRiskLevel.SAFE
+        )
+
+    async def execute_batch(
+        self,
+        requests: Sequence[ToolRequest],
+        concurrent: bool = True,
+    ) -> list[ToolExecutionResult]:
+        """Execute the tool calls of one AI turn.
+
+        With ``concurrent``, each run of consecutive read-only calls executes
+        concurrently. Any other call is a barrier: it starts after every
+        earlier call has finished and completes before later ones start, so
+        character changes keep their order and reads after a change see it.
+
+        Args:
+            requests: Tool calls in the order the AI made them
+            concurrent: Run read-only calls concurrently
+
+        Returns:
+            One result per request, in request order
+        """
+        scheduler = ToolScheduler(self, concurrent=concurrent)
+        for request in requests:
+            scheduler.submit(request)
+        return await scheduler.results()
+
     async def _handle_confirmation(
         self,
         tool: ToolDefinition,
@@ -224,14 +279,26 @@ class ToolExecutor:
             )
 
         try:
-            # Execute handler - only pass character if tool requires it
-            if tool.requires_character and self.character:
-                result = await handler(self.character, **tool_input)
+            # Pass the character if the tool requires it; lookup handlers
+            # take an optional character as their first argument
+            if (tool.requires_character and self.character) or _takes_character(handler):
+                args: tuple = (self.character,)
+            else:
+                args = ()
+            if inspect.iscoroutinefunction(handler):
+                result = await handler(*args, **tool_input)
+            elif self.is_read_only(tool.name):
+                # Read-only lookups run in a worker thread so concurrent
+                # calls don't block the event loop
+                result = await asyncio.to_thread(handler, *args, **tool_input)
             else:
-                result = await handler(**tool_input)
+                # Mutating handlers stay on the loop thread, which is the
+                # only one allowed to touch the shared character
+                result = handler(*args, **tool_input)
+            # Lookup handlers return their payload directly
             return ToolExecutionResult(
                 success=True,
-                result=result.get("data"),
+                result=result.get("data") if "data" in result else result,
                 changes_made=result.get("changes", []),
             )
         except Exception as e:
@@ -287,3 +354,53 @@ class ToolExecutor:
         count = len(self._pending_confirmations)
         self._pending_confirmations.clear()
         return count
+
+
+class ToolScheduler:
+    """Starts tool calls as they arrive, ordered like execute_batch.
+
+    Used while a response is still streaming: each tool_use block is
+    submitted once its input is complete. A read-only call starts as soon
+    as the last earlier non-read-only call has finished; any other call
+    waits for every earlier call.
+    """
+
+    def __init__(self, executor: ToolExecutor, concurrent: bool = True) -> None:
+        self._executor = executor
+        self._concurrent = concurrent
+        self._tasks: list[asyncio.Task] = []
+        self._barrier: Optional[asyncio.Task] = None
+
+    def submit(self, request: ToolRequest) -> asyncio.Task:
+        """Schedule a call; the task's result is its ToolExecutionResult."""
+        read_only = self._concurrent and self._executor.is_read_only(request.tool_name)
+        if read_only:
+            waits = [self._barrier] if self._barrier is not None else []
+        else:
+            waits = list(self._tasks)
+
+        async def run() -> ToolExecutionResult:
+            if waits:
+                await asyncio.wait(waits)
+            return await self._executor.execute(
+                request.tool_name, request.tool_input, request.tool_use_id
+            )
+
+        task = asyncio.create_task(run())
+        self._tasks.append(task)
+        if not read_only:
+            self._barrier = task
+        return task
+
+    async def results(self) -> list[ToolExecutionResult]:
+        """Wait for every submitted call; results in submission order."""
+        return list(await asyncio.gather(*self._tasks))
+
+    async def drain(self) -> list[ToolExecutionResult]:
+        """Wait for submitted calls to finish; results of those that didn't fail."""
+        if self._tasks:
+            await asyncio.wait(self._tasks)
+        return [
+            task.result() for task in self._tasks
+            if not task.cancelled() and task.exception() is None
+        ]
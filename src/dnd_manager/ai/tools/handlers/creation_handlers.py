@@ -1114,12 +1114,12 @@ async def finalize_character(
     if session.armor_proficiencies:
         char.proficiencies.armor = session.armor_proficiencies.copy()
     elif (class_info := get_class_info(session.class_name)):
-        char.proficiencies.armor = class_info.armor_proficiencies.copy()
+        char.proficiencies.armor = list(class_info.armor_proficiencies)
 
     if session.weapon_proficiencies:
         char.proficiencies.weapons = session.weapon_proficiencies.copy()
     elif (class_info := get_class_info(session.class_name)):
-        char.proficiencies.weapons = class_info.weapon_proficiencies.copy()
+        char.proficiencies.weapons = list(class_info.weapon_proficiencies)
 
     if session.tool_proficiencies:
         char.proficiencies.tools = session.tool_proficiencies.copy()
@@ -4,7 +4,16 @@ import json
 from typing import Any, Optional
 
 from dnd_manager.models.character import Character
-from dnd_manager.ai.semantic import get_semantic_layer
+from dnd_manager.ai.semantic import NameLookup, get_semantic_layer
+
+
+def _found(key: str, name: str, result: NameLookup) -> dict[str, Any]:
+    """Response for a successful lookup, flagging fuzzy matches."""
+    response: dict[str, Any] = {"found": True, key: result.data}
+    if not result.exact:
+        response["matched_name"] = result.name
+        response["note"] = f"No entry is named '{name}'; showing the closest match, '{result.name}'."
+    return response
 
 
 def handle_lookup_spell(
@@ -13,15 +22,13 @@ def handle_lookup_spell(
 ) -> dict[str, Any]:
     """Look up a spell by name."""
     layer = get_semantic_layer()
-    result = layer.get_spell(name)
+    result = layer.lookup("spells", name)
 
-    if result:
-        return {
-            "found": True,
-            "spell": result,
-        }
+    if result.data:
+        return _found("spell", name, result)
     return {
         "found": False,
+        "suggestions": result.suggestions,
         "error": f"Spell '{name}' not found. Check the spelling or use search_spells to find similar spells.",
     }
 
@@ -34,7 +41,10 @@ def handle_search_spells(
     class_name: Optional[str] = None,
     concentration: Optional[bool] = None,
     ritual: Optional[bool] = None,
+    min_cost: Optional[int] = None,
+    max_cost: Optional[int] = None,
     limit: int = 10,
+    offset: int = 0,
 ) -> dict[str, Any]:
     """Search for spells with filters."""
     layer = get_semantic_layer()
@@ -45,12 +55,16 @@ def handle_search_spells(
         class_name=class_name,
         concentration=concentration,
         ritual=ritual,
+        min_cost=min_cost,
+        max_cost=max_cost,
         limit=limit,
+        offset=offset,
     )
 
     return {
         "spells": result.data,
         "total_count": result.total_count,
+        "offset": result.offset,
         "has_more": result.has_more,
         "summary": result.summary,
     }
@@ -88,15 +102,13 @@ def handle_lookup_class(
 ) -> dict[str, Any]:
     """Look up a class by name."""
     layer = get_semantic_layer()
-    result = layer.get_class_info(name)
+    result = layer.lookup("classes", name)
 
-    if result:
-        return {
-            "found": True,
-            "class": result,
-        }
+    if result.data:
+        return _found("class", name, result)
     return {
         "found": False,
+        "suggestions": result.suggestions,
         "error": f"Class '{name}' not found. Available classes: Barbarian, Bard, Cleric, Druid, Fighter, Monk, Paladin, Ranger, Rogue, Sorcerer, Warlock, Wizard",
     }
 
@@ -123,15 +135,13 @@ def handle_lookup_species(
 ) -> dict[str, Any]:
     """Look up a species by name."""
     layer = get_semantic_layer()
-    result = layer.get_species(name)
+    result = layer.lookup("species", name)
 
-    if result:
-        return {
-            "found": True,
-            "species": result,
-        }
+    if result.data:
+        return _found("species", name, result)
     return {
         "found": False,
+        "suggestions": result.suggestions,
         "error": f"Species '{name}' not found. Use list_species to see available options.",
     }
 
@@ -156,15 +166,13 @@ def handle_lookup_feat(
 ) -> dict[str, Any]:
     """Look up a feat by name."""
     layer = get_semantic_layer()
-    result = layer.get_feat(name)
+    result = layer.lookup("feats", name)
 
-    if result:
-        return {
-            "found": True,
-            "feat": result,
-        }
+    if result.data:
+        return _found("feat", name, result)
     return {
         "found": False,
+        "suggestions": result.suggestions,
         "error": f"Feat '{name}' not found. Use search_feats to find similar feats.",
     }
 
@@ -175,6 +183,7 @@ def handle_search_feats(
     category: Optional[str] = None,
     has_prerequisites: Optional[bool] = None,
     limit: int = 10,
+    offset: int = 0,
 ) -> dict[str, Any]:
     """Search for feats with filters."""
     layer = get_semantic_layer()
@@ -183,11 +192,13 @@ def handle_search_feats(
         category=category,
         has_prerequisites=has_prerequisites,
         limit=limit,
+        offset=offset,
     )
 
     return {
         "feats": result.data,
         "total_count": result.total_count,
+        "offset": result.offset,
         "has_more": result.has_more,
         "summary": result.summary,
     }
@@ -199,15 +210,13 @@ def handle_lookup_magic_item(
 ) -> dict[str, Any]:
     """Look up a magic item by name."""
     layer = get_semantic_layer()
-    result = layer.get_magic_item(name)
+    result = layer.lookup("magic_items", name)
 
-    if result:
-        return {
-            "found": True,
-            "item": result,
-        }
+    if result.data:
+        return _found("item", name, result)
     return {
         "found": False,
+        "suggestions": result.suggestions,
         "error": f"Magic item '{name}' not found. Use search_magic_items to find similar items.",
     }
 
@@ -219,6 +228,7 @@ def handle_search_magic_items(
     item_type: Optional[str] = None,
     requires_attunement: Optional[bool] = None,
     limit: int = 10,
+    offset: int = 0,
 ) -> dict[str, Any]:
     """Search for magic items with filters."""
     layer = get_semantic_layer()
@@ -228,11 +238,13 @@ def handle_search_magic_items(
         item_type=item_type,
         requires_attunement=requires_attunement,
         limit=limit,
+        offset=offset,
     )
 
     return {
         "items": result.data,
         "total_count": result.total_count,
+        "offset": result.offset,
         "has_more": result.has_more,
         "summary": result.summary,
     }
@@ -244,15 +256,13 @@ def handle_lookup_monster(
 ) -> dict[str, Any]:
     """Look up a monster by name."""
     layer = get_semantic_layer()
-    result = layer.get_monster(name)
+    result = layer.lookup("monsters", name)
 
-    if result:
-        return {
-            "found": True,
-            "monster": result,
-        }
+    if result.data:
+        return _found("monster", name, result)
     return {
         "found": False,
+        "suggestions": result.suggestions,
         "error": f"Monster '{name}' not found. Use search_monsters to find similar monsters.",
     }
 
@@ -264,6 +274,7 @@ def handle_search_monsters(
     cr_max: Optional[float] = None,
     monster_type: Optional[str] = None,
     limit: int = 10,
+    offset: int = 0,
 ) -> dict[str, Any]:
     """Search for monsters with filters."""
     layer = get_semantic_layer()
@@ -273,11 +284,13 @@ def handle_search_monsters(
         cr_max=cr_max,
         monster_type=monster_type,
         limit=limit,
+        offset=offset,
     )
 
     return {
         "monsters": result.data,
         "total_count": result.total_count,
+        "offset": result.offset,
         "has_more": result.has_more,
         "summary": result.summary,
     }
@@ -309,6 +322,24 @@ def handle_get_encounter_monsters(
     }
 
 
+def handle_search_srd(
+    character: Optional[Character],
+    query: str,
+    collections: Optional[list[str]] = None,
+    limit: int = 10,
+) -> dict[str, Any]:
+    """Full-text search across the SRD content."""
+    layer = get_semantic_layer()
+    result = layer.full_text_search(query, collections=collections, limit=limit)
+
+    return {
+        "results": result.data,
+        "total_count": result.total_count,
+        "has_more": result.has_more,
+        "summary": result.summary,
+    }
+
+
 # Handler mapping
 RULESET_HANDLERS = {
     "lookup_spell": handle_lookup_spell,
@@ -325,4 +356,5 @@ RULESET_HANDLERS = {
     "lookup_monster": handle_lookup_monster,
     "search_monsters": handle_search_monsters,
     "get_encounter_monsters": handle_get_encounter_monsters,
+    "search_srd": handle_search_srd,
 }
@@ -118,6 +118,7 @@ class ToolRegistry:
         self.register(ruleset_tools.LOOKUP_MONSTER, ruleset_handlers.handle_lookup_monster)
         self.register(ruleset_tools.SEARCH_MONSTERS, ruleset_handlers.handle_search_monsters)
         self.register(ruleset_tools.GET_ENCOUNTER_MONSTERS, ruleset_handlers.handle_get_encounter_monsters)
+        self.register(ruleset_tools.SEARCH_SRD, ruleset_handlers.handle_search_srd)
 
         # Register character creation tools
         self.register(creation_tools.CREATE_CHARACTER, creation_handlers.create_character)
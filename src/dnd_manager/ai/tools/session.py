@@ -1,22 +1,34 @@
 """Tool session manager for AI conversations with function calling."""
 
+import logging
 from dataclasses import dataclass, field
-from typing import Any, Callable, Optional
+from typing import AsyncIterator, Callable, Optional
 
 from dnd_manager.models.character import Character
 from dnd_manager.storage import CharacterStore
+from dnd_manager.storage.autosave import AutosaveQueue
 from dnd_manager.ai.base import (
     AIProvider,
     AIMessage,
-    AIResponse,
     MessageRole,
+    StreamEvent,
+    StreamEventType,
+    TokenUsage,
     ToolChoice,
     ToolUseBlock,
     ToolResultBlock,
 )
 from dnd_manager.ai.context import build_system_prompt
+from dnd_manager.ai.history import CompactionReport, HistoryManager
 from dnd_manager.ai.tools.registry import get_tool_registry
-from dnd_manager.ai.tools.executor import ToolExecutor
+from dnd_manager.ai.tools.executor import (
+    ToolExecutionResult,
+    ToolExecutor,
+    ToolRequest,
+    ToolScheduler,
+)
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -32,6 +44,7 @@ class ToolSessionResult:
     """Result from a tool session run."""
     final_response: str
     tool_calls: list[ToolCall] = field(default_factory=list)
+    usage: TokenUsage = field(default_factory=TokenUsage)
 
 
 @dataclass
@@ -50,25 +63,47 @@ class ToolSession:
         character: Optional character to operate on
         character_name: Character name for reloading
         store: Character store for persistence
+        autosaver: Optional write-behind queue; when set, saves are queued
+            on it instead of written synchronously to ``store``
         mode: AI mode (assistant, dm, roleplay, etc.)
         auto_save: Whether to save after tool modifications
         max_tool_iterations: Maximum tool call loops (safety limit)
         system_prompt: Optional custom system prompt (overrides built-in)
         tools: Optional custom tool list (overrides registry)
+        parallel_tools: Run consecutive read-only tool calls of one turn
+            concurrently; calls that modify the character still run one at
+            a time, in order
+        compact_history: Keep the history within a token budget by
+            stubbing old tool results and dropping the oldest turns
+        history_budget: Token budget for the history (None for the
+            provider's default)
+        keep_recent_turns: Number of latest turns never compacted
     """
 
     provider: AIProvider
     character: Optional[Character] = None
     character_name: Optional[str] = None
     store: Optional[CharacterStore] = None
+    autosaver: Optional[AutosaveQueue] = None
     mode: str = "assistant"
     auto_save: bool = True
     max_tool_iterations: int = 10
     system_prompt: Optional[str] = None
     tools: Optional[list] = None
+    parallel_tools: bool = True
+    compact_history: bool = True
+    history_budget: Optional[int] = None
+    keep_recent_turns: int = 3
 
     # Internal state (initialized in __post_init__)
     messages: list[AIMessage] = field(default_factory=list, init=False)
+    # Token counts (incl. prompt cache reads/writes) for the session and
+    # for the last chat() call
+    usage: TokenUsage = field(default_factory=TokenUsage, init=False)
+    last_usage: TokenUsage = field(default_factory=TokenUsage, init=False)
+    # One report per compaction, oldest first
+    compactions: list[CompactionReport] = field(default_factory=list, init=False)
+    _history: HistoryManager = field(init=False)
     _executor: ToolExecutor = field(init=False)
     _registry: "ToolRegistry" = field(init=False)
     _initialized: bool = field(default=False, init=False)
@@ -81,6 +116,10 @@ class ToolSession:
             character=self.character,
             auto_confirm=False,
         )
+        if self.history_budget is not None:
+            self._history = HistoryManager(self.history_budget, self.keep_recent_turns)
+        else:
+            self._history = HistoryManager.for_provider(self.provider.name, self.keep_recent_turns)
 
     def _ensure_initialized(self) -> None:
         """Ensure system prompt is set up."""
@@ -147,11 +186,7 @@ IMPORTANT:
             content=user_message,
         ))
 
-        # Get tool definitions - use custom tools if provided
-        if self.tools:
-            tools = [t.to_anthropic_format() for t in self.tools if hasattr(t, 'to_anthropic_format')]
-        else:
-            tools = self._registry.get_anthropic_tool_definitions()
+        tools = self._tool_definitions()
 
         # Determine tool choice - force tools on first iteration if required
         tool_choice = ToolChoice.ANY if require_tools else ToolChoice.AUTO
@@ -160,12 +195,15 @@ IMPORTANT:
         iterations = 0
         final_response = ""
         self._last_tool_calls = []  # Reset tool call tracking
+        self.last_usage = TokenUsage()
         character_modified = False  # Track across all iterations
 
         try:
             while iterations < self.max_tool_iterations:
                 iterations += 1
 
+                self._compact_history()
+
                 # Call AI with tools
                 response = await self.provider.chat_with_tools(
                     messages=self.messages,
@@ -173,6 +211,9 @@ IMPORTANT:
                     tool_choice=tool_choice,
                 )
 
+                self.usage.add(response)
+                self.last_usage.add(response)
+
                 # After first iteration, switch back to AUTO
                 tool_choice = ToolChoice.AUTO
 
@@ -198,44 +239,161 @@ IMPORTANT:
                     content=response.tool_use,  # List of ToolUseBlocks
                 ))
 
-                # Execute tools and collect results
-                tool_results = []
-
-                for tool_use in response.tool_use:
-                    result = await self._executor.execute(
-                        tool_name=tool_use.name,
-                        tool_input=tool_use.input,
-                        tool_use_id=tool_use.id,
-                    )
-
-                    # Track tool call with result
-                    self._last_tool_calls.append(ToolCall(
-                        name=tool_use.name,
-                        input=tool_use.input,
-                        result=result.to_dict() if hasattr(result, 'to_dict') else {"status": "success" if result.success else "error"},
-                    ))
+                # Execute tools and collect results (in tool_use order)
+                results = await self._executor.execute_batch(
+                    [ToolRequest(t.name, t.input, t.id) for t in response.tool_use],
+                    concurrent=self.parallel_tools,
+                )
+                if self._record_tool_results(response.tool_use, results):
+                    character_modified = True
 
-                    tool_results.append(ToolResultBlock(
-                        tool_use_id=tool_use.id,
-                        content=result.to_json(),
-                        is_error=not result.success,
-                    ))
+        finally:
+            # Always save character if modified, even on exception
+            if character_modified and self.auto_save:
+                self._save_character()
 
-                    if result.success and result.changes_made:
+        return final_response
+
+    async def stream(
+        self,
+        user_message: str,
+        require_tools: bool = False,
+    ) -> AsyncIterator[StreamEvent]:
+        """Streaming version of chat().
+
+        Yields the provider's TEXT and TOOL_USE events as they arrive and a
+        DONE event at the end of each model turn. Each tool starts running
+        as soon as its tool_use block is complete, while the model is still
+        generating (ordered as in chat(): read-only tools concurrently,
+        others one at a time). After a turn, a TOOL_RESULT event follows for
+        every tool call, in tool_use order.
+
+        Args:
+            user_message: The user's input
+            require_tools: If True, force the AI to use at least one tool
+
+        Yields:
+            StreamEvent objects
+        """
+        self._ensure_initialized()
+
+        self.messages.append(AIMessage(
+            role=MessageRole.USER,
+            content=user_message,
+        ))
+
+        tools = self._tool_definitions()
+        tool_choice = ToolChoice.ANY if require_tools else ToolChoice.AUTO
+        self._last_tool_calls = []
+        self.last_usage = TokenUsage()
+        character_modified = False
+
+        try:
+            for _ in range(self.max_tool_iterations):
+                scheduler = ToolScheduler(self._executor, concurrent=self.parallel_tools)
+                tool_uses = []
+                response = None
+                self._compact_history()
+                try:
+                    async for event in self.provider.chat_with_tools_stream(
+                        messages=self.messages,
+                        tools=tools,
+                        tool_choice=tool_choice,
+                    ):
+                        if event.type == StreamEventType.TOOL_USE:
+                            tool_uses.append(event.tool_use)
+                            scheduler.submit(ToolRequest(
+                                event.tool_use.name, event.tool_use.input, event.tool_use.id,
+                            ))
+                        elif event.type == StreamEventType.DONE:
+                            response = event.response
+                        yield event
+                except BaseException:
+                    # Tools already started still run; keep their changes
+                    if any(r.success and r.changes_made for r in await scheduler.drain()):
                         character_modified = True
+                    raise
+
+                tool_choice = ToolChoice.AUTO
+                if response is not None:
+                    self.usage.add(response)
+                    self.last_usage.add(response)
+
+                if not tool_uses:
+                    self.messages.append(AIMessage(
+                        role=MessageRole.ASSISTANT,
+                        content=response.content if response else "",
+                    ))
+                    break
 
-                # Add tool results message
                 self.messages.append(AIMessage(
-                    role=MessageRole.TOOL_RESULT,
-                    content=tool_results,
+                    role=MessageRole.ASSISTANT,
+                    content=tool_uses,
                 ))
+                results = await scheduler.results()
+                if self._record_tool_results(tool_uses, results):
+                    character_modified = True
+                for tool_use, result in zip(tool_uses, results, strict=True):
+                    yield StreamEvent(StreamEventType.TOOL_RESULT, tool_use=tool_use, result=result)
 
         finally:
-            # Always save character if modified, even on exception
             if character_modified and self.auto_save:
                 self._save_character()
 
-        return final_response
+    def _compact_history(self) -> None:
+        """Compact the message history if it is over the token budget."""
+        if not self.compact_history:
+            return
+        self.messages, report = self._history.compact(self.messages)
+        if report is not None:
+            self.compactions.append(report)
+            logger.info(
+                "Compacted history: %d -> %d tokens (saved %d)",
+                report.tokens_before, report.tokens_after, report.tokens_saved,
+            )
+
+    def _tool_definitions(self) -> list[dict]:
+        """Tool definitions to send - custom tools if provided."""
+        if self.tools:
+            return [t.to_anthropic_format() for t in self.tools if hasattr(t, 'to_anthropic_format')]
+        return self._registry.get_anthropic_tool_definitions()
+
+    def _record_tool_results(
+        self,
+        tool_uses: list[ToolUseBlock],
+        results: list[ToolExecutionResult],
+    ) -> bool:
+        """Track tool calls and add their results to the conversation.
+
+        Returns:
+            Whether any tool changed the character
+        """
+        tool_results = []
+        character_modified = False
+
+        for tool_use, result in zip(tool_uses, results, strict=True):
+            # Track tool call with result
+            self._last_tool_calls.append(ToolCall(
+                name=tool_use.name,
+                input=tool_use.input,
+                result=result.to_dict() if hasattr(result, 'to_dict') else {"status": "success" if result.success else "error"},
+            ))
+
+            tool_results.append(ToolResultBlock(
+                tool_use_id=tool_use.id,
+                content=result.to_json(),
+                is_error=not result.success,
+            ))
+
+            if result.success and result.changes_made:
+                character_modified = True
+
+        # Add tool results message
+        self.messages.append(AIMessage(
+            role=MessageRole.TOOL_RESULT,
+            content=tool_results,
+        ))
+        return character_modified
 
     async def run(
         self,
@@ -254,7 +412,7 @@ IMPORTANT:
             require_tools: If True, force the AI to use at least one tool
 
         Returns:
-            ToolSessionResult with final_response and tool_calls
+            ToolSessionResult with final_response, tool_calls and token usage
         """
         final_response = await self.chat(
             user_message=user_message,
@@ -263,16 +421,28 @@ IMPORTANT:
         )
         return ToolSessionResult(
             final_response=final_response,
-            tool_calls=self._last_tool_calls.copy(),
+            tool_calls=self.last_tool_calls,
+            usage=self.last_usage,
         )
 
+    @property
+    def last_tool_calls(self) -> list[ToolCall]:
+        """Tool calls made by the last chat() or stream() call."""
+        return self._last_tool_calls.copy()
+
     def _save_character(self) -> None:
         """Save character state to storage."""
-        if self.store and self.character:
+        if not self.character:
+            return
+        if self.autosaver:
+            self.autosaver.schedule(self.character)
+        elif self.store:
             self.store.save(self.character)
 
     def refresh_character(self) -> None:
         """Reload character from storage."""
+        if self.autosaver:
+            self.autosaver.flush()
         if self.store and self.character_name:
             loaded = self.store.load(self.character_name)
             if loaded is not None:
@@ -1,6 +1,7 @@
 """Main Textual application for D&D Character Manager."""
 
 import asyncio
+from contextlib import contextmanager
 from datetime import date
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Optional
@@ -21,6 +22,7 @@ from rich.text import Text
 from dnd_manager.config import Config, get_config_manager
 from dnd_manager.models.character import Character, RulesetId, Feature, Alignment
 from dnd_manager.storage import CharacterStore
+from dnd_manager.storage.autosave import AutosaveQueue
 from dnd_manager.data import (
     get_all_species_names,
     get_species,
@@ -162,6 +164,12 @@ class DNDManagerApp(App):
         super().__init__(**kwargs)
         self.config = Config.load()
         self.store = CharacterStore(self.config.get_character_directory())
+        self.autosave = AutosaveQueue(
+            self.store,
+            interval=self.config.storage.autosave_interval,
+            on_error=self._on_autosave_error,
+        )
+        self.autosave.recover()
         self.current_character: Optional[Character] = None
         self.character_path = character_path
 
@@ -183,6 +191,7 @@ class DNDManagerApp(App):
 
     def action_open_character(self, return_to_dashboard: bool = False) -> None:
         """Open character selection screen."""
+        self.autosave.flush()
         char_info = self.store.get_character_info()
         if not char_info:
             self.notify("No characters found. Create one first!", severity="warning")
@@ -192,6 +201,7 @@ class DNDManagerApp(App):
 
     def load_character(self, path: Path) -> None:
         """Load a character from a path and switch to dashboard."""
+        self.autosave.flush()
         char = self.store.load_path(path)
         if char:
             self.current_character = char
@@ -203,9 +213,39 @@ class DNDManagerApp(App):
             self.notify("Failed to load character", severity="error")
 
     def save_character(self) -> None:
-        """Save the current character."""
+        """Queue a save of the current character.
+
+        Writes happen on the autosave worker thread; rapid successive calls
+        are coalesced into a single disk write.
+        """
         if self.current_character:
-            self.store.save(self.current_character)
+            self.autosave.schedule(self.current_character)
+
+    def delete_character(self, name: str) -> bool:
+        """Delete a character, dropping any queued autosave for it."""
+        self.autosave.discard(name)
+        return self.store.delete(name)
+
+    def _on_autosave_error(self, name: str, error: Exception) -> None:
+        """Report a failed background save (called from the worker thread)."""
+        try:
+            self.call_from_thread(
+                self.notify, f"Failed to save {name}: {error}", severity="error"
+            )
+        except RuntimeError:
+            # App isn't running (startup/shutdown) - already logged
+            pass
+
+    @contextmanager
+    def suspend(self):
+        """Suspend the app, flushing pending saves first (e.g. before $EDITOR)."""
+        self.autosave.flush()
+        with super().suspend():
+            yield
+
+    def on_unmount(self) -> None:
+        """Write any pending saves before the app exits."""
+        self.autosave.close()
 
     def action_ai_overlay(self) -> None:
         """Open the AI assistant overlay with context from current screen."""
@@ -240,4 +280,7 @@ class DNDManagerApp(App):
 def run_app(character_path: Optional[Path] = None) -> None:
     """Run the D&D Character Manager application."""
     app = DNDManagerApp(character_path=character_path)
-    app.run()
+    try:
+        app.run()
+    finally:
+        app.autosave.close()
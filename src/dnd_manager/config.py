@@ -8,11 +8,10 @@ import logging
 import os
 import threading
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from platformdirs import user_config_dir, user_data_dir
-import yaml
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +82,10 @@ class StorageConfig(BaseModel):
 
     max_backups: int = Field(default=3, description="Maximum backup files to keep per character")
     backup_dir_name: str = Field(default=".backups", description="Name of backup subdirectory")
+    autosave_interval: float = Field(
+        default=1.0, ge=0.0, le=60.0,
+        description="Seconds to coalesce autosaves of the current character",
+    )
 
 
 def _get_app_version() -> str:
@@ -113,9 +116,13 @@ class AIProviderConfig(BaseModel):
 class GeminiConfig(BaseModel):
     """Gemini-specific configuration."""
 
+    model_config = ConfigDict(validate_assignment=True)
+
     enabled: bool = True
     api_key: Optional[str] = None
     auto_classify: bool = True  # Use intelligent routing
+    classifier: Literal["local", "remote", "hybrid"] = "hybrid"  # hybrid: local, remote when unsure
+    classifier_min_confidence: float = Field(default=0.5, ge=0.0, le=1.0)
     preferred_model: Optional[str] = None  # Override auto-routing
 
 
@@ -123,6 +130,10 @@ class AIConfig(BaseModel):
     """AI integration configuration."""
 
     default_provider: str = Field(default="gemini")
+    prompt_caching: bool = Field(
+        default=True,
+        description="Cache system prompts and tool definitions with the provider",
+    )
     gemini: GeminiConfig = Field(default_factory=GeminiConfig)
     anthropic: AIProviderConfig = Field(default_factory=AIProviderConfig)
     openai: AIProviderConfig = Field(default_factory=AIProviderConfig)
@@ -348,11 +359,13 @@ class Config(BaseModel):
 
         Automatically runs migrations if the config version is outdated.
         """
+        from dnd_manager.storage.serialization import load_yaml
+
         config_path = cls.get_config_path()
 
         if config_path.exists():
             with open(config_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+                data = load_yaml(f) or {}
 
             # Create backup BEFORE validation/migration in case something goes wrong
             import shutil
@@ -389,6 +402,8 @@ class Config(BaseModel):
         import shutil
         import tempfile
 
+        from dnd_manager.storage.serialization import YAMLError, dump_yaml
+
         config_path = self.get_config_path()
         data = self.model_dump(mode="json")
 
@@ -411,10 +426,10 @@ class Config(BaseModel):
             )
             try:
                 with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+                    dump_yaml(data, f, default_flow_style=False, sort_keys=False)
                 # Atomic rename
                 Path(temp_path).replace(config_path)
-            except (OSError, IOError, yaml.YAMLError):
+            except (OSError, IOError, YAMLError):
                 # Clean up temp file on error
                 try:
                     os.unlink(temp_path)
@@ -536,7 +551,12 @@ class ConfigManager:
                 except ValueError:
                     return False
 
-            setattr(obj, final_key, value)
+            try:
+                setattr(obj, final_key, value)
+            except ValueError as e:
+                # Models with validate_assignment reject invalid values
+                logger.warning(f"Invalid value for {key}: {e}")
+                return False
             self.save()
             return True
 
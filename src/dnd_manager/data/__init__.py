@@ -1,490 +1,312 @@
-"""Data module containing SRD content."""
+"""Data module containing SRD content.
 
-from dnd_manager.data.spells import (
-    Spell,
-    SpellVariant,
-    ALL_SPELLS,
-    CANTRIPS,
-    get_spells_by_level,
-    get_spells_by_class,
-    get_spell_by_name,
-    search_spells,
-    get_spell_for_ruleset,
-    get_spells_by_level_for_ruleset,
-    get_spells_by_class_for_ruleset,
-    get_spells_with_variants,
-    # Material component functions
-    get_spells_with_material_cost,
-    get_spells_with_consumed_materials,
-    get_spell_cost_summary,
-)
+The SRD modules build thousands of records when imported, and most commands
+never touch them. The names below are therefore resolved on first access
+(PEP 562 module ``__getattr__``): ``from dnd_manager.data import get_spell_by_name``
+imports ``dnd_manager.data.spells`` only at that point.
+"""
 
-from dnd_manager.data.items import (
-    Weapon,
-    Armor,
-    Equipment,
-    ArmorType,
-    WeaponProperty,
-    ALL_WEAPONS,
-    ARMOR,
-    ADVENTURING_GEAR,
-    TOOLS,
-    EQUIPMENT_PACKS,
-    get_weapon_by_name,
-    get_armor_by_name,
-    get_equipment_by_name,
-    search_items,
-)
+import importlib
+from typing import Any
 
-from dnd_manager.data.classes import (
-    ClassFeature,
-    ClassInfo,
-    CasterType,
-    ALL_CLASSES,
-    MULTICLASS_REQUIREMENTS,
-    MULTICLASS_ALT_REQUIREMENTS,
-    CLASS_CASTER_TYPES,
-    THIRD_CASTER_SUBCLASSES,
-    MULTICLASS_SPELL_SLOTS,
-    get_class_info,
-    get_features_at_level,
-    get_features_up_to_level,
-    get_features_for_ruleset,
-)
+# Submodule -> public names it provides
+_LAZY_IMPORTS: dict[str, tuple[str, ...]] = {
+    "spells": (
+        "Spell",
+        "SpellVariant",
+        "ALL_SPELLS",
+        "CANTRIPS",
+        "get_spells_by_level",
+        "get_spells_by_class",
+        "get_spell_by_name",
+        "search_spells",
+        "get_spell_for_ruleset",
+        "get_spells_by_level_for_ruleset",
+        "get_spells_by_class_for_ruleset",
+        "get_spells_with_variants",
+        # Material component functions
+        "MaterialComponent",
+        "parse_material_component",
+        "get_spells_with_material_cost",
+        "get_spells_by_material_cost",
+        "get_spells_with_consumed_materials",
+        "get_spell_cost_summary",
+    ),
+    "items": (
+        "Weapon",
+        "Armor",
+        "Equipment",
+        "ArmorType",
+        "WeaponProperty",
+        "ALL_WEAPONS",
+        "ARMOR",
+        "ADVENTURING_GEAR",
+        "TOOLS",
+        "EQUIPMENT_PACKS",
+        "get_weapon_by_name",
+        "get_armor_by_name",
+        "get_equipment_by_name",
+        "search_items",
+    ),
+    "classes": (
+        "ClassFeature",
+        "ClassInfo",
+        "CasterType",
+        "ALL_CLASSES",
+        "MULTICLASS_REQUIREMENTS",
+        "MULTICLASS_ALT_REQUIREMENTS",
+        "CLASS_CASTER_TYPES",
+        "THIRD_CASTER_SUBCLASSES",
+        "MULTICLASS_SPELL_SLOTS",
+        "get_class_info",
+        "get_features_at_level",
+        "get_features_up_to_level",
+        "get_features_for_ruleset",
+    ),
+    "backgrounds": (
+        "Background",
+        "BackgroundFeature",
+        "ALL_BACKGROUNDS",
+        "get_background",
+        "get_all_background_names",
+        "get_backgrounds_for_ruleset",
+        "search_backgrounds",
+        "validate_origin_feat",
+        "validate_all_origin_feats",
+        "get_origin_feat_for_background",
+    ),
+    "custom": (
+        "CustomSpell",
+        "CustomItem",
+        "CustomFeat",
+        "CustomContent",
+        "CustomContentStore",
+        "ContentValidator",
+        "ValidationWarning",
+        "get_custom_content_store",
+    ),
+    "prerequisites": (
+        "Prerequisite",
+        "AbilityRequirement",
+        "LevelRequirement",
+        "ProficiencyRequirement",
+        "SpellcastingRequirement",
+        "ClassRequirement",
+        "FeatRequirement",
+        "ProficiencyType",
+        # Builder functions
+        "ability_prereq",
+        "dual_ability_prereq",
+        "either_ability_prereq",
+        "level_prereq",
+        "proficiency_prereq",
+        "spellcasting_prereq",
+        "class_prereq",
+        "feat_prereq",
+        "combine_prereqs",
+        # Preset prerequisites
+        "MARTIAL_FEAT_STR",
+        "MARTIAL_FEAT_DEX",
+        "HEAVY_ARMOR_PREREQ",
+        "MEDIUM_ARMOR_PREREQ",
+        "SPELLCASTER_PREREQ",
+    ),
+    "balance": (
+        "BalanceGuidelines",
+        "BalanceGuidelinesManager",
+        "get_balance_guidelines",
+        "get_guidelines_manager",
+        "get_homebrew_prompt",
+    ),
+    "weapon_mastery": (
+        "WEAPON_MASTERY_BY_WEAPON",
+        "WEAPON_MASTERY_PROPERTIES",
+        "WEAPON_MASTERY_PROGRESSIONS",
+        "get_weapon_mastery_for_weapon",
+        "get_weapon_mastery_summary",
+        "get_weapon_mastery_limit_for_class",
+    ),
+    "library": (
+        "ContentType",
+        "ContentStatus",
+        "LibraryAuthor",
+        "ContentRating",
+        "LibraryContent",
+        "UserRating",
+        "HomebrewLibrary",
+        "get_homebrew_library",
+    ),
+    "species": (
+        "RacialTrait",
+        "Subspecies",
+        "Heritage",
+        "Species",
+        "ALL_SPECIES",
+        "DRACONIC_ANCESTRY",
+        "TOV_LINEAGES",
+        "TOV_HERITAGES",
+        "get_species",
+        "get_all_species_names",
+        "get_subraces",
+        "get_subspecies",
+        "search_species",
+        "get_species_for_ruleset",
+        "get_tov_lineages",
+        "get_tov_heritages",
+        # Level-gated trait functions
+        "get_trait_min_level",
+        "get_species_traits_at_level",
+        "get_subspecies_traits_at_level",
+        "get_all_traits_at_level",
+        # Species feat check
+        "species_grants_feat",
+    ),
+    "feats": (
+        "Feat",
+        "ORIGIN_FEATS",
+        "GENERAL_FEATS",
+        "GENERAL_FEATS_2014",
+        "GENERAL_FEATS_2024",
+        "ALL_FEATS",
+        # ToV Talent collections
+        "TOV_TALENTS",
+        "TOV_MARTIAL_TALENTS",
+        "TOV_MAGIC_TALENTS",
+        "TOV_TECHNICAL_TALENTS",
+        "DND_FEATS",
+        # D&D feat functions
+        "get_feat",
+        "get_feats_by_category",
+        "get_origin_feats",
+        "get_general_feats",
+        "get_feats_with_prerequisites",
+        "get_feats_with_ability_increase",
+        "get_repeatable_feats",
+        "search_feats",
+        "get_all_feat_names",
+        # ToV talent functions
+        "get_tov_talents",
+        "get_tov_martial_talents",
+        "get_tov_magic_talents",
+        "get_tov_technical_talents",
+        "get_feats_for_ruleset",
+        "get_focus_talents",
+        "search_talents",
+        # Prerequisite validation
+        "get_feat_prerequisite",
+        "check_feat_prerequisites",
+    ),
+    "subclasses": (
+        "SubclassFeature",
+        "Subclass",
+        "ALL_SUBCLASSES",
+        "DND_SUBCLASSES",
+        "DND_2014_SUBCLASSES",
+        "DND_2024_SUBCLASSES",
+        "TOV_SUBCLASSES",
+        "get_subclass",
+        "get_subclasses_for_class",
+        "get_all_subclass_names",
+        "get_subclass_features_at_level",
+        "get_subclass_features_up_to_level",
+        "search_subclasses",
+        # ToV subclass functions
+        "get_tov_subclasses",
+        "get_tov_subclasses_for_class",
+        "get_subclasses_for_ruleset",
+        "get_subclasses_for_class_and_ruleset",
+        # Spell validation
+        "validate_subclass_spells",
+        "validate_all_subclass_spells",
+        "get_subclass_spells_at_level",
+        "get_subclass_spells_up_to_level",
+    ),
+    "skills": (
+        "get_skill_description",
+        "skill_name_to_enum",
+    ),
+    "magic_items": (
+        "MagicItem",
+        "RARITY_MIN_LEVELS",
+        "COMMON_ITEMS",
+        "UNCOMMON_ITEMS",
+        "RARE_ITEMS",
+        "VERY_RARE_ITEMS",
+        "LEGENDARY_ITEMS",
+        "DND_MAGIC_ITEMS",
+        "TOV_MAGIC_ITEMS",
+        "ALL_MAGIC_ITEMS",
+        "get_magic_item",
+        "get_magic_items_by_rarity",
+        "get_magic_items_by_type",
+        "get_attunement_items",
+        "get_items_with_charges",
+        "search_magic_items",
+        "get_all_magic_item_names",
+        "get_magic_items_for_ruleset",
+        "get_tov_magic_items",
+        # Prerequisite validation
+        "get_item_prerequisite",
+        "check_item_requirements",
+        "get_items_for_level",
+    ),
+    "monsters": (
+        "Size",
+        "MonsterType",
+        "Attack",
+        "Trait",
+        "Action",
+        "Monster",
+        "ALL_MONSTERS",
+        "get_monster",
+        "get_monsters_by_cr",
+        "get_monsters_by_type",
+        "get_monsters_by_cr_range",
+        "search_monsters",
+        "get_all_monster_names",
+        "calculate_encounter_xp",
+    ),
+    "catalog": (
+        "CatalogIndex",
+        "GameDataCatalog",
+        "RulesetCatalog",
+        "get_catalog",
+    ),
+    "search": (
+        "TextIndex",
+    ),
+    "query": (
+        "Page",
+        "Query",
+    ),
+    "fuzzy": (
+        "NameIndex",
+        "NameMatch",
+    ),
+    "srd_fts": (
+        "SRDFullTextIndex",
+        "SRDMatch",
+        "get_srd_fts",
+    ),
+}
 
-from dnd_manager.data.backgrounds import (
-    Background,
-    BackgroundFeature,
-    ALL_BACKGROUNDS,
-    get_background,
-    get_all_background_names,
-    get_backgrounds_for_ruleset,
-    search_backgrounds,
-    validate_origin_feat,
-    validate_all_origin_feats,
-    get_origin_feat_for_background,
-)
+_NAME_TO_MODULE: dict[str, str] = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names
+}
 
-from dnd_manager.data.custom import (
-    CustomSpell,
-    CustomItem,
-    CustomFeat,
-    CustomContent,
-    CustomContentStore,
-    ContentValidator,
-    ValidationWarning,
-    get_custom_content_store,
-)
 
-from dnd_manager.data.prerequisites import (
-    Prerequisite,
-    AbilityRequirement,
-    LevelRequirement,
-    ProficiencyRequirement,
-    SpellcastingRequirement,
-    ClassRequirement,
-    FeatRequirement,
-    ProficiencyType,
-    # Builder functions
-    ability_prereq,
-    dual_ability_prereq,
-    either_ability_prereq,
-    level_prereq,
-    proficiency_prereq,
-    spellcasting_prereq,
-    class_prereq,
-    feat_prereq,
-    combine_prereqs,
-    # Preset prerequisites
-    MARTIAL_FEAT_STR,
-    MARTIAL_FEAT_DEX,
-    HEAVY_ARMOR_PREREQ,
-    MEDIUM_ARMOR_PREREQ,
-    SPELLCASTER_PREREQ,
-)
+def __getattr__(name: str) -> Any:
+    module = _NAME_TO_MODULE.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
 
-from dnd_manager.data.balance import (
-    BalanceGuidelines,
-    BalanceGuidelinesManager,
-    get_balance_guidelines,
-    get_guidelines_manager,
-    get_homebrew_prompt,
-)
 
-from dnd_manager.data.weapon_mastery import (
-    WEAPON_MASTERY_BY_WEAPON,
-    WEAPON_MASTERY_PROPERTIES,
-    WEAPON_MASTERY_PROGRESSIONS,
-    get_weapon_mastery_for_weapon,
-    get_weapon_mastery_summary,
-    get_weapon_mastery_limit_for_class,
-)
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_NAME_TO_MODULE))
 
-from dnd_manager.data.library import (
-    ContentType,
-    ContentStatus,
-    LibraryAuthor,
-    ContentRating,
-    LibraryContent,
-    UserRating,
-    HomebrewLibrary,
-    get_homebrew_library,
-)
 
-from dnd_manager.data.species import (
-    RacialTrait,
-    Subspecies,
-    Heritage,
-    Species,
-    ALL_SPECIES,
-    DRACONIC_ANCESTRY,
-    TOV_LINEAGES,
-    TOV_HERITAGES,
-    get_species,
-    get_all_species_names,
-    get_subraces,
-    get_subspecies,
-    search_species,
-    get_species_for_ruleset,
-    get_tov_lineages,
-    get_tov_heritages,
-    # Level-gated trait functions
-    get_trait_min_level,
-    get_species_traits_at_level,
-    get_subspecies_traits_at_level,
-    get_all_traits_at_level,
-    # Species feat check
-    species_grants_feat,
-)
-
-from dnd_manager.data.feats import (
-    Feat,
-    ORIGIN_FEATS,
-    GENERAL_FEATS,
-    GENERAL_FEATS_2014,
-    GENERAL_FEATS_2024,
-    ALL_FEATS,
-    # ToV Talent collections
-    TOV_TALENTS,
-    TOV_MARTIAL_TALENTS,
-    TOV_MAGIC_TALENTS,
-    TOV_TECHNICAL_TALENTS,
-    DND_FEATS,
-    # D&D feat functions
-    get_feat,
-    get_feats_by_category,
-    get_origin_feats,
-    get_general_feats,
-    get_feats_with_prerequisites,
-    get_feats_with_ability_increase,
-    get_repeatable_feats,
-    search_feats,
-    get_all_feat_names,
-    # ToV talent functions
-    get_tov_talents,
-    get_tov_martial_talents,
-    get_tov_magic_talents,
-    get_tov_technical_talents,
-    get_feats_for_ruleset,
-    get_focus_talents,
-    search_talents,
-    # Prerequisite validation
-    get_feat_prerequisite,
-    check_feat_prerequisites,
-)
-
-from dnd_manager.data.subclasses import (
-    SubclassFeature,
-    Subclass,
-    ALL_SUBCLASSES,
-    DND_SUBCLASSES,
-    DND_2014_SUBCLASSES,
-    DND_2024_SUBCLASSES,
-    TOV_SUBCLASSES,
-    get_subclass,
-    get_subclasses_for_class,
-    get_all_subclass_names,
-    get_subclass_features_at_level,
-    get_subclass_features_up_to_level,
-    search_subclasses,
-    # ToV subclass functions
-    get_tov_subclasses,
-    get_tov_subclasses_for_class,
-    get_subclasses_for_ruleset,
-    get_subclasses_for_class_and_ruleset,
-    # Spell validation
-    validate_subclass_spells,
-    validate_all_subclass_spells,
-    get_subclass_spells_at_level,
-    get_subclass_spells_up_to_level,
-)
-
-from dnd_manager.data.skills import (
-    get_skill_description,
-    skill_name_to_enum,
-)
-
-from dnd_manager.data.magic_items import (
-    MagicItem,
-    RARITY_MIN_LEVELS,
-    COMMON_ITEMS,
-    UNCOMMON_ITEMS,
-    RARE_ITEMS,
-    VERY_RARE_ITEMS,
-    LEGENDARY_ITEMS,
-    DND_MAGIC_ITEMS,
-    TOV_MAGIC_ITEMS,
-    ALL_MAGIC_ITEMS,
-    get_magic_item,
-    get_magic_items_by_rarity,
-    get_magic_items_by_type,
-    get_attunement_items,
-    get_items_with_charges,
-    search_magic_items,
-    get_all_magic_item_names,
-    get_magic_items_for_ruleset,
-    get_tov_magic_items,
-    # Prerequisite validation
-    get_item_prerequisite,
-    check_item_requirements,
-    get_items_for_level,
-)
-
-from dnd_manager.data.monsters import (
-    Size,
-    MonsterType,
-    Attack,
-    Trait,
-    Action,
-    Monster,
-    ALL_MONSTERS,
-    get_monster,
-    get_monsters_by_cr,
-    get_monsters_by_type,
-    get_monsters_by_cr_range,
-    search_monsters,
-    get_all_monster_names,
-    calculate_encounter_xp,
-)
-
-__all__ = [
-    # Spells
-    "Spell",
-    "SpellVariant",
-    "ALL_SPELLS",
-    "CANTRIPS",
-    "get_spells_by_level",
-    "get_spells_by_class",
-    "get_spell_by_name",
-    "search_spells",
-    "get_spell_for_ruleset",
-    "get_spells_by_level_for_ruleset",
-    "get_spells_by_class_for_ruleset",
-    "get_spells_with_variants",
-    "get_spells_with_material_cost",
-    "get_spells_with_consumed_materials",
-    "get_spell_cost_summary",
-    # Items
-    "Weapon",
-    "Armor",
-    "Equipment",
-    "ArmorType",
-    "WeaponProperty",
-    "ALL_WEAPONS",
-    "ARMOR",
-    "ADVENTURING_GEAR",
-    "TOOLS",
-    "EQUIPMENT_PACKS",
-    "get_weapon_by_name",
-    "get_armor_by_name",
-    "get_equipment_by_name",
-    "search_items",
-    # Classes
-    "ClassFeature",
-    "ClassInfo",
-    "CasterType",
-    "ALL_CLASSES",
-    "MULTICLASS_REQUIREMENTS",
-    "MULTICLASS_ALT_REQUIREMENTS",
-    "CLASS_CASTER_TYPES",
-    "THIRD_CASTER_SUBCLASSES",
-    "MULTICLASS_SPELL_SLOTS",
-    "get_class_info",
-    "get_features_at_level",
-    "get_features_up_to_level",
-    "get_features_for_ruleset",
-    # Backgrounds
-    "Background",
-    "BackgroundFeature",
-    "ALL_BACKGROUNDS",
-    "get_background",
-    "get_all_background_names",
-    "get_backgrounds_for_ruleset",
-    "search_backgrounds",
-    "validate_origin_feat",
-    "validate_all_origin_feats",
-    "get_origin_feat_for_background",
-    # Custom Content
-    "CustomSpell",
-    "CustomItem",
-    "CustomFeat",
-    "CustomContent",
-    "CustomContentStore",
-    "ContentValidator",
-    "ValidationWarning",
-    "get_custom_content_store",
-    # Prerequisites
-    "Prerequisite",
-    "AbilityRequirement",
-    "LevelRequirement",
-    "ProficiencyRequirement",
-    "SpellcastingRequirement",
-    "ClassRequirement",
-    "FeatRequirement",
-    "ProficiencyType",
-    "ability_prereq",
-    "dual_ability_prereq",
-    "either_ability_prereq",
-    "level_prereq",
-    "proficiency_prereq",
-    "spellcasting_prereq",
-    "class_prereq",
-    "feat_prereq",
-    "combine_prereqs",
-    "MARTIAL_FEAT_STR",
-    "MARTIAL_FEAT_DEX",
-    "HEAVY_ARMOR_PREREQ",
-    "MEDIUM_ARMOR_PREREQ",
-    "SPELLCASTER_PREREQ",
-    # Balance Guidelines
-    "BalanceGuidelines",
-    "BalanceGuidelinesManager",
-    "get_balance_guidelines",
-    "get_guidelines_manager",
-    "get_homebrew_prompt",
-    # Homebrew Library
-    "ContentType",
-    "ContentStatus",
-    "LibraryAuthor",
-    "ContentRating",
-    "LibraryContent",
-    "UserRating",
-    "HomebrewLibrary",
-    "get_homebrew_library",
-    # Species
-    "RacialTrait",
-    "Subspecies",
-    "Heritage",
-    "Species",
-    "ALL_SPECIES",
-    "DRACONIC_ANCESTRY",
-    "TOV_LINEAGES",
-    "TOV_HERITAGES",
-    "get_species",
-    "get_all_species_names",
-    "get_subraces",
-    "get_subspecies",
-    "search_species",
-    "get_species_for_ruleset",
-    "get_tov_lineages",
-    "get_tov_heritages",
-    "get_trait_min_level",
-    "get_species_traits_at_level",
-    "get_subspecies_traits_at_level",
-    "get_all_traits_at_level",
-    "species_grants_feat",
-    # Feats
-    "Feat",
-    "ORIGIN_FEATS",
-    "GENERAL_FEATS",
-    "GENERAL_FEATS_2014",
-    "GENERAL_FEATS_2024",
-    "ALL_FEATS",
-    "get_feat",
-    "get_feats_by_category",
-    "get_origin_feats",
-    "get_general_feats",
-    "get_feats_with_prerequisites",
-    "get_feats_with_ability_increase",
-    "get_repeatable_feats",
-    "search_feats",
-    "get_all_feat_names",
-    # ToV Talents
-    "TOV_TALENTS",
-    "TOV_MARTIAL_TALENTS",
-    "TOV_MAGIC_TALENTS",
-    "TOV_TECHNICAL_TALENTS",
-    "DND_FEATS",
-    "get_tov_talents",
-    "get_tov_martial_talents",
-    "get_tov_magic_talents",
-    "get_tov_technical_talents",
-    "get_feats_for_ruleset",
-    "get_focus_talents",
-    "search_talents",
-    "get_feat_prerequisite",
-    "check_feat_prerequisites",
-    # Subclasses
-    "SubclassFeature",
-    "Subclass",
-    "ALL_SUBCLASSES",
-    "DND_SUBCLASSES",
-    "DND_2014_SUBCLASSES",
-    "DND_2024_SUBCLASSES",
-    "TOV_SUBCLASSES",
-    "get_subclass",
-    "get_subclasses_for_class",
-    "get_all_subclass_names",
-    "get_subclass_features_at_level",
-    "get_subclass_features_up_to_level",
-    "search_subclasses",
-    "get_tov_subclasses",
-    "get_tov_subclasses_for_class",
-    "get_subclasses_for_ruleset",
-    "get_subclasses_for_class_and_ruleset",
-    "validate_subclass_spells",
-    "validate_all_subclass_spells",
-    "get_subclass_spells_at_level",
-    "get_subclass_spells_up_to_level",
-    # Skills
-    "get_skill_description",
-    "skill_name_to_enum",
-    # Magic Items
-    "MagicItem",
-    "COMMON_ITEMS",
-    "UNCOMMON_ITEMS",
-    "RARE_ITEMS",
-    "VERY_RARE_ITEMS",
-    "LEGENDARY_ITEMS",
-    "DND_MAGIC_ITEMS",
-    "TOV_MAGIC_ITEMS",
-    "ALL_MAGIC_ITEMS",
-    "get_magic_item",
-    "get_magic_items_by_rarity",
-    "get_magic_items_by_type",
-    "get_attunement_items",
-    "get_items_with_charges",
-    "search_magic_items",
-    "get_all_magic_item_names",
-    "get_magic_items_for_ruleset",
-    "get_tov_magic_items",
-    "RARITY_MIN_LEVELS",
-    "get_item_prerequisite",
-    "check_item_requirements",
-    "get_items_for_level",
-    # Monsters
-    "Size",
-    "MonsterType",
-    "Attack",
-    "Trait",
-    "Action",
-    "Monster",
-    "ALL_MONSTERS",
-    "get_monster",
-    "get_monsters_by_cr",
-    "get_monsters_by_type",
-    "get_monsters_by_cr_range",
-    "search_monsters",
-    "get_all_monster_names",
-    "calculate_encounter_xp",
-]
+__all__ = [name for names in _LAZY_IMPORTS.values() for name in names]
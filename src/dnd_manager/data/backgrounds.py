@@ -3,22 +3,24 @@
 This module contains backgrounds from the System Reference Document (SRD).
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import Optional, Sequence, TYPE_CHECKING
+
+from dnd_manager.data.records import FrozenRecord
 
 if TYPE_CHECKING:
     from dnd_manager.data.feats import Feat
 
 
-@dataclass
-class BackgroundFeature:
+@dataclass(frozen=True, slots=True)
+class BackgroundFeature(FrozenRecord):
     """A background feature."""
     name: str
     description: str
 
 
-@dataclass
-class Background:
+@dataclass(frozen=True, slots=True)
+class Background(FrozenRecord):
     """A character background definition.
 
     Backgrounds can support multiple rulesets:
@@ -32,15 +34,19 @@ class Background:
     - "dnd2024": Only for D&D 2024 rules
     - "tov": Only for Tales of the Valiant
     """
+    _INTERNED = frozenset({
+        "skill_proficiencies", "tool_proficiencies", "ability_score_options",
+        "origin_feat", "ruleset",
+    })
     name: str
     description: str
-    skill_proficiencies: list[str]
-    tool_proficiencies: list[str] = field(default_factory=list)
+    skill_proficiencies: Sequence[str]
+    tool_proficiencies: Sequence[str] = ()
     languages: int = 0  # Number of language choices
-    equipment: list[str] = field(default_factory=list)
+    equipment: Sequence[str] = ()
     feature: Optional[BackgroundFeature] = None  # 2014/ToV feature
     # 2024 PHB additions
-    ability_score_options: list[str] = field(default_factory=list)  # For 2024 rules
+    ability_score_options: Sequence[str] = ()  # For 2024 rules
     origin_feat: Optional[str] = None  # For 2024 rules
     # Ruleset support
     ruleset: Optional[str] = None  # None = universal, "dnd2014", "dnd2024", "tov"
@@ -7,10 +7,11 @@ AI assistants provide balanced homebrew creation advice.
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Any
-import yaml
 
 from platformdirs import user_data_dir
 
+from dnd_manager.storage.serialization import dump_yaml, load_yaml
+
 
 @dataclass
 class BalanceGuidelines:
@@ -377,12 +378,12 @@ class BalanceGuidelinesManager:
         # Load default guidelines
         if self._default_path.exists():
             with open(self._default_path, "r") as f:
-                guidelines_data = yaml.safe_load(f) or {}
+                guidelines_data = load_yaml(f) or {}
 
         # Load and merge user overrides
         if self._user_path.exists():
             with open(self._user_path, "r") as f:
-                user_data = yaml.safe_load(f) or {}
+                user_data = load_yaml(f) or {}
             guidelines_data = self._deep_merge(guidelines_data, user_data)
 
         self._guidelines = BalanceGuidelines.from_dict(guidelines_data)
@@ -396,13 +397,13 @@ class BalanceGuidelinesManager:
         existing = {}
         if self._user_path.exists():
             with open(self._user_path, "r") as f:
-                existing = yaml.safe_load(f) or {}
+                existing = load_yaml(f) or {}
 
         # Merge new overrides
         merged = self._deep_merge(existing, overrides)
 
         with open(self._user_path, "w") as f:
-            yaml.dump(merged, f, default_flow_style=False, sort_keys=False)
+            dump_yaml(merged, f, default_flow_style=False, sort_keys=False)
 
         # Reload guidelines
         self._guidelines = None
@@ -0,0 +1,386 @@
+"""Indexed catalog of the built-in game data.
+
+The data modules define their content as plain lists, and their lookup
+helpers used to answer every query by scanning a whole list and lowercasing
+each name as they went. The catalog builds the lookup structures once per
+process instead:
+
+- a case-folded name -> record hash map per collection,
+- inverted indexes (class, level, school, CR, type, rarity, ...) mapping a
+  key to a tuple of records, in their original list order,
+- sorted keys for numeric range queries (e.g. monster CR, spell material
+  cost),
+- a ranked full-text index over names and descriptions (see ``search``),
+  behind the records whose name contains the query.
+
+``dnd_manager.data.query.Query`` combines these into filtered, paginated
+queries.
+
+Each collection is indexed lazily the first time it is used, so importing a
+data module does not pay for the others. Results are tuples shared by every
+caller; the module helpers copy them into lists to keep their existing
+return types.
+
+The catalog indexes the lists as they are when first used. It reflects the
+built-in content only; homebrew lives in ``CustomContentStore``.
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from functools import cached_property
+from operator import attrgetter, itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Generic, Hashable, Iterable, Optional, TypeVar
+
+from dnd_manager.data.search import TextIndex
+
+if TYPE_CHECKING:
+    from dnd_manager.data.classes import ClassFeature
+    from dnd_manager.data.feats import Feat
+    from dnd_manager.data.items import Armor, Equipment, Weapon
+    from dnd_manager.data.magic_items import MagicItem
+    from dnd_manager.data.monsters import Monster
+    from dnd_manager.data.species import Species
+    from dnd_manager.data.spells import Spell
+    from dnd_manager.data.subclasses import Subclass
+
+T = TypeVar("T")
+
+_SPELL_INDEXES: dict[str, Callable[["Spell"], Iterable[Hashable]]] = {
+    "class": attrgetter("classes"),
+    "level": lambda s: (s.level,),
+    "school": lambda s: (s.school,),
+}
+_SUBCLASS_INDEXES: dict[str, Callable[["Subclass"], Iterable[Hashable]]] = {
+    "class": lambda s: (s.parent_class,),
+}
+
+# Collection -> (text getter, weight) pairs for full-text search
+_TEXT_FIELDS: dict[str, tuple[tuple[Callable[[Any], Optional[str]], float], ...]] = {
+    "spells": ((attrgetter("name"), 3.0), (attrgetter("description"), 1.0)),
+    "feats": ((attrgetter("name"), 3.0), (attrgetter("description"), 1.0)),
+    "magic_items": (
+        (attrgetter("name"), 3.0),
+        (attrgetter("item_type"), 1.5),
+        (attrgetter("description"), 1.0),
+    ),
+    "monsters": (
+        (attrgetter("name"), 3.0),
+        (lambda m: m.monster_type.value, 1.5),
+        (attrgetter("description"), 1.0),
+    ),
+    "species": ((attrgetter("name"), 3.0), (attrgetter("description"), 1.0)),
+    "subclasses": ((attrgetter("name"), 3.0), (attrgetter("description"), 1.0)),
+}
+
+
+def names_first(name_matches: list[T], ranked: Iterable[T], limit: Optional[int] = None) -> list[T]:
+    """Name matches followed by the ranked matches not among them."""
+    seen = {id(record) for record in name_matches}
+    results = name_matches + [record for record in ranked if id(record) not in seen]
+    return results if limit is None else results[:limit]
+
+
+def fold_key(key: Hashable) -> Hashable:
+    """Normalize an index key: strings are case-folded, others used as-is."""
+    return key.casefold() if isinstance(key, str) else key
+
+
+class CatalogIndex(Generic[T]):
+    """Immutable lookup structures over one collection of records."""
+
+    def __init__(
+        self,
+        records: Iterable[T],
+        name: Callable[[T], str] = attrgetter("name"),
+        indexes: Optional[dict[str, Callable[[T], Iterable[Hashable]]]] = None,
+        ranges: Optional[dict[str, Callable[[T], Optional[float]]]] = None,
+        first_wins: bool = True,
+    ):
+        """
+        Args:
+            records: Records in their canonical order
+            name: Returns a record's lookup name
+            indexes: Index name -> function returning the keys a record is
+                filed under (a record may have several, e.g. spell classes)
+            ranges: Index name -> numeric sort key for range queries; records
+                whose key is None are left out of that range
+            first_wins: Which record ``get`` returns when several share a
+                name; matches the scan or dict the helper used to have
+        """
+        self.records: tuple[T, ...] = tuple(records)
+        self._positions = {id(record): i for i, record in enumerate(self.records)}
+
+        by_name: dict[str, T] = {}
+        named: dict[str, list[T]] = {}
+        folded: list[str] = []
+        for record in self.records:
+            key = name(record).casefold()
+            folded.append(key)
+            named.setdefault(key, []).append(record)
+            if not first_wins or key not in by_name:
+                by_name[key] = record
+        self._folded_names = tuple(folded)
+        self._by_name = by_name
+        self._named = {key: tuple(group) for key, group in named.items()}
+
+        self._indexes: dict[str, dict[Hashable, tuple[T, ...]]] = {}
+        for index_name, keys_of in (indexes or {}).items():
+            buckets: dict[Hashable, list[T]] = {}
+            for record in self.records:
+                # dict.fromkeys drops repeated keys so a record is filed once
+                for key in dict.fromkeys(fold_key(k) for k in keys_of(record)):
+                    buckets.setdefault(key, []).append(record)
+            self._indexes[index_name] = {key: tuple(group) for key, group in buckets.items()}
+
+        self._range_keys = dict(ranges or {})
+        self._ranges: dict[str, tuple[list[float], tuple[T, ...]]] = {}
+        for index_name, value_of in self._range_keys.items():
+            valued = [(value, r) for r in self.records if (value := value_of(r)) is not None]
+            valued.sort(key=itemgetter(0))  # Stable: ties keep list order
+            self._ranges[index_name] = (
+                [value for value, _ in valued],
+                tuple(r for _, r in valued),
+            )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def position(self, record: T) -> int:
+        """Index of a record in the canonical order."""
+        return self._positions[id(record)]
+
+    def get(self, name: str) -> Optional[T]:
+        """Get a record by name (case-insensitive)."""
+        return self._by_name.get(name.casefold())
+
+    def get_all(self, name: str) -> tuple[T, ...]:
+        """Get every record sharing a name (e.g. 2014 and 2024 versions)."""
+        return self._named.get(name.casefold(), ())
+
+    def name_contains(self, text: str) -> list[T]:
+        """Get records whose name contains ``text`` (case-insensitive).
+
+        Exact names come first, then names starting with ``text``, then the
+        rest, each group in list order.
+        """
+        needle = text.casefold()
+        if not needle:
+            return []
+        hits = [i for i, folded in enumerate(self._folded_names) if needle in folded]
+        hits.sort(key=lambda i: (
+            self._folded_names[i] != needle,
+            not self._folded_names[i].startswith(needle),
+        ))
+        return [self.records[i] for i in hits]
+
+    def where(self, index: str, key: Hashable) -> tuple[T, ...]:
+        """Get the records filed under ``key`` in ``index``."""
+        return self._indexes[index].get(fold_key(key), ())
+
+    def keys(self, index: str) -> list[Hashable]:
+        """List the keys present in ``index``."""
+        return list(self._indexes[index])
+
+    def range_key(self, index: str) -> Callable[[T], Optional[float]]:
+        """The function giving a record's value in a range index."""
+        return self._range_keys[index]
+
+    def between(self, index: str, low: float, high: float) -> tuple[T, ...]:
+        """Get records whose ``index`` value lies in ``[low, high]``, ascending."""
+        values, ordered = self._ranges[index]
+        return ordered[bisect_left(values, low):bisect_right(values, high)]
+
+
+class GameDataCatalog:
+    """Lazily built indexes over every built-in data collection.
+
+    The data modules are imported inside each property so the catalog can
+    be imported by those same modules without a cycle. Building is pure, so
+    two threads racing on first use at worst build an index twice.
+    """
+
+    def __init__(self):
+        self._rulesets: dict[str, RulesetCatalog] = {}
+        self._text: dict[str, TextIndex] = {}
+
+    @cached_property
+    def spells(self) -> "CatalogIndex[Spell]":
+        from dnd_manager.data.spells import ALL_SPELLS
+        return CatalogIndex(ALL_SPELLS, indexes=_SPELL_INDEXES)
+
+    @cached_property
+    def spell_materials(self) -> "CatalogIndex[Spell]":
+        from dnd_manager.data.spells import ALL_SPELLS
+        return CatalogIndex(
+            (s for s in ALL_SPELLS if s.material_component() is not None),
+            indexes={"consumed": lambda s: (s.material_component().consumed,)},
+            ranges={"cost": lambda s: s.material_component().cost},
+        )
+
+    @cached_property
+    def weapons(self) -> "CatalogIndex[Weapon]":
+        from dnd_manager.data.items import ALL_WEAPONS
+        return CatalogIndex(ALL_WEAPONS, indexes={"category": lambda w: (w.category,)})
+
+    @cached_property
+    def armor(self) -> "CatalogIndex[Armor]":
+        from dnd_manager.data.items import ARMOR
+        return CatalogIndex(ARMOR, indexes={"type": lambda a: (a.armor_type,)})
+
+    @cached_property
+    def equipment(self) -> "CatalogIndex[Equipment]":
+        from dnd_manager.data.items import ADVENTURING_GEAR, TOOLS
+        return CatalogIndex(
+            ADVENTURING_GEAR + TOOLS, indexes={"category": lambda e: (e.category,)}
+        )
+
+    @cached_property
+    def feats(self) -> "CatalogIndex[Feat]":
+        from dnd_manager.data.feats import ALL_FEATS
+        return CatalogIndex(
+            ALL_FEATS, indexes={"category": lambda f: (f.category,)}, first_wins=False
+        )
+
+    @cached_property
+    def species(self) -> "CatalogIndex[Species]":
+        from dnd_manager.data.species import ALL_SPECIES
+        # Looked up by the ALL_SPECIES key, which can differ from Species.name
+        keys = {id(species): key for key, species in ALL_SPECIES.items()}
+        return CatalogIndex(
+            ALL_SPECIES.values(),
+            name=lambda s: keys[id(s)],
+            indexes={"size": lambda s: (s.size,)},
+        )
+
+    @cached_property
+    def monsters(self) -> "CatalogIndex[Monster]":
+        from dnd_manager.data.monsters import ALL_MONSTERS
+        return CatalogIndex(
+            ALL_MONSTERS,
+            indexes={
+                "cr": lambda m: (m.challenge_rating,),
+                "type": lambda m: (m.monster_type,),
+            },
+            ranges={"cr": attrgetter("cr_numeric")},
+            first_wins=False,
+        )
+
+    @cached_property
+    def magic_items(self) -> "CatalogIndex[MagicItem]":
+        from dnd_manager.data.magic_items import ALL_MAGIC_ITEMS
+        return CatalogIndex(
+            ALL_MAGIC_ITEMS,
+            indexes={
+                "rarity": lambda i: (i.rarity,),
+                "type": lambda i: (i.item_type,),
+            },
+            first_wins=False,
+        )
+
+    @cached_property
+    def subclasses(self) -> "CatalogIndex[Subclass]":
+        from dnd_manager.data.subclasses import ALL_SUBCLASSES
+        return CatalogIndex(ALL_SUBCLASSES, indexes=_SUBCLASS_INDEXES, first_wins=False)
+
+    def text_index(self, collection: str) -> TextIndex:
+        """Get the full-text index of a collection (built on first use)."""
+        index = self._text.get(collection)
+        if index is None:
+            records = getattr(self, collection).records
+            index = self._text.setdefault(collection, TextIndex(records, _TEXT_FIELDS[collection]))
+        return index
+
+    def name_matches(self, collection: str, query: str) -> list:
+        """Records of a collection whose name contains ``query`` as typed.
+
+        Surrounding whitespace and quotes are ignored, so "ball" finds
+        Fireball even though no word of the name starts with it.
+        """
+        return getattr(self, collection).name_contains(query.strip().strip('"').strip())
+
+    def search(self, collection: str, query: str, limit: Optional[int] = None) -> list:
+        """Search a collection's names and descriptions, most relevant first.
+
+        Records whose name contains ``query`` come first (see
+        ``name_matches``), followed by the full-text matches: every word of
+        ``query`` must match a word of the record, or be the start of one.
+
+        Args:
+            collection: One of spells, feats, magic_items, monsters,
+                species or subclasses
+            query: Free text, e.g. "fire dam" or "undead"
+            limit: Maximum number of results
+
+        Returns:
+            Matching records, best match first.
+        """
+        ranked = self.text_index(collection).search(query)
+        return names_first(self.name_matches(collection, query), ranked, limit)
+
+    def for_ruleset(self, ruleset: str) -> "RulesetCatalog":
+        """Get the resolved view of the data for ``ruleset`` (built once)."""
+        view = self._rulesets.get(ruleset)
+        if view is None:
+            view = self._rulesets.setdefault(ruleset, RulesetCatalog(self, ruleset))
+        return view
+
+
+class RulesetCatalog:
+    """Data resolved for one ruleset, computed on first use and then shared.
+
+    Spells have their ruleset variant applied, and subclasses and class
+    features are filtered to the ruleset. Repeated queries return the same
+    tuples of the same objects, so callers must not mutate them.
+    """
+
+    def __init__(self, catalog: GameDataCatalog, ruleset: str):
+        self.catalog = catalog
+        self.ruleset = ruleset
+        self._features: dict[tuple[str, int], tuple["ClassFeature", ...]] = {}
+
+    @cached_property
+    def spells(self) -> "CatalogIndex[Spell]":
+        return CatalogIndex(
+            (spell.for_ruleset(self.ruleset) for spell in self.catalog.spells),
+            indexes=_SPELL_INDEXES,
+        )
+
+    @cached_property
+    def subclasses(self) -> "CatalogIndex[Subclass]":
+        from dnd_manager.data.subclasses import subclass_in_ruleset
+        return CatalogIndex(
+            (s for s in self.catalog.subclasses if subclass_in_ruleset(s, self.ruleset)),
+            indexes=_SUBCLASS_INDEXES,
+            first_wins=False,
+        )
+
+    def class_features(self, class_name: str, level: int) -> tuple["ClassFeature", ...]:
+        """Features of ``class_name`` up to ``level`` that apply to this ruleset."""
+        key = (class_name, level)
+        features = self._features.get(key)
+        if features is None:
+            from dnd_manager.data.classes import get_class_info
+            class_info = get_class_info(class_name)
+            features = tuple(
+                f for f in (class_info.features if class_info else ())
+                if f.level <= level and (f.ruleset is None or f.ruleset == self.ruleset)
+            )
+            self._features[key] = features
+        return features
+
+
+_catalog: Optional[GameDataCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> GameDataCatalog:
+    """Get the process-wide game data catalog."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = GameDataCatalog()
+    return _catalog
@@ -3,9 +3,12 @@
 This module contains class information from the System Reference Document (SRD).
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Optional, Sequence
+
+from dnd_manager.data.catalog import get_catalog
+from dnd_manager.data.records import FrozenRecord
 
 
 class CasterType(Enum):
@@ -17,8 +20,8 @@ class CasterType(Enum):
     NONE = "none"       # Non-casters (Barbarian, Fighter*, Monk, Rogue*)
 
 
-@dataclass
-class ClassFeature:
+@dataclass(frozen=True, slots=True)
+class ClassFeature(FrozenRecord):
     """A class feature definition.
 
     The ruleset field indicates which rules system the feature applies to:
@@ -27,6 +30,7 @@ class ClassFeature:
     - "dnd2024": Only for D&D 2024 rules
     - "tov": Only for Tales of the Valiant
     """
+    _INTERNED = frozenset({"source", "recharge", "ruleset"})
     name: str
     level: int
     description: str
@@ -36,23 +40,27 @@ class ClassFeature:
     ruleset: Optional[str] = None  # None = universal, "dnd2014", "dnd2024", "tov"
 
 
-@dataclass
-class ClassInfo:
+@dataclass(frozen=True, slots=True)
+class ClassInfo(FrozenRecord):
     """Information about a character class.
 
     Features can have ruleset-specific variants. Use get_features_for_ruleset()
     to filter features for a specific ruleset.
     """
+    _INTERNED = frozenset({
+        "primary_ability", "saving_throws", "armor_proficiencies", "weapon_proficiencies",
+        "skill_options", "spellcasting_ability",
+    })
     name: str
     hit_die: str
     primary_ability: str
-    saving_throws: list[str]
-    armor_proficiencies: list[str]
-    weapon_proficiencies: list[str]
+    saving_throws: Sequence[str]
+    armor_proficiencies: Sequence[str]
+    weapon_proficiencies: Sequence[str]
     skill_choices: int
-    skill_options: list[str]
+    skill_options: Sequence[str]
     spellcasting_ability: Optional[str]
-    features: list[ClassFeature] = field(default_factory=list)
+    features: Sequence[ClassFeature] = ()
     # 2024 additions
     weapon_masteries: int = 0  # Number of weapon masteries (2024 martial classes)
 
@@ -609,10 +617,6 @@ def get_features_for_ruleset(
         List of features up to the specified level, filtered by ruleset.
         Returns features matching the ruleset or with ruleset=None (universal).
     """
-    all_features = get_features_up_to_level(class_name, level)
     if ruleset is None:
-        return all_features
-    return [
-        f for f in all_features
-        if f.ruleset is None or f.ruleset == ruleset
-    ]
+        return get_features_up_to_level(class_name, level)
+    return list(get_catalog().for_ruleset(ruleset).class_features(class_name, level))
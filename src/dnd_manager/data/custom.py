@@ -7,12 +7,12 @@ items, classes, backgrounds, and other content.
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Any
-import yaml
 
 from dnd_manager.data.spells import Spell
 from dnd_manager.data.items import Weapon, Armor, Equipment
 from dnd_manager.data.classes import ClassFeature
 from dnd_manager.data.backgrounds import Background, BackgroundFeature
+from dnd_manager.storage.serialization import dump_yaml, load_yaml
 
 
 @dataclass
@@ -436,7 +436,7 @@ class CustomContentStore:
         for yaml_file in self.content_dir.glob("*.yaml"):
             try:
                 with open(yaml_file) as f:
-                    data = yaml.safe_load(f)
+                    data = load_yaml(f)
                 if data:
                     file_content = CustomContent.from_dict(data)
                     combined.spells.extend(file_content.spells)
@@ -452,7 +452,7 @@ class CustomContentStore:
         """Save custom content to a YAML file."""
         filepath = self.content_dir / filename
         with open(filepath, "w") as f:
-            yaml.dump(content.to_dict(), f, default_flow_style=False, sort_keys=False)
+            dump_yaml(content.to_dict(), f, default_flow_style=False, sort_keys=False)
         return filepath
 
     def validate(self) -> list[ValidationWarning]:
@@ -520,13 +520,13 @@ class CustomContentStore:
     def export_to_yaml(self, output_path: Path) -> Path:
         """Export all custom content to a single YAML file."""
         with open(output_path, "w") as f:
-            yaml.dump(self.content.to_dict(), f, default_flow_style=False, sort_keys=False)
+            dump_yaml(self.content.to_dict(), f, default_flow_style=False, sort_keys=False)
         return output_path
 
     def import_from_yaml(self, input_path: Path) -> tuple[CustomContent, list[ValidationWarning]]:
         """Import custom content from a YAML file."""
         with open(input_path) as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
 
         imported = CustomContent.from_dict(data)
         warnings = self._validator.validate_all(imported)
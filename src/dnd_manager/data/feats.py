@@ -4,8 +4,11 @@ Contains origin feats (background-granted) and general feats with original
 flavor text and accurate SRD mechanics.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import Optional, Sequence, TYPE_CHECKING
+
+from dnd_manager.data.catalog import get_catalog
+from dnd_manager.data.records import FrozenRecord
 
 if TYPE_CHECKING:
     from dnd_manager.data.prerequisites import Prerequisite
@@ -41,8 +44,8 @@ def _get_prereqs():
     }
 
 
-@dataclass
-class Feat:
+@dataclass(frozen=True, slots=True)
+class Feat(FrozenRecord):
     """Represents a feat that grants special abilities or bonuses.
 
     For ToV Talents, category should be one of:
@@ -58,11 +61,13 @@ class Feat:
     Otherwise, the system falls back to parsing the prerequisites strings.
     """
 
+    _INTERNED = frozenset({"category", "ruleset"})
+
     name: str
     description: str
     category: str  # "origin", "general", "fighting_style", "epic_boon", "tov_martial", "tov_magic", "tov_technical"
-    prerequisites: list[str] = field(default_factory=list)
-    benefits: list[str] = field(default_factory=list)
+    prerequisites: Sequence[str] = ()
+    benefits: Sequence[str] = ()
     ability_increase: Optional[dict[str, int]] = None
     repeatable: bool = False
     ruleset: Optional[str] = None  # None = all rulesets, "tov" = Tales of the Valiant only
@@ -1998,10 +2003,6 @@ DND_FEATS: list[Feat] = ORIGIN_FEATS + GENERAL_FEATS
 
 ALL_FEATS: list[Feat] = DND_FEATS + TOV_TALENTS
 
-# Dictionary for quick lookup
-_FEATS_BY_NAME: dict[str, Feat] = {feat.name.lower(): feat for feat in ALL_FEATS}
-
-
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -2009,12 +2010,12 @@ _FEATS_BY_NAME: dict[str, Feat] = {feat.name.lower(): feat for feat in ALL_FEATS
 
 def get_feat(name: str) -> Optional[Feat]:
     """Get a feat by name (case-insensitive)."""
-    return _FEATS_BY_NAME.get(name.lower())
+    return get_catalog().feats.get(name)
 
 
 def get_feats_by_category(category: str) -> list[Feat]:
     """Get all feats in a specific category."""
-    return [feat for feat in ALL_FEATS if feat.category == category]
+    return list(get_catalog().feats.where("category", category))
 
 
 def get_origin_feats() -> list[Feat]:
@@ -2043,13 +2044,8 @@ def get_repeatable_feats() -> list[Feat]:
 
 
 def search_feats(query: str) -> list[Feat]:
-    """Search feats by name or description."""
-    query_lower = query.lower()
-    results = []
-    for feat in ALL_FEATS:
-        if query_lower in feat.name.lower() or query_lower in feat.description.lower():
-            results.append(feat)
-    return results
+    """Search feats by name or description, most relevant first."""
+    return get_catalog().search("feats", query)
 
 
 def get_all_feat_names() -> list[str]:
@@ -2114,13 +2110,9 @@ def get_focus_talents() -> list[Feat]:
 
 
 def search_talents(query: str) -> list[Feat]:
-    """Search ToV talents by name or description."""
-    query_lower = query.lower()
-    results = []
-    for feat in TOV_TALENTS:
-        if query_lower in feat.name.lower() or query_lower in feat.description.lower():
-            results.append(feat)
-    return results
+    """Search ToV talents by name or description, most relevant first."""
+    talents = {id(feat) for feat in TOV_TALENTS}
+    return [feat for feat in get_catalog().search("feats", query) if id(feat) in talents]
 
 
 # =============================================================================
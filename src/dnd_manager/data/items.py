@@ -6,7 +6,10 @@ which is available under the Open Gaming License.
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Optional, Sequence
+
+from dnd_manager.data.catalog import get_catalog
+from dnd_manager.data.records import FrozenRecord
 
 
 class ItemCategory(Enum):
@@ -42,22 +45,23 @@ class ArmorType(Enum):
     SHIELD = "Shield"
 
 
-@dataclass
-class Weapon:
+@dataclass(frozen=True, slots=True)
+class Weapon(FrozenRecord):
     """A weapon definition."""
+    _INTERNED = frozenset({"category", "damage", "damage_type", "cost", "properties"})
     name: str
     category: str  # Simple or Martial
     damage: str
     damage_type: str
     weight: float  # pounds
     cost: str
-    properties: list[str]
+    properties: Sequence[str]
     range_normal: Optional[int] = None
     range_long: Optional[int] = None
 
 
-@dataclass
-class Armor:
+@dataclass(frozen=True, slots=True)
+class Armor(FrozenRecord):
     """An armor definition."""
     name: str
     armor_type: ArmorType
@@ -69,9 +73,10 @@ class Armor:
     cost: str
 
 
-@dataclass
-class Equipment:
+@dataclass(frozen=True, slots=True)
+class Equipment(FrozenRecord):
     """Generic equipment/gear item."""
+    _INTERNED = frozenset({"category", "cost"})
     name: str
     category: str
     cost: str
@@ -322,30 +327,17 @@ EQUIPMENT_PACKS = {
 
 def get_weapon_by_name(name: str) -> Optional[Weapon]:
     """Get a weapon by name (case-insensitive)."""
-    name_lower = name.lower()
-    for weapon in ALL_WEAPONS:
-        if weapon.name.lower() == name_lower:
-            return weapon
-    return None
+    return get_catalog().weapons.get(name)
 
 
 def get_armor_by_name(name: str) -> Optional[Armor]:
     """Get armor by name (case-insensitive)."""
-    name_lower = name.lower()
-    for armor in ARMOR:
-        if armor.name.lower() == name_lower:
-            return armor
-    return None
+    return get_catalog().armor.get(name)
 
 
 def get_equipment_by_name(name: str) -> Optional[Equipment]:
     """Get equipment by name (case-insensitive)."""
-    name_lower = name.lower()
-    all_equipment = ADVENTURING_GEAR + TOOLS
-    for item in all_equipment:
-        if item.name.lower() == name_lower:
-            return item
-    return None
+    return get_catalog().equipment.get(name)
 
 
 def search_items(query: str) -> list:
@@ -11,6 +11,7 @@ All content is stored and shared locally only at this time.
 
 import logging
 import sqlite3
+import threading
 import json
 import hashlib
 import uuid
@@ -317,6 +318,12 @@ class HomebrewLibrary:
             db_path = data_dir / "homebrew_library.db"
 
         self.db_path = db_path
+        # The creating thread uses _conn; other threads (AI lookup tools run
+        # in workers) each get their own connection from _local
+        self._owner = threading.get_ident()
+        self._local = threading.local()
+        self._thread_conns: list[sqlite3.Connection] = []
+        self._thread_conns_lock = threading.Lock()
         self._conn: Optional[sqlite3.Connection] = None
         self._user_id: Optional[str] = None
         try:
@@ -338,23 +345,46 @@ class HomebrewLibrary:
         self.close()
 
     def close(self) -> None:
-        """Close database connection."""
+        """Close the database connections of all threads."""
         if self._conn:
             self._conn.close()
             self._conn = None
+        with self._thread_conns_lock:
+            conns, self._thread_conns = self._thread_conns, []
+        for conn in conns:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new database connection with proper cleanup on error."""
+        # Each connection is only used by one thread (see _get_conn); the
+        # check is off so close() can run from any thread
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        try:
+            conn.row_factory = sqlite3.Row
+            # WAL lets worker threads read while another thread writes
+            conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
 
     def _get_conn(self) -> sqlite3.Connection:
-        """Get database connection with proper cleanup on error."""
-        if self._conn is None:
-            conn = sqlite3.connect(self.db_path)
-            try:
-                conn.row_factory = sqlite3.Row
-                conn.execute("PRAGMA journal_mode=WAL")
-                self._conn = conn
-            except sqlite3.Error:
-                conn.close()
-                raise
-        return self._conn
+        """Get the calling thread's database connection.
+
+        A connection is only ever used by the thread that opened it.
+        """
+        if threading.get_ident() == self._owner:
+            if self._conn is None:
+                self._conn = self._connect()
+            return self._conn
+
+        conn = getattr(self._local, "conn", None)
+        with self._thread_conns_lock:
+            if conn is None or conn not in self._thread_conns:
+                conn = self._connect()
+                self._thread_conns.append(conn)
+                self._local.conn = conn
+        return conn
 
     def _init_db(self) -> None:
         """Initialize database schema."""
@@ -458,12 +488,6 @@ class HomebrewLibrary:
 
         conn.commit()
 
-    def close(self) -> None:
-        """Close database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
-
     @property
     def user_id(self) -> str:
         """Get or create user ID for ratings."""
@@ -759,6 +783,18 @@ class HomebrewLibrary:
         )
         return [LibraryContent.from_row(row) for row in cursor.fetchall()]
 
+    def get_installed_version(self) -> tuple:
+        """Cheap fingerprint of the installed content, for caches built from it."""
+        conn = self._get_conn()
+        cursor = conn.execute(
+            """
+            SELECT COUNT(*), MAX(installed_content.installed_at), MAX(library_content.updated_at)
+            FROM library_content
+            JOIN installed_content ON library_content.id = installed_content.content_id
+            """
+        )
+        return tuple(cursor.fetchone())
+
     def is_installed(self, content_id: str) -> bool:
         """Check if content is installed."""
         conn = self._get_conn()
@@ -4,8 +4,11 @@ Contains SRD magic items with original flavor text and accurate mechanics
 across all rarity tiers.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import Optional, Sequence, TYPE_CHECKING
+
+from dnd_manager.data.catalog import get_catalog
+from dnd_manager.data.records import FrozenRecord
 
 if TYPE_CHECKING:
     from dnd_manager.data.prerequisites import Prerequisite
@@ -22,8 +25,8 @@ RARITY_MIN_LEVELS = {
 }
 
 
-@dataclass
-class MagicItem:
+@dataclass(frozen=True, slots=True)
+class MagicItem(FrozenRecord):
     """Represents a magic item.
 
     The ruleset field indicates which rules system the item was designed for:
@@ -37,6 +40,8 @@ class MagicItem:
     - structured_prereq: Prerequisite object for validation (optional)
     """
 
+    _INTERNED = frozenset({"item_type", "rarity", "properties", "ruleset"})
+
     name: str
     item_type: str  # weapon, armor, wondrous, potion, ring, rod, staff, wand, scroll
     rarity: str  # common, uncommon, rare, very_rare, legendary, artifact
@@ -45,7 +50,7 @@ class MagicItem:
     attunement_requirements: Optional[str] = None
     magic_bonus: Optional[int] = None
     charges: Optional[int] = None
-    properties: list[str] = field(default_factory=list)
+    properties: Sequence[str] = ()
     ruleset: Optional[str] = None  # None = universal, "dnd2014", "dnd2024", "tov"
     # New prerequisite fields
     min_level: Optional[int] = None  # Override rarity default, None = use RARITY_MIN_LEVELS
@@ -1449,12 +1454,6 @@ DND_MAGIC_ITEMS: list[MagicItem] = (
 
 ALL_MAGIC_ITEMS: list[MagicItem] = DND_MAGIC_ITEMS + TOV_MAGIC_ITEMS
 
-# Dictionary for quick lookup
-_ITEMS_BY_NAME: dict[str, MagicItem] = {
-    item.name.lower(): item for item in ALL_MAGIC_ITEMS
-}
-
-
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -1462,7 +1461,7 @@ _ITEMS_BY_NAME: dict[str, MagicItem] = {
 
 def get_magic_item(name: str) -> Optional[MagicItem]:
     """Get a magic item by name (case-insensitive)."""
-    return _ITEMS_BY_NAME.get(name.lower())
+    return get_catalog().magic_items.get(name)
 
 
 def get_magic_items_by_rarity(rarity: str) -> list[MagicItem]:
@@ -1472,15 +1471,13 @@ def get_magic_items_by_rarity(rarity: str) -> list[MagicItem]:
         rarity: Rarity name (e.g., "common", "very rare", "very_rare")
                 Spaces and underscores are normalized.
     """
-    # Normalize: lowercase and convert spaces to underscores
-    rarity_normalized = rarity.lower().replace(" ", "_")
-    return [item for item in ALL_MAGIC_ITEMS if item.rarity == rarity_normalized]
+    # Normalize: convert spaces to underscores (case is folded by the index)
+    return list(get_catalog().magic_items.where("rarity", rarity.replace(" ", "_")))
 
 
 def get_magic_items_by_type(item_type: str) -> list[MagicItem]:
     """Get all magic items of a specific type."""
-    type_lower = item_type.lower()
-    return [item for item in ALL_MAGIC_ITEMS if item.item_type == type_lower]
+    return list(get_catalog().magic_items.where("type", item_type))
 
 
 def get_attunement_items() -> list[MagicItem]:
@@ -1494,13 +1491,8 @@ def get_items_with_charges() -> list[MagicItem]:
 
 
 def search_magic_items(query: str) -> list[MagicItem]:
-    """Search magic items by name or description."""
-    query_lower = query.lower()
-    results = []
-    for item in ALL_MAGIC_ITEMS:
-        if query_lower in item.name.lower() or query_lower in item.description.lower():
-            results.append(item)
-    return results
+    """Search magic items by name, type or description, most relevant first."""
+    return get_catalog().search("magic_items", query)
 
 
 def get_all_magic_item_names() -> list[str]:
@@ -3,9 +3,12 @@
 Contains SRD monsters with stats for encounter building and combat tracking.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Optional, Sequence
+
+from dnd_manager.data.catalog import get_catalog
+from dnd_manager.data.records import FrozenRecord
 
 
 class Size(str, Enum):
@@ -36,9 +39,10 @@ class MonsterType(str, Enum):
     UNDEAD = "Undead"
 
 
-@dataclass
-class Attack:
+@dataclass(frozen=True, slots=True)
+class Attack(FrozenRecord):
     """A monster's attack action."""
+    _INTERNED = frozenset({"reach"})
     name: str
     attack_bonus: int
     damage: str  # e.g., "2d6+4 slashing"
@@ -46,24 +50,29 @@ class Attack:
     description: str = ""
 
 
-@dataclass
-class Trait:
+@dataclass(frozen=True, slots=True)
+class Trait(FrozenRecord):
     """A monster's special trait."""
     name: str
     description: str
 
 
-@dataclass
-class Action:
+@dataclass(frozen=True, slots=True)
+class Action(FrozenRecord):
     """A monster's action (non-attack)."""
     name: str
     description: str
     recharge: Optional[str] = None  # e.g., "5-6", "short rest"
 
 
-@dataclass
-class Monster:
+@dataclass(frozen=True, slots=True)
+class Monster(FrozenRecord):
     """A monster stat block."""
+    _INTERNED = frozenset({
+        "alignment", "challenge_rating", "speed", "saving_throws", "skills",
+        "damage_vulnerabilities", "damage_resistances", "damage_immunities",
+        "condition_immunities", "senses", "languages",
+    })
     name: str
     size: Size
     monster_type: MonsterType
@@ -85,19 +94,19 @@ class Monster:
     xp: int
 
     # Optional features
-    saving_throws: list[str] = field(default_factory=list)
-    skills: list[str] = field(default_factory=list)
-    damage_vulnerabilities: list[str] = field(default_factory=list)
-    damage_resistances: list[str] = field(default_factory=list)
-    damage_immunities: list[str] = field(default_factory=list)
-    condition_immunities: list[str] = field(default_factory=list)
+    saving_throws: Sequence[str] = ()
+    skills: Sequence[str] = ()
+    damage_vulnerabilities: Sequence[str] = ()
+    damage_resistances: Sequence[str] = ()
+    damage_immunities: Sequence[str] = ()
+    condition_immunities: Sequence[str] = ()
     senses: str = ""
     languages: str = ""
 
-    traits: list[Trait] = field(default_factory=list)
-    actions: list[Action] = field(default_factory=list)
-    attacks: list[Attack] = field(default_factory=list)
-    legendary_actions: list[Action] = field(default_factory=list)
+    traits: Sequence[Trait] = ()
+    actions: Sequence[Action] = ()
+    attacks: Sequence[Attack] = ()
+    legendary_actions: Sequence[Action] = ()
 
     description: str = ""
 
@@ -2585,12 +2594,6 @@ ALL_MONSTERS: list[Monster] = (
     CR_0 + CR_1_8 + CR_1_4 + CR_1_2 + CR_1 + CR_2 + CR_3 + CR_4 + CR_5 + CR_6_PLUS + CR_10_PLUS
 )
 
-# Dictionary for quick lookup
-_MONSTERS_BY_NAME: dict[str, Monster] = {
-    monster.name.lower(): monster for monster in ALL_MONSTERS
-}
-
-
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -2598,34 +2601,27 @@ _MONSTERS_BY_NAME: dict[str, Monster] = {
 
 def get_monster(name: str) -> Optional[Monster]:
     """Get a monster by name (case-insensitive)."""
-    return _MONSTERS_BY_NAME.get(name.lower())
+    return get_catalog().monsters.get(name)
 
 
 def get_monsters_by_cr(cr: str) -> list[Monster]:
     """Get all monsters of a specific challenge rating."""
-    return [m for m in ALL_MONSTERS if m.challenge_rating == cr]
+    return list(get_catalog().monsters.where("cr", cr))
 
 
 def get_monsters_by_type(monster_type: MonsterType) -> list[Monster]:
     """Get all monsters of a specific type."""
-    return [m for m in ALL_MONSTERS if m.monster_type == monster_type]
+    return list(get_catalog().monsters.where("type", monster_type))
 
 
 def get_monsters_by_cr_range(min_cr: float, max_cr: float) -> list[Monster]:
-    """Get all monsters within a CR range."""
-    return [m for m in ALL_MONSTERS if min_cr <= m.cr_numeric <= max_cr]
+    """Get all monsters within a CR range, lowest CR first."""
+    return list(get_catalog().monsters.between("cr", min_cr, max_cr))
 
 
 def search_monsters(query: str) -> list[Monster]:
-    """Search monsters by name or description."""
-    query_lower = query.lower()
-    results = []
-    for monster in ALL_MONSTERS:
-        if (query_lower in monster.name.lower() or
-            query_lower in monster.description.lower() or
-            query_lower in monster.monster_type.value.lower()):
-            results.append(monster)
-    return results
+    """Search monsters by name, type or description, most relevant first."""
+    return get_catalog().search("monsters", query)
 
 
 def get_all_monster_names() -> list[str]:
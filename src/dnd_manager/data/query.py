@@ -0,0 +1,149 @@
+"""Composable, paginated queries over the catalog indexes.
+
+The AI search methods used to loop over a whole collection testing each
+filter in turn, convert every match to a dict, and only then slice to the
+requested limit. A ``Query`` plans the work instead:
+
+- equality filters on indexed columns (``where``) and range filters
+  (``between``) fetch their candidate tuples from the catalog; the smallest
+  one drives the scan and the others become membership tests,
+- remaining conditions (``filter``) are only evaluated on those candidates,
+- ``page`` applies ``offset``/``limit`` before converting records, so only
+  the returned page is turned into dicts.
+
+Results come in relevance order when the query was seeded with ranked
+search results, in ``order_by`` order if given, and otherwise in the
+collection's canonical order.
+
+    page = (
+        Query(get_catalog().monsters)
+        .between("cr", 1, 5)
+        .where("type", "undead")
+        .order_by("cr")
+        .page(offset=10, limit=10, convert=to_dict)
+    )
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Hashable, Iterable, Optional, Sequence, TypeVar, Union
+
+from dnd_manager.data.catalog import CatalogIndex
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of query results."""
+    items: list  # Converted records
+    total: int  # Number of matches across all pages
+    offset: int
+
+    @property
+    def has_more(self) -> bool:
+        return self.offset + len(self.items) < self.total
+
+
+class Query(Generic[T]):
+    """Builder for filtered, ordered, paginated lookups on a ``CatalogIndex``.
+
+    Builder methods modify the query and return it for chaining. Filters
+    given None are ignored, so optional arguments can be passed straight
+    through.
+    """
+
+    def __init__(self, index: CatalogIndex[T], ranked: Optional[Iterable[T]] = None):
+        """
+        Args:
+            index: Collection to query
+            ranked: Search results, best first; restricts the query to them
+                and keeps their order
+        """
+        self._index = index
+        self._ranked: Optional[tuple[T, ...]] = tuple(ranked) if ranked is not None else None
+        # Candidate sets from indexes, with the order each is in: "" for
+        # canonical, a range index name, or None for unknown
+        self._sources: list[tuple[Sequence[T], Optional[str]]] = []
+        self._predicates: list[Callable[[T], bool]] = []
+        self._order: Optional[tuple[Union[str, Callable[[T], Any]], bool]] = None
+
+    def where(self, index: str, key: Optional[Hashable]) -> "Query[T]":
+        """Keep records filed under ``key`` in an equality index."""
+        if key is not None:
+            self._sources.append((self._index.where(index, key), ""))
+        return self
+
+    def between(self, index: str, low: Optional[float], high: Optional[float]) -> "Query[T]":
+        """Keep records whose ``index`` range value lies in ``[low, high]``."""
+        if low is not None or high is not None:
+            low = low if low is not None else float("-inf")
+            high = high if high is not None else float("inf")
+            self._sources.append((self._index.between(index, low, high), index))
+        return self
+
+    def within(self, records: Sequence[T]) -> "Query[T]":
+        """Keep only the given records (e.g. from another index)."""
+        self._sources.append((records, None))
+        return self
+
+    def filter(self, predicate: Callable[[T], bool]) -> "Query[T]":
+        """Keep records for which ``predicate`` is true."""
+        self._predicates.append(predicate)
+        return self
+
+    def order_by(self, key: Union[str, Callable[[T], Any]], reverse: bool = False) -> "Query[T]":
+        """Sort results by ``key`` (stable: ties keep their order).
+
+        ``key`` may name a range index to sort by its values; no sorting is
+        needed when a ``between`` on that index drove the query.
+        """
+        self._order = (key, reverse)
+        return self
+
+    def all(self) -> list[T]:
+        """Every matching record, in result order."""
+        sources = sorted(self._sources, key=lambda source: len(source[0]))
+        if self._ranked is not None:
+            driver, driver_order = self._ranked, ""
+        elif sources:
+            (driver, driver_order), sources = sources[0], sources[1:]
+        else:
+            driver, driver_order = self._index.records, ""
+
+        members = [{id(record) for record in source} for source, _ in sources]
+        predicates = self._predicates
+        if members or predicates:
+            results = [
+                record for record in driver
+                if all(id(record) in member for member in members)
+                and all(predicate(record) for predicate in predicates)
+            ]
+        else:
+            results = list(driver)
+
+        if self._order is None:
+            if driver_order != "":
+                results.sort(key=self._index.position)
+        else:
+            key, reverse = self._order
+            if isinstance(key, str):
+                if driver_order == key and not reverse:
+                    return results
+                key = self._index.range_key(key)
+            results.sort(key=key, reverse=reverse)
+        return results
+
+    def page(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        convert: Callable[[T], Any] = lambda record: record,
+    ) -> Page:
+        """Matching records from ``offset``, at most ``limit``, converted.
+
+        Only the records on the page are passed to ``convert``.
+        """
+        results = self.all()
+        offset = max(0, offset)
+        end = None if limit is None else offset + max(0, limit)
+        return Page([convert(record) for record in results[offset:end]], len(results), offset)
@@ -0,0 +1,53 @@
+"""Base class for the immutable records of the built-in game data.
+
+Spells, monsters, items and the other SRD records are defined as
+``@dataclass(frozen=True, slots=True)`` subclasses of ``FrozenRecord``.
+Several thousand of them are alive for the whole process, so each one is
+kept compact:
+
+- ``slots=True`` drops the per-instance ``__dict__``,
+- list values are converted to tuples on construction (recursively, so
+  ``[(3, ["bless", "cure wounds"])]`` becomes nested tuples), which lets the
+  data modules keep their list literals; such fields are annotated as
+  ``Sequence[...]`` so the literals type-check,
+- strings in the fields named by ``_INTERNED`` are passed through
+  ``sys.intern``, so repeated values such as schools, class names and
+  rarities share one object across modules and with homebrew records.
+
+Dict fields are left as dicts. Records are shared by every caller, so
+treat those as read-only too.
+"""
+
+import sys
+from typing import Any, ClassVar
+
+
+def _freeze(value: Any, intern: bool) -> Any:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item, intern) for item in value)
+    if intern and type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+class FrozenRecord:
+    """Mixin for frozen, slotted data records.
+
+    Subclasses list the fields whose strings should be interned in
+    ``_INTERNED``. Subclasses that define ``__post_init__`` must call
+    ``super().__post_init__()``.
+    """
+
+    __slots__ = ()
+
+    _INTERNED: ClassVar[frozenset[str]] = frozenset()
+    # Set by @dataclass on each subclass
+    __dataclass_fields__: ClassVar[dict[str, Any]]
+
+    def __post_init__(self) -> None:
+        interned = self._INTERNED
+        for name in self.__dataclass_fields__:
+            value = getattr(self, name)
+            frozen = _freeze(value, name in interned)
+            if frozen is not value:
+                object.__setattr__(self, name, frozen)
@@ -0,0 +1,120 @@
+"""Ranked full-text search over the built-in game data.
+
+Searching used to mean lowercasing every name and description on every
+query and testing for a substring. ``TextIndex`` tokenizes a collection
+once into an inverted index (term -> records containing it) and answers
+queries from that:
+
+- every query word must match, either as a whole term or as the prefix of
+  one ("fire" finds "fireball"), so partial words work while typing,
+- matches are ranked with BM25 over the weighted fields, so a hit in the
+  name outranks one buried in a long description, and a rare word counts
+  for more than a common one.
+
+``GameDataCatalog.search`` builds one index per collection on first use.
+"""
+
+import math
+import re
+from bisect import bisect_left
+from typing import Callable, Generic, Iterable, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+# BM25 parameters: term frequency saturation and document length normalization
+_K1 = 1.2
+_B = 0.75
+# Score multiplier for a term that only extends the query word
+_PREFIX_WEIGHT = 0.5
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into case-folded word tokens."""
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+class TextIndex(Generic[T]):
+    """Inverted index with prefix matching and BM25 ranking."""
+
+    def __init__(
+        self,
+        records: Iterable[T],
+        fields: Sequence[tuple[Callable[[T], Optional[str]], float]],
+    ):
+        """
+        Args:
+            records: Records in their canonical order, used to break ties
+            fields: (text getter, weight) pairs; a term in a field with
+                weight 3 counts as if it appeared three times
+        """
+        self.records: tuple[T, ...] = tuple(records)
+
+        postings: dict[str, dict[int, float]] = {}
+        lengths: list[float] = []
+        for doc, record in enumerate(self.records):
+            length = 0.0
+            for text_of, weight in fields:
+                tokens = tokenize(text_of(record) or "")
+                length += weight * len(tokens)
+                for token in tokens:
+                    docs = postings.setdefault(token, {})
+                    docs[doc] = docs.get(doc, 0.0) + weight
+            lengths.append(length)
+
+        self._postings = {term: tuple(docs.items()) for term, docs in postings.items()}
+        self._terms = sorted(self._postings)
+        self._lengths = lengths
+        self._average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _expand(self, word: str) -> list[str]:
+        """Terms equal to or starting with ``word``."""
+        start = bisect_left(self._terms, word)
+        end = start
+        while end < len(self._terms) and self._terms[end].startswith(word):
+            end += 1
+        return self._terms[start:end]
+
+    def _word_scores(self, word: str) -> dict[int, float]:
+        """BM25 score per document for one query word (best matching term)."""
+        total = len(self.records)
+        scores: dict[int, float] = {}
+        for term in self._expand(word):
+            docs = self._postings[term]
+            idf = math.log(1 + (total - len(docs) + 0.5) / (len(docs) + 0.5))
+            if term != word:
+                idf *= _PREFIX_WEIGHT
+            for doc, frequency in docs:
+                norm = _K1 * (1 - _B + _B * self._lengths[doc] / self._average_length)
+                score = idf * frequency * (_K1 + 1) / (frequency + norm)
+                if score > scores.get(doc, 0.0):
+                    scores[doc] = score
+        return scores
+
+    def ranked(self, query: str) -> list[tuple[T, float]]:
+        """Records matching every word of ``query`` with their scores, best first."""
+        words = dict.fromkeys(tokenize(query))
+        if not words:
+            return []
+
+        totals: Optional[dict[int, float]] = None
+        # Rarest words first so the candidate set shrinks quickly
+        for scores in sorted(map(self._word_scores, words), key=len):
+            if totals is None:
+                totals = scores
+            else:
+                totals = {doc: totals[doc] + s for doc, s in scores.items() if doc in totals}
+            if not totals:
+                return []
+
+        order = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+        return [(self.records[doc], score) for doc, score in order]
+
+    def search(self, query: str, limit: Optional[int] = None) -> list[T]:
+        """Records matching every word of ``query``, most relevant first."""
+        results = [record for record, _ in self.ranked(query)]
+        return results if limit is None else results[:limit]
@@ -0,0 +1,325 @@
+"""Precompiled binary snapshot of the built-in SRD dataset.
+
+The data modules (``spells.py``, ``monsters.py``, ...) remain the source of
+truth. The snapshot is a file next to this module that holds every
+collection as marshalled plain dicts. Spells also carry their fully
+resolved per-ruleset versions, as produced by ``Spell.for_ruleset``.
+
+It serves readers that need the whole dataset as plain data:
+``SemanticLayer.get_data_summary`` (counts for AI prompts) and the SQLite
+full-text mirror in ``srd_fts``. Unmarshalling it takes about 6 ms, where
+converting the dataclass records to dicts (``SRDSnapshot.from_modules``)
+takes about 80 ms.
+
+It does not shorten startup. ``ALL_SPELLS``, the catalog and the ``get_*``
+lookups keep their dataclass records and still execute the data modules,
+since rebuilding those records from the snapshot costs about as much as
+running the modules. A stale snapshot is only slower, never wrong: it is
+ignored and the dicts are built from the modules, and
+``tests/test_snapshot.py`` flags it so it gets regenerated.
+
+Regenerate it after editing any data module, ``records.py`` or this module:
+
+    python -m dnd_manager.data.snapshot
+
+File layout::
+
+    magic        6 bytes   b"CCVSRD"
+    version      uint16    SNAPSHOT_FORMAT_VERSION
+    fingerprint  32 bytes  SHA-256 of the sources (see ``source_fingerprint``)
+    index size   uint32
+    index        marshal   {collection: (offset, length)}
+    blobs        marshal   one tuple of record dicts per collection
+
+The file is memory-mapped and each collection is unmarshalled the first
+time it is requested. A snapshot whose fingerprint no longer matches the
+sources is ignored, and the data is rebuilt from the modules.
+"""
+
+import hashlib
+import importlib
+import logging
+import marshal
+import mmap
+import struct
+import sys
+import threading
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_PATH = Path(__file__).with_name("srd_snapshot.bin")
+
+_MAGIC = b"CCVSRD"
+_HEADER = struct.Struct("<6sH32sI")
+# Pinned so snapshots written by newer Pythons stay readable by older ones
+_MARSHAL_VERSION = 4
+
+# Data modules whose source the snapshot is derived from
+SOURCE_MODULES = (
+    "backgrounds",
+    "classes",
+    "feats",
+    "items",
+    "magic_items",
+    "monsters",
+    "species",
+    "spells",
+    "subclasses",
+)
+
+# Modules that shape the records without holding data: the record base
+# class and the conversion below. Spell variant resolution lives in spells.py.
+BUILD_MODULES = (
+    "records",
+    "snapshot",
+)
+
+Record = dict[str, Any]
+
+
+def _plain(value: Any) -> Any:
+    """Convert dataclasses and enums into marshal-friendly builtins."""
+    if is_dataclass(value) and not isinstance(value, type):
+        # Underscore fields are runtime caches, not data
+        return {
+            f.name: _plain(getattr(value, f.name))
+            for f in fields(value)
+            if not f.name.startswith("_")
+        }
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {_plain(key): _plain(item) for key, item in value.items()}
+    return value
+
+
+def _spell_records() -> tuple[Record, ...]:
+    from dnd_manager.data.spells import ALL_SPELLS
+
+    records = []
+    for spell in ALL_SPELLS:
+        record = _plain(spell)
+        record["resolved"] = {
+            ruleset: _plain(spell.for_ruleset(ruleset)) for ruleset in spell.variants
+        }
+        records.append(record)
+    return tuple(records)
+
+
+def _keyed_records(mapping: dict[str, Any]) -> tuple[Record, ...]:
+    """Records from a name-keyed dict, keeping the key (it can differ from .name)."""
+    return tuple({"key": key, **_plain(value)} for key, value in mapping.items())
+
+
+def _records(attr: str, module: str) -> Callable[[], tuple[Record, ...]]:
+    def build() -> tuple[Record, ...]:
+        items = getattr(importlib.import_module(f"dnd_manager.data.{module}"), attr)
+        if isinstance(items, dict):
+            return _keyed_records(items)
+        return tuple(_plain(item) for item in items)
+    return build
+
+
+# Collection name -> builder reading the source modules
+COLLECTIONS: dict[str, Callable[[], tuple[Record, ...]]] = {
+    "spells": _spell_records,
+    "weapons": _records("ALL_WEAPONS", "items"),
+    "armor": _records("ARMOR", "items"),
+    "adventuring_gear": _records("ADVENTURING_GEAR", "items"),
+    "tools": _records("TOOLS", "items"),
+    "magic_items": _records("ALL_MAGIC_ITEMS", "magic_items"),
+    "monsters": _records("ALL_MONSTERS", "monsters"),
+    "classes": _records("ALL_CLASSES", "classes"),
+    "subclasses": _records("ALL_SUBCLASSES", "subclasses"),
+    "species": _records("ALL_SPECIES", "species"),
+    "backgrounds": _records("ALL_BACKGROUNDS", "backgrounds"),
+    "feats": _records("ALL_FEATS", "feats"),
+}
+
+
+def source_fingerprint() -> Optional[bytes]:
+    """SHA-256 over the data and build module sources, or None if they aren't on disk."""
+    digest = hashlib.sha256(f"{SNAPSHOT_FORMAT_VERSION}\0".encode())
+    directory = Path(__file__).parent
+    for module in SOURCE_MODULES + BUILD_MODULES:
+        try:
+            digest.update((directory / f"{module}.py").read_bytes())
+        except OSError:
+            return None
+        digest.update(b"\0")
+    return digest.digest()
+
+
+def build_collections() -> dict[str, tuple[Record, ...]]:
+    """Build every collection from the source modules."""
+    return {name: build() for name, build in COLLECTIONS.items()}
+
+
+def write_snapshot(path: Path = SNAPSHOT_PATH) -> int:
+    """Serialize the dataset to ``path`` atomically.
+
+    Returns:
+        The size of the written file in bytes
+    """
+    fingerprint = source_fingerprint()
+    if fingerprint is None:
+        raise OSError("Data module sources not found; cannot build snapshot")
+
+    blobs = {
+        name: marshal.dumps(records, _MARSHAL_VERSION)
+        for name, records in build_collections().items()
+    }
+    index: dict[str, tuple[int, int]] = {}
+    offset = 0
+    for name, blob in blobs.items():
+        index[name] = (offset, len(blob))
+        offset += len(blob)
+    index_blob = marshal.dumps(index, _MARSHAL_VERSION)
+
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, SNAPSHOT_FORMAT_VERSION, fingerprint, len(index_blob)))
+        f.write(index_blob)
+        for blob in blobs.values():
+            f.write(blob)
+    temp_path.replace(path)
+    return path.stat().st_size
+
+
+class SRDSnapshot:
+    """Read access to the dataset as tuples of plain record dicts.
+
+    Treat records as read-only; they are shared by every caller.
+    """
+
+    def __init__(
+        self,
+        loaders: dict[str, Callable[[], tuple[Record, ...]]],
+        source: str,
+        fingerprint: Optional[bytes] = None,
+    ):
+        self.source = source  # "snapshot" or "modules"
+        # Identifies the dataset version; None if the sources aren't on disk
+        self.fingerprint = fingerprint
+        self._loaders = loaders
+        self._cache: dict[str, tuple[Record, ...]] = {}
+        self._lock = threading.Lock()
+        self._mapped: Optional[mmap.mmap] = None  # Kept open for lazy loads
+
+    @classmethod
+    def from_modules(cls) -> "SRDSnapshot":
+        """Build collections from the source modules on demand."""
+        return cls(dict(COLLECTIONS), source="modules", fingerprint=source_fingerprint())
+
+    @classmethod
+    def open(cls, path: Path = SNAPSHOT_PATH, verify: bool = True) -> Optional["SRDSnapshot"]:
+        """Memory-map a snapshot file.
+
+        Returns None if the file is missing, unreadable, in another format
+        version, or (with ``verify``) built from different sources.
+        """
+        try:
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable SRD snapshot {path}: {e}")
+            return None
+
+        try:
+            magic, version, fingerprint, index_size = _HEADER.unpack_from(mapped)
+            if magic != _MAGIC or version != SNAPSHOT_FORMAT_VERSION:
+                raise ValueError(f"unsupported format {magic!r} v{version}")
+            if verify:
+                current = source_fingerprint()
+                if current is not None and current != fingerprint:
+                    logger.info(f"SRD snapshot {path} is stale; using data modules")
+                    mapped.close()
+                    return None
+            base = _HEADER.size + index_size
+            index = marshal.loads(mapped[_HEADER.size:base])
+        except (struct.error, ValueError, EOFError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable SRD snapshot {path}: {e}")
+            mapped.close()
+            return None
+
+        def loader(offset: int, length: int) -> Callable[[], tuple[Record, ...]]:
+            start = base + offset
+            return lambda: marshal.loads(mapped[start:start + length])
+
+        snapshot = cls(
+            {name: loader(offset, length) for name, (offset, length) in index.items()},
+            source="snapshot",
+            fingerprint=fingerprint,
+        )
+        snapshot._mapped = mapped
+        return snapshot
+
+    @property
+    def collections(self) -> list[str]:
+        return list(self._loaders)
+
+    def __getitem__(self, name: str) -> tuple[Record, ...]:
+        records = self._cache.get(name)
+        if records is None:
+            with self._lock:
+                records = self._cache.get(name)
+                if records is None:
+                    records = self._loaders[name]()
+                    self._cache[name] = records
+        return records
+
+
+def spell_for_ruleset(record: Record, ruleset: str) -> Record:
+    """The resolved version of a spell record for ``ruleset``."""
+    return record["resolved"].get(ruleset, record)
+
+
+_snapshot: Optional[SRDSnapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+def get_snapshot() -> SRDSnapshot:
+    """Get the process-wide dataset, from the snapshot file when it is current."""
+    global _snapshot
+    if _snapshot is None:
+        with _snapshot_lock:
+            if _snapshot is None:
+                _snapshot = SRDSnapshot.open() or SRDSnapshot.from_modules()
+    return _snapshot
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Rebuild the snapshot, or with --check report whether it is current."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m dnd_manager.data.snapshot",
+        description="Build the binary SRD snapshot from the data modules.",
+    )
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the snapshot is stale")
+    parser.add_argument("--output", type=Path, default=SNAPSHOT_PATH)
+    args = parser.parse_args(argv)
+
+    if args.check:
+        if SRDSnapshot.open(args.output) is None:
+            print(f"{args.output} is missing or stale; run python -m dnd_manager.data.snapshot")
+            return 1
+        print(f"{args.output} is up to date")
+        return 0
+
+    size = write_snapshot(args.output)
+    print(f"Wrote {args.output} ({size / 1024:.0f} KiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,11 +14,14 @@ runtime parsing, and dataclass methods on species instances.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Sequence
 
+from dnd_manager.data.catalog import get_catalog
+from dnd_manager.data.records import FrozenRecord
 
-@dataclass
-class RacialTrait:
+
+@dataclass(frozen=True, slots=True)
+class RacialTrait(FrozenRecord):
     """A racial trait or feature.
 
     The min_level field indicates when a trait becomes available:
@@ -30,37 +33,39 @@ class RacialTrait:
     min_level: int = 1  # Character level required (1 = always available)
 
 
-@dataclass
-class Subspecies:
+@dataclass(frozen=True, slots=True)
+class Subspecies(FrozenRecord):
     """A subspecies variant (subrace in 2014 terminology)."""
     name: str
     description: str
     ability_bonuses: dict[str, int] = field(default_factory=dict)
-    traits: list[RacialTrait] = field(default_factory=list)
+    traits: Sequence[RacialTrait] = ()
 
 
-@dataclass
-class Heritage:
+@dataclass(frozen=True, slots=True)
+class Heritage(FrozenRecord):
     """A ToV Heritage (cultural background)."""
+    _INTERNED = frozenset({"skill_proficiencies"})
     name: str
     description: str
-    skill_proficiencies: list[str] = field(default_factory=list)
+    skill_proficiencies: Sequence[str] = ()
     languages: int = 0  # Number of additional languages
-    traits: list[RacialTrait] = field(default_factory=list)
+    traits: Sequence[RacialTrait] = ()
 
 
-@dataclass
-class Species:
+@dataclass(frozen=True, slots=True)
+class Species(FrozenRecord):
     """A playable species (race/lineage) definition."""
+    _INTERNED = frozenset({"size", "languages", "ruleset"})
     name: str
     description: str
     size: str  # Small, Medium, Large
     speed: int  # Base speed (2014 rules)
     ability_bonuses: dict[str, int]  # Base bonuses (2014 rules)
-    languages: list[str]
-    traits: list[RacialTrait] = field(default_factory=list)
+    languages: Sequence[str]
+    traits: Sequence[RacialTrait] = ()
     darkvision: int = 0  # Range in feet, 0 if none
-    subspecies: list[Subspecies] = field(default_factory=list)
+    subspecies: Sequence[Subspecies] = ()
     age_info: str = ""
     alignment_tendency: str = ""
     # Ruleset support
@@ -2735,10 +2740,7 @@ DRACONIC_ANCESTRY: dict[str, dict[str, str]] = {
 
 def get_species(name: str) -> Optional[Species]:
     """Get a species by name (case-insensitive)."""
-    for species_name, species in ALL_SPECIES.items():
-        if species_name.lower() == name.lower():
-            return species
-    return None
+    return get_catalog().species.get(name)
 
 
 def get_all_species_names() -> list[str]:
@@ -2750,7 +2752,7 @@ def get_subraces(species_name: str) -> list[Subspecies]:
     """Get all subspecies for a species."""
     species = get_species(species_name)
     if species:
-        return species.subspecies
+        return list(species.subspecies)
     return []
 
 
@@ -2765,19 +2767,13 @@ def get_subspecies(species_name: str, subspecies_name: str) -> Optional[Subspeci
 
 
 def search_species(query: str) -> list[Species]:
-    """Search species by name or description."""
-    query = query.lower()
-    results = []
-    for species in ALL_SPECIES.values():
-        if query in species.name.lower() or query in species.description.lower():
-            results.append(species)
-    return results
+    """Search species by name or description, most relevant first."""
+    return get_catalog().search("species", query)
 
 
 def get_species_by_size(size: str) -> list[Species]:
     """Get all species of a particular size."""
-    size = size.capitalize()
-    return [s for s in ALL_SPECIES.values() if s.size == size]
+    return list(get_catalog().species.where("size", size))
 
 
 def get_species_with_darkvision() -> list[Species]:
@@ -31,11 +31,15 @@ Structure:
 
 import re
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Sequence
 
+from dnd_manager.data.catalog import get_catalog
+from dnd_manager.data.records import FrozenRecord
 
-@dataclass
-class SpellVariant:
+
+@dataclass(frozen=True, slots=True)
+class SpellVariant(FrozenRecord):
     """Ruleset-specific overrides for a spell.
 
     Only include fields that differ from the base spell.
@@ -49,13 +53,14 @@ class SpellVariant:
     higher_levels: Optional[str] = None
 
 
-@dataclass
-class Spell:
+@dataclass(frozen=True, slots=True)
+class Spell(FrozenRecord):
     """A D&D spell definition.
 
     Base values are for 2024 rules. Use `variants` for ruleset-specific
     differences and call `for_ruleset()` to get the resolved spell.
     """
+    _INTERNED = frozenset({"school", "casting_time", "range", "duration", "classes"})
     name: str
     level: int  # 0 = cantrip
     school: str
@@ -64,26 +69,39 @@ class Spell:
     components: str
     duration: str
     description: str
-    classes: list[str]
+    classes: Sequence[str]
     ritual: bool = False
     concentration: bool = False
     higher_levels: Optional[str] = None
     # Ruleset variants: {"dnd2014": SpellVariant(...), ...}
     variants: dict[str, SpellVariant] = field(default_factory=dict)
+    # Resolved spells by ruleset, filled in by for_ruleset()
+    _resolved: dict[str, "Spell"] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def for_ruleset(self, ruleset: str = "dnd2024") -> "Spell":
         """Get this spell with ruleset-specific variant applied.
 
+        The resolved spell is built once per ruleset and cached, so repeated
+        calls return the same object. Treat it as read-only.
+
         Args:
             ruleset: The ruleset ID (e.g., "dnd2014", "dnd2024")
 
         Returns:
-            A new Spell with variant overrides applied, or self if no variant.
+            A Spell with variant overrides applied, or self if no variant.
         """
         if ruleset not in self.variants:
             return self
 
-        variant = self.variants[ruleset]
+        resolved = self._resolved.get(ruleset)
+        if resolved is None:
+            resolved = self._resolved[ruleset] = self._apply_variant(self.variants[ruleset])
+        return resolved
+
+    def _apply_variant(self, variant: SpellVariant) -> "Spell":
+        """Build a new Spell with ``variant``'s overrides applied."""
         return Spell(
             name=self.name,
             level=self.level,
@@ -108,6 +126,10 @@ class Spell:
         """Check if this spell has a material component."""
         return "M" in self.components and "(" in self.components
 
+    def material_component(self) -> Optional["MaterialComponent"]:
+        """Get the parsed material component, or None if there isn't one."""
+        return parse_material_component(self.components)
+
     def get_material_description(self) -> Optional[str]:
         """Extract the material component description.
 
@@ -115,12 +137,8 @@ class Spell:
             The material component text (e.g., "a pearl worth at least 100 gp"),
             or None if no material component.
         """
-        if "M" not in self.components:
-            return None
-        match = re.search(r"M\s*\(([^)]+)\)", self.components)
-        if match:
-            return match.group(1).strip()
-        return None
+        material = self.material_component()
+        return material.description if material else None
 
     def get_material_cost(self) -> Optional[int]:
         """Extract the gold piece cost of material components.
@@ -128,35 +146,8 @@ class Spell:
         Returns:
             The cost in gold pieces, or None if no cost specified.
         """
-        material = self.get_material_description()
-        if material is None:
-            return None
-
-        # Patterns to match:
-        # - "worth at least 100 gp"
-        # - "worth 50 gp"
-        # - "100 gp worth of"
-        # - "100 gp, which is consumed"
-        # - "worth at least 50 gp each" (multiply by 2 for pairs)
-        patterns = [
-            r"worth\s+(?:at\s+least\s+)?(\d+(?:,\d+)?)\s*gp",  # worth [at least] X gp
-            r"(\d+(?:,\d+)?)\s*gp\s+worth",  # X gp worth of
-            r"(\d+(?:,\d+)?)\s*gp[,\s]",  # X gp, consumed
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, material, re.IGNORECASE)
-            if match:
-                cost_str = match.group(1).replace(",", "")
-                cost = int(cost_str)
-                # Check for "each" indicating multiple items (e.g., "50 gp each")
-                if "each" in material.lower():
-                    # Count common multiplier words
-                    if "pair" in material.lower() or "rings" in material.lower():
-                        cost *= 2
-                return cost
-
-        return None
+        material = self.material_component()
+        return material.cost if material else None
 
     def is_material_consumed(self) -> bool:
         """Check if the material component is consumed by the spell.
@@ -164,17 +155,71 @@ class Spell:
         Returns:
             True if the material is consumed, False otherwise.
         """
-        material = self.get_material_description()
-        if material is None:
-            return False
+        material = self.material_component()
+        return material.consumed if material else False
+
 
-        material_lower = material.lower()
-        return any(word in material_lower for word in [
-            "consumed",
-            "consumes",
-            "which the spell consumes",
-            "which is consumed",
-        ])
+@dataclass(frozen=True, slots=True)
+class MaterialComponent(FrozenRecord):
+    """A spell's material component, parsed from its components string."""
+    description: str  # e.g., "a pearl worth at least 100 gp"
+    cost: Optional[int] = None  # Gold pieces, None if no cost specified
+    consumed: bool = False
+
+
+_MATERIAL_PATTERN = re.compile(r"M\s*\(([^)]+)\)")
+
+# Patterns to match:
+# - "worth at least 100 gp"
+# - "worth 50 gp"
+# - "100 gp worth of"
+# - "100 gp, which is consumed"
+# - "worth at least 50 gp each" (multiply by 2 for pairs)
+_COST_PATTERNS = (
+    re.compile(r"worth\s+(?:at\s+least\s+)?(\d+(?:,\d+)?)\s*gp", re.IGNORECASE),  # worth [at least] X gp
+    re.compile(r"(\d+(?:,\d+)?)\s*gp\s+worth", re.IGNORECASE),  # X gp worth of
+    re.compile(r"(\d+(?:,\d+)?)\s*gp[,\s]", re.IGNORECASE),  # X gp, consumed
+)
+
+# Also covers "which the spell consumes" and "which is consumed"
+_CONSUMED_WORDS = ("consumed", "consumes")
+
+
+@lru_cache(maxsize=None)
+def parse_material_component(components: str) -> Optional[MaterialComponent]:
+    """Parse the material component out of a spell's components string.
+
+    Results are cached per components string, so each distinct string is
+    parsed once per process.
+
+    Args:
+        components: A components string, e.g. "V, S, M (a pearl worth 100 gp)"
+
+    Returns:
+        The parsed component, or None if there is no material component.
+    """
+    if "M" not in components:
+        return None
+    match = _MATERIAL_PATTERN.search(components)
+    if not match:
+        return None
+    description = match.group(1).strip()
+    description_lower = description.lower()
+
+    cost = None
+    for pattern in _COST_PATTERNS:
+        match = pattern.search(description)
+        if match:
+            cost = int(match.group(1).replace(",", ""))
+            # Check for "each" indicating multiple items (e.g., "50 gp each")
+            if "each" in description_lower:
+                # Count common multiplier words
+                if "pair" in description_lower or "rings" in description_lower:
+                    cost *= 2
+            break
+
+    consumed = any(word in description_lower for word in _CONSUMED_WORDS)
+    return MaterialComponent(description=description, cost=cost, consumed=consumed)
 
 
 # SRD Cantrips
@@ -7584,30 +7629,22 @@ ALL_SPELLS = (
 
 def get_spells_by_level(level: int) -> list[Spell]:
     """Get all spells of a specific level."""
-    return [s for s in ALL_SPELLS if s.level == level]
+    return list(get_catalog().spells.where("level", level))
 
 
 def get_spells_by_class(class_name: str) -> list[Spell]:
-    """Get all spells available to a class."""
-    return [s for s in ALL_SPELLS if class_name in s.classes]
+    """Get all spells available to a class (case-insensitive)."""
+    return list(get_catalog().spells.where("class", class_name))
 
 
 def get_spell_by_name(name: str) -> Optional[Spell]:
     """Get a spell by name (case-insensitive)."""
-    name_lower = name.lower()
-    for spell in ALL_SPELLS:
-        if spell.name.lower() == name_lower:
-            return spell
-    return None
+    return get_catalog().spells.get(name)
 
 
 def search_spells(query: str) -> list[Spell]:
-    """Search spells by name or description."""
-    query_lower = query.lower()
-    return [
-        s for s in ALL_SPELLS
-        if query_lower in s.name.lower() or query_lower in s.description.lower()
-    ]
+    """Search spells by name or description, most relevant first."""
+    return get_catalog().search("spells", query)
 
 
 def get_spell_for_ruleset(name: str, ruleset: str = "dnd2024") -> Optional[Spell]:
@@ -7620,20 +7657,17 @@ def get_spell_for_ruleset(name: str, ruleset: str = "dnd2024") -> Optional[Spell
     Returns:
         The spell with the appropriate variant applied, or None if not found.
     """
-    spell = get_spell_by_name(name)
-    if spell:
-        return spell.for_ruleset(ruleset)
-    return None
+    return get_catalog().for_ruleset(ruleset).spells.get(name)
 
 
 def get_spells_by_level_for_ruleset(level: int, ruleset: str = "dnd2024") -> list[Spell]:
     """Get all spells of a specific level with ruleset variants applied."""
-    return [s.for_ruleset(ruleset) for s in ALL_SPELLS if s.level == level]
+    return list(get_catalog().for_ruleset(ruleset).spells.where("level", level))
 
 
 def get_spells_by_class_for_ruleset(class_name: str, ruleset: str = "dnd2024") -> list[Spell]:
     """Get all spells available to a class with ruleset variants applied."""
-    return [s.for_ruleset(ruleset) for s in ALL_SPELLS if class_name in s.classes]
+    return list(get_catalog().for_ruleset(ruleset).spells.where("class", class_name))
 
 
 def get_spells_with_variants() -> list[Spell]:
@@ -7650,12 +7684,27 @@ def get_spells_with_material_cost(min_cost: int = 1) -> list[Spell]:
     Returns:
         List of spells with material costs at or above min_cost.
     """
-    result = []
-    for spell in ALL_SPELLS:
-        cost = spell.get_material_cost()
-        if cost is not None and cost >= min_cost:
-            result.append(spell)
-    return result
+    return [
+        spell for spell in get_catalog().spell_materials
+        if (cost := spell.get_material_cost()) is not None and cost >= min_cost
+    ]
+
+
+def get_spells_by_material_cost(
+    min_cost: float = 0, max_cost: float = float("inf")
+) -> list[Spell]:
+    """Get spells whose material component costs between min_cost and max_cost gp.
+
+    Spells without a priced material component are not included.
+
+    Args:
+        min_cost: Minimum cost in gold pieces, inclusive
+        max_cost: Maximum cost in gold pieces, inclusive
+
+    Returns:
+        Matching spells, cheapest first.
+    """
+    return list(get_catalog().spell_materials.between("cost", min_cost, max_cost))
 
 
 def get_spells_with_consumed_materials() -> list[Spell]:
@@ -7664,7 +7713,7 @@ def get_spells_with_consumed_materials() -> list[Spell]:
     Returns:
         List of spells where material is consumed.
     """
-    return [s for s in ALL_SPELLS if s.is_material_consumed()]
+    return list(get_catalog().spell_materials.where("consumed", True))
 
 
 def get_spell_cost_summary() -> dict[str, list[tuple[str, int, bool]]]:
@@ -7676,13 +7725,11 @@ def get_spell_cost_summary() -> dict[str, list[tuple[str, int, bool]]]:
     """
     summary: dict[str, list[tuple[str, int, bool]]] = {}
 
-    for spell in ALL_SPELLS:
-        cost = spell.get_material_cost()
-        if cost is not None:
+    for spell in get_catalog().spell_materials:
+        material = spell.material_component()
+        if material.cost is not None:
             level_key = "Cantrip" if spell.level == 0 else f"Level {spell.level}"
-            if level_key not in summary:
-                summary[level_key] = []
-            summary[level_key].append((spell.name, cost, spell.is_material_consumed()))
+            summary.setdefault(level_key, []).append((spell.name, material.cost, material.consumed))
 
     # Sort each level's spells by cost (descending)
     for level_key in summary:
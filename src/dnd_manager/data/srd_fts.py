@@ -0,0 +1,301 @@
+"""SQLite FTS5 mirror of the built-in SRD content.
+
+The notes and homebrew library search with SQLite FTS5; this module gives
+the built-in spells, monsters, feats, magic items and subclasses the same
+treatment. A read-only database is generated from the SRD snapshot on first
+use and stored in the user cache directory (or ``$DND_MANAGER_CACHE_DIR``
+if set), named after the dataset version (the snapshot's source fingerprint). Editing a data module
+therefore yields a new file instead of serving stale rows; files for other
+versions are deleted when a new one is built.
+
+Queries support:
+
+- prefix matching on every word: ``fire dam`` matches "fire damage",
+- phrases in double quotes: ``"bonus action"``,
+- BM25 ranking with names weighted over tags (school, type, rarity, ...)
+  and tags over descriptions.
+
+User input never reaches FTS5 as syntax: it is reduced to word tokens,
+each quoted, so operators and column filters cannot be injected.
+
+Each row stores its position in the collection's list (``ALL_SPELLS``,
+``ALL_MONSTERS``, ...), so results map straight back to the records.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from platformdirs import user_cache_dir
+
+from dnd_manager.data.search import tokenize
+from dnd_manager.data.snapshot import SRDSnapshot, get_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Bump when the table layout or indexed text changes
+FTS_SCHEMA_VERSION = 1
+
+# Environment variable overriding the directory the database is kept in
+CACHE_DIR_ENV = "DND_MANAGER_CACHE_DIR"
+
+Record = dict[str, Any]
+
+
+def _join(*values: Any) -> str:
+    parts: list[str] = []
+    for value in values:
+        if isinstance(value, (list, tuple)):
+            parts.extend(str(item) for item in value)
+        elif value:
+            parts.append(str(value))
+    return " ".join(parts)
+
+
+# Collection -> text for the tags column
+COLLECTIONS: dict[str, Callable[[Record], str]] = {
+    "spells": lambda r: _join(r["school"], r["classes"]),
+    "monsters": lambda r: _join(r["monster_type"], r["size"]),
+    "feats": lambda r: _join(r["category"].replace("_", " ")),
+    "magic_items": lambda r: _join(r["item_type"], r["rarity"].replace("_", " ")),
+    "subclasses": lambda r: _join(r["parent_class"]),
+}
+
+# bm25() column weights: name, tags, body
+_WEIGHTS = (4.0, 2.0, 1.0)
+
+_QUERY_PART = re.compile(r'"([^"]*)"?|([^\s"]+)')
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """Translate user input into a safe FTS5 MATCH expression.
+
+    Quoted text becomes a phrase; every other word is matched as a prefix.
+    All parts must match. Returns None if the input has no words.
+    """
+    terms: list[str] = []
+    for phrase, word in _QUERY_PART.findall(query):
+        if phrase:
+            tokens = tokenize(phrase)
+            if tokens:
+                terms.append('"' + " ".join(tokens) + '"')
+        else:
+            terms.extend(f'"{token}"*' for token in tokenize(word))
+    return " AND ".join(terms) if terms else None
+
+
+def fts5_available() -> bool:
+    """Check that this Python's SQLite was compiled with FTS5."""
+    try:
+        with sqlite3.connect(":memory:") as conn:
+            conn.execute("CREATE VIRTUAL TABLE probe USING fts5(text)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def dataset_version(snapshot: SRDSnapshot) -> Optional[str]:
+    """Version key for the database built from ``snapshot``."""
+    if snapshot.fingerprint is None:
+        return None
+    return f"{FTS_SCHEMA_VERSION}-{snapshot.fingerprint.hex()[:16]}"
+
+
+def _rows(snapshot: SRDSnapshot) -> Iterable[tuple[str, str, str, str, int]]:
+    for collection, tags_of in COLLECTIONS.items():
+        for position, record in enumerate(snapshot[collection]):
+            yield (
+                record["name"],
+                tags_of(record),
+                record.get("description") or "",
+                collection,
+                position,
+            )
+
+
+def build_database(path: Path, snapshot: SRDSnapshot, version: str) -> int:
+    """Write the FTS database for ``snapshot`` to ``path`` atomically.
+
+    Returns:
+        The number of indexed records
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temp_path.unlink(missing_ok=True)
+    conn = sqlite3.connect(temp_path)
+    try:
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        conn.execute("""
+            CREATE VIRTUAL TABLE srd_fts USING fts5(
+                name,
+                tags,
+                body,
+                collection UNINDEXED,
+                position UNINDEXED,
+                tokenize='unicode61 remove_diacritics 2',
+                prefix='2 3'
+            )
+        """)
+        cursor = conn.executemany(
+            "INSERT INTO srd_fts (name, tags, body, collection, position) VALUES (?, ?, ?, ?, ?)",
+            _rows(snapshot),
+        )
+        count = cursor.rowcount
+        conn.execute("INSERT INTO srd_fts (srd_fts) VALUES ('optimize')")
+        conn.execute("INSERT INTO meta (key, value) VALUES ('version', ?)", (version,))
+        conn.commit()
+    except BaseException:
+        conn.close()
+        temp_path.unlink(missing_ok=True)
+        raise
+    conn.close()
+    temp_path.replace(path)
+    return count
+
+
+@dataclass
+class SRDMatch:
+    """One full-text search hit."""
+    collection: str  # spells, monsters, feats, magic_items, subclasses
+    position: int  # Index into the collection's list (e.g. ALL_SPELLS)
+    name: str
+    score: float  # Higher is better
+    snippet: str  # Description excerpt with matches in [brackets]
+
+
+class SRDFullTextIndex:
+    """Read-only connection to a built SRD FTS database."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(
+            f"{db_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+
+    @classmethod
+    def open(
+        cls,
+        directory: Optional[Path] = None,
+        snapshot: Optional[SRDSnapshot] = None,
+    ) -> Optional["SRDFullTextIndex"]:
+        """Open the database for the current dataset, building it if needed.
+
+        Returns None if FTS5 is unavailable, the dataset has no version, or
+        the database cannot be built; callers fall back to in-memory search.
+        """
+        if not fts5_available():
+            logger.info("SQLite has no FTS5; SRD full-text search disabled")
+            return None
+        snapshot = snapshot or get_snapshot()
+        version = dataset_version(snapshot)
+        if version is None:
+            return None
+        if directory is None:
+            directory = cache_dir()
+
+        path = directory / f"srd_fts-{version}.db"
+        try:
+            if not path.exists() or cls._stored_version(path) != version:
+                count = build_database(path, snapshot, version)
+                logger.info(f"Built SRD full-text index {path} ({count} records)")
+                for old in directory.glob("srd_fts-*.db"):
+                    if old != path:
+                        old.unlink(missing_ok=True)
+            return cls(path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"SRD full-text index unavailable: {e}")
+            return None
+
+    @staticmethod
+    def _stored_version(path: Path) -> Optional[str]:
+        try:
+            with sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True) as conn:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+                return row[0] if row else None
+        except sqlite3.Error:
+            return None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def search(
+        self,
+        query: str,
+        collections: Optional[Iterable[str]] = None,
+        limit: Optional[int] = 20,
+    ) -> list[SRDMatch]:
+        """Ranked search; see the module docstring for the query syntax.
+
+        Args:
+            query: Words to prefix-match and/or "quoted phrases"
+            collections: Restrict to these collections (default: all)
+            limit: Maximum number of results, or None for all
+        """
+        match = build_match_query(query)
+        if match is None:
+            return []
+
+        sql = """
+            SELECT collection, position, name,
+                   bm25(srd_fts, ?, ?, ?) AS score,
+                   snippet(srd_fts, 2, '[', ']', '...', 12) AS excerpt
+            FROM srd_fts
+            WHERE srd_fts MATCH ?
+        """
+        params: list[Any] = [*_WEIGHTS, match]
+        if collections is not None:
+            wanted = list(collections)
+            sql += f" AND collection IN ({', '.join('?' * len(wanted))})"
+            params.extend(wanted)
+        sql += " ORDER BY score, rowid"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(max(1, limit))
+
+        with self._lock:
+            if self._conn is None:
+                return []
+            try:
+                rows = self._conn.execute(sql, params).fetchall()
+            except sqlite3.OperationalError as e:
+                logger.warning(f"SRD FTS5 search error: {e}")
+                return []
+        # bm25() is lower-is-better; flip it so higher is better
+        return [
+            SRDMatch(collection, position, name, -score, excerpt)
+            for collection, position, name, score, excerpt in rows
+        ]
+
+
+def cache_dir() -> Path:
+    """Directory for the database: ``$DND_MANAGER_CACHE_DIR`` or the user cache."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    return Path(user_cache_dir("dnd-manager", "dnd-manager"))
+
+
+_index: Optional[SRDFullTextIndex] = None
+_index_checked = False
+_index_lock = threading.Lock()
+
+
+def get_srd_fts() -> Optional[SRDFullTextIndex]:
+    """Get the process-wide SRD full-text index, or None if unavailable."""
+    global _index, _index_checked
+    if not _index_checked:
+        with _index_lock:
+            if not _index_checked:
+                _index = SRDFullTextIndex.open()
+                _index_checked = True
+    return _index
@@ -8,12 +8,15 @@ dataclass definitions. This provides IDE type checking, fast imports without
 runtime parsing, and dataclass methods on subclass instances.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import dataclass
+from typing import Optional, Sequence
 
+from dnd_manager.data.catalog import get_catalog
+from dnd_manager.data.records import FrozenRecord
 
-@dataclass
-class SubclassFeature:
+
+@dataclass(frozen=True, slots=True)
+class SubclassFeature(FrozenRecord):
     """A feature granted by a subclass at a specific level."""
 
     name: str
@@ -21,18 +24,20 @@ class SubclassFeature:
     description: str
 
 
-@dataclass
-class Subclass:
+@dataclass(frozen=True, slots=True)
+class Subclass(FrozenRecord):
     """A subclass specialization for a character class.
 
     For ToV subclasses, features typically come at levels 3, 7, 11, and 15.
     """
 
+    _INTERNED = frozenset({"parent_class", "source", "ruleset", "subclass_spells"})
+
     name: str
     parent_class: str
     description: str
-    features: list[SubclassFeature] = field(default_factory=list)
-    subclass_spells: list[tuple[int, list[str]]] = field(default_factory=list)
+    features: Sequence[SubclassFeature] = ()
+    subclass_spells: Sequence[tuple[int, Sequence[str]]] = ()
     source: str = "SRD"
     ruleset: Optional[str] = None  # None = all rulesets, "tov" = Tales of the Valiant only
 
@@ -4451,19 +4456,6 @@ DND_SUBCLASSES: list[Subclass] = DND_2014_SUBCLASSES + DND_2024_SUBCLASSES
 
 ALL_SUBCLASSES: list[Subclass] = DND_SUBCLASSES + TOV_SUBCLASSES
 
-# Dictionary for quick lookup
-_SUBCLASSES_BY_NAME: dict[str, Subclass] = {
-    subclass.name.lower(): subclass for subclass in ALL_SUBCLASSES
-}
-
-_SUBCLASSES_BY_CLASS: dict[str, list[Subclass]] = {}
-for subclass in ALL_SUBCLASSES:
-    parent = subclass.parent_class.lower()
-    if parent not in _SUBCLASSES_BY_CLASS:
-        _SUBCLASSES_BY_CLASS[parent] = []
-    _SUBCLASSES_BY_CLASS[parent].append(subclass)
-
-
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -4471,12 +4463,12 @@ for subclass in ALL_SUBCLASSES:
 
 def get_subclass(name: str) -> Optional[Subclass]:
     """Get a subclass by name (case-insensitive)."""
-    return _SUBCLASSES_BY_NAME.get(name.lower())
+    return get_catalog().subclasses.get(name)
 
 
 def get_subclasses_for_class(class_name: str) -> list[Subclass]:
     """Get all subclasses for a given parent class."""
-    return _SUBCLASSES_BY_CLASS.get(class_name.lower(), [])
+    return list(get_catalog().subclasses.where("class", class_name))
 
 
 def get_all_subclass_names() -> list[str]:
@@ -4497,16 +4489,8 @@ def get_subclass_features_up_to_level(
 
 
 def search_subclasses(query: str) -> list[Subclass]:
-    """Search subclasses by name or description."""
-    query_lower = query.lower()
-    results = []
-    for subclass in ALL_SUBCLASSES:
-        if (
-            query_lower in subclass.name.lower()
-            or query_lower in subclass.description.lower()
-        ):
-            results.append(subclass)
-    return results
+    """Search subclasses by name or description, most relevant first."""
+    return get_catalog().search("subclasses", query)
 
 
 # =============================================================================
@@ -4521,10 +4505,21 @@ def get_tov_subclasses() -> list[Subclass]:
 
 def get_tov_subclasses_for_class(class_name: str) -> list[Subclass]:
     """Get all ToV subclasses for a given parent class."""
-    return [
-        s for s in TOV_SUBCLASSES
-        if s.parent_class.lower() == class_name.lower()
-    ]
+    return list(get_catalog().for_ruleset("tov").subclasses.where("class", class_name))
+
+
+def subclass_in_ruleset(subclass: Subclass, ruleset: str) -> bool:
+    """Check whether a subclass is available in a ruleset.
+
+    ToV only offers ToV subclasses. D&D rulesets offer their own versions
+    plus subclasses without version-specific differences (ruleset=None).
+    """
+    if ruleset == "tov":
+        return subclass.ruleset == "tov"
+    if ruleset == "dnd2024":
+        return subclass.ruleset in ("dnd2024", None)
+    # dnd2014
+    return subclass.ruleset in ("dnd2014", None)
 
 
 def get_subclasses_for_ruleset(ruleset: Optional[str] = None) -> list[Subclass]:
@@ -4540,14 +4535,7 @@ def get_subclasses_for_ruleset(ruleset: Optional[str] = None) -> list[Subclass]:
     """
     if ruleset is None:
         return ALL_SUBCLASSES.copy()
-    elif ruleset == "tov":
-        return TOV_SUBCLASSES.copy()
-    elif ruleset == "dnd2024":
-        # Return 2024 versions + subclasses without version-specific differences
-        return [s for s in DND_SUBCLASSES if s.ruleset in ("dnd2024", None)]
-    else:
-        # dnd2014 - Return 2014 versions + subclasses without version-specific differences
-        return [s for s in DND_SUBCLASSES if s.ruleset in ("dnd2014", None)]
+    return list(get_catalog().for_ruleset(ruleset).subclasses)
 
 
 def get_subclasses_for_class_and_ruleset(
@@ -4563,16 +4551,9 @@ def get_subclasses_for_class_and_ruleset(
     Returns:
         List of subclasses for the class and ruleset.
     """
-    all_for_class = get_subclasses_for_class(class_name)
     if ruleset is None:
-        return all_for_class
-    elif ruleset == "tov":
-        return [s for s in all_for_class if s.ruleset == "tov"]
-    elif ruleset == "dnd2024":
-        return [s for s in all_for_class if s.ruleset in ("dnd2024", None)]
-    else:
-        # dnd2014
-        return [s for s in all_for_class if s.ruleset in ("dnd2014", None)]
+        return get_subclasses_for_class(class_name)
+    return list(get_catalog().for_ruleset(ruleset).subclasses.where("class", class_name))
 
 
 # =============================================================================
@@ -4631,7 +4612,7 @@ def get_subclass_spells_at_level(subclass: Subclass, level: int) -> list[str]:
     """
     for spell_level, spells in subclass.subclass_spells:
         if spell_level == level:
-            return spells.copy()
+            return list(spells)
     return []
 
 
@@ -4645,7 +4626,7 @@ def get_subclass_spells_up_to_level(subclass: Subclass, level: int) -> list[str]
     Returns:
         List of all spell names granted up to that level.
     """
-    spells = []
+    spells: list[str] = []
     for spell_level, spell_list in subclass.subclass_spells:
         if spell_level <= level:
             spells.extend(spell_list)
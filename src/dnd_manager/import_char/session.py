@@ -512,7 +512,7 @@ class ImportSession:
 
     def save_partial(self, path: Path) -> None:
         """Save partial import for later resumption."""
-        import yaml
+        from dnd_manager.storage.serialization import dump_yaml
 
         data = {
             "session_id": self.session_id,
@@ -526,15 +526,15 @@ class ImportSession:
         }
 
         with open(path, "w") as f:
-            yaml.safe_dump(data, f, default_flow_style=False)
+            dump_yaml(data, f, default_flow_style=False)
 
     @classmethod
     def load_partial(cls, path: Path) -> "ImportSession":
         """Load a partial import session."""
-        import yaml
+        from dnd_manager.storage.serialization import load_yaml
 
         with open(path) as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
 
         session = cls(
             source_file=Path(data["source_file"]),
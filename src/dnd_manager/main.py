@@ -5,11 +5,12 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-from dnd_manager.app import run_app
-from dnd_manager.storage import CharacterStore
-from dnd_manager.models.character import Character
 from dnd_manager.config import get_config_manager, Config
 
+# Subcommand dependencies (the Textual app, character models, SRD data, AI
+# providers) are imported inside the cmd_* functions so each command only
+# pays for what it uses. scripts/benchmark_import_time.py tracks the cost.
+
 
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser."""
@@ -325,7 +326,15 @@ def create_parser() -> argparse.ArgumentParser:
     notes_subparsers.add_parser("stats", help="Show session notes statistics")
 
     # notes reindex
-    notes_subparsers.add_parser("reindex", help="Regenerate embeddings for all notes")
+    notes_reindex_parser = notes_subparsers.add_parser(
+        "reindex", help="Regenerate embeddings for new or changed notes"
+    )
+    notes_reindex_parser.add_argument(
+        "--batch-size", type=int, default=32, help="Notes embedded per batch (default: 32)"
+    )
+    notes_reindex_parser.add_argument(
+        "--force", action="store_true", help="Re-embed every note, even unchanged ones"
+    )
 
     # Library command (CLIMR Homebrew Library)
     lib_parser = subparsers.add_parser("library", help="CLIMR Homebrew Library - browse and share content")
@@ -400,6 +409,8 @@ def create_parser() -> argparse.ArgumentParser:
 
 def cmd_list() -> int:
     """List all characters."""
+    from dnd_manager.storage import CharacterStore
+
     store = CharacterStore()
     characters = store.get_character_info()
 
@@ -428,6 +439,8 @@ def cmd_list() -> int:
 
 def cmd_new(name: str, char_class: str, level: int) -> int:
     """Create a new character."""
+    from dnd_manager.storage import CharacterStore
+
     store = CharacterStore()
 
     if store.exists(name):
@@ -446,6 +459,8 @@ def cmd_new(name: str, char_class: str, level: int) -> int:
 
 def cmd_delete(name: str, force: bool) -> int:
     """Delete a character with confirmation."""
+    from dnd_manager.storage import CharacterStore
+
     store = CharacterStore()
 
     if not store.exists(name):
@@ -469,6 +484,8 @@ def cmd_delete(name: str, force: bool) -> int:
 
 def cmd_export(name: str, output: Optional[Path], format: str) -> int:
     """Export character to Markdown, PDF, or HTML."""
+    from dnd_manager.storage import CharacterStore
+
     store = CharacterStore()
     character = store.load(name)
 
@@ -545,6 +562,7 @@ def cmd_import(
 ) -> int:
     """Import character from PDF file using AI vision."""
     import asyncio
+    from dnd_manager.storage import CharacterStore
 
     # Check if file exists
     if not file.exists():
@@ -727,6 +745,8 @@ def cmd_ask(
     import asyncio
     from dnd_manager.ai import get_provider, build_system_prompt
     from dnd_manager.ai.context import build_homebrew_system_prompt
+    from dnd_manager.storage import CharacterStore
+    from dnd_manager.storage.autosave import AutosaveQueue
 
     # Get provider
     ai = get_provider(provider)
@@ -762,8 +782,11 @@ def cmd_ask(
 
     # Load character for context if specified
     character = None
+    store = CharacterStore()
+    autosaver = AutosaveQueue(store, interval=get_config_manager().config.storage.autosave_interval)
     if character_name:
-        store = CharacterStore()
+        # Replay changes a crashed session left in the autosave journal first
+        autosaver.recover()
         character = store.load(character_name)
         if not character:
             print(f"Warning: Character '{character_name}' not found, proceeding without context.")
@@ -851,18 +874,19 @@ def cmd_ask(
 
     async def interactive_session_with_tools() -> None:
         """Run interactive chat with tool calling support."""
+        from dnd_manager.ai.base import StreamEventType
         from dnd_manager.ai.tools import ToolSession
 
         if not character:
             print("Error: --tools requires --character to be specified")
             return
 
-        store = CharacterStore()
         session = ToolSession(
             provider=ai,
             character=character,
             character_name=character_name,
             store=store,
+            autosaver=autosaver,
             mode=mode,
             auto_save=True,
         )
@@ -874,38 +898,47 @@ def cmd_ask(
         print("Commands: 'quit' to exit, 'clear' to reset, 'refresh' to reload character")
         print("-" * 50)
 
-        while True:
-            try:
-                user_input = input("\nYou: ").strip()
-            except (EOFError, KeyboardInterrupt):
-                print("\nGoodbye!")
-                break
-
-            if not user_input:
-                continue
-            if user_input.lower() in ("quit", "exit", "q"):
-                print("Goodbye!")
-                break
-            if user_input.lower() == "clear":
-                session.clear_history()
-                print("Conversation cleared.")
-                continue
-            if user_input.lower() == "refresh":
-                session.refresh_character()
-                print(f"Character reloaded: {session.character.name}")
-                continue
+        try:
+            while True:
+                try:
+                    user_input = input("\nYou: ").strip()
+                except (EOFError, KeyboardInterrupt):
+                    print("\nGoodbye!")
+                    break
+
+                if not user_input:
+                    continue
+                if user_input.lower() in ("quit", "exit", "q"):
+                    print("Goodbye!")
+                    break
+                if user_input.lower() == "clear":
+                    session.clear_history()
+                    print("Conversation cleared.")
+                    continue
+                if user_input.lower() == "refresh":
+                    session.refresh_character()
+                    print(f"Character reloaded: {session.character.name}")
+                    continue
 
-            try:
-                print("\nAssistant: ", end="", flush=True)
-                response = await session.chat(
-                    user_input,
-                    stream_callback=lambda chunk: print(chunk, end="", flush=True),
-                )
-                # If there's more content after streaming (from tool results)
-                if response and not response.endswith("\n"):
-                    print()
-            except Exception as e:
-                print(f"\nError: {e}")
+                try:
+                    print("\nAssistant: ", end="", flush=True)
+                    at_line_start = False
+                    async for event in session.stream(user_input):
+                        if event.type == StreamEventType.TEXT:
+                            print(event.text, end="", flush=True)
+                            at_line_start = event.text.endswith("\n")
+                        elif event.type == StreamEventType.TOOL_USE:
+                            # Tool starts running while the reply streams on
+                            prefix = "" if at_line_start else "\n"
+                            print(f"{prefix}  [{event.tool_use.name}]", flush=True)
+                            at_line_start = True
+                    if not at_line_start:
+                        print()
+                except Exception as e:
+                    print(f"\nError: {e}")
+        finally:
+            # Write any queued character changes before leaving
+            autosaver.close()
 
     # Run appropriate mode
     if enable_tools and interactive:
@@ -924,6 +957,8 @@ def cmd_ask(
 
 def cmd_show(name: str) -> int:
     """Show character summary."""
+    from dnd_manager.storage import CharacterStore
+
     store = CharacterStore()
     character = store.load(name)
 
@@ -1737,6 +1772,13 @@ def cmd_notes(args: argparse.Namespace) -> int:
         print(f"  With embeddings: {stats['notes_with_embeddings']}")
         print(f"  Campaigns: {stats['campaigns']}")
         print(f"  Embedding provider: {stats['embedding_provider']}")
+        cache = stats["embedding_cache"]
+        print(
+            f"  Embedding cache: {cache['entries']}/{cache['max_entries']} entries "
+            f"({cache['size_bytes'] / 1024:.0f} KB), "
+            f"{cache['total_hit_rate']:.0%} hit rate over "
+            f"{cache['total_hits'] + cache['total_misses']} lookups"
+        )
 
         if stats["date_range"]:
             print(f"  Date range: {stats['date_range']['start']} to {stats['date_range']['end']}")
@@ -1761,8 +1803,22 @@ def cmd_notes(args: argparse.Namespace) -> int:
             print("Install sentence-transformers: pip install sentence-transformers")
             return 1
 
-        print("Regenerating embeddings for all notes...")
-        count = store.reindex_embeddings()
+        def show_progress(done: int, total: int) -> None:
+            if total:
+                print(f"\r  Embedded {done}/{total} notes", end="", flush=True)
+
+        print("Regenerating embeddings for new or changed notes..." if not args.force
+              else "Regenerating embeddings for all notes...")
+        try:
+            count = store.reindex_embeddings(
+                batch_size=args.batch_size,
+                force=args.force,
+                progress=show_progress,
+            )
+        except KeyboardInterrupt:
+            print("\nInterrupted. Finished batches were saved; run reindex again to resume.")
+            return 130
+        print()
         print(f"Reindexed {count} notes.")
         return 0
 
@@ -1776,7 +1832,7 @@ def cmd_notes(args: argparse.Namespace) -> int:
         print("  show <id>     Show a specific note")
         print("  delete <id>   Delete a note")
         print("  stats         Show notes statistics")
-        print("  reindex       Regenerate embeddings for search")
+        print("  reindex       Regenerate embeddings for new or changed notes")
         print()
         print("Examples:")
         print('  ccvault notes list --campaign "Curse of Strahd"')
@@ -1792,12 +1848,10 @@ def main() -> int:
     args = parser.parse_args()
 
     # Default to run command if no command specified
-    if args.command is None:
-        run_app()
-        return 0
+    if args.command in (None, "run"):
+        from dnd_manager.app import run_app
 
-    if args.command == "run":
-        run_app(character_path=args.character)
+        run_app(character_path=getattr(args, "character", None))
         return 0
 
     if args.command == "list":
@@ -1,34 +1,71 @@
-"""Storage layer for character persistence."""
-
-from dnd_manager.storage.yaml_store import (
-    YAMLStore,
-    CharacterStore,
-    LoadResult,
-    StorageError,
-    CorruptedFileError,
-)
-from dnd_manager.storage.sync import (
-    SyncStatus,
-    SyncResult,
-    SyncMetadata,
-    SyncProvider,
-    SyncManager,
-    get_sync_manager,
-)
-from dnd_manager.storage.migrations import (
-    MigrationResult,
-    CharacterMigrator,
-    migrate_character_file,
-    batch_migrate,
-)
-from dnd_manager.storage.notes import (
-    SessionNote,
-    SearchResult,
-    EmbeddingProvider,
-    EmbeddingEngine,
-    SessionNotesStore,
-    get_notes_store,
-)
+"""Storage layer for character persistence.
+
+Names are resolved on first access (PEP 562 module ``__getattr__``) so that
+commands which only need ``CharacterStore`` do not also import the session
+notes stack and its optional numpy dependency.
+"""
+
+import importlib
+from typing import Any
+
+# Submodule -> public names it provides
+_LAZY_IMPORTS: dict[str, tuple[str, ...]] = {
+    "yaml_store": (
+        "YAMLStore",
+        "CharacterStore",
+        "LoadResult",
+        "StorageError",
+        "CorruptedFileError",
+    ),
+    "autosave": ("AutosaveQueue",),
+    "backups": (
+        "BackupEntry",
+        "BackupStore",
+    ),
+    "embedding_cache": ("EmbeddingCache",),
+    "summary_index": ("CharacterSummaryIndex",),
+    "sync": (
+        "SyncStatus",
+        "SyncResult",
+        "SyncMetadata",
+        "SyncProvider",
+        "SyncManager",
+        "get_sync_manager",
+    ),
+    "migrations": (
+        "MigrationResult",
+        "CharacterMigrator",
+        "migrate_character_file",
+        "batch_migrate",
+    ),
+    "notes": (
+        "SessionNote",
+        "SearchResult",
+        "EmbeddingProvider",
+        "EmbeddingEngine",
+        "SessionNotesStore",
+        "get_notes_store",
+    ),
+}
+
+_NAME_TO_MODULE: dict[str, str] = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _NAME_TO_MODULE.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_NAME_TO_MODULE))
+
 
 __all__ = [
     "YAMLStore",
@@ -36,6 +73,10 @@ __all__ = [
     "LoadResult",
     "StorageError",
     "CorruptedFileError",
+    "CharacterSummaryIndex",
+    "BackupEntry",
+    "BackupStore",
+    "AutosaveQueue",
     # Sync
     "SyncStatus",
     "SyncResult",
@@ -53,6 +94,7 @@ __all__ = [
     "SearchResult",
     "EmbeddingProvider",
     "EmbeddingEngine",
+    "EmbeddingCache",
     "SessionNotesStore",
     "get_notes_store",
 ]
@@ -0,0 +1,317 @@
+"""Approximate nearest-neighbour index for note embeddings.
+
+An inverted-file (IVF) index: vectors are clustered with spherical k-means
+into ``n_lists`` cells, and a query only scores the vectors in the
+``n_probe`` cells whose centroids are closest to it. With ``n_lists`` around
+``sqrt(n)`` this scans a few percent of the corpus instead of all of it.
+
+The index supports incremental inserts (assigned to the nearest existing
+centroid), tombstoned deletes, and compaction/retraining once enough of it
+is stale. It is persisted as an uncompressed ``.npz`` file and tagged with
+a generation number so the owner can detect when it no longer matches the
+database.
+
+Requires numpy; callers should fall back to brute force when it is missing.
+"""
+
+import logging
+import math
+from pathlib import Path
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # Checked by callers via ANN_AVAILABLE
+    np = None
+
+logger = logging.getLogger(__name__)
+
+ANN_AVAILABLE = np is not None
+
+# Format version stored inside the index file
+INDEX_FORMAT_VERSION = 1
+
+
+def _normalize_rows(matrix: "np.ndarray") -> "np.ndarray":
+    """L2-normalize each row, leaving zero rows as zeros."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+
+def _nearest(vectors: "np.ndarray", centroids: "np.ndarray", chunk: int = 8192) -> "np.ndarray":
+    """Index of the most similar centroid for each vector (chunked to bound memory)."""
+    out = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), chunk):
+        out[start:start + chunk] = np.argmax(vectors[start:start + chunk] @ centroids.T, axis=1)
+    return out
+
+
+def train_centroids(
+    vectors: "np.ndarray",
+    n_lists: int,
+    iterations: int = 10,
+    seed: int = 0,
+) -> "np.ndarray":
+    """Cluster normalized vectors with spherical k-means."""
+    rng = np.random.default_rng(seed)
+    n_lists = max(1, min(n_lists, len(vectors)))
+    centroids = vectors[rng.choice(len(vectors), size=n_lists, replace=False)].copy()
+
+    for _ in range(iterations):
+        assign = _nearest(vectors, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, vectors)
+        counts = np.bincount(assign, minlength=n_lists)
+        empty = counts == 0
+        if empty.any():
+            # Re-seed empty cells with random points so every list is used
+            sums[empty] = vectors[rng.choice(len(vectors), size=int(empty.sum()))]
+        centroids = _normalize_rows(sums)
+
+    return centroids
+
+
+class IVFIndex:
+    """Inverted-file index over normalized float32 vectors."""
+
+    # Retrain centroids once the live corpus grows this much past training size
+    RETRAIN_GROWTH = 4.0
+    # Compact once this fraction of stored rows are tombstones
+    COMPACT_DEAD_FRACTION = 0.3
+
+    def __init__(self, dim: int, n_probe: Optional[int] = None):
+        self.dim = dim
+        self.n_probe = n_probe
+        self.generation = 0
+        self.dirty = False
+
+        self.centroids = np.zeros((0, dim), dtype=np.float32)
+        self.trained_size = 0
+
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._assign = np.zeros(0, dtype=np.int32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._size = 0  # Rows in use (arrays may have spare capacity)
+
+        # Rows [0, _packed) are sorted by cell, so cell c occupies the slice
+        # _offsets[c]:_offsets[c + 1] and can be scored without a gather.
+        # Rows appended since the last (re)build are listed in _extra[c].
+        self._packed = 0
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._extra: list[list[int]] = []
+        self._row_of: dict[int, int] = {}
+
+    # ----- construction -----------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        ids: list[int],
+        vectors: "np.ndarray",
+        n_probe: Optional[int] = None,
+    ) -> "IVFIndex":
+        """Train an index on ``vectors`` (one row per id)."""
+        vectors = _normalize_rows(np.asarray(vectors, dtype=np.float32))
+        index = cls(vectors.shape[1], n_probe=n_probe)
+        n_lists = max(1, int(math.sqrt(len(ids))))
+        index.centroids = train_centroids(vectors, n_lists) if len(ids) else index.centroids
+        index.trained_size = len(ids)
+        index._load_rows(np.asarray(ids, dtype=np.int64), vectors)
+        index.dirty = True
+        return index
+
+    def _load_rows(self, ids: "np.ndarray", vectors: "np.ndarray") -> None:
+        """Replace all rows with live ``ids``/``vectors``, packed by cell."""
+        n_lists = len(self.centroids)
+        assign = (
+            _nearest(vectors, self.centroids)
+            if len(ids) and n_lists else np.zeros(len(ids), dtype=np.int32)
+        )
+        order = np.argsort(assign, kind="stable")
+        self._vectors = np.ascontiguousarray(vectors[order], dtype=np.float32)
+        self._ids = ids[order].astype(np.int64, copy=True)
+        self._assign = assign[order]
+        self._alive = np.ones(len(ids), dtype=bool)
+        self._size = self._packed = len(ids)
+        self._offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self._assign, minlength=n_lists), out=self._offsets[1:])
+        self._extra = [[] for _ in range(n_lists)]
+        self._row_of = {int(note_id): row for row, note_id in enumerate(self._ids)}
+
+    # ----- queries ----------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    @property
+    def n_lists(self) -> int:
+        return len(self.centroids)
+
+    def _probe_count(self) -> int:
+        if self.n_probe:
+            return max(1, min(self.n_probe, self.n_lists))
+        # Default: scan roughly 1/8 of the cells, at least 8
+        return max(1, min(self.n_lists, max(8, self.n_lists // 8)))
+
+    def search(self, query: "np.ndarray", k: int) -> list[tuple[int, float]]:
+        """Return up to ``k`` ``(id, cosine similarity)`` pairs, best first."""
+        if not self._row_of or k <= 0:
+            return []
+
+        query = np.asarray(query, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm == 0:
+            return []
+        query = query / norm
+
+        centroid_scores = self.centroids @ query
+        n_probe = self._probe_count()
+        if n_probe < self.n_lists:
+            probes = np.argpartition(-centroid_scores, n_probe - 1)[:n_probe]
+        else:
+            probes = range(self.n_lists)
+
+        row_parts, score_parts = [], []
+        for cell in probes:
+            start, end = self._offsets[cell], self._offsets[cell + 1]
+            if end > start:
+                row_parts.append(np.arange(start, end))
+                score_parts.append(self._vectors[start:end] @ query)
+            extra = self._extra[cell]
+            if extra:
+                extra_rows = np.asarray(extra, dtype=np.int64)
+                row_parts.append(extra_rows)
+                score_parts.append(self._vectors[extra_rows] @ query)
+        if not row_parts:
+            return []
+
+        rows = np.concatenate(row_parts)
+        scores = np.concatenate(score_parts)
+        alive = self._alive[rows]
+        if not alive.all():
+            rows, scores = rows[alive], scores[alive]
+        if not len(rows):
+            return []
+
+        k = min(k, len(rows))
+        top = np.argpartition(-scores, k - 1)[:k] if k < len(rows) else np.arange(len(rows))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(self._ids[rows[i]]), float(scores[i])) for i in top]
+
+    # ----- incremental updates ----------------------------------------------
+
+    def add(self, note_id: int, vector: "list[float] | np.ndarray") -> None:
+        """Insert or replace the vector for ``note_id``."""
+        vec = np.asarray(vector, dtype=np.float32)
+        if vec.shape != (self.dim,):
+            raise ValueError(f"Expected {self.dim}-dim vector, got {vec.shape}")
+        norm = float(np.linalg.norm(vec))
+        if norm == 0:
+            self.remove(note_id)
+            return
+        vec = vec / norm
+
+        self.remove(note_id)
+        if not len(self.centroids):
+            self.centroids = vec[None, :].copy()
+            self._offsets = np.zeros(2, dtype=np.int64)
+            self._extra = [[]]
+            self.trained_size = 1
+
+        row = self._append_row(note_id, vec)
+        cell = int(np.argmax(self.centroids @ vec))
+        self._assign[row] = cell
+        self._extra[cell].append(row)
+        self._row_of[note_id] = row
+        self.dirty = True
+        self._maybe_rebuild()
+
+    def remove(self, note_id: int) -> None:
+        """Tombstone ``note_id`` if present."""
+        row = self._row_of.pop(note_id, None)
+        if row is None:
+            return
+        self._alive[row] = False
+        if row >= self._packed:
+            self._extra[self._assign[row]].remove(row)
+        self.dirty = True
+        self._maybe_rebuild()
+
+    def _append_row(self, note_id: int, vec: "np.ndarray") -> int:
+        """Append a row, growing the backing arrays geometrically."""
+        if self._size == len(self._ids):
+            capacity = max(16, 2 * len(self._ids))
+            self._vectors = self._grow(self._vectors, capacity)
+            self._ids = self._grow(self._ids, capacity)
+            self._assign = self._grow(self._assign, capacity)
+            self._alive = self._grow(self._alive, capacity)
+        row = self._size
+        self._vectors[row] = vec
+        self._ids[row] = note_id
+        self._alive[row] = True
+        self._size += 1
+        return row
+
+    @staticmethod
+    def _grow(arr: "np.ndarray", capacity: int) -> "np.ndarray":
+        grown = np.zeros((capacity,) + arr.shape[1:], dtype=arr.dtype)
+        grown[:len(arr)] = arr
+        return grown
+
+    def _maybe_rebuild(self) -> None:
+        """Compact tombstones and retrain when the index has drifted."""
+        live = len(self._row_of)
+        dead = self._size - live
+        needs_retrain = live > self.RETRAIN_GROWTH * max(self.trained_size, 1) and live >= 64
+        needs_compact = self._size >= 64 and dead > self.COMPACT_DEAD_FRACTION * self._size
+        if not (needs_retrain or needs_compact):
+            return
+
+        rows = np.flatnonzero(self._alive[:self._size])
+        ids, vectors = self._ids[rows], self._vectors[rows]
+        if needs_retrain:
+            self.centroids = train_centroids(vectors, max(1, int(math.sqrt(live))))
+            self.trained_size = live
+            logger.debug(f"Retrained ANN index: {live} vectors, {self.n_lists} lists")
+        self._load_rows(ids, vectors)
+
+    # ----- persistence ------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        """Write the index (live rows only) atomically to ``path``."""
+        rows = np.flatnonzero(self._alive[:self._size])
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "wb") as f:
+            np.savez(
+                f,
+                format_version=np.int64(INDEX_FORMAT_VERSION),
+                generation=np.int64(self.generation),
+                trained_size=np.int64(self.trained_size),
+                centroids=self.centroids,
+                ids=self._ids[rows],
+                vectors=self._vectors[rows],
+            )
+        temp_path.replace(path)
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path, n_probe: Optional[int] = None) -> Optional["IVFIndex"]:
+        """Load an index written by ``save``; None if missing or unreadable."""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data["format_version"]) != INDEX_FORMAT_VERSION:
+                    return None
+                centroids = data["centroids"]
+                index = cls(centroids.shape[1], n_probe=n_probe)
+                index.centroids = centroids
+                index.generation = int(data["generation"])
+                index.trained_size = int(data["trained_size"])
+                index._load_rows(data["ids"], data["vectors"])
+        except FileNotFoundError:
+            return None
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable ANN index {path}: {e}")
+            return None
+        return index
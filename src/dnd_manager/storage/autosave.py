@@ -0,0 +1,306 @@
+"""Debounced write-behind autosave for characters.
+
+Interactive play mutates the current character constantly (HP ticks, spell
+slots, hit dice) and each mutation used to trigger a full synchronous save
+on the caller's thread. ``AutosaveQueue`` instead snapshots the character,
+returns immediately, and lets a background thread write it:
+
+- Successive saves of the same character within ``interval`` seconds are
+  coalesced into one disk write of the latest snapshot.
+- Pending snapshots are also written to a small fsync'd JSON journal in
+  ``<character dir>/.autosave/``, at most once per ``journal_interval``
+  and always before the real save; the journal entry is removed once the
+  real save succeeds. ``recover()`` replays entries left behind by a crash.
+- ``flush()`` blocks until everything pending is on disk and should be
+  called before exiting, suspending, or reading characters back.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from pydantic import ValidationError
+
+from dnd_manager.models.character import Character
+from dnd_manager.storage.yaml_store import CharacterStore, StorageError, YAMLStore
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_DIR_NAME = ".autosave"
+
+
+@dataclass
+class _PendingSave:
+    """Latest unsaved snapshot of one character."""
+    snapshot: str  # Character JSON
+    due: float  # time.monotonic() deadline for the disk write
+    journal_due: float  # Earliest time.monotonic() for the next journal write
+    journaled: bool = False
+
+
+class AutosaveQueue:
+    """Coalescing background saver for a CharacterStore.
+
+    Thread-safe; ``schedule`` may be called from any thread.
+    """
+
+    def __init__(
+        self,
+        store: CharacterStore,
+        interval: float = 1.0,
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+        journal_interval: Optional[float] = None,
+    ):
+        """
+        Args:
+            store: Store that performs the actual saves
+            interval: Seconds to coalesce saves of the same character
+            journal_interval: Minimum seconds between journal writes of the
+                same character (default: a quarter of ``interval``)
+            on_error: Called from the worker thread with (character name,
+                exception) when a save fails
+        """
+        self.store = store
+        self.interval = max(0.0, interval)
+        self.journal_interval = max(
+            0.0, self.interval / 4 if journal_interval is None else journal_interval
+        )
+        self.on_error = on_error
+        self.journal_dir = store.directory / JOURNAL_DIR_NAME
+
+        self._pending: dict[str, _PendingSave] = {}
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    # ----- public API -------------------------------------------------------
+
+    def schedule(self, character: Character) -> None:
+        """Queue a save of ``character``'s current state.
+
+        The character is snapshotted immediately, so later mutations are
+        not written until they are scheduled too.
+        """
+        character.update_modified()
+        snapshot = character.model_dump_json()
+        key = YAMLStore._sanitize_filename(character.name)
+
+        with self._cond:
+            closed = self._closed
+            if not closed:
+                entry = self._pending.get(key)
+                if entry is None:
+                    now = time.monotonic()
+                    self._pending[key] = _PendingSave(snapshot, now + self.interval, now)
+                else:
+                    # Keep the original deadline: at most one write per interval
+                    entry.snapshot = snapshot
+                    entry.journaled = False
+                self._ensure_worker()
+                self._cond.notify_all()
+
+        if closed:
+            # Late saves after shutdown are written synchronously
+            self.store.save(character, update_modified=False)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write all pending saves now and wait for them to finish.
+
+        Returns:
+            True if everything was written, False on timeout
+        """
+        with self._cond:
+            if not self._pending and not self._in_flight:
+                return True
+            for entry in self._pending.values():
+                entry.due = 0.0
+            self._ensure_worker()
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: not self._pending and not self._in_flight,
+                timeout=timeout,
+            )
+
+    def discard(self, name: str) -> None:
+        """Drop any pending save and journal entry for a character (e.g. on delete).
+
+        Waits for in-progress saves and journal writes, so the entry is not
+        written back after this returns.
+        """
+        key = YAMLStore._sanitize_filename(name)
+        with self._cond:
+            self._pending.pop(key, None)
+            self._cond.wait_for(lambda: not self._in_flight)
+            self._remove_journal(key)
+
+    def close(self) -> None:
+        """Flush pending saves and stop the worker thread."""
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def has_pending(self) -> bool:
+        """Check whether any save has not reached disk yet."""
+        with self._cond:
+            return bool(self._pending) or self._in_flight > 0
+
+    def recover(self) -> int:
+        """Replay journal entries left behind by a crash.
+
+        An entry is only applied if it is newer than the character file on
+        disk. Returns the number of characters restored.
+        """
+        if not self.journal_dir.exists():
+            return 0
+
+        recovered = 0
+        for journal in self.journal_dir.glob("*.json"):
+            try:
+                character = Character.model_validate_json(journal.read_text(encoding="utf-8"))
+            except (OSError, ValidationError, ValueError) as e:
+                logger.warning(f"Discarding unreadable autosave journal {journal}: {e}")
+                self._unlink(journal)
+                continue
+
+            existing = self.store.load(character.name, try_recovery=False)
+            if existing is None or existing.meta.modified < character.meta.modified:
+                try:
+                    self.store.save(character, update_modified=False)
+                    recovered += 1
+                    logger.info(f"Recovered unsaved changes to {character.name}")
+                except StorageError as e:
+                    logger.error(f"Failed to recover {character.name}: {e}")
+                    continue
+            self._unlink(journal)
+
+        return recovered
+
+    # ----- worker -----------------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread if needed (caller holds the lock)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="ccvault-autosave", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Worker loop: journal new snapshots, then write due ones."""
+        while True:
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    # Journal unjournaled snapshots once their journal slot
+                    # opens, and always before the real write
+                    to_journal = [
+                        (key, entry.snapshot)
+                        for key, entry in self._pending.items()
+                        if not entry.journaled and min(entry.journal_due, entry.due) <= now
+                    ]
+                    for key, _ in to_journal:
+                        entry = self._pending[key]
+                        entry.journaled = True
+                        entry.journal_due = now + self.journal_interval
+
+                    due = [
+                        (key, entry.snapshot)
+                        for key, entry in self._pending.items()
+                        if entry.due <= now
+                    ]
+                    for key, _ in due:
+                        del self._pending[key]
+
+                    if to_journal or due:
+                        # Journal writes count too, so discard() cannot
+                        # return while one is about to recreate its entry
+                        self._in_flight += len(to_journal) + len(due)
+                        break
+                    if self._closed and not self._pending:
+                        return
+
+                    timeout = (
+                        min(
+                            e.due if e.journaled else min(e.due, e.journal_due)
+                            for e in self._pending.values()
+                        ) - now
+                        if self._pending else None
+                    )
+                    self._cond.wait(timeout)
+
+            for key, snapshot in to_journal:
+                try:
+                    self._write_journal(key, snapshot)
+                finally:
+                    with self._cond:
+                        self._in_flight -= 1
+                        self._cond.notify_all()
+
+            for key, snapshot in due:
+                try:
+                    self._save(key, snapshot)
+                finally:
+                    with self._cond:
+                        self._in_flight -= 1
+                        self._cond.notify_all()
+
+    def _save(self, key: str, snapshot: str) -> None:
+        """Write one snapshot through the store and retire its journal entry."""
+        try:
+            character = Character.model_validate_json(snapshot)
+            self.store.save(character, update_modified=False)
+        except (StorageError, ValidationError, ValueError) as e:
+            # Journal entry stays behind so recover() can retry
+            logger.error(f"Autosave failed for {key}: {e}")
+            if self.on_error:
+                try:
+                    self.on_error(key, e)
+                except Exception:
+                    logger.exception("Autosave error callback failed")
+            return
+
+        with self._cond:
+            # A newer snapshot may already have been journaled under this key
+            newer = self._pending.get(key)
+            if newer is None or not newer.journaled:
+                self._remove_journal(key)
+
+    # ----- journal ----------------------------------------------------------
+
+    def _journal_path(self, key: str) -> Path:
+        return self.journal_dir / f"{key}.json"
+
+    def _write_journal(self, key: str, snapshot: str) -> None:
+        """Durably record a snapshot before it is written to the real file."""
+        path = self._journal_path(key)
+        temp_path = path.with_suffix(".json.tmp")
+        try:
+            self.journal_dir.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(snapshot)
+                f.flush()
+                os.fsync(f.fileno())
+            temp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to write autosave journal for {key}: {e}")
+
+    def _remove_journal(self, key: str) -> None:
+        self._unlink(self._journal_path(key))
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove autosave journal {path}: {e}")
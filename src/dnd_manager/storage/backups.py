@@ -0,0 +1,259 @@
+"""Content-addressed, compressed backup store.
+
+Each stored file gets its own directory under the backup root holding
+zlib-compressed snapshots named by the SHA-256 of their content, plus a
+small JSON manifest listing snapshots oldest to newest:
+
+    .backups/
+        thorin/
+            manifest.json
+            3f2a...e1.yaml.zz
+
+Snapshotting content identical to the newest backup is a no-op, and content
+seen before reuses its existing blob. The newest backup is the last manifest
+entry, so finding it never lists the backup directory.
+
+Backups written by older versions (``thorin_YYYYMMDD_HHMMSS.yaml`` files in
+the backup root) are imported into the store the first time a character's
+backups are accessed. The backup root is scanned for them at most once per
+character and process.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+# (backup root, name) pairs already checked for legacy backups. Older
+# versions are the only writers of legacy files, so one scan per process is
+# enough; BackupStore instances are short-lived, hence module level.
+_legacy_checked: set[tuple[Path, str]] = set()
+
+
+@dataclass
+class BackupEntry:
+    """A single backup snapshot."""
+    name: str  # File stem the backup belongs to
+    digest: str  # SHA-256 of the uncompressed content
+    created: datetime
+    size: int  # Uncompressed size in bytes
+    path: Path  # Compressed blob on disk
+
+
+class BackupStore:
+    """Deduplicating snapshot store for files in a directory."""
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(self, directory: Path, extension: str = ".yaml"):
+        self.directory = directory
+        self.extension = extension
+        self.blob_suffix = f"{extension}.zz"
+
+    def _entry_dir(self, name: str) -> Path:
+        return self.directory / name
+
+    def _blob_path(self, name: str, digest: str) -> Path:
+        return self._entry_dir(name) / f"{digest}{self.blob_suffix}"
+
+    def _load_manifest(self, name: str) -> list[BackupEntry]:
+        """Load the manifest for a file, importing legacy backups if needed."""
+        manifest_path = self._entry_dir(name) / self.MANIFEST_NAME
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except FileNotFoundError:
+            return self._import_legacy(name)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Unreadable backup manifest {manifest_path}: {e}")
+            return []
+
+        entries = []
+        for item in raw.get("entries", []):
+            try:
+                entries.append(BackupEntry(
+                    name=name,
+                    digest=item["digest"],
+                    created=datetime.fromisoformat(item["created"]),
+                    size=item["size"],
+                    path=self._blob_path(name, item["digest"]),
+                ))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return entries
+
+    def _write_manifest(self, name: str, entries: list[BackupEntry]) -> None:
+        """Atomically replace the manifest for a file."""
+        entry_dir = self._entry_dir(name)
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = entry_dir / self.MANIFEST_NAME
+        temp_path = manifest_path.with_suffix(".json.tmp")
+        data = {
+            "version": MANIFEST_VERSION,
+            "entries": [
+                {"digest": e.digest, "created": e.created.isoformat(), "size": e.size}
+                for e in entries
+            ],
+        }
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        temp_path.replace(manifest_path)
+
+    def _write_blob(self, name: str, digest: str, content: bytes) -> Path:
+        """Store compressed content unless a blob with this digest exists."""
+        blob_path = self._blob_path(name, digest)
+        if blob_path.exists():
+            return blob_path
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = blob_path.with_name(blob_path.name + ".tmp")
+        with open(temp_path, "wb") as f:
+            f.write(zlib.compress(content))
+        temp_path.replace(blob_path)
+        return blob_path
+
+    def _import_legacy(self, name: str) -> list[BackupEntry]:
+        """Move old-style timestamped copies of ``name`` into the store."""
+        key = (self.directory, name)
+        if key in _legacy_checked or not self.directory.exists():
+            return []
+
+        pattern = re.compile(
+            rf"^{re.escape(name)}_\d{{8}}_\d{{6}}{re.escape(self.extension)}$"
+        )
+        legacy = []
+        for candidate in self.directory.iterdir():
+            if not pattern.match(candidate.name):
+                continue
+            try:
+                legacy.append((candidate.stat().st_mtime, candidate))
+            except OSError:
+                continue
+        if not legacy:
+            _legacy_checked.add(key)
+            return []
+
+        legacy.sort()
+        entries: list[BackupEntry] = []
+        try:
+            for mtime, candidate in legacy:
+                content = candidate.read_bytes()
+                digest = hashlib.sha256(content).hexdigest()
+                blob_path = self._write_blob(name, digest, content)
+                entries.append(BackupEntry(
+                    name=name,
+                    digest=digest,
+                    created=datetime.fromtimestamp(mtime),
+                    size=len(content),
+                    path=blob_path,
+                ))
+            self._write_manifest(name, entries)
+        except OSError as e:
+            logger.warning(f"Failed to import legacy backups for {name}: {e}")
+            return []
+        _legacy_checked.add(key)
+
+        for _, candidate in legacy:
+            try:
+                candidate.unlink()
+            except OSError:
+                pass
+        logger.debug(f"Imported {len(entries)} legacy backups for {name}")
+        return entries
+
+    def snapshot(self, name: str, content: bytes, max_backups: int) -> BackupEntry:
+        """Record ``content`` as the newest backup of ``name``.
+
+        If the content matches the newest backup nothing is written. Entries
+        beyond ``max_backups`` are dropped along with blobs no longer
+        referenced by any remaining entry.
+
+        Raises:
+            OSError: If the blob or manifest cannot be written
+        """
+        entries = self._load_manifest(name)
+        digest = hashlib.sha256(content).hexdigest()
+
+        if entries and entries[-1].digest == digest:
+            return entries[-1]
+
+        blob_path = self._write_blob(name, digest, content)
+        entry = BackupEntry(
+            name=name,
+            digest=digest,
+            created=datetime.now(),
+            size=len(content),
+            path=blob_path,
+        )
+        entries.append(entry)
+
+        cutoff = max(len(entries) - max(max_backups, 1), 0)
+        removed, kept = entries[:cutoff], entries[cutoff:]
+        self._write_manifest(name, kept)
+
+        live = {e.digest for e in kept}
+        for old in removed:
+            if old.digest in live:
+                continue
+            live.add(old.digest)  # Only unlink each blob once
+            try:
+                old.path.unlink()
+                logger.debug(f"Removed old backup: {old.path}")
+            except OSError:
+                # Already gone or not removable - the manifest no longer
+                # references it either way
+                pass
+
+        return entry
+
+    def snapshot_file(self, path: Path, max_backups: int) -> Optional[BackupEntry]:
+        """Snapshot the current content of ``path``.
+
+        Returns None if the file doesn't exist or can't be backed up.
+        """
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Failed to create backup: {e}")
+            return None
+
+        try:
+            entry = self.snapshot(path.stem, content, max_backups)
+        except OSError as e:
+            logger.warning(f"Failed to create backup: {e}")
+            return None
+        logger.debug(f"Created backup: {entry.path}")
+        return entry
+
+    def latest(self, name: str) -> Optional[BackupEntry]:
+        """Get the newest backup for ``name``."""
+        entries = self._load_manifest(name)
+        return entries[-1] if entries else None
+
+    def list_entries(self, name: str) -> list[BackupEntry]:
+        """List backups for ``name``, newest first."""
+        return list(reversed(self._load_manifest(name)))
+
+    def read(self, entry: BackupEntry) -> bytes:
+        """Return the uncompressed content of a backup.
+
+        Raises:
+            OSError: If the blob is missing or corrupted
+        """
+        try:
+            content = zlib.decompress(entry.path.read_bytes())
+        except zlib.error as e:
+            raise OSError(f"Corrupted backup {entry.path}: {e}") from e
+        if hashlib.sha256(content).hexdigest() != entry.digest:
+            raise OSError(f"Backup {entry.path} does not match its digest")
+        return content
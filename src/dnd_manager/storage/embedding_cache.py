@@ -0,0 +1,254 @@
+"""Persistent LRU cache of text embeddings.
+
+Embedding a text is by far the most expensive step in semantic search: a
+model forward pass or an HTTP round trip to Ollama. Identical texts come up
+constantly: repeated search queries, re-saved notes, and reindex runs. This
+cache stores vectors in a small SQLite database keyed by a fingerprint of
+(provider, model, text), so a text is embedded at most once per model.
+
+Entries record when they were last used; once the cache holds more than
+``max_entries`` vectors the least recently used ones are evicted. Hit and
+miss counts are kept both for the current session and, in the database,
+for the cache's lifetime.
+
+Lookups do not write to disk: last-used times and hit/miss counts are
+collected in memory and written with the next insert (before eviction, so
+it sees them), on close, or at most once per ``FLUSH_INTERVAL`` seconds.
+
+The cache is safe to share between threads (a background reindex and the UI
+may use it at the same time).
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """SQLite-backed, size-bounded LRU store of embeddings."""
+
+    # ~30 MB of 384-dim float32 vectors
+    DEFAULT_MAX_ENTRIES = 20000
+    # Evict down to this fraction of max_entries so eviction isn't per insert
+    EVICT_TO = 0.9
+    # Longest time lookup bookkeeping is held in memory before it is written
+    FLUSH_INTERVAL = 30.0
+
+    def __init__(self, db_path: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.db_path = db_path
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # Lookup bookkeeping not yet written: key -> last used, and counts
+        self._touched: dict[str, float] = {}
+        self._pending_hits = 0
+        self._pending_misses = 0
+        self._last_flush = time.monotonic()
+        self._init_db()
+
+    def _init_db(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used)"
+            )
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_stats (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    hits INTEGER NOT NULL,
+                    misses INTEGER NOT NULL
+                )
+            """)
+            conn.execute("INSERT OR IGNORE INTO cache_stats (id, hits, misses) VALUES (1, 0, 0)")
+            conn.commit()
+        except sqlite3.Error:
+            conn.close()
+            raise
+        self._conn = conn
+
+    def close(self) -> None:
+        """Write pending bookkeeping and close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._commit_pending()
+                self._conn.close()
+                self._conn = None
+
+    def _write_pending(self) -> None:
+        """Write buffered bookkeeping (caller holds the lock and commits)."""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                [(used, key) for key, used in self._touched.items()],
+            )
+        if self._pending_hits or self._pending_misses:
+            self._conn.execute(
+                "UPDATE cache_stats SET hits = hits + ?, misses = misses + ? WHERE id = 1",
+                (self._pending_hits, self._pending_misses),
+            )
+        self._touched = {}
+        self._pending_hits = self._pending_misses = 0
+        self._last_flush = time.monotonic()
+
+    def _commit_pending(self) -> None:
+        """Write and commit buffered bookkeeping (caller holds the lock)."""
+        try:
+            self._write_pending()
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+
+    def flush(self) -> None:
+        """Write buffered last-used times and hit counts now."""
+        with self._lock:
+            if self._conn is not None:
+                self._commit_pending()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Look up cached vectors, marking the ones found as recently used.
+
+        Returns ``{key: vector}`` for the keys present in the cache.
+        """
+        if not keys:
+            return {}
+        unique = list(dict.fromkeys(keys))
+        found: dict[str, list[float]] = {}
+
+        with self._lock:
+            if self._conn is None:
+                return {}
+            try:
+                # Stay well under SQLite's bound-parameter limit
+                for start in range(0, len(unique), 500):
+                    chunk = unique[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    for key, blob in self._conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                        chunk,
+                    ):
+                        vec = array("f")
+                        vec.frombytes(blob)
+                        found[key] = vec.tolist()
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache lookup failed: {e}")
+                found = {}
+
+            hits = sum(1 for key in keys if key in found)
+            misses = len(keys) - hits
+            now = time.time()
+            for key in found:
+                self._touched[key] = now
+            self._pending_hits += hits
+            self._pending_misses += misses
+            self.hits += hits
+            self.misses += misses
+
+            if time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+                self._commit_pending()
+        return found
+
+    def get(self, key: str) -> Optional[list[float]]:
+        """Look up a single cached vector."""
+        return self.get_many([key]).get(key)
+
+    def put_many(self, model: str, vectors: dict[str, list[float]]) -> None:
+        """Store vectors computed by ``model``, evicting old entries if full."""
+        now = time.time()
+        rows = [
+            (key, model, array("f", vec).tobytes(), now)
+            for key, vec in vectors.items()
+            if vec
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                # Recency first, so new rows keep their own timestamp and
+                # eviction sees every lookup
+                self._write_pending()
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, model, vector, last_used) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+                if count > self.max_entries:
+                    excess = count - int(self.max_entries * self.EVICT_TO)
+                    self._conn.execute(
+                        "DELETE FROM embeddings WHERE key IN "
+                        "(SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+                        (excess,),
+                    )
+                    logger.debug(f"Evicted {excess} cached embeddings")
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache write failed: {e}")
+
+    def put(self, model: str, key: str, vector: list[float]) -> None:
+        """Store a single vector."""
+        self.put_many(model, {key: vector})
+
+    def clear(self, model: Optional[str] = None) -> int:
+        """Remove all entries, or only those computed by ``model``.
+
+        Returns the number of entries removed.
+        """
+        with self._lock:
+            if self._conn is None:
+                return 0
+            if model is None:
+                cursor = self._conn.execute("DELETE FROM embeddings")
+            else:
+                cursor = self._conn.execute("DELETE FROM embeddings WHERE model = ?", (model,))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def get_stats(self) -> dict:
+        """Entry count, payload size, and hit rates for this session and overall."""
+        with self._lock:
+            entries, size, total_hits, total_misses = 0, 0, 0, 0
+            if self._conn is not None:
+                entries, size = self._conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+                ).fetchone()
+                total_hits, total_misses = self._conn.execute(
+                    "SELECT hits, misses FROM cache_stats WHERE id = 1"
+                ).fetchone()
+                total_hits += self._pending_hits
+                total_misses += self._pending_misses
+            return {
+                "entries": entries,
+                "max_entries": self.max_entries,
+                "size_bytes": size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": _rate(self.hits, self.misses),
+                "total_hits": total_hits,
+                "total_misses": total_misses,
+                "total_hit_rate": _rate(total_hits, total_misses),
+            }
+
+
+def _rate(hits: int, misses: int) -> float:
+    return hits / (hits + misses) if hits + misses else 0.0
@@ -7,22 +7,63 @@ This module provides:
 - Character and campaign association
 """
 
+import asyncio
 import atexit
+import hashlib
+import heapq
 import logging
+import math
 import re
 import sqlite3
 import json
 import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, date
 from pathlib import Path
-from typing import Optional, Any
+from typing import Callable, Optional, Any
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
 from platformdirs import user_data_dir
 
+from dnd_manager.storage.ann import ANN_AVAILABLE, IVFIndex
+from dnd_manager.storage.embedding_cache import EmbeddingCache
+
+try:
+    import numpy as np
+except ImportError:  # Optional: the "embeddings" and "vector" extras
+    np = None
+
+# Bump when the session_notes schema changes; _init_db migrates older databases
+NOTES_SCHEMA_VERSION = 2
+
+
+def note_text(title: str, content: str) -> str:
+    """Text that is embedded for a note."""
+    return f"{title}\n\n{content}"
+
+
+def embedding_hash(text: str, model_id: str) -> str:
+    """Fingerprint of the text and model an embedding was computed from."""
+    return hashlib.sha256(f"{model_id}\0{text}".encode("utf-8")).hexdigest()
+
+
+def pack_embedding(embedding: list[float]) -> tuple[bytes, float]:
+    """Encode an embedding as a float32 BLOB plus its L2 norm."""
+    vec = array("f", embedding)
+    norm = math.sqrt(sum(x * x for x in vec))
+    return vec.tobytes(), norm
+
+
+def unpack_embedding(blob: bytes) -> list[float]:
+    """Decode a float32 BLOB written by pack_embedding."""
+    vec = array("f")
+    vec.frombytes(blob)
+    return vec.tolist()
+
 
 class EmbeddingProvider(Enum):
     """Available embedding providers."""
@@ -74,11 +115,11 @@ class SessionNote:
                 logger.warning(f"Corrupted tags JSON in note {row['id']}: {e}")
 
         embedding: Optional[list[float]] = None
-        if row["embedding"]:
+        if row["embedding_vec"]:
             try:
-                embedding = json.loads(row["embedding"])
-            except json.JSONDecodeError as e:
-                logger.warning(f"Corrupted embedding JSON in note {row['id']}: {e}")
+                embedding = unpack_embedding(row["embedding_vec"])
+            except ValueError as e:
+                logger.warning(f"Corrupted embedding in note {row['id']}: {e}")
 
         # Safely parse dates with logging
         session_date_val = date.today()
@@ -130,15 +171,30 @@ class EmbeddingEngine:
     # Default model for sentence-transformers (small, fast, ~80MB)
     DEFAULT_MODEL = "all-MiniLM-L6-v2"
 
+    # Ollama embedding model (small, fast) and request shaping
+    OLLAMA_MODEL = "nomic-embed-text"
+    OLLAMA_BATCH_SIZE = 32  # Texts per /api/embed request
+    OLLAMA_MAX_CONCURRENCY = 4  # Requests in flight at once
+
     def __init__(
         self,
         provider: EmbeddingProvider = EmbeddingProvider.NONE,
         show_progress: bool = True,
+        ollama_host: Optional[str] = None,
+        cache: Optional[EmbeddingCache] = None,
     ):
         self.provider = provider
         self.show_progress = show_progress
+        self.cache = cache
         self._model = None
+        # Ollama clients hold pooled keep-alive connections and are reused.
+        # httpx async pools are tied to an event loop, so that client is
+        # cached per loop.
+        self._ollama_host = ollama_host
         self._ollama_client = None
+        self._ollama_async_client: Optional[tuple[Any, Any]] = None  # (loop, client)
+        # Cleared if the server predates the batch /api/embed endpoint
+        self._ollama_batch_api = True
         self._dimension = 384  # Default for all-MiniLM-L6-v2
         self._model_loaded = False
 
@@ -167,29 +223,95 @@ class EmbeddingEngine:
         """Get the embedding dimension."""
         return self._dimension
 
-    def embed(self, text: str) -> Optional[list[float]]:
-        """Generate embedding for text."""
-        if self.provider == EmbeddingProvider.NONE:
-            return None
-
+    @property
+    def model_id(self) -> str:
+        """Identifies the provider and model; embeddings from different ids are incompatible."""
         if self.provider == EmbeddingProvider.SENTENCE_TRANSFORMERS:
-            return self._embed_sentence_transformers(text)
-
+            return f"{self.provider.value}/{self.DEFAULT_MODEL}"
         if self.provider == EmbeddingProvider.OLLAMA:
-            return self._embed_ollama(text)
+            return f"{self.provider.value}/{self.OLLAMA_MODEL}"
+        return self.provider.value
 
-        return None
+    def embed(self, text: str) -> Optional[list[float]]:
+        """Generate embedding for text, reusing a cached one if available."""
+        if self.provider == EmbeddingProvider.NONE:
+            return None
+        return self.embed_batch([text])[0]
 
     def embed_batch(self, texts: list[str]) -> list[Optional[list[float]]]:
-        """Generate embeddings for multiple texts."""
+        """Generate embeddings for multiple texts, reusing cached ones."""
         if self.provider == EmbeddingProvider.NONE:
             return [None] * len(texts)
 
+        keys, found, missing = self._split_cached(texts)
+        if missing:
+            self._store_computed(missing, self._embed_batch_uncached(missing), found)
+        return [found.get(key) for key in keys]
+
+    async def aembed_batch(self, texts: list[str]) -> list[Optional[list[float]]]:
+        """Generate embeddings for multiple texts without blocking the event loop.
+
+        Ollama requests are pipelined on an async client (at most
+        ``OLLAMA_MAX_CONCURRENCY`` in flight); other providers run
+        ``embed_batch`` in a worker thread.
+        """
+        if not texts:
+            return []
+        if self.provider != EmbeddingProvider.OLLAMA:
+            return await asyncio.to_thread(self.embed_batch, texts)
+
+        keys, found, missing = self._split_cached(texts)
+        if missing:
+            semaphore = asyncio.Semaphore(self.OLLAMA_MAX_CONCURRENCY)
+
+            async def run(chunk: list[str]) -> list[Optional[list[float]]]:
+                async with semaphore:
+                    return await self._aembed_ollama_chunk(chunk)
+
+            results = await asyncio.gather(*(run(chunk) for chunk in self._ollama_chunks(missing)))
+            self._store_computed(missing, [e for chunk in results for e in chunk], found)
+        return [found.get(key) for key in keys]
+
+    def _split_cached(
+        self, texts: list[str]
+    ) -> tuple[list[str], dict[str, list[float]], list[str]]:
+        """Return (cache key per text, cached vectors by key, distinct uncached texts)."""
+        model_id = self.model_id
+        keys = [embedding_hash(text, model_id) for text in texts]
+        found = self.cache.get_many(keys) if self.cache is not None else {}
+        missing = list(dict.fromkeys(
+            text for text, key in zip(texts, keys) if key not in found
+        ))
+        return keys, found, missing
+
+    def _store_computed(
+        self,
+        texts: list[str],
+        embeddings: list[Optional[list[float]]],
+        found: dict[str, list[float]],
+    ) -> None:
+        """Add freshly computed embeddings to ``found`` and the cache."""
+        model_id = self.model_id
+        computed = {
+            embedding_hash(text, model_id): embedding
+            for text, embedding in zip(texts, embeddings)
+            if embedding
+        }
+        found.update(computed)
+        if self.cache is not None and computed:
+            self.cache.put_many(model_id, computed)
+
+    def _embed_batch_uncached(self, texts: list[str]) -> list[Optional[list[float]]]:
+        """Compute embeddings with the configured provider."""
         if self.provider == EmbeddingProvider.SENTENCE_TRANSFORMERS:
+            if len(texts) == 1:
+                return [self._embed_sentence_transformers(texts[0])]
             return self._embed_batch_sentence_transformers(texts)
 
-        # Fall back to individual embedding for other providers
-        return [self.embed(text) for text in texts]
+        if self.provider == EmbeddingProvider.OLLAMA:
+            return self._embed_batch_ollama(texts)
+
+        return [None] * len(texts)
 
     def _load_sentence_transformer_model(self) -> bool:
         """Load the sentence-transformers model with progress indication.
@@ -289,35 +411,116 @@ class EmbeddingEngine:
             print(f"Batch embedding error: {e}", file=sys.stderr)
             return [None] * len(texts)
 
-    def _embed_ollama(self, text: str) -> Optional[list[float]]:
-        """Embed using Ollama."""
-        try:
+    def _get_ollama_client(self):
+        """Lazy-create the shared Ollama client (thread-safe, pooled connections)."""
+        if self._ollama_client is None:
             import ollama
+            self._ollama_client = ollama.Client(host=self._ollama_host)
+        return self._ollama_client
 
-            if self._ollama_client is None:
-                self._ollama_client = ollama.Client()
+    def _get_ollama_async_client(self):
+        """Lazy-create the async Ollama client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._ollama_async_client is None or self._ollama_async_client[0] is not loop:
+            import ollama
+            self._ollama_async_client = (loop, ollama.AsyncClient(host=self._ollama_host))
+        return self._ollama_async_client[1]
+
+    def _ollama_chunks(self, texts: list[str]) -> list[list[str]]:
+        size = self.OLLAMA_BATCH_SIZE
+        return [texts[i:i + size] for i in range(0, len(texts), size)]
+
+    def _ollama_vectors(self, embeddings: list, count: int) -> list[Optional[list[float]]]:
+        """Validate an /api/embed response against the number of inputs."""
+        if len(embeddings) != count:
+            raise ValueError(f"Expected {count} embeddings, got {len(embeddings)}")
+        vectors = [list(e) if e else None for e in embeddings]
+        for vec in vectors:
+            if vec:
+                self._dimension = len(vec)
+                break
+        return vectors
+
+    @staticmethod
+    def _is_missing_batch_api(error: Exception) -> bool:
+        """Whether a ResponseError means the server has no /api/embed (Ollama < 0.3.4)."""
+        # A missing *model* is also a 404, but its message names the model
+        return getattr(error, "status_code", None) == 404 and "model" not in str(error).lower()
+
+    def _embed_batch_ollama(self, texts: list[str]) -> list[Optional[list[float]]]:
+        """Embed using Ollama, one /api/embed request per chunk, several at a time."""
+        if not texts:
+            return []
+        chunks = self._ollama_chunks(texts)
+        if len(chunks) == 1:
+            return self._embed_ollama_chunk(chunks[0])
+        with ThreadPoolExecutor(max_workers=min(self.OLLAMA_MAX_CONCURRENCY, len(chunks))) as pool:
+            results = list(pool.map(self._embed_ollama_chunk, chunks))
+        return [embedding for chunk in results for embedding in chunk]
+
+    def _embed_ollama_chunk(self, texts: list[str]) -> list[Optional[list[float]]]:
+        """Embed one request's worth of texts with Ollama."""
+        try:
+            import httpx
+            import ollama
 
-            response = self._ollama_client.embeddings(
-                model="nomic-embed-text",  # Small, fast embedding model
-                prompt=text,
-            )
-            embedding = response.get("embedding", [])
-            if embedding:
-                self._dimension = len(embedding)
-            return embedding if embedding else None
+            client = self._get_ollama_client()
+            if self._ollama_batch_api:
+                try:
+                    response = client.embed(model=self.OLLAMA_MODEL, input=texts)
+                    return self._ollama_vectors(response.get("embeddings", []), len(texts))
+                except ollama.ResponseError as e:
+                    if not self._is_missing_batch_api(e):
+                        raise
+                    self._ollama_batch_api = False
+
+            # Older servers: one /api/embeddings request per text
+            vectors = []
+            for text in texts:
+                response = client.embeddings(model=self.OLLAMA_MODEL, prompt=text)
+                vectors.extend(self._ollama_vectors([response.get("embedding", [])], 1))
+            return vectors
         except ImportError:
             # Ollama not installed
-            return None
+            return [None] * len(texts)
         except (ConnectionError, TimeoutError, OSError) as e:
             # Network/connection issues with Ollama server
             import sys
             print(f"Ollama connection error: {e}", file=sys.stderr)
-            return None
-        except (ValueError, TypeError, KeyError) as e:
-            # Response parsing issues
+            return [None] * len(texts)
+        except (ollama.ResponseError, httpx.HTTPError, ValueError, TypeError, KeyError) as e:
+            # Server-side errors, other transport errors, response parsing issues
             import sys
             print(f"Ollama response error: {e}", file=sys.stderr)
-            return None
+            return [None] * len(texts)
+
+    async def _aembed_ollama_chunk(self, texts: list[str]) -> list[Optional[list[float]]]:
+        """Async version of _embed_ollama_chunk."""
+        if not self._ollama_batch_api:
+            return await asyncio.to_thread(self._embed_ollama_chunk, texts)
+        try:
+            import httpx
+            import ollama
+
+            client = self._get_ollama_async_client()
+            try:
+                response = await client.embed(model=self.OLLAMA_MODEL, input=texts)
+            except ollama.ResponseError as e:
+                if not self._is_missing_batch_api(e):
+                    raise
+                self._ollama_batch_api = False
+                return await asyncio.to_thread(self._embed_ollama_chunk, texts)
+            return self._ollama_vectors(response.get("embeddings", []), len(texts))
+        except ImportError:
+            return [None] * len(texts)
+        except (ConnectionError, TimeoutError, OSError) as e:
+            import sys
+            print(f"Ollama connection error: {e}", file=sys.stderr)
+            return [None] * len(texts)
+        except (ollama.ResponseError, httpx.HTTPError, ValueError, TypeError, KeyError) as e:
+            import sys
+            print(f"Ollama response error: {e}", file=sys.stderr)
+            return [None] * len(texts)
 
 
 class SessionNotesStore:
@@ -326,13 +529,22 @@ class SessionNotesStore:
     Supports context manager protocol for proper resource cleanup:
         with SessionNotesStore() as store:
             store.add(note)
+
+    Once a corpus has ``ANN_MIN_NOTES`` embedded notes (and numpy is
+    installed), semantic search goes through an IVF approximate index
+    persisted next to the database as ``<db name>.ann.npz``.
     """
 
+    # Below this many embedded notes an exact scan is fast enough
+    ANN_MIN_NOTES = 5000
+
     def __init__(
         self,
         db_path: Optional[Path] = None,
         embedding_provider: EmbeddingProvider = EmbeddingProvider.NONE,
         show_progress: bool = True,
+        use_ann: bool = True,
+        embedding_cache: Optional[EmbeddingCache] = None,
     ):
         if db_path is None:
             data_dir = Path(user_data_dir("dnd-manager", "dnd-manager"))
@@ -340,8 +552,20 @@ class SessionNotesStore:
             db_path = data_dir / "session_notes.db"
 
         self.db_path = db_path
-        self.embedding_engine = EmbeddingEngine(embedding_provider, show_progress)
         self._conn: Optional[sqlite3.Connection] = None
+        # Shared with anything else embedding text from the same data directory
+        self._owns_cache = embedding_cache is None
+        self.embedding_cache = embedding_cache or EmbeddingCache(db_path.parent / "embedding_cache.db")
+        self.embedding_engine = EmbeddingEngine(
+            embedding_provider, show_progress, cache=self.embedding_cache
+        )
+        # {dim: (note_ids, normalized vectors)}; None until first semantic search
+        self._vectors: Optional[dict[int, tuple[list[int], Any]]] = None
+        self.use_ann = use_ann and ANN_AVAILABLE
+        self.ann_path = db_path.with_name(f"{db_path.stem}.ann.npz")
+        self._ann: Optional[IVFIndex] = None
+        # Generation at which the corpus was last found too small for ANN
+        self._ann_skipped_generation: Optional[int] = None
         try:
             self._init_db()
         except sqlite3.Error:
@@ -361,18 +585,22 @@ class SessionNotesStore:
         """Destructor to ensure connection is closed."""
         self.close()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new database connection with proper cleanup on error."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.row_factory = sqlite3.Row
+            # WAL lets a background reindex write while the UI reads
+            conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
     def _get_conn(self) -> sqlite3.Connection:
-        """Get database connection with proper cleanup on error."""
+        """Get the store's database connection (bound to the creating thread)."""
         if self._conn is None:
-            conn = sqlite3.connect(self.db_path)
-            try:
-                conn.row_factory = sqlite3.Row
-                # Enable FTS5 for full-text search
-                conn.execute("PRAGMA journal_mode=WAL")
-                self._conn = conn
-            except sqlite3.Error:
-                conn.close()
-                raise
+            self._conn = self._connect()
         return self._conn
 
     def _init_db(self) -> None:
@@ -391,10 +619,15 @@ class SessionNotesStore:
                 tags TEXT,
                 created_at TEXT NOT NULL,
                 updated_at TEXT NOT NULL,
-                embedding TEXT
+                embedding TEXT,
+                embedding_vec BLOB,
+                embedding_norm REAL,
+                embedding_hash TEXT
             )
         """)
 
+        self._migrate_schema(conn)
+
         # Full-text search index
         conn.execute("""
             CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
@@ -421,8 +654,10 @@ class SessionNotesStore:
             END
         """)
 
+        # Only text changes touch the FTS index, not embedding writes
         conn.execute("""
-            CREATE TRIGGER IF NOT EXISTS notes_au AFTER UPDATE ON session_notes BEGIN
+            CREATE TRIGGER IF NOT EXISTS notes_au
+            AFTER UPDATE OF title, content, tags ON session_notes BEGIN
                 INSERT INTO notes_fts(notes_fts, rowid, title, content, tags)
                 VALUES ('delete', old.id, old.title, old.content, old.tags);
                 INSERT INTO notes_fts(rowid, title, content, tags)
@@ -430,6 +665,15 @@ class SessionNotesStore:
             END
         """)
 
+        # Small key/value table; embedding_generation changes whenever any
+        # embedding does, so on-disk derived indexes can detect staleness
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS notes_meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        """)
+
         # Indexes
         conn.execute("CREATE INDEX IF NOT EXISTS idx_notes_date ON session_notes(session_date)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_notes_campaign ON session_notes(campaign)")
@@ -437,48 +681,151 @@ class SessionNotesStore:
 
         conn.commit()
 
+    def _migrate_schema(self, conn: sqlite3.Connection) -> None:
+        """Upgrade databases created by older versions.
+
+        Version 1 moves embeddings from the JSON ``embedding`` TEXT column to
+        a float32 ``embedding_vec`` BLOB with a precomputed ``embedding_norm``.
+        The old column is kept (SQLite can't portably drop it) but cleared.
+
+        Version 2 adds ``embedding_hash`` (see ``embedding_hash()``) and
+        restricts the FTS update trigger to text columns. Existing embeddings
+        have no hash, so the next reindex recomputes them once.
+        """
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= NOTES_SCHEMA_VERSION:
+            return
+
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(session_notes)")}
+        if "embedding_vec" not in columns:
+            conn.execute("ALTER TABLE session_notes ADD COLUMN embedding_vec BLOB")
+        if "embedding_norm" not in columns:
+            conn.execute("ALTER TABLE session_notes ADD COLUMN embedding_norm REAL")
+        if "embedding_hash" not in columns:
+            conn.execute("ALTER TABLE session_notes ADD COLUMN embedding_hash TEXT")
+        # Recreated with its column list by _init_db
+        conn.execute("DROP TRIGGER IF EXISTS notes_au")
+
+        if version < 1:
+            rows = conn.execute(
+                "SELECT id, embedding FROM session_notes WHERE embedding IS NOT NULL"
+            ).fetchall()
+            updates = []
+            for note_id, raw in rows:
+                try:
+                    blob, norm = pack_embedding(json.loads(raw))
+                except (json.JSONDecodeError, TypeError, OverflowError) as e:
+                    logger.warning(f"Dropping corrupted embedding JSON in note {note_id}: {e}")
+                    blob, norm = None, None
+                updates.append((blob, norm, note_id))
+
+            conn.executemany(
+                "UPDATE session_notes SET embedding_vec = ?, embedding_norm = ?, embedding = NULL "
+                "WHERE id = ?",
+                updates,
+            )
+            if updates:
+                logger.info(f"Migrated {len(updates)} note embeddings to binary format")
+
+        conn.execute(f"PRAGMA user_version = {NOTES_SCHEMA_VERSION}")
+        conn.commit()
+
     def close(self) -> None:
-        """Close database connection."""
+        """Close database connection, persisting the ANN index if it changed."""
+        ann = getattr(self, "_ann", None)
+        if ann is not None and ann.dirty:
+            try:
+                ann.save(self.ann_path)
+            except OSError as e:
+                logger.warning(f"Failed to save ANN index: {e}")
         if self._conn:
             self._conn.close()
             self._conn = None
-
-    def add(self, note: SessionNote) -> SessionNote:
-        """Add a new session note."""
+        cache = getattr(self, "embedding_cache", None)
+        if cache is not None and self._owns_cache:
+            cache.close()
+
+    def _embedding_fields(
+        self, text: str, embedding: Optional[list[float]]
+    ) -> tuple[Optional[bytes], Optional[float], Optional[str]]:
+        """Column values (blob, norm, hash) for storing ``embedding`` of ``text``."""
+        if not embedding:
+            return None, None, None
+        blob, norm = pack_embedding(embedding)
+        return blob, norm, embedding_hash(text, self.embedding_engine.model_id)
+
+    def _insert_notes(
+        self,
+        notes: list[SessionNote],
+        embeddings: list[Optional[list[float]]],
+    ) -> list[SessionNote]:
+        """Insert notes with precomputed embeddings in one transaction."""
         conn = self._get_conn()
         now = datetime.now()
+        changes: dict[int, Optional[list[float]]] = {}
 
-        # Generate embedding if provider available
+        for note, embedding in zip(notes, embeddings):
+            blob, norm, text_hash = self._embedding_fields(
+                note_text(note.title, note.content), embedding
+            )
+            cursor = conn.execute(
+                """
+                INSERT INTO session_notes
+                (session_date, title, content, campaign, character_id, tags, created_at,
+                 updated_at, embedding_vec, embedding_norm, embedding_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    note.session_date.isoformat(),
+                    note.title,
+                    note.content,
+                    note.campaign,
+                    note.character_id,
+                    json.dumps(note.tags),
+                    now.isoformat(),
+                    now.isoformat(),
+                    blob,
+                    norm,
+                    text_hash,
+                ),
+            )
+            note.id = cursor.lastrowid
+            note.created_at = now
+            note.updated_at = now
+            note.embedding = embedding or None
+            changes[note.id] = embedding
+
+        self._embeddings_changed(conn, changes)
+        conn.commit()
+        return notes
+
+    def add(self, note: SessionNote) -> SessionNote:
+        """Add a new session note."""
         embedding = None
         if self.embedding_engine.is_available():
-            text = f"{note.title}\n\n{note.content}"
-            embedding = self.embedding_engine.embed(text)
+            embedding = self.embedding_engine.embed(note_text(note.title, note.content))
+        return self._insert_notes([note], [embedding])[0]
 
-        cursor = conn.execute(
-            """
-            INSERT INTO session_notes
-            (session_date, title, content, campaign, character_id, tags, created_at, updated_at, embedding)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                note.session_date.isoformat(),
-                note.title,
-                note.content,
-                note.campaign,
-                note.character_id,
-                json.dumps(note.tags),
-                now.isoformat(),
-                now.isoformat(),
-                json.dumps(embedding) if embedding else None,
-            ),
-        )
-        conn.commit()
+    def add_many(self, notes: list[SessionNote]) -> list[SessionNote]:
+        """Add several notes, embedding them in batches and committing once."""
+        texts = [note_text(n.title, n.content) for n in notes]
+        if self.embedding_engine.is_available():
+            embeddings = self.embedding_engine.embed_batch(texts)
+        else:
+            embeddings = [None] * len(notes)
+        return self._insert_notes(notes, embeddings)
 
-        note.id = cursor.lastrowid
-        note.created_at = now
-        note.updated_at = now
-        note.embedding = embedding
-        return note
+    async def add_many_async(self, notes: list[SessionNote]) -> list[SessionNote]:
+        """Like add_many, but awaits embeddings so requests can be pipelined.
+
+        Must be awaited on the thread that owns the store's connection.
+        """
+        texts = [note_text(n.title, n.content) for n in notes]
+        if self.embedding_engine.is_available():
+            embeddings = await self.embedding_engine.aembed_batch(texts)
+        else:
+            embeddings = [None] * len(notes)
+        return self._insert_notes(notes, embeddings)
 
     def update(self, note: SessionNote) -> SessionNote:
         """Update an existing session note."""
@@ -488,11 +835,11 @@ class SessionNotesStore:
         conn = self._get_conn()
         now = datetime.now()
 
-        # Regenerate embedding
+        text = note_text(note.title, note.content)
         embedding = None
         if self.embedding_engine.is_available():
-            text = f"{note.title}\n\n{note.content}"
             embedding = self.embedding_engine.embed(text)
+        blob, norm, text_hash = self._embedding_fields(text, embedding)
 
         conn.execute(
             """
@@ -504,7 +851,9 @@ class SessionNotesStore:
                 character_id = ?,
                 tags = ?,
                 updated_at = ?,
-                embedding = ?
+                embedding_vec = ?,
+                embedding_norm = ?,
+                embedding_hash = ?
             WHERE id = ?
             """,
             (
@@ -515,10 +864,13 @@ class SessionNotesStore:
                 note.character_id,
                 json.dumps(note.tags),
                 now.isoformat(),
-                json.dumps(embedding) if embedding else None,
+                blob,
+                norm,
+                text_hash,
                 note.id,
             ),
         )
+        self._embeddings_changed(conn, {note.id: embedding})
         conn.commit()
 
         note.updated_at = now
@@ -529,6 +881,7 @@ class SessionNotesStore:
         """Delete a session note."""
         conn = self._get_conn()
         cursor = conn.execute("DELETE FROM session_notes WHERE id = ?", (note_id,))
+        self._embeddings_changed(conn, {note_id: None})
         conn.commit()
         return cursor.rowcount > 0
 
@@ -642,8 +995,175 @@ class SessionNotesStore:
             logger.warning(f"FTS5 search error: {e}")
             return []
 
+    def _invalidate_vectors(self) -> None:
+        """Drop the in-memory embedding matrix after notes change."""
+        self._vectors = None
+
+    def _get_generation(self) -> int:
+        """Current embedding generation counter."""
+        row = self._get_conn().execute(
+            "SELECT value FROM notes_meta WHERE key = 'embedding_generation'"
+        ).fetchone()
+        return row[0] if row else 0
+
+    @staticmethod
+    def _bump_generation(conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "INSERT INTO notes_meta (key, value) VALUES ('embedding_generation', 1) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + 1"
+        )
+
+    def _embeddings_changed(
+        self,
+        conn: sqlite3.Connection,
+        changes: dict[int, Optional[list[float]]],
+    ) -> None:
+        """Record embedding changes in the pending transaction.
+
+        Bumps the generation counter, drops the exact-search matrix, and
+        applies the changes incrementally to a loaded ANN index (inserts for
+        new vectors, tombstones for removed ones).
+        """
+        self._bump_generation(conn)
+        self._invalidate_vectors()
+        self._ann_skipped_generation = None
+
+        if self._ann is None:
+            return
+        for note_id, embedding in changes.items():
+            if embedding and len(embedding) == self._ann.dim:
+                self._ann.add(note_id, embedding)
+            else:
+                self._ann.remove(note_id)
+        self._ann.generation = conn.execute(
+            "SELECT value FROM notes_meta WHERE key = 'embedding_generation'"
+        ).fetchone()[0]
+
+    def _get_ann(self) -> Optional[IVFIndex]:
+        """Return the ANN index, loading or building it if the corpus is large enough."""
+        if not self.use_ann:
+            return None
+        if self._ann is not None:
+            return self._ann
+
+        generation = self._get_generation()
+        if self._ann_skipped_generation == generation:
+            return None
+
+        count = self._get_conn().execute(
+            "SELECT COUNT(*) FROM session_notes WHERE embedding_vec IS NOT NULL"
+        ).fetchone()[0]
+        if count < self.ANN_MIN_NOTES:
+            self._ann_skipped_generation = generation
+            return None
+
+        index = IVFIndex.load(self.ann_path)
+        if index is None or index.generation != generation:
+            # Build over the most common embedding dimension
+            vectors = self._load_vectors()
+            dim = max(vectors, key=lambda d: len(vectors[d][0]))
+            ids, matrix = vectors[dim]
+            index = IVFIndex.build(ids, matrix)
+            index.generation = generation
+            self._invalidate_vectors()  # The index holds its own copy
+            try:
+                index.save(self.ann_path)
+            except OSError as e:
+                logger.warning(f"Failed to save ANN index: {e}")
+            logger.info(f"Built ANN index: {len(index)} notes, {index.n_lists} lists")
+
+        self._ann = index
+        return index
+
+    def _load_vectors(self) -> dict[int, tuple[list[int], Any]]:
+        """Load all note embeddings, normalized, grouped by dimension.
+
+        Returns ``{dim: (note_ids, vectors)}`` where ``vectors`` is a
+        contiguous ``(n, dim)`` float32 matrix when numpy is available, or a
+        list of float arrays otherwise. Cached until notes change.
+        """
+        if self._vectors is not None:
+            return self._vectors
+
+        conn = self._get_conn()
+        rows = conn.execute(
+            "SELECT id, embedding_vec, embedding_norm FROM session_notes "
+            "WHERE embedding_vec IS NOT NULL AND embedding_norm > 0"
+        ).fetchall()
+
+        grouped: dict[int, tuple[list[int], list[bytes], list[float]]] = {}
+        for note_id, blob, norm in rows:
+            dim = len(blob) // 4
+            ids, blobs, norms = grouped.setdefault(dim, ([], [], []))
+            ids.append(note_id)
+            blobs.append(blob)
+            norms.append(norm)
+
+        vectors: dict[int, tuple[list[int], Any]] = {}
+        for dim, (ids, blobs, norms) in grouped.items():
+            if np is not None:
+                matrix = np.frombuffer(b"".join(blobs), dtype=np.float32).reshape(len(ids), dim)
+                matrix = matrix / np.asarray(norms, dtype=np.float32)[:, None]
+                vectors[dim] = (ids, np.ascontiguousarray(matrix))
+            else:
+                rows_normalized = []
+                for blob, norm in zip(blobs, norms):
+                    vec = array("f")
+                    vec.frombytes(blob)
+                    rows_normalized.append(array("f", (x / norm for x in vec)))
+                vectors[dim] = (ids, rows_normalized)
+
+        self._vectors = vectors
+        return vectors
+
+    def _top_k_similar(self, query_embedding: list[float], limit: int) -> list[tuple[int, float]]:
+        """Return ``(note_id, cosine similarity)`` for the best matches, best first."""
+        _, query_norm = pack_embedding(query_embedding)
+        if query_norm == 0:
+            return []
+
+        group = self._load_vectors().get(len(query_embedding))
+        if not group:
+            return []
+        ids, vectors = group
+
+        if np is not None:
+            query = np.asarray(query_embedding, dtype=np.float32) / np.float32(query_norm)
+            scores = vectors @ query
+            k = min(limit, len(ids))
+            if k < len(ids):
+                top = np.argpartition(-scores, k - 1)[:k]
+            else:
+                top = np.arange(len(ids))
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return [(ids[i], float(scores[i])) for i in top]
+
+        query = [x / query_norm for x in query_embedding]
+        scored = (
+            (note_id, sum(x * y for x, y in zip(vec, query)))
+            for note_id, vec in zip(ids, vectors)
+        )
+        return heapq.nlargest(limit, scored, key=lambda item: item[1])
+
+    def _get_many(self, note_ids: list[int]) -> dict[int, SessionNote]:
+        """Fetch several notes by ID in one query."""
+        if not note_ids:
+            return {}
+        conn = self._get_conn()
+        placeholders = ",".join("?" * len(note_ids))
+        cursor = conn.execute(
+            f"SELECT * FROM session_notes WHERE id IN ({placeholders})", note_ids
+        )
+        return {row["id"]: SessionNote.from_row(row) for row in cursor.fetchall()}
+
     def search_semantic(self, query: str, limit: int = 20) -> list[SearchResult]:
-        """Semantic search using vector similarity."""
+        """Semantic search using vector similarity.
+
+        Scores every note with one matrix-vector product over the cached,
+        pre-normalized embedding matrix, then selects the top ``limit``
+        with ``argpartition``. Large corpora use the IVF index instead and
+        only score the closest clusters. Only the winning notes are read back.
+        """
         if not self.embedding_engine.is_available():
             # Fall back to text search
             return self.search_text(query, limit)
@@ -653,24 +1173,19 @@ class SessionNotesStore:
         if not query_embedding:
             return self.search_text(query, limit)
 
-        conn = self._get_conn()
-
-        # Get all notes with embeddings
-        cursor = conn.execute(
-            "SELECT * FROM session_notes WHERE embedding IS NOT NULL"
-        )
-
-        results = []
-        for row in cursor.fetchall():
-            note = SessionNote.from_row(row)
-            if note.embedding:
-                # Calculate cosine similarity
-                score = self._cosine_similarity(query_embedding, note.embedding)
-                results.append(SearchResult(note=note, score=score, match_type="semantic"))
-
-        # Sort by score (higher is better) and limit
-        results.sort(key=lambda r: r.score, reverse=True)
-        return results[:limit]
+        limit = max(1, min(limit, 100))
+        ann = self._get_ann()
+        if ann is not None and ann.dim == len(query_embedding):
+            ranked = ann.search(query_embedding, limit)
+        else:
+            ranked = self._top_k_similar(query_embedding, limit)
+        notes = self._get_many([note_id for note_id, _ in ranked])
+
+        return [
+            SearchResult(note=notes[note_id], score=score, match_type="semantic")
+            for note_id, score in ranked
+            if note_id in notes
+        ]
 
     def search(
         self,
@@ -700,20 +1215,6 @@ class SessionNotesStore:
         sorted_results = sorted(results.values(), key=lambda r: r.score, reverse=True)
         return sorted_results[:limit]
 
-    def _cosine_similarity(self, a: list[float], b: list[float]) -> float:
-        """Calculate cosine similarity between two vectors."""
-        if len(a) != len(b):
-            return 0.0
-
-        dot_product = sum(x * y for x, y in zip(a, b))
-        norm_a = sum(x * x for x in a) ** 0.5
-        norm_b = sum(x * x for x in b) ** 0.5
-
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-
-        return dot_product / (norm_a * norm_b)
-
     def get_campaigns(self) -> list[str]:
         """Get list of all unique campaigns."""
         conn = self._get_conn()
@@ -738,29 +1239,90 @@ class SessionNotesStore:
 
         return sorted(all_tags)
 
-    def reindex_embeddings(self) -> int:
-        """Regenerate embeddings for all notes."""
-        if not self.embedding_engine.is_available():
+    def reindex_embeddings(
+        self,
+        batch_size: int = 32,
+        force: bool = False,
+        progress: Optional[Callable[[int, int], None]] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> int:
+        """Re-embed notes whose text or embedding model has changed.
+
+        A note is skipped when its stored ``embedding_hash`` matches its
+        current title, content and the engine's ``model_id``. Stale notes
+        are embedded ``batch_size`` at a time, written with one
+        ``executemany`` and committed per batch, so an interrupted run picks
+        up where it stopped. The work runs on its own connection, so this
+        may be called from a worker thread.
+
+        Args:
+            batch_size: Notes per embedding call and transaction
+            force: Re-embed every note regardless of hash
+            progress: Called as ``progress(done, total)`` after each batch
+            cancel: Stop after the current batch once this is set
+
+        Returns:
+            Number of notes re-embedded
+        """
+        engine = self.embedding_engine
+        if engine.provider == EmbeddingProvider.NONE or not engine.is_available():
             return 0
+        batch_size = max(1, batch_size)
+        model_id = engine.model_id
 
-        conn = self._get_conn()
-        cursor = conn.execute("SELECT * FROM session_notes")
-        notes = [SessionNote.from_row(row) for row in cursor.fetchall()]
-
-        # Batch embed
-        texts = [f"{n.title}\n\n{n.content}" for n in notes]
-        embeddings = self.embedding_engine.embed_batch(texts)
-
-        count = 0
-        for note, embedding in zip(notes, embeddings):
-            if embedding and note.id:
-                conn.execute(
-                    "UPDATE session_notes SET embedding = ? WHERE id = ?",
-                    (json.dumps(embedding), note.id),
+        conn = self._connect()
+        try:
+            stale = [
+                note_id
+                for note_id, title, content, stored_hash in conn.execute(
+                    "SELECT id, title, content, embedding_hash FROM session_notes ORDER BY id"
                 )
-                count += 1
-
-        conn.commit()
+                if force or stored_hash != embedding_hash(note_text(title, content), model_id)
+            ]
+            total = len(stale)
+            if progress:
+                progress(0, total)
+
+            count = 0
+            for start in range(0, total, batch_size):
+                if cancel is not None and cancel.is_set():
+                    break
+                batch_ids = stale[start:start + batch_size]
+                placeholders = ",".join("?" * len(batch_ids))
+                # Re-read so edits made since the scan are embedded as they are now
+                rows = conn.execute(
+                    f"SELECT id, title, content FROM session_notes WHERE id IN ({placeholders})",
+                    batch_ids,
+                ).fetchall()
+                texts = [note_text(title, content) for _, title, content in rows]
+                embeddings = engine.embed_batch(texts)
+
+                updates = []
+                for (note_id, _, _), text, embedding in zip(rows, texts, embeddings):
+                    if not embedding:
+                        continue  # Left stale; retried on the next run
+                    updates.append((*self._embedding_fields(text, embedding), note_id))
+
+                if updates:
+                    conn.executemany(
+                        "UPDATE session_notes SET embedding_vec = ?, embedding_norm = ?, "
+                        "embedding_hash = ? WHERE id = ?",
+                        updates,
+                    )
+                    self._bump_generation(conn)
+                    conn.commit()
+                    self._invalidate_vectors()
+                    count += len(updates)
+
+                if progress:
+                    progress(min(start + batch_size, total), total)
+        finally:
+            conn.close()
+
+        if count:
+            # Vectors may have changed wholesale (e.g. new model) - rebuild lazily
+            self._ann = None
+            self._ann_skipped_generation = None
         return count
 
     def get_stats(self) -> dict:
@@ -773,12 +1335,13 @@ class SessionNotesStore:
             "campaigns": 0,
             "date_range": None,
             "embedding_provider": self.embedding_engine.provider.value,
+            "embedding_cache": self.embedding_cache.get_stats(),
         }
 
         cursor = conn.execute("SELECT COUNT(*) FROM session_notes")
         stats["total_notes"] = cursor.fetchone()[0]
 
-        cursor = conn.execute("SELECT COUNT(*) FROM session_notes WHERE embedding IS NOT NULL")
+        cursor = conn.execute("SELECT COUNT(*) FROM session_notes WHERE embedding_vec IS NOT NULL")
         stats["notes_with_embeddings"] = cursor.fetchone()[0]
 
         cursor = conn.execute("SELECT COUNT(DISTINCT campaign) FROM session_notes WHERE campaign IS NOT NULL")
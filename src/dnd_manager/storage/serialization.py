@@ -0,0 +1,57 @@
+"""Shared YAML serialization helpers.
+
+All YAML reads and writes go through this module so they pick up PyYAML's
+libyaml-backed ``CSafeLoader``/``CSafeDumper`` when PyYAML was built with
+libyaml, falling back to the pure-Python ``SafeLoader``/``SafeDumper``
+otherwise. Both paths produce and accept the same documents.
+"""
+
+from typing import IO, Any, Optional
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+
+    HAS_LIBYAML = True
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+    HAS_LIBYAML = False
+
+# Re-exported so callers don't need to import yaml just to catch errors
+YAMLError = yaml.YAMLError
+
+
+def load_yaml(stream: str | bytes | IO[Any], loader: Optional[type] = None) -> Any:
+    """Parse a YAML document safely.
+
+    Args:
+        stream: YAML text, bytes or an open file
+        loader: Override the loader class (used by benchmarks)
+
+    Returns:
+        The parsed Python object (None for an empty document)
+    """
+    return yaml.load(stream, Loader=loader or SafeLoader)
+
+
+def dump_yaml(
+    data: Any,
+    stream: Optional[IO[str]] = None,
+    dumper: Optional[type] = None,
+    **kwargs: Any,
+) -> Optional[str]:
+    """Serialize data to YAML using only safe (plain) tags.
+
+    Args:
+        data: Plain Python data (dicts, lists, scalars)
+        stream: File to write to; if None the YAML text is returned
+        dumper: Override the dumper class (used by benchmarks)
+        **kwargs: Extra options passed to ``yaml.dump`` (sort_keys, width, ...)
+
+    Returns:
+        The YAML text if no stream was given, otherwise None
+    """
+    return yaml.dump(data, stream, Dumper=dumper or SafeDumper, **kwargs)
@@ -0,0 +1,191 @@
+"""Persistent summary index for character listings.
+
+Listing characters only needs a handful of fields (name, level, class, ...),
+but loading a character means parsing and validating the whole YAML file.
+This module keeps a small SQLite sidecar next to the character files that
+caches those fields keyed by file name, mtime and size, so a listing only
+reparses files that changed since the last time they were indexed.
+"""
+
+import logging
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+
+from dnd_manager.models.character import Character
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored summary fields change so stale rows are rebuilt
+INDEX_SCHEMA_VERSION = 1
+
+
+def summarize_character(character: Character, path: Path) -> dict:
+    """Build the summary dict shown in character listings."""
+    return {
+        "name": character.name,
+        "path": path,
+        "level": character.total_level,
+        "class": character.primary_class.name,
+        "subclass": character.primary_class.subclass,
+        "species": character.species,
+        "ruleset": character.meta.ruleset.value,
+        "modified": character.meta.modified,
+    }
+
+
+class CharacterSummaryIndex:
+    """SQLite-backed cache of character summaries.
+
+    Rows are keyed by file name and validated against the file's
+    ``st_mtime_ns`` and ``st_size``; a mismatch means the file changed on
+    disk (another process, sync, manual edit) and must be reparsed.
+
+    The index is purely a cache. Any SQLite failure is logged and treated
+    as a miss, so a missing or read-only index never breaks listing.
+    """
+
+    INDEX_FILENAME = ".summary_index.db"
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.db_path = directory / self.INDEX_FILENAME
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the schema on first use."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            if not self._initialized:
+                self._init_db(conn)
+                self._initialized = True
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def _init_db(self, conn: sqlite3.Connection) -> None:
+        """Initialize (or rebuild) the index schema."""
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != INDEX_SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS summaries")
+            conn.execute(f"PRAGMA user_version = {INDEX_SCHEMA_VERSION}")
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS summaries (
+                filename TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                level INTEGER NOT NULL,
+                class_name TEXT NOT NULL,
+                subclass TEXT,
+                species TEXT,
+                ruleset TEXT NOT NULL,
+                modified TEXT NOT NULL
+            )
+        """)
+        conn.commit()
+
+    def get_all(self) -> dict[str, tuple[int, int, dict]]:
+        """Return all indexed rows as ``{filename: (mtime_ns, size, summary)}``.
+
+        The ``path`` field of each summary is resolved against the index
+        directory.
+        """
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT filename, mtime_ns, size, name, level, class_name, "
+                    "subclass, species, ruleset, modified FROM summaries"
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Character summary index unavailable: {e}")
+            return {}
+
+        entries: dict[str, tuple[int, int, dict]] = {}
+        for filename, mtime_ns, size, name, level, class_name, subclass, species, ruleset, modified in rows:
+            try:
+                modified_val = datetime.fromisoformat(modified)
+            except ValueError:
+                # Unparseable row - drop it so the file is reparsed
+                continue
+            entries[filename] = (
+                mtime_ns,
+                size,
+                {
+                    "name": name,
+                    "path": self.directory / filename,
+                    "level": level,
+                    "class": class_name,
+                    "subclass": subclass,
+                    "species": species,
+                    "ruleset": ruleset,
+                    "modified": modified_val,
+                },
+            )
+        return entries
+
+    def put_many(self, entries: list[tuple[Path, int, int, dict]]) -> None:
+        """Insert or replace summaries for ``(path, mtime_ns, size, summary)`` tuples."""
+        if not entries:
+            return
+
+        rows = [
+            (
+                path.name,
+                mtime_ns,
+                size,
+                summary["name"],
+                summary["level"],
+                summary["class"],
+                summary["subclass"],
+                summary["species"],
+                summary["ruleset"],
+                summary["modified"].isoformat(),
+            )
+            for path, mtime_ns, size, summary in entries
+        ]
+        try:
+            with closing(self._connect()) as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO summaries "
+                    "(filename, mtime_ns, size, name, level, class_name, subclass, "
+                    "species, ruleset, modified) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to update character summary index: {e}")
+
+    def put(self, path: Path, character: Character) -> None:
+        """Index a character that was just written to ``path``."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return
+        self.put_many([(path, stat.st_mtime_ns, stat.st_size, summarize_character(character, path))])
+
+    def remove_many(self, filenames: list[str]) -> None:
+        """Drop summaries for the given file names."""
+        if not filenames:
+            return
+        try:
+            with closing(self._connect()) as conn:
+                conn.executemany(
+                    "DELETE FROM summaries WHERE filename = ?",
+                    [(name,) for name in filenames],
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to update character summary index: {e}")
+
+    def remove(self, path: Path) -> None:
+        """Drop the summary for a deleted character file."""
+        self.remove_many([path.name])
+
+    @staticmethod
+    def is_fresh(stat_result, mtime_ns: int, size: int) -> bool:
+        """Check whether an indexed row still matches the file on disk."""
+        return stat_result.st_mtime_ns == mtime_ns and stat_result.st_size == size
@@ -1,19 +1,22 @@
 """YAML-based storage for characters and custom content."""
 
 import os
-import shutil
+import hashlib
 import logging
+import zlib
 from pathlib import Path
 from typing import Any, Optional, TypeVar, Generic
 from datetime import datetime
 from dataclasses import dataclass
 
-import yaml
 from pydantic import BaseModel, ValidationError
 from platformdirs import user_data_dir
 
 from dnd_manager.config import get_config_manager
 from dnd_manager.models.character import Character
+from dnd_manager.storage.backups import BackupEntry, BackupStore
+from dnd_manager.storage.serialization import YAMLError, dump_yaml, load_yaml
+from dnd_manager.storage.summary_index import CharacterSummaryIndex, summarize_character
 
 
 def _get_storage_config():
@@ -65,10 +68,29 @@ class CorruptedFileError(StorageError):
 class YAMLStore(Generic[T]):
     """Generic YAML file store for Pydantic models."""
 
-    def __init__(self, directory: Path, model_class: type[T], extension: str = ".yaml"):
+    def __init__(
+        self,
+        directory: Path,
+        model_class: type[T],
+        extension: str = ".yaml",
+        compare_exclude: Optional[dict] = None,
+    ):
+        """
+        Args:
+            directory: Directory holding the files
+            model_class: Pydantic model stored in each file
+            extension: File extension
+            compare_exclude: Pydantic exclude spec for fields that don't count
+                as a change in ``is_unchanged`` (e.g. timestamps)
+        """
         self.directory = directory
         self.model_class = model_class
         self.extension = extension
+        self.compare_exclude = compare_exclude
+        # file name -> (logical name, mtime_ns, size) of files this store has seen
+        self._known_names: dict[str, tuple[str, int, int]] = {}
+        # file name -> (content digest, mtime_ns, size), see is_unchanged()
+        self._known_digests: dict[str, tuple[str, int, int]] = {}
         self._ensure_directory()
 
     def _ensure_directory(self) -> None:
@@ -128,6 +150,72 @@ class YAMLStore(Generic[T]):
 
         return safe or "unnamed"
 
+    def _remember_name(self, path: Path, name: str, stat: Optional[os.stat_result] = None) -> None:
+        """Record which logical name owns a file, for collision checks.
+
+        The entry is tagged with the file's mtime and size so an external
+        edit (sync, another process) invalidates it.
+        """
+        if stat is None:
+            try:
+                stat = path.stat()
+            except OSError:
+                return
+        self._known_names[path.name] = (name, stat.st_mtime_ns, stat.st_size)
+
+    def _remember_model(self, path: Path, model: Any, stat: Optional[os.stat_result] = None) -> None:
+        """Record the name and digest of a model just read from or written to ``path``."""
+        if stat is None:
+            try:
+                stat = path.stat()
+            except OSError:
+                return
+        name = getattr(model, "name", None)
+        if isinstance(name, str) and name:
+            self._remember_name(path, name, stat)
+        self._known_digests[path.name] = (self._digest(model), stat.st_mtime_ns, stat.st_size)
+
+    def _digest(self, model: BaseModel) -> str:
+        """Hash a model's content, ignoring ``compare_exclude`` fields."""
+        dumped = model.model_dump_json(exclude=self.compare_exclude)
+        return hashlib.sha256(dumped.encode("utf-8")).hexdigest()
+
+    def is_unchanged(self, name: str, data: T) -> bool:
+        """Check whether saving ``data`` would rewrite the file with the same content.
+
+        Only answers from what this store last read or wrote; a file edited
+        since then (different mtime or size) always counts as changed.
+        """
+        path = self._get_path(name)
+        known = self._known_digests.get(path.name)
+        if known is None:
+            return False
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if known[1] != stat.st_mtime_ns or known[2] != stat.st_size:
+            return False
+        return known[0] == self._digest(data)
+
+    def _lookup_name(self, path: Path) -> Optional[str]:
+        """Return the logical name stored in an existing file.
+
+        Uses the in-memory name map when it is still fresh; otherwise reads
+        the file once and caches the result.
+        """
+        stat = path.stat()
+        known = self._known_names.get(path.name)
+        if known and known[1] == stat.st_mtime_ns and known[2] == stat.st_size:
+            return known[0]
+
+        with open(path, "r", encoding="utf-8") as f:
+            existing_data = load_yaml(f)
+        existing_name = existing_data.get("name") if existing_data else None
+        if existing_name:
+            self._remember_name(path, existing_name, stat)
+        return existing_name
+
     def _check_collision(self, name: str, allow_overwrite: bool = False) -> None:
         """Check if saving a file would cause a collision.
 
@@ -145,26 +233,68 @@ class YAMLStore(Generic[T]):
             return
 
         # File exists - check if it's the same logical entity
-        # We need to determine if we're overwriting the same character or a different one
-        # Read the existing file to check
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                existing_data = yaml.safe_load(f)
-
-            # If the existing file has a name field, compare it
-            existing_name = existing_data.get("name") if existing_data else None
+            existing_name = self._lookup_name(path)
 
             if existing_name and existing_name.lower() != name.lower():
                 # Different logical entity - this is a collision
                 raise FilenameCollisionError(name, sanitized, path)
-        except (yaml.YAMLError, OSError):
+        except (YAMLError, OSError):
             # Can't read existing file - if we're not allowing overwrite, raise
             if not allow_overwrite:
                 raise FilenameCollisionError(name, sanitized, path)
 
+    @staticmethod
+    def _fsync_directory(directory: Path) -> None:
+        """Flush a directory entry so a rename survives a crash (POSIX only)."""
+        if os.name != "posix":
+            return
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def _write_atomic(self, path: Path, payload: bytes) -> None:
+        """Write bytes to ``path`` via an fsync'd temp file and atomic rename.
+
+        The temp file is checked against the payload's CRC32 before it
+        replaces the target, and removed if anything fails.
+
+        Raises:
+            OSError: If the write fails or the written bytes don't match
+        """
+        temp_path = path.with_suffix(f"{self.extension}.tmp")
+        try:
+            checksum = zlib.crc32(payload)
+            with open(temp_path, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Verify the written bytes match the buffer without reparsing
+            if zlib.crc32(temp_path.read_bytes()) != checksum:
+                raise OSError(f"checksum mismatch writing {temp_path}")
+
+            temp_path.replace(path)
+        except OSError:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+        self._fsync_directory(self.directory)
+
     def save(self, name: str, data: T, create_backup: bool = True, check_collision: bool = True) -> Path:
         """Save a model to YAML file with auto-backup.
 
+        The model is serialized once into memory, written to a temporary
+        file and fsync'd, checked against the buffer's CRC32, then atomically
+        renamed over the target.
+
         Args:
             name: Name of the file (without extension)
             data: Model to save
@@ -188,142 +318,83 @@ class YAMLStore(Generic[T]):
         if create_backup and path.exists():
             self._create_backup(path)
 
-        # Convert to dict, handling datetime serialization
-        data_dict = data.model_dump(mode="json")
-
-        # Write to temporary file first, then rename (atomic save)
-        temp_path = path.with_suffix(".yaml.tmp")
         try:
-            with open(temp_path, "w", encoding="utf-8") as f:
-                yaml.dump(
-                    data_dict,
-                    f,
-                    default_flow_style=False,
-                    allow_unicode=True,
-                    sort_keys=False,
-                    width=100,
-                )
-
-            # Verify the written file is valid
-            with open(temp_path, "r", encoding="utf-8") as f:
-                yaml.safe_load(f)
-
-            # Atomic rename
-            temp_path.replace(path)
+            # Convert to dict, handling datetime serialization
+            data_dict = data.model_dump(mode="json")
+            payload = dump_yaml(
+                data_dict,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+                width=100,
+            ).encode("utf-8")
+
+            # Write to temporary file first, then rename (atomic save)
+            self._write_atomic(path, payload)
             logger.debug(f"Saved {name} to {path}")
 
         except (OSError, IOError) as e:
             # File system errors (permissions, disk full, etc.)
-            if temp_path.exists():
-                temp_path.unlink()
             logger.error(f"Failed to save {name} (I/O error): {e}")
             raise StorageError(f"Failed to save {name}: {e}") from e
-        except yaml.YAMLError as e:
-            # YAML serialization/parsing errors
-            if temp_path.exists():
-                temp_path.unlink()
+        except YAMLError as e:
+            # YAML serialization errors
             logger.error(f"Failed to save {name} (YAML error): {e}")
             raise StorageError(f"Failed to save {name}: {e}") from e
         except (TypeError, ValueError) as e:
             # Data conversion errors
-            if temp_path.exists():
-                temp_path.unlink()
             logger.error(f"Failed to save {name} (data error): {e}")
             raise StorageError(f"Failed to save {name}: {e}") from e
 
+        self._remember_model(path, data)
         return path
 
-    def _create_backup(self, path: Path, max_backups: Optional[int] = None) -> Optional[Path]:
-        """Create a backup of a file.
+    @property
+    def backups(self) -> BackupStore:
+        """Backup store for this directory (honours the configured backup dir)."""
+        _, backup_dir_name = _get_storage_config()
+        return BackupStore(self.directory / backup_dir_name, self.extension)
+
+    def _create_backup(self, path: Path, max_backups: Optional[int] = None) -> Optional[BackupEntry]:
+        """Snapshot a file into the backup store.
 
-        Keeps only the most recent `max_backups` backup files.
+        Keeps only the most recent `max_backups` snapshots; saving content
+        identical to the newest snapshot stores nothing new.
         Uses config defaults if max_backups not specified.
         """
-        # Get config values (don't check exists() - just try to copy)
-        config_max_backups, backup_dir_name = _get_storage_config()
+        config_max_backups, _ = _get_storage_config()
         if max_backups is None:
             max_backups = config_max_backups
-
-        backup_dir = self.directory / backup_dir_name
-        backup_dir.mkdir(exist_ok=True)
-
-        # Create timestamped backup
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_name = f"{path.stem}_{timestamp}{path.suffix}"
-        backup_path = backup_dir / backup_name
-
-        try:
-            shutil.copy2(path, backup_path)
-            logger.debug(f"Created backup: {backup_path}")
-
-            # Clean up old backups with safer validation
-            # Use stricter pattern: stem_YYYYMMDD_HHMMSS.extension
-            import re
-            backup_pattern = re.compile(
-                rf"^{re.escape(path.stem)}_\d{{8}}_\d{{6}}{re.escape(path.suffix)}$"
-            )
-
-            valid_backups = []
-            for candidate in backup_dir.iterdir():
-                if not backup_pattern.match(candidate.name):
-                    continue
-                try:
-                    mtime = candidate.stat().st_mtime
-                    valid_backups.append((candidate, mtime))
-                except (OSError, FileNotFoundError):
-                    # File was deleted or inaccessible, skip
-                    continue
-
-            # Sort by mtime descending (newest first)
-            valid_backups.sort(key=lambda x: x[1], reverse=True)
-
-            # Remove old backups beyond the limit
-            for old_backup, _ in valid_backups[max_backups:]:
-                try:
-                    old_backup.unlink()
-                    logger.debug(f"Removed old backup: {old_backup}")
-                except (OSError, FileNotFoundError):
-                    # File was already deleted, ignore
-                    pass
-
-            return backup_path
-
-        except FileNotFoundError:
-            # Source file doesn't exist - not an error, just nothing to backup
-            return None
-        except (OSError, IOError, PermissionError) as e:
-            logger.warning(f"Failed to create backup: {e}")
+        if max_backups <= 0:
             return None
 
-    def _get_latest_backup(self, name: str) -> Optional[Path]:
-        """Get the most recent backup for a file."""
-        import re
-        _, backup_dir_name = _get_storage_config()
-        backup_dir = self.directory / backup_dir_name
-        if not backup_dir.exists():
-            return None
+        return self.backups.snapshot_file(path, max_backups)
 
-        # Use stricter pattern: name_YYYYMMDD_HHMMSS.extension
-        backup_pattern = re.compile(
-            rf"^{re.escape(name)}_\d{{8}}_\d{{6}}{re.escape(self.extension)}$"
-        )
+    def _get_latest_backup(self, name: str) -> Optional[BackupEntry]:
+        """Get the most recent backup for a file."""
+        return self.backups.latest(name)
 
-        valid_backups = []
-        for candidate in backup_dir.iterdir():
-            if not backup_pattern.match(candidate.name):
-                continue
-            try:
-                mtime = candidate.stat().st_mtime
-                valid_backups.append((candidate, mtime))
-            except (OSError, FileNotFoundError):
-                continue
+    def _recover_from_backup(self, path: Path) -> tuple[Optional[BackupEntry], LoadResult]:
+        """Try to load the newest backup of ``path`` and restore it as the main file."""
+        backup = self._get_latest_backup(path.stem)
+        if backup is None:
+            return None, LoadResult(success=False, error="No backup available")
 
-        if not valid_backups:
-            return None
+        logger.info(f"Attempting recovery from backup: {backup.path}")
+        try:
+            content = self.backups.read(backup)
+        except OSError as e:
+            return backup, LoadResult(success=False, error=f"Unreadable backup: {e}")
 
-        # Return newest backup
-        valid_backups.sort(key=lambda x: x[1], reverse=True)
-        return valid_backups[0][0]
+        result = self._parse(content.decode("utf-8", errors="replace"))
+        if result.success:
+            try:
+                self._write_atomic(path, content)
+            except OSError as e:
+                logger.warning(f"Recovered {path} from backup but could not restore file: {e}")
+            else:
+                self._remember_model(path, result.data)
+        return backup, result
 
     def load(self, name: str, try_recovery: bool = True) -> Optional[T]:
         """Load a model from YAML file.
@@ -359,17 +430,10 @@ class YAMLStore(Generic[T]):
         # Try recovery from backup
         if try_recovery:
             logger.warning(f"Failed to load {path}: {result.error}")
-            backup = self._get_latest_backup(path.stem)
-
-            if backup:
-                logger.info(f"Attempting recovery from backup: {backup}")
-                backup_result = self._try_load(backup)
-
-                if backup_result.success:
-                    logger.info(f"Successfully recovered from backup")
-                    # Restore the backup as the main file
-                    shutil.copy2(backup, path)
-                    return backup_result.data
+            _, backup_result = self._recover_from_backup(path)
+            if backup_result.success:
+                logger.info(f"Successfully recovered from backup")
+                return backup_result.data
 
         logger.error(f"Could not load or recover {path}")
         return None
@@ -378,7 +442,21 @@ class YAMLStore(Generic[T]):
         """Attempt to load a file, returning detailed result."""
         try:
             with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                stat = os.fstat(f.fileno())
+                text = f.read()
+        except Exception as e:
+            return LoadResult(success=False, error=f"Unexpected error: {e}")
+
+        result = self._parse(text)
+        if result.success:
+            # Saving this model back must not reparse the file for collisions
+            self._remember_model(path, result.data, stat)
+        return result
+
+    def _parse(self, text: str) -> LoadResult:
+        """Parse and validate YAML text, returning detailed result."""
+        try:
+            data = load_yaml(text)
 
             if data is None:
                 return LoadResult(success=False, error="File is empty")
@@ -386,7 +464,7 @@ class YAMLStore(Generic[T]):
             model = self.model_class.model_validate(data)
             return LoadResult(success=True, data=model)
 
-        except yaml.YAMLError as e:
+        except YAMLError as e:
             return LoadResult(success=False, error=f"YAML parse error: {e}")
 
         except ValidationError as e:
@@ -412,24 +490,22 @@ class YAMLStore(Generic[T]):
             return result
 
         # Try recovery
-        backup = self._get_latest_backup(name)
-        if backup:
-            backup_result = self._try_load(backup)
-            if backup_result.success:
-                # Restore backup
-                shutil.copy2(backup, path)
-                return LoadResult(
-                    success=True,
-                    data=backup_result.data,
-                    recovered_from_backup=True,
-                    backup_used=backup,
-                )
+        backup, backup_result = self._recover_from_backup(path)
+        if backup_result.success:
+            return LoadResult(
+                success=True,
+                data=backup_result.data,
+                recovered_from_backup=True,
+                backup_used=backup.path,
+            )
 
         return result
 
     def delete(self, name: str) -> bool:
         """Delete a file. Returns True if deleted, False if not found."""
         path = self._get_path(name)
+        self._known_names.pop(path.name, None)
+        self._known_digests.pop(path.name, None)
         if path.exists():
             path.unlink()
             return True
@@ -470,25 +546,42 @@ class CharacterStore:
             app_dir = Path(user_data_dir("dnd-manager", "dnd"))
             directory = app_dir / "characters"
 
-        self._store = YAMLStore(directory, Character)
+        # A save that only bumps meta.modified is not a change
+        self._store = YAMLStore(directory, Character, compare_exclude={"meta": {"modified"}})
+        self._index = CharacterSummaryIndex(self._store.directory)
 
     @property
     def directory(self) -> Path:
         """Get the character storage directory."""
         return self._store.directory
 
-    def save(self, character: Character, create_backup: bool = True) -> Path:
+    def save(
+        self,
+        character: Character,
+        create_backup: bool = True,
+        update_modified: bool = True,
+    ) -> Path:
         """Save a character, updating modified timestamp.
 
+        Saving a character whose content matches the file on disk (apart
+        from the timestamp) writes nothing and creates no backup.
+
         Args:
             character: Character to save
             create_backup: Whether to backup existing file before overwriting
+            update_modified: Whether to bump the modified timestamp first
+                (False when writing an already-timestamped snapshot)
 
         Returns:
             Path to the saved file
         """
-        character.update_modified()
-        return self._store.save(character.name, character, create_backup=create_backup)
+        if self._store.is_unchanged(character.name, character):
+            return self._store._get_path(character.name)
+        if update_modified:
+            character.update_modified()
+        path = self._store.save(character.name, character, create_backup=create_backup)
+        self._index.put(path, character)
+        return path
 
     def load(self, name: str, try_recovery: bool = True) -> Optional[Character]:
         """Load a character by name.
@@ -522,43 +615,42 @@ class CharacterStore:
         """
         return self._store.load_with_details(name)
 
-    def list_backups(self, name: str) -> list[Path]:
-        """List all backups for a character."""
-        _, backup_dir_name = _get_storage_config()
-        backup_dir = self._store.directory / backup_dir_name
-        if not backup_dir.exists():
-            return []
-
+    def list_backups(self, name: str) -> list[BackupEntry]:
+        """List all backups for a character, newest first."""
         safe_name = self._store._sanitize_filename(name)
-        return sorted(
-            backup_dir.glob(f"{safe_name}_*.yaml"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )
+        return self._store.backups.list_entries(safe_name)
 
-    def restore_from_backup(self, name: str, backup_path: Path) -> bool:
+    def restore_from_backup(self, name: str, backup: BackupEntry | Path) -> bool:
         """Restore a character from a specific backup.
 
         Args:
             name: Character name
-            backup_path: Path to the backup file
+            backup: Backup entry from list_backups(), or a path to a plain
+                character file
 
         Returns:
             True if restored successfully
         """
-        if not backup_path.exists():
-            logger.error(f"Backup not found: {backup_path}")
-            return False
-
         target_path = self._store._get_path(name)
 
         try:
+            if isinstance(backup, BackupEntry):
+                content = self._store.backups.read(backup)
+                source = backup.path
+            else:
+                if not backup.exists():
+                    logger.error(f"Backup not found: {backup}")
+                    return False
+                content = backup.read_bytes()
+                source = backup
+
             # Create backup of current file first
             if target_path.exists():
                 self._store._create_backup(target_path)
 
-            shutil.copy2(backup_path, target_path)
-            logger.info(f"Restored {name} from {backup_path}")
+            self._store._write_atomic(target_path, content)
+            self._index.remove(target_path)
+            logger.info(f"Restored {name} from {source}")
             return True
 
         except Exception as e:
@@ -567,7 +659,10 @@ class CharacterStore:
 
     def delete(self, name: str) -> bool:
         """Delete a character."""
-        return self._store.delete(name)
+        deleted = self._store.delete(name)
+        if deleted:
+            self._index.remove(self._store._get_path(name))
+        return deleted
 
     def exists(self, name: str) -> bool:
         """Check if a character exists."""
@@ -582,21 +677,43 @@ class CharacterStore:
         return self._store.list_paths()
 
     def get_character_info(self) -> list[dict]:
-        """Get summary info for all characters."""
+        """Get summary info for all characters.
+
+        Summaries come from the sidecar index when the file's mtime and size
+        still match; only new or changed files are parsed and validated.
+        """
+        indexed = self._index.get_all()
         info = []
+        updates = []
+        seen = set()
+
         for path in self.list_character_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            seen.add(path.name)
+
+            entry = indexed.get(path.name)
+            if entry and self._index.is_fresh(stat, entry[0], entry[1]):
+                info.append(entry[2])
+                self._store._remember_name(path, entry[2]["name"], stat)
+                continue
+
             char = self.load_path(path)
             if char:
-                info.append({
-                    "name": char.name,
-                    "path": path,
-                    "level": char.total_level,
-                    "class": char.primary_class.name,
-                    "subclass": char.primary_class.subclass,
-                    "species": char.species,
-                    "ruleset": char.meta.ruleset.value,
-                    "modified": char.meta.modified,
-                })
+                # Loading may have restored the file from backup - restat
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                summary = summarize_character(char, path)
+                info.append(summary)
+                self._store._remember_name(path, char.name, stat)
+                updates.append((path, stat.st_mtime_ns, stat.st_size, summary))
+
+        self._index.put_many(updates)
+        self._index.remove_many([name for name in indexed if name not in seen])
 
         # Sort by modified date, most recent first
         info.sort(key=lambda x: x["modified"], reverse=True)
@@ -651,7 +768,7 @@ class DraftStore:
         temp_file = self._draft_file.with_suffix(".yaml.tmp")
         try:
             with open(temp_file, "w", encoding="utf-8") as f:
-                yaml.dump(draft_data, f, default_flow_style=False, allow_unicode=True)
+                dump_yaml(draft_data, f, default_flow_style=False, allow_unicode=True)
             # Atomic rename
             temp_file.replace(self._draft_file)
             logger.debug(f"Saved draft: {self._draft_file}")
@@ -668,13 +785,13 @@ class DraftStore:
         """Load character creation draft if exists."""
         try:
             with open(self._draft_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = load_yaml(f)
             logger.debug(f"Loaded draft: {self._draft_file}")
             return data
         except FileNotFoundError:
             # No draft exists
             return None
-        except (OSError, yaml.YAMLError) as e:
+        except (OSError, YAMLError) as e:
             logger.warning(f"Failed to load draft: {e}")
             return None
 
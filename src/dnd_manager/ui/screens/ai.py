@@ -13,6 +13,31 @@ from dnd_manager.config import get_config_manager
 from dnd_manager.models.character import Character
 
 
+class StreamWriter:
+    """Writes streamed AI text to a RichLog as it arrives.
+
+    RichLog appends whole lines only, so chunks are buffered until a
+    newline completes a line; close() writes the rest.
+    """
+
+    def __init__(self, log: RichLog, prefix: str = "") -> None:
+        self._log = log
+        self._buffer = prefix
+
+    def write(self, chunk: str) -> None:
+        """Add a chunk, writing any completed lines."""
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            self._log.write(line)
+
+    def close(self) -> None:
+        """Write the last, unterminated line."""
+        if self._buffer:
+            self._log.write(self._buffer)
+            self._buffer = ""
+
+
 class AIChatScreen(Screen):
     """Screen for AI chat assistant."""
 
@@ -140,19 +165,20 @@ class AIChatScreen(Screen):
             *self._messages,
         ]
 
-        log.write("[bold blue]Assistant:[/] ", end="")
+        writer = StreamWriter(log, "[bold blue]Assistant:[/] ")
 
         try:
             response_text = ""
             async for chunk in provider.chat_stream(all_messages):
-                log.write(chunk, end="")
+                writer.write(chunk)
                 response_text += chunk
-            log.write("")  # Newline after response
+            writer.close()
 
             # Save assistant response
             self._messages.append(AIMessage(role=MessageRole.ASSISTANT, content=response_text))
 
         except Exception as e:
+            writer.close()
             log.write(f"\n[bold red]Error:[/] {e}")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -361,8 +387,8 @@ You don't need to use tools for every question - for general D&D knowledge quest
 
     async def _send_with_tools(self, message: str, system_prompt: str, log: RichLog) -> None:
         """Send a message with tool calling support for character creation."""
-        from dnd_manager.ai.base import AIMessage, MessageRole
-        from dnd_manager.ai.tools.session import ToolSession
+        from dnd_manager.ai.base import AIMessage, MessageRole, StreamEventType
+        from dnd_manager.ai.tools.session import ToolSession, ToolSessionResult
         from dnd_manager.ai.tools.registry import get_tool_registry
 
         provider = await self._get_provider()
@@ -390,14 +416,21 @@ You don't need to use tools for every question - for general D&D knowledge quest
             )
 
         self._messages.append(AIMessage(role=MessageRole.USER, content=message))
-        log.write("[bold blue]Assistant:[/] ", end="")
+        writer = StreamWriter(log, "[bold blue]Assistant:[/] ")
 
         try:
-            # Use tool session which handles the full AI <-> tool loop
-            result = await self._tool_session.run(message)
-
-            # Display the final response
-            log.write(result.final_response)
+            # Use tool session which handles the full AI <-> tool loop,
+            # showing text as it streams in
+            response_text = ""
+            async for event in self._tool_session.stream(message):
+                if event.type == StreamEventType.TEXT:
+                    writer.write(event.text)
+                    response_text += event.text
+            writer.close()
+            result = ToolSessionResult(
+                final_response=response_text,
+                tool_calls=self._tool_session.last_tool_calls,
+            )
 
             # Show any tool calls that were made
             if result.tool_calls:
@@ -425,6 +458,7 @@ You don't need to use tools for every question - for general D&D knowledge quest
             self._messages.append(AIMessage(role=MessageRole.ASSISTANT, content=result.final_response))
 
         except Exception as e:
+            writer.close()
             log.write(f"\n[bold red]Error:[/] {e}")
             import traceback
             log.write(f"[dim]{traceback.format_exc()}[/]")
@@ -728,19 +762,20 @@ class HomebrewChatScreen(Screen):
             *self._messages,
         ]
 
-        log.write("[bold blue]Assistant:[/] ", end="")
+        writer = StreamWriter(log, "[bold blue]Assistant:[/] ")
 
         try:
             response_text = ""
             async for chunk in provider.chat_stream(all_messages):
-                log.write(chunk, end="")
+                writer.write(chunk)
                 response_text += chunk
-            log.write("")  # Newline after response
+            writer.close()
 
             # Save assistant response
             self._messages.append(AIMessage(role=MessageRole.ASSISTANT, content=response_text))
 
         except Exception as e:
+            writer.close()
             log.write(f"\n[bold red]Error:[/] {e}")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -382,6 +382,7 @@ class MagicItemBrowserScreen(ListNavigationMixin, Screen):
 
     def _refresh_item_list(self) -> None:
         """Refresh the item list based on filters."""
+        from dnd_manager.ai.semantic import get_semantic_layer
         from dnd_manager.data import ALL_MAGIC_ITEMS, get_magic_items_by_rarity
 
         # Get items based on rarity filter
@@ -390,19 +391,16 @@ class MagicItemBrowserScreen(ListNavigationMixin, Screen):
         else:
             items = ALL_MAGIC_ITEMS
 
-        # Apply search filter
+        # Apply search filter, keeping the most relevant items first
         if self.search_query:
+            allowed = {id(item) for item in items}
             self.filtered_items = [
-                item for item in items
-                if self.search_query in item.name.lower()
-                or self.search_query in item.description.lower()
-                or self.search_query in item.item_type.lower()
+                item for item in get_semantic_layer().search_records("magic_items", self.search_query)
+                if id(item) in allowed
             ]
         else:
-            self.filtered_items = list(items)
-
-        # Sort by name
-        self.filtered_items.sort(key=lambda x: x.name)
+            # Sort by name
+            self.filtered_items = sorted(items, key=lambda x: x.name)
 
         # Update filter info
         filter_widget = self.query_one("#filter-info", Static)
@@ -699,11 +697,7 @@ class SpellBrowserScreen(ListNavigationMixin, Screen):
         list_widget = self.query_one("#spell-list", VerticalScroll)
         list_widget.remove_children()
 
-        # Filter by search query
-        spells = self.filtered_spells
-        if self.search_query:
-            query = self.search_query.lower()
-            spells = [s for s in spells if query in s.name.lower()]
+        spells = self._get_list_items()
 
         if not spells:
             list_widget.mount(Static("  No spells found", classes="no-items"))
@@ -725,10 +719,7 @@ class SpellBrowserScreen(ListNavigationMixin, Screen):
         details_widget = self.query_one("#spell-details", VerticalScroll)
         details_widget.remove_children()
 
-        spells = self.filtered_spells
-        if self.search_query:
-            query = self.search_query.lower()
-            spells = [s for s in spells if query in s.name.lower()]
+        spells = self._get_list_items()
 
         if not spells or self.selected_index >= len(spells):
             return
@@ -742,6 +733,10 @@ class SpellBrowserScreen(ListNavigationMixin, Screen):
         details_widget.mount(Static(f"  Casting Time: {spell.casting_time}"))
         details_widget.mount(Static(f"  Range: {spell.range}"))
         details_widget.mount(Static(f"  Components: {spell.components}"))
+        material = spell.material_component()
+        if material is not None and material.cost is not None:
+            consumed = ", consumed" if material.consumed else ""
+            details_widget.mount(Static(f"  Material Cost: {material.cost:,} gp{consumed}"))
         details_widget.mount(Static(f"  Duration: {spell.duration}"))
         if spell.concentration:
             details_widget.mount(Static("  (Concentration)", classes="spell-tag"))
@@ -763,11 +758,15 @@ class SpellBrowserScreen(ListNavigationMixin, Screen):
 
     # ListNavigationMixin implementation
     def _get_list_items(self) -> list:
-        spells = self.filtered_spells
-        if self.search_query:
-            query = self.search_query.lower()
-            spells = [s for s in spells if query in s.name.lower()]
-        return spells
+        if not self.search_query:
+            return self.filtered_spells
+        # Search results keep their relevance order
+        from dnd_manager.ai.semantic import get_semantic_layer
+        available = {id(spell) for spell in self.filtered_spells}
+        return [
+            spell for spell in get_semantic_layer().search_records("spells", self.search_query)
+            if id(spell) in available
+        ]
 
     def _get_item_name(self, item) -> str:
         return item.name
@@ -806,20 +805,14 @@ class SpellBrowserScreen(ListNavigationMixin, Screen):
 
     def on_clickable_list_item_selected(self, event: ClickableListItem.Selected) -> None:
         """Handle mouse click on a list item."""
-        spells = self.filtered_spells
-        if self.search_query:
-            query = self.search_query.lower()
-            spells = [s for s in spells if query in s.name.lower()]
+        spells = self._get_list_items()
         if 0 <= event.index < len(spells):
             self.selected_index = event.index
             self._update_selection()
 
     def action_add_spell(self) -> None:
         """Add the selected spell to the character."""
-        spells = self.filtered_spells
-        if self.search_query:
-            query = self.search_query.lower()
-            spells = [s for s in spells if query in s.name.lower()]
+        spells = self._get_list_items()
 
         if not spells or self.selected_index >= len(spells):
             return
@@ -838,23 +838,22 @@ class FeatPickerScreen(ListNavigationMixin, Screen):
 
     def _refresh_feat_list(self) -> None:
         """Refresh the feat list."""
-        from dnd_manager.data import ALL_FEATS, GENERAL_FEATS
+        from dnd_manager.ai.semantic import get_semantic_layer
+        from dnd_manager.data import GENERAL_FEATS
 
         # Use general feats for ASI selection
         feats = GENERAL_FEATS
 
-        # Filter by search query
+        # Filter by search query, most relevant first
         if self.search_query:
+            general = {id(f) for f in feats}
             self.filtered_feats = [
-                f for f in feats
-                if self.search_query in f.name.lower()
-                or self.search_query in f.description.lower()
+                f for f in get_semantic_layer().search_records("feats", self.search_query)
+                if id(f) in general
             ]
         else:
-            self.filtered_feats = list(feats)
-
-        # Sort alphabetically
-        self.filtered_feats.sort(key=lambda f: f.name)
+            # Sort alphabetically
+            self.filtered_feats = sorted(feats, key=lambda f: f.name)
 
         # Update list
         list_widget = self.query_one("#feat-list", VerticalScroll)
@@ -389,7 +389,7 @@ class CharacterSelectScreen(ListNavigationMixin, Screen):
         name = selected["name"]
 
         def on_confirm():
-            deleted = self.app.store.delete(name)
+            deleted = self.app.delete_character(name)
             if deleted:
                 if self.app.current_character and self.app.current_character.name == name:
                     self.app.current_character = None
@@ -1,6 +1,7 @@
 """Notes screens for the D&D Manager application."""
 
 import asyncio
+import threading
 from datetime import date
 from typing import TYPE_CHECKING, Optional
 
@@ -10,6 +11,7 @@ from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.css.query import NoMatches
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, Input, Static
+from textual.worker import Worker, WorkerState
 
 from dnd_manager.config import get_config_manager
 from dnd_manager.ui.screens.base import ListNavigationMixin
@@ -174,6 +176,7 @@ class SessionNotesScreen(ListNavigationMixin, Screen):
         Binding("+", "new_note", "New Note"),
         Binding("-", "delete_note", "Delete Note"),
         Binding("/", "search", "Search"),
+        Binding("ctrl+r", "reindex", "Reindex"),
     ]
 
     def __init__(self, character: Optional["Character"] = None, **kwargs) -> None:
@@ -186,6 +189,8 @@ class SessionNotesScreen(ListNavigationMixin, Screen):
         self._store = None
         self._last_letter = ""
         self._last_letter_index = -1
+        # Set while a background reindex runs; setting the event stops it
+        self._reindex_cancel: Optional[threading.Event] = None
 
     @property
     def store(self):
@@ -199,10 +204,11 @@ class SessionNotesScreen(ListNavigationMixin, Screen):
         yield Header()
         yield Container(
             Static("Session Notes", classes="title"),
-            Static("\\[N] New  \\[E] Edit  \\[D] Delete  / Search  \\[S] Toggle Semantic", classes="subtitle"),
+            Static("\\[N] New  \\[E] Edit  \\[D] Delete  / Search  \\[S] Toggle Semantic  Ctrl+R Reindex", classes="subtitle"),
             Horizontal(
                 Input(placeholder="Search notes...", id="notes-search"),
                 Static(id="search-mode", classes="search-mode"),
+                Static(id="reindex-status", classes="search-mode"),
                 classes="search-row",
             ),
             Horizontal(
@@ -400,6 +406,61 @@ class SessionNotesScreen(ListNavigationMixin, Screen):
         else:
             self.notify("Semantic search not available (install sentence-transformers)", severity="warning")
 
+    def action_reindex(self) -> None:
+        """Re-embed new or changed notes in a background thread."""
+        from dnd_manager.storage.notes import EmbeddingProvider
+
+        engine = self.store.embedding_engine
+        if engine.provider == EmbeddingProvider.NONE or not engine.is_available():
+            self.notify("Semantic search not available (install sentence-transformers)", severity="warning")
+            return
+        if self._reindex_cancel is not None:
+            self.notify("Reindex already running")
+            return
+
+        self._reindex_cancel = threading.Event()
+        self.query_one("#reindex-status", Static).update("[Reindexing...]")
+        self.run_worker(self._reindex, name="reindex_notes", thread=True, exclusive=True)
+
+    def _reindex(self) -> int:
+        """Worker body for action_reindex; runs off the UI thread."""
+        return self.store.reindex_embeddings(
+            progress=lambda done, total: self.app.call_from_thread(
+                self._show_reindex_progress, done, total
+            ),
+            cancel=self._reindex_cancel,
+        )
+
+    def _show_reindex_progress(self, done: int, total: int) -> None:
+        """Update the reindex progress indicator."""
+        try:
+            self.query_one("#reindex-status", Static).update(f"[Reindexing {done}/{total}]")
+        except NoMatches:
+            pass
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Report background reindex completion."""
+        if event.worker.name != "reindex_notes" or not event.worker.is_finished:
+            return
+
+        self._reindex_cancel = None
+        try:
+            self.query_one("#reindex-status", Static).update("")
+        except NoMatches:
+            return
+
+        if event.state == WorkerState.SUCCESS:
+            self.notify(f"Reindexed {event.worker.result} notes")
+            if self.search_query:
+                self._load_notes()
+        elif event.state == WorkerState.ERROR:
+            self.notify(f"Reindex failed: {event.worker.error}", severity="error")
+
+    def on_unmount(self) -> None:
+        """Stop a running reindex after its current batch."""
+        if self._reindex_cancel is not None:
+            self._reindex_cancel.set()
+
     def action_back(self) -> None:
         """Return to previous screen."""
         self.app.pop_screen()
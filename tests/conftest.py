@@ -0,0 +1,21 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from dnd_manager.data import srd_fts
+
+
+@pytest.fixture(scope="session", autouse=True)
+def srd_fts_cache(tmp_path_factory):
+    """Build the SRD full-text index in a temporary directory.
+
+    Keeps tests that reach SemanticLayer searches from writing into the
+    user's cache directory. Session-scoped so the index is built once.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(srd_fts.CACHE_DIR_ENV, str(tmp_path_factory.mktemp("cache")))
+        mp.setattr(srd_fts, "_index", None)
+        mp.setattr(srd_fts, "_index_checked", False)
+        yield
+        if srd_fts._index is not None:
+            srd_fts._index.close()
@@ -416,3 +416,468 @@ class TestAnthropicToolConversion:
         assert converted[0]["content"][0]["type"] == "tool_result"
         assert converted[0]["content"][0]["tool_use_id"] == "toolu_123"
         assert converted[0]["content"][0]["is_error"] is False
+
+
+class TestToolBatchExecution:
+    """Tests for running one turn's tool calls, read-only ones concurrently."""
+
+    @pytest.fixture
+    def executor(self):
+        import asyncio
+        from dnd_manager.ai.tools.executor import ToolExecutor
+        from dnd_manager.ai.tools.registry import ToolRegistry
+        from dnd_manager.ai.tools.schema import ToolCategory, ToolDefinition, ToolRiskLevel
+
+        registry = ToolRegistry()
+        registry._initialized = True
+        events = []
+
+        def make(name, category, risk):
+            async def handler(**kwargs):
+                events.append(("start", name))
+                await asyncio.sleep(0.01)
+                events.append(("end", name))
+                return {"data": name, "changes": [] if category == ToolCategory.QUERY else [name]}
+            registry.register(ToolDefinition(
+                name=name, description=name, input_schema={"type": "object"},
+                category=category, risk_level=risk, requires_character=False,
+            ), handler)
+
+        make("read_a", ToolCategory.QUERY, ToolRiskLevel.SAFE)
+        make("read_b", ToolCategory.QUERY, ToolRiskLevel.SAFE)
+        make("write", ToolCategory.COMBAT, ToolRiskLevel.SAFE)
+
+        executor = ToolExecutor()
+        executor._registry = registry
+        executor.events = events
+        return executor
+
+    def _run(self, executor, names, concurrent=True):
+        import asyncio
+        from dnd_manager.ai.tools.executor import ToolRequest
+
+        requests = [ToolRequest(name, {}, f"id{i}") for i, name in enumerate(names)]
+        return asyncio.run(executor.execute_batch(requests, concurrent=concurrent))
+
+    def test_read_only_classification(self, executor):
+        """Test only safe query tools count as read-only."""
+        assert executor.is_read_only("read_a")
+        assert not executor.is_read_only("write")
+        assert not executor.is_read_only("missing")
+
+    def test_reads_overlap_and_writes_are_barriers(self, executor):
+        """Test reads run together and never overlap a write."""
+        results = self._run(executor, ["read_a", "read_b", "write", "read_b", "read_a"])
+        assert [r.result for r in results] == ["read_a", "read_b", "write", "read_b", "read_a"]
+        assert executor.events[:2] == [("start", "read_a"), ("start", "read_b")]
+        write = executor.events.index(("start", "write"))
+        assert executor.events[write + 1] == ("end", "write")
+        assert all(kind == "end" for kind, _ in executor.events[write - 2:write])
+
+    def test_sequential(self, executor):
+        """Test concurrency can be turned off."""
+        self._run(executor, ["read_a", "read_b"], concurrent=False)
+        assert executor.events == [
+            ("start", "read_a"), ("end", "read_a"), ("start", "read_b"), ("end", "read_b"),
+        ]
+
+    def test_ruleset_tools(self):
+        """Test the synchronous lookup handlers run through the executor."""
+        import asyncio
+        from dnd_manager.ai.tools.executor import ToolExecutor, ToolRequest
+
+        results = asyncio.run(ToolExecutor().execute_batch([
+            ToolRequest("lookup_spell", {"name": "Fireball"}, "a"),
+            ToolRequest("search_spells", {"level": 0, "limit": 3}, "b"),
+        ]))
+        assert all(r.success for r in results)
+        assert results[0].result["spell"]["name"] == "Fireball"
+        assert len(results[1].result["spells"]) == 3
+
+    def test_only_read_only_sync_handlers_leave_the_loop_thread(self, executor):
+        """Test mutating handlers run on the event loop thread, lookups off it."""
+        import threading
+        from dnd_manager.ai.tools.schema import ToolCategory, ToolDefinition, ToolRiskLevel
+
+        threads = {}
+        for name, category in [("sync_read", ToolCategory.QUERY), ("sync_write", ToolCategory.COMBAT)]:
+            executor._registry.register(ToolDefinition(
+                name=name, description=name, input_schema={"type": "object"},
+                category=category, risk_level=ToolRiskLevel.SAFE, requires_character=False,
+            ), lambda name=name: threads.setdefault(name, threading.current_thread()) and {})
+
+        results = self._run(executor, ["sync_read", "sync_write"])
+        assert all(r.success for r in results)
+        assert threads["sync_write"] is threading.main_thread()
+        assert threads["sync_read"] is not threading.main_thread()
+
+
+class TestPromptCaching:
+    """Tests for provider prompt caching and cache usage counters."""
+
+    def test_anthropic_breakpoints(self):
+        """Test breakpoints go on tools, system and the history tail."""
+        from dnd_manager.ai.anthropic_provider import add_cache_breakpoints
+
+        tools = [{"name": "a"}, {"name": "b"}]
+        messages = [
+            {"role": "user", "content": "Hi"},
+            {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t", "content": "{}"}]},
+        ]
+        kwargs = add_cache_breakpoints({"system": "Prompt", "tools": tools, "messages": messages})
+
+        assert "cache_control" not in kwargs["tools"][0]
+        assert kwargs["tools"][1]["cache_control"] == {"type": "ephemeral"}
+        assert kwargs["system"] == [{"type": "text", "text": "Prompt", "cache_control": {"type": "ephemeral"}}]
+        assert kwargs["messages"][0] == messages[0]
+        assert kwargs["messages"][1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+        # Caller's dicts are untouched
+        assert "cache_control" not in tools[1]
+        assert "cache_control" not in messages[1]["content"][0]
+
+    def test_anthropic_usage(self):
+        """Test cache reads and writes are reported and counted as input."""
+        import asyncio
+        from unittest.mock import AsyncMock
+        from dnd_manager.ai.anthropic_provider import AnthropicProvider
+
+        client = MagicMock()
+        client.messages.create = AsyncMock(return_value=MagicMock(
+            content=[MagicMock(type="text", text="Done")],
+            stop_reason="end_turn",
+            usage=MagicMock(input_tokens=50, output_tokens=10,
+                            cache_read_input_tokens=3000, cache_creation_input_tokens=200),
+        ))
+        provider = AnthropicProvider(api_key="test-key", prompt_caching=True)
+        provider._client = client
+
+        response = asyncio.run(provider.chat_with_tools(
+            [AIMessage(role=MessageRole.SYSTEM, content="Prompt"),
+             AIMessage(role=MessageRole.USER, content="Hi")],
+            tools=[{"name": "a", "description": "", "input_schema": {"type": "object"}}],
+        ))
+        assert (response.input_tokens, response.cache_read_tokens, response.cache_write_tokens) == (3250, 3000, 200)
+        sent = client.messages.create.call_args.kwargs
+        assert sent["system"][0]["cache_control"] == {"type": "ephemeral"}
+
+        provider._prompt_caching = False
+        asyncio.run(provider.chat_with_tools([AIMessage(role=MessageRole.USER, content="Hi")], tools=[]))
+        assert client.messages.create.call_args.kwargs["messages"][0]["content"] == "Hi"
+
+    def test_setting_from_config(self, monkeypatch):
+        """Test providers read ai.prompt_caching when not told explicitly."""
+        from dnd_manager import config
+        from dnd_manager.ai.anthropic_provider import AnthropicProvider
+        from dnd_manager.ai.router import GeminiRouter
+
+        manager = config.ConfigManager(config=config.Config())
+        monkeypatch.setattr(config, "get_config_manager", lambda: manager)
+        assert AnthropicProvider(api_key="k")._prompt_caching is True
+        manager.config.ai.prompt_caching = False
+        assert AnthropicProvider(api_key="k")._prompt_caching is False
+        assert GeminiRouter(api_key="k", auto_classify=False)._context_cache is None
+        assert AnthropicProvider(api_key="k", prompt_caching=True)._prompt_caching is True
+
+    def test_gemini_context_cache(self):
+        """Test caches are reused per prefix and skipped when unavailable."""
+        import asyncio
+        from unittest.mock import AsyncMock
+        from google.genai import errors, types
+        from dnd_manager.ai.gemini import GeminiContextCache
+
+        client = MagicMock()
+        client.aio.caches.create = AsyncMock(return_value=MagicMock(
+            usage_metadata=MagicMock(total_token_count=5000),
+        ))
+        client.aio.caches.create.return_value.name = "cachedContents/abc"
+        cache = GeminiContextCache()
+        tools = [{"name": f"tool_{i}", "description": "x" * 200} for i in range(40)]
+        mode = types.ToolConfig(function_calling_config=types.FunctionCallingConfig(mode="AUTO"))
+
+        assert asyncio.run(cache.get(client, "gemini-2.5-flash", "Prompt", tools, mode)) == ("cachedContents/abc", 5000)
+        assert asyncio.run(cache.get(client, "gemini-2.5-flash", "Prompt", tools, mode)) == ("cachedContents/abc", 0)
+        assert client.aio.caches.create.await_count == 1
+        # Too small to cache
+        assert asyncio.run(cache.get(client, "gemini-2.5-flash", "Prompt", tools[:1], mode)) == (None, 0)
+
+        # Transient failures skip caching for that request only
+        for error in (
+            RuntimeError("connection reset"),
+            errors.ServerError(503, {"error": {"message": "unavailable"}}),
+            errors.ClientError(429, {"error": {"message": "quota"}}),
+        ):
+            client.aio.caches.create.side_effect = error
+            assert asyncio.run(cache.get(client, "gemini-2.5-pro", "Prompt", tools * 2, mode)) == (None, 0)
+        assert client.aio.caches.create.await_count == 4
+
+        # A 4xx rejection disables caching for the model
+        client.aio.caches.create.side_effect = errors.ClientError(
+            400, {"error": {"message": "not available on free tier"}}
+        )
+        assert asyncio.run(cache.get(client, "gemini-2.5-pro", "Prompt", tools * 2, mode)) == (None, 0)
+        assert asyncio.run(cache.get(client, "gemini-2.5-pro", "Other", tools * 2, mode)) == (None, 0)
+        assert client.aio.caches.create.await_count == 5
+
+    def test_token_usage(self):
+        """Test usage accumulates across responses."""
+        from dnd_manager.ai.base import TokenUsage
+
+        usage = TokenUsage()
+        usage.add(AIResponse(content="", model="m", provider="p", input_tokens=1000,
+                             output_tokens=10, cache_write_tokens=800))
+        usage.add(AIResponse(content="", model="m", provider="p", input_tokens=1000,
+                             output_tokens=10, cache_read_tokens=800))
+        usage.add(AIResponse(content="", model="m", provider="p"))
+        assert usage.requests == 3
+        assert usage.cache_hit_rate == 0.4
+        assert usage.to_dict()["cache_write_tokens"] == 800
+
+
+class TestToolStreaming:
+    """Tests for streamed tool-use turns."""
+
+    @staticmethod
+    def _collect(stream):
+        import asyncio
+
+        async def collect():
+            return [event async for event in stream]
+        return asyncio.run(collect())
+
+    @staticmethod
+    async def _aiter(items):
+        for item in items:
+            yield item
+
+    def test_default_replays_response(self):
+        """Test providers without native streaming replay chat_with_tools."""
+        from unittest.mock import AsyncMock
+        from dnd_manager.ai.base import StreamEventType
+        from dnd_manager.ai.ollama_provider import OllamaProvider
+
+        provider = OllamaProvider(host="http://localhost:11434")
+        block = ToolUseBlock(id="t1", name="lookup_spell", input={"name": "Shield"})
+        response = AIResponse(content="Checking", model="m", provider="p", tool_use=[block])
+        provider.chat_with_tools = AsyncMock(return_value=response)
+
+        events = self._collect(super(OllamaProvider, provider).chat_with_tools_stream([], []))
+        assert [e.type for e in events] == [StreamEventType.TEXT, StreamEventType.TOOL_USE, StreamEventType.DONE]
+        assert events[1].tool_use is block and events[2].response is response
+
+    def test_anthropic(self):
+        """Test text deltas and completed tool_use blocks are yielded."""
+        from dnd_manager.ai.anthropic_provider import AnthropicProvider
+        from dnd_manager.ai.base import StreamEventType
+
+        tool = MagicMock(type="tool_use", id="toolu_1", input={"amount": 5})
+        tool.name = "deal_damage"
+        final = MagicMock(
+            content=[MagicMock(type="text", text="Ouch"), tool],
+            stop_reason="tool_use",
+            usage=MagicMock(input_tokens=10, output_tokens=5,
+                            cache_read_input_tokens=None, cache_creation_input_tokens=None),
+        )
+
+        class Stream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def __aiter__(self):
+                return TestToolStreaming._aiter([
+                    MagicMock(type="content_block_start"),
+                    MagicMock(type="text", text="Ou"),
+                    MagicMock(type="text", text="ch"),
+                    MagicMock(type="content_block_stop", content_block=MagicMock(type="text")),
+                    MagicMock(type="input_json"),
+                    MagicMock(type="content_block_stop", content_block=tool),
+                ])
+
+            async def get_final_message(self):
+                return final
+
+        provider = AnthropicProvider(api_key="test-key", prompt_caching=False)
+        provider._client = MagicMock()
+        provider._client.messages.stream = MagicMock(return_value=Stream())
+
+        events = self._collect(provider.chat_with_tools_stream(
+            [AIMessage(role=MessageRole.USER, content="Hit me")], tools=[]))
+        assert [e.text for e in events if e.type == StreamEventType.TEXT] == ["Ou", "ch"]
+        assert events[2].tool_use == ToolUseBlock(id="toolu_1", name="deal_damage", input={"amount": 5})
+        assert events[-1].response.content == "Ouch"
+        assert events[-1].response.tool_use == [events[2].tool_use]
+
+    def test_openai(self):
+        """Test fragmented tool call arguments are assembled per call."""
+        from unittest.mock import AsyncMock
+        from dnd_manager.ai.base import StreamEventType
+        from dnd_manager.ai.openai_provider import OpenAIProvider
+
+        def chunk(content=None, calls=None, finish=None, usage=None):
+            choices = [] if usage else [MagicMock(
+                delta=MagicMock(content=content, tool_calls=calls), finish_reason=finish,
+            )]
+            return MagicMock(choices=choices, usage=usage)
+
+        def call(index, id=None, name=None, arguments=None):
+            function = MagicMock(arguments=arguments)
+            function.name = name
+            return MagicMock(index=index, id=id, function=function)
+
+        chunks = [
+            chunk(content="Let me check."),
+            chunk(calls=[call(0, "call_a", "lookup_spell", '{"na')]),
+            chunk(calls=[call(0, arguments='me": "Shield"}')]),
+            chunk(calls=[call(1, "call_b", "lookup_feat", "")]),
+            chunk(calls=[call(1, arguments='{"name": "Alert"}')], finish="tool_calls"),
+            chunk(usage=MagicMock(prompt_tokens=100, completion_tokens=20,
+                                  prompt_tokens_details=MagicMock(cached_tokens=64))),
+        ]
+        provider = OpenAIProvider(api_key="test-key")
+        provider._client = MagicMock()
+        provider._client.chat.completions.create = AsyncMock(return_value=self._aiter(chunks))
+
+        events = self._collect(provider.chat_with_tools_stream(
+            [AIMessage(role=MessageRole.USER, content="Spells?")],
+            tools=[{"name": "lookup_spell", "description": "", "input_schema": {"type": "object"}}],
+        ))
+        assert [e.type for e in events] == [
+            StreamEventType.TEXT, StreamEventType.TOOL_USE, StreamEventType.TOOL_USE, StreamEventType.DONE,
+        ]
+        assert events[1].tool_use == ToolUseBlock(id="call_a", name="lookup_spell", input={"name": "Shield"})
+        assert events[2].tool_use.input == {"name": "Alert"}
+        done = events[-1].response
+        assert (done.finish_reason, done.input_tokens, done.cache_read_tokens) == ("tool_calls", 100, 64)
+
+        sent = provider._client.chat.completions.create.call_args.kwargs
+        assert sent["tools"][0]["function"]["name"] == "lookup_spell"
+        assert sent["stream"] is True
+
+    def test_openai_message_conversion(self):
+        """Test tool use and results map to tool_calls and tool messages."""
+        from dnd_manager.ai.openai_provider import OpenAIProvider
+
+        converted = OpenAIProvider(api_key="test-key")._convert_messages_with_tools([
+            AIMessage(role=MessageRole.ASSISTANT, content=[
+                ToolUseBlock(id="call_a", name="heal_character", input={"amount": 3})]),
+            AIMessage(role=MessageRole.TOOL_RESULT, content=[
+                ToolResultBlock(tool_use_id="call_a", content='{"hp": 10}')]),
+        ])
+        assert converted[0]["tool_calls"][0]["function"] == {"name": "heal_character", "arguments": '{"amount": 3}'}
+        assert converted[1] == {"role": "tool", "tool_call_id": "call_a", "content": '{"hp": 10}'}
+
+    def test_ollama(self):
+        """Test Ollama tool calls become tool_use blocks with IDs."""
+        from unittest.mock import AsyncMock
+        from dnd_manager.ai.base import StreamEventType
+        from dnd_manager.ai.ollama_provider import OllamaProvider
+
+        chunks = [
+            {"message": {"content": "Rolling"}},
+            {"message": {"content": "", "tool_calls": [
+                {"function": {"name": "roll_dice", "arguments": {"notation": "1d20"}}}]}},
+            {"message": {"content": ""}, "done_reason": "stop", "prompt_eval_count": 30, "eval_count": 4},
+        ]
+        provider = OllamaProvider(host="http://localhost:11434")
+        provider._client = MagicMock()
+        provider._client.chat = AsyncMock(return_value=self._aiter(chunks))
+
+        events = self._collect(provider.chat_with_tools_stream(
+            [AIMessage(role=MessageRole.USER, content="Roll")], tools=[]))
+        assert events[1].type == StreamEventType.TOOL_USE
+        assert events[1].tool_use.name == "roll_dice" and events[1].tool_use.id.startswith("toolu_")
+        assert events[-1].response.input_tokens == 30
+        assert "tools" not in provider._client.chat.call_args.kwargs
+
+    def test_gemini(self):
+        """Test Gemini chunks are converted to stream events."""
+        from dnd_manager.ai.base import StreamEventType
+        from dnd_manager.ai.gemini import stream_tool_events
+
+        def chunk(*parts, finish=None, usage=None):
+            return MagicMock(
+                candidates=[MagicMock(content=MagicMock(parts=list(parts)), finish_reason=finish)],
+                usage_metadata=usage,
+            )
+
+        fc = MagicMock(args={"name": "Fireball"})
+        fc.name = "lookup_spell"
+        chunks = [
+            chunk(MagicMock(text="Looking", function_call=None)),
+            chunk(MagicMock(text=None, function_call=fc),
+                  finish=MagicMock(), usage=MagicMock(prompt_token_count=50, candidates_token_count=7,
+                                                      cached_content_token_count=40)),
+        ]
+        chunks[1].candidates[0].finish_reason.name = "STOP"
+
+        events = self._collect(stream_tool_events(self._aiter(chunks), "gemini-2.5-flash", "gemini"))
+        assert [e.type for e in events] == [StreamEventType.TEXT, StreamEventType.TOOL_USE, StreamEventType.DONE]
+        assert events[1].tool_use.input == {"name": "Fireball"}
+        assert (events[2].response.finish_reason, events[2].response.cache_read_tokens) == ("STOP", 40)
+
+    def test_session_runs_tools_while_streaming(self):
+        """Test tools start before the model turn ends and results follow in order."""
+        import asyncio
+        from dnd_manager.ai.base import AIProvider, StreamEvent, StreamEventType
+        from dnd_manager.ai.tools.registry import ToolRegistry
+        from dnd_manager.ai.tools.schema import ToolCategory, ToolDefinition
+        from dnd_manager.ai.tools.session import ToolSession
+
+        started = []
+
+        async def handler(**kwargs):
+            started.append(kwargs["key"])
+            return {"data": kwargs["key"], "changes": []}
+
+        registry = ToolRegistry()
+        registry._initialized = True
+        registry.register(ToolDefinition(
+            name="peek", description="", input_schema={"type": "object"},
+            category=ToolCategory.QUERY, requires_character=False,
+        ), handler)
+
+        class Provider(AIProvider):
+            name = "fake"
+            default_model = "fake"
+            available_models = ["fake"]
+            turns = 0
+            started_mid_stream = None
+
+            def is_configured(self):
+                return True
+
+            async def chat(self, *args, **kwargs):
+                raise NotImplementedError
+
+            async def chat_stream(self, *args, **kwargs):
+                yield ""
+
+            async def chat_with_tools_stream(self, messages, tools, **kwargs):
+                Provider.turns += 1
+                if Provider.turns == 1:
+                    blocks = [ToolUseBlock(id=f"t{i}", name="peek", input={"key": i}) for i in range(2)]
+                    yield StreamEvent(StreamEventType.TOOL_USE, tool_use=blocks[0])
+                    yield StreamEvent(StreamEventType.TOOL_USE, tool_use=blocks[1])
+                    await asyncio.sleep(0.01)
+                    Provider.started_mid_stream = list(started)
+                    yield StreamEvent(StreamEventType.DONE, response=AIResponse(
+                        content="", model="fake", provider="fake", tool_use=blocks))
+                else:
+                    yield StreamEvent(StreamEventType.TEXT, text="Done")
+                    yield StreamEvent(StreamEventType.DONE, response=AIResponse(
+                        content="Done", model="fake", provider="fake", input_tokens=5))
+
+        session = ToolSession(provider=Provider(), system_prompt="Test", auto_save=False)
+        session._registry = registry
+        session._executor._registry = registry
+
+        events = self._collect(session.stream("Go"))
+        assert Provider.started_mid_stream == [0, 1]
+        results = [e for e in events if e.type == StreamEventType.TOOL_RESULT]
+        assert [e.result.result for e in results] == [0, 1]
+        assert [e.tool_use.id for e in results] == ["t0", "t1"]
+        assert [c.name for c in session.last_tool_calls] == ["peek", "peek"]
+        assert session.messages[-1].content == "Done"
+        assert session.last_usage.requests == 2
@@ -3,6 +3,10 @@
 These tests ensure the app can actually launch without errors.
 """
 
+import os
+import subprocess
+import sys
+
 import pytest
 from pathlib import Path
 
@@ -90,6 +94,52 @@ class TestAppStartup:
                 assert binding.key != ",", f"Bare comma key in {screen_class.__name__} - use 'comma' instead"
 
 
+class TestLazyImports:
+    """Test that the CLI and data packages defer heavy imports."""
+
+    @staticmethod
+    def _modules_after(statement: str) -> set[str]:
+        """Run ``statement`` in a fresh interpreter and list loaded modules."""
+        code = f"import sys\n{statement}\nprint('\\n'.join(sys.modules))"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        return set(result.stdout.split())
+
+    def test_main_does_not_import_app_or_data(self):
+        """Test importing the CLI entry point skips Textual and SRD data."""
+        loaded = self._modules_after("import dnd_manager.main")
+        assert "textual" not in loaded
+        assert "dnd_manager.app" not in loaded
+        assert "dnd_manager.data.spells" not in loaded
+        assert "dnd_manager.storage.notes" not in loaded
+
+    def test_data_package_is_lazy(self):
+        """Test the data package only imports submodules on first access."""
+        loaded = self._modules_after("import dnd_manager.data")
+        assert "dnd_manager.data.spells" not in loaded
+
+        loaded = self._modules_after("from dnd_manager.data import get_spell_by_name")
+        assert "dnd_manager.data.spells" in loaded
+        assert "dnd_manager.data.monsters" not in loaded
+
+    def test_lazy_names_resolve(self):
+        """Test every exported name still resolves."""
+        import dnd_manager.data
+        import dnd_manager.storage
+
+        for package in (dnd_manager.data, dnd_manager.storage):
+            for name in package.__all__:
+                assert getattr(package, name) is not None
+            assert "__all__" in dir(package)
+            with pytest.raises(AttributeError):
+                package.does_not_exist
+
+
 class TestModelsImport:
     """Test that all models can be imported."""
 
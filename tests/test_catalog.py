@@ -0,0 +1,302 @@
+"""Tests for the indexed game data catalog."""
+
+import pytest
+
+from dnd_manager.data.catalog import CatalogIndex, GameDataCatalog, get_catalog
+from dnd_manager.data.feats import ALL_FEATS, get_feat, get_feats_by_category
+from dnd_manager.data.items import ARMOR, ALL_WEAPONS, get_armor_by_name, get_weapon_by_name
+from dnd_manager.data.magic_items import (
+    ALL_MAGIC_ITEMS,
+    get_magic_items_by_rarity,
+    get_magic_items_by_type,
+)
+from dnd_manager.data.monsters import (
+    ALL_MONSTERS,
+    MonsterType,
+    get_monster,
+    get_monsters_by_cr,
+    get_monsters_by_cr_range,
+    get_monsters_by_type,
+)
+from dnd_manager.data.species import get_species, get_species_by_size
+from dnd_manager.data.spells import (
+    ALL_SPELLS,
+    get_spell_by_name,
+    get_spells_by_class,
+    get_spells_by_level,
+)
+from dnd_manager.data.subclasses import (
+    ALL_SUBCLASSES,
+    get_subclass,
+    get_subclasses_for_class,
+    get_tov_subclasses_for_class,
+)
+
+
+class TestCatalogIndex:
+    """Tests for the generic index."""
+
+    @pytest.fixture
+    def index(self):
+        records = [
+            {"name": "Fire Bolt", "level": 0, "tags": ["Fire", "Attack"]},
+            {"name": "Shield", "level": 1, "tags": []},
+            {"name": "fire bolt", "level": 5, "tags": ["fire", "FIRE"]},
+        ]
+        return CatalogIndex(
+            records,
+            name=lambda r: r["name"],
+            indexes={"level": lambda r: (r["level"],), "tag": lambda r: r["tags"]},
+            ranges={"level": lambda r: r["level"]},
+        )
+
+    def test_get_is_case_insensitive(self, index):
+        """Test name lookups fold case."""
+        assert index.get("SHIELD")["level"] == 1
+        assert index.get("Missing") is None
+
+    def test_duplicate_names(self, index):
+        """Test first_wins picks the record get() returns for shared names."""
+        assert index.get("Fire Bolt")["level"] == 0
+        assert [r["level"] for r in index.get_all("FIRE BOLT")] == [0, 5]
+
+        last = CatalogIndex(index.records, name=lambda r: r["name"], first_wins=False)
+        assert last.get("fire bolt")["level"] == 5
+
+    def test_where(self, index):
+        """Test inverted indexes fold string keys and file records once."""
+        fire = index.where("tag", "fIrE")
+        assert isinstance(fire, tuple)
+        assert [r["level"] for r in fire] == [0, 5]
+        assert index.where("level", 1)[0]["name"] == "Shield"
+        assert index.where("level", 9) == ()
+
+    def test_unknown_index_raises(self, index):
+        """Test querying an index that was not built is an error."""
+        with pytest.raises(KeyError):
+            index.where("school", "Evocation")
+
+    def test_between(self, index):
+        """Test range queries are inclusive and sorted."""
+        assert [r["level"] for r in index.between("level", 0, 1)] == [0, 1]
+        assert [r["level"] for r in index.between("level", 1, 10)] == [1, 5]
+        assert index.between("level", 2, 4) == ()
+
+
+class TestGameDataCatalog:
+    """Tests that the catalog-backed helpers match a scan of the data lists."""
+
+    def test_singleton(self):
+        """Test the catalog is shared and each index is built once."""
+        catalog = get_catalog()
+        assert catalog is get_catalog()
+        assert catalog.spells is catalog.spells
+
+    def test_indexes_are_lazy(self):
+        """Test a fresh catalog builds nothing until asked."""
+        catalog = GameDataCatalog()
+        assert "monsters" not in vars(catalog)
+        catalog.monsters
+        assert "monsters" in vars(catalog)
+        assert "spells" not in vars(catalog)
+
+    def test_spell_lookups(self):
+        """Test spell helpers return what a linear scan would."""
+        for spell in ALL_SPELLS:
+            first = next(s for s in ALL_SPELLS if s.name.lower() == spell.name.lower())
+            assert get_spell_by_name(spell.name.upper()) is first
+
+        assert get_spells_by_level(3) == [s for s in ALL_SPELLS if s.level == 3]
+        assert get_spells_by_class("Wizard") == [s for s in ALL_SPELLS if "Wizard" in s.classes]
+        assert get_spells_by_class("wizard") == get_spells_by_class("Wizard")
+
+    def test_school_index(self):
+        """Test spells are indexed by school."""
+        evocation = get_catalog().spells.where("school", "evocation")
+        assert evocation
+        assert all(s.school == "Evocation" for s in evocation)
+
+    def test_item_lookups(self):
+        """Test weapon and armor lookups."""
+        assert get_weapon_by_name("LONGSWORD") is next(w for w in ALL_WEAPONS if w.name == "Longsword")
+        assert get_armor_by_name(ARMOR[0].name.lower()) is ARMOR[0]
+        assert get_weapon_by_name("Not A Weapon") is None
+
+    def test_feat_lookups(self):
+        """Test feats keep last-wins semantics for shared names."""
+        by_name = {feat.name.lower(): feat for feat in ALL_FEATS}
+        for key, feat in by_name.items():
+            assert get_feat(key) is feat
+        assert get_feats_by_category("origin") == [f for f in ALL_FEATS if f.category == "origin"]
+
+    def test_species_lookups(self):
+        """Test species are looked up by their catalog key."""
+        assert get_species("smallfolk (tov)") is not None
+        assert get_species("HUMAN").name == "Human"
+        assert all(s.size == "Small" for s in get_species_by_size("small"))
+
+    def test_monster_lookups(self):
+        """Test monster name, CR, type and CR range lookups."""
+        goblin = get_monster("goblin")
+        assert goblin is not None and goblin.name == "Goblin"
+
+        assert get_monsters_by_cr("1/4") == [m for m in ALL_MONSTERS if m.challenge_rating == "1/4"]
+        assert get_monsters_by_type(MonsterType.UNDEAD) == [
+            m for m in ALL_MONSTERS if m.monster_type == MonsterType.UNDEAD
+        ]
+
+        in_range = get_monsters_by_cr_range(0.5, 3)
+        expected = [m for m in ALL_MONSTERS if 0.5 <= m.cr_numeric <= 3]
+        assert sorted(in_range, key=id) == sorted(expected, key=id)
+        assert [m.cr_numeric for m in in_range] == sorted(m.cr_numeric for m in in_range)
+
+    def test_magic_item_lookups(self):
+        """Test rarity and type lookups normalize their arguments."""
+        very_rare = [i for i in ALL_MAGIC_ITEMS if i.rarity == "very_rare"]
+        assert get_magic_items_by_rarity("Very Rare") == very_rare
+        assert get_magic_items_by_rarity("very_rare") == very_rare
+        assert get_magic_items_by_type("Potion") == [
+            i for i in ALL_MAGIC_ITEMS if i.item_type == "potion"
+        ]
+
+    def test_subclass_lookups(self):
+        """Test subclass lookups and that results are fresh lists."""
+        by_name = {s.name.lower(): s for s in ALL_SUBCLASSES}
+        for key, subclass in by_name.items():
+            assert get_subclass(key) is subclass
+
+        fighters = get_subclasses_for_class("fighter")
+        assert fighters == [s for s in ALL_SUBCLASSES if s.parent_class == "Fighter"]
+        fighters.clear()
+        assert get_subclasses_for_class("Fighter")
+
+        assert all(s.ruleset == "tov" for s in get_tov_subclasses_for_class("Fighter"))
+
+
+class TestRulesetCatalog:
+    """Tests for memoized per-ruleset resolution."""
+
+    def test_for_ruleset_is_cached(self):
+        """Test a spell resolves to the same object every time."""
+        spell = next(s for s in ALL_SPELLS if "dnd2014" in s.variants)
+        resolved = spell.for_ruleset("dnd2014")
+        assert resolved is not spell
+        assert resolved is spell.for_ruleset("dnd2014")
+        assert resolved.variants == {}
+        assert spell.for_ruleset("dnd2024") is spell
+        # The cache is not part of the spell's value
+        assert spell == next(s for s in ALL_SPELLS if s.name == spell.name)
+
+    def test_spell_helpers_share_resolved_spells(self):
+        """Test the ruleset helpers return cached, resolved spells."""
+        from dnd_manager.data.spells import (
+            get_spell_for_ruleset,
+            get_spells_by_class_for_ruleset,
+            get_spells_by_level_for_ruleset,
+        )
+
+        spell = next(s for s in ALL_SPELLS if "dnd2014" in s.variants)
+        first = get_spells_by_level_for_ruleset(spell.level, "dnd2014")
+        second = get_spells_by_level_for_ruleset(spell.level, "dnd2014")
+        assert first == [s.for_ruleset("dnd2014") for s in ALL_SPELLS if s.level == spell.level]
+        assert all(a is b for a, b in zip(first, second))
+        assert get_spell_for_ruleset(spell.name, "dnd2014") is spell.for_ruleset("dnd2014")
+
+        class_name = spell.classes[0]
+        assert get_spells_by_class_for_ruleset(class_name, "dnd2014") == [
+            s.for_ruleset("dnd2014") for s in ALL_SPELLS if class_name in s.classes
+        ]
+
+    def test_view_is_shared(self):
+        """Test each ruleset view is built once."""
+        catalog = get_catalog()
+        assert catalog.for_ruleset("tov") is catalog.for_ruleset("tov")
+        assert catalog.for_ruleset("tov") is not catalog.for_ruleset("dnd2024")
+
+    def test_class_features(self):
+        """Test features match filtering the class's features by ruleset."""
+        from dnd_manager.data.classes import ALL_CLASSES, get_features_for_ruleset
+
+        for ruleset in ("dnd2014", "dnd2024", "tov"):
+            features = get_features_for_ruleset("Barbarian", 10, ruleset)
+            assert features == [
+                f for f in ALL_CLASSES["Barbarian"].features
+                if f.level <= 10 and f.ruleset in (None, ruleset)
+            ]
+        view = get_catalog().for_ruleset("dnd2024")
+        assert view.class_features("Barbarian", 5) is view.class_features("Barbarian", 5)
+        assert get_features_for_ruleset("Nope", 5, "dnd2024") == []
+
+    def test_subclasses(self):
+        """Test ruleset subclass views match the ruleset filters."""
+        from dnd_manager.data.subclasses import (
+            DND_SUBCLASSES,
+            TOV_SUBCLASSES,
+            get_subclasses_for_class_and_ruleset,
+            get_subclasses_for_ruleset,
+        )
+
+        assert get_subclasses_for_ruleset("tov") == TOV_SUBCLASSES
+        assert get_subclasses_for_ruleset("dnd2024") == [
+            s for s in DND_SUBCLASSES if s.ruleset in ("dnd2024", None)
+        ]
+        assert get_subclasses_for_class_and_ruleset("Fighter", "dnd2014") == [
+            s for s in DND_SUBCLASSES
+            if s.parent_class == "Fighter" and s.ruleset in ("dnd2014", None)
+        ]
+        assert get_tov_subclasses_for_class("fighter") == [
+            s for s in TOV_SUBCLASSES if s.parent_class == "Fighter"
+        ]
+
+
+class TestSpellMaterials:
+    """Tests for parsed material components and the cost index."""
+
+    def test_parse_material_component(self):
+        """Test description, cost and consumption are parsed once per string."""
+        from dnd_manager.data.spells import parse_material_component
+
+        material = parse_material_component("V, S, M (a diamond worth 1,000 gp, which the spell consumes)")
+        assert material.description == "a diamond worth 1,000 gp, which the spell consumes"
+        assert material.cost == 1000
+        assert material.consumed
+        assert parse_material_component("V, S, M (two rings worth at least 50 gp each)").cost == 100
+        assert parse_material_component("V, S, M (a feather)").cost is None
+        assert parse_material_component("V, S") is None
+        assert parse_material_component("V, M (a pearl worth 100 gp)") is (
+            parse_material_component("V, M (a pearl worth 100 gp)")
+        )
+
+    def test_cost_range(self):
+        """Test range queries return priced spells in the range, cheapest first."""
+        from dnd_manager.data.spells import get_spells_by_material_cost
+
+        spells = get_spells_by_material_cost(100, 500)
+        costs = [s.get_material_cost() for s in spells]
+        assert costs == sorted(costs)
+        assert spells == sorted(
+            (s for s in ALL_SPELLS if (c := s.get_material_cost()) is not None and 100 <= c <= 500),
+            key=lambda s: s.get_material_cost(),
+        )
+
+    def test_helpers_match_scan(self):
+        """Test the material helpers keep their list order."""
+        from dnd_manager.data.spells import (
+            get_spells_with_consumed_materials,
+            get_spells_with_material_cost,
+        )
+
+        assert get_spells_with_material_cost(100) == [
+            s for s in ALL_SPELLS if (s.get_material_cost() or 0) >= 100
+        ]
+        assert get_spells_with_consumed_materials() == [
+            s for s in ALL_SPELLS if s.is_material_consumed()
+        ]
+
+    def test_semantic_cost_filter(self):
+        """Test the AI spell search filters on material cost."""
+        from dnd_manager.ai.semantic import SemanticLayer
+
+        result = SemanticLayer().search_spells(min_cost=1000, limit=50)
+        assert result.data
+        assert all(spell["material_cost_gp"] >= 1000 for spell in result.data)
@@ -0,0 +1,96 @@
+"""Tests for the local query complexity classifier."""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from dnd_manager.ai.classifier import QueryComplexity, classify_complexity
+
+QUERIES = Path(__file__).parent / "fixtures" / "classifier_queries.jsonl"
+
+
+class TestClassifier:
+    """Tests for classify_complexity."""
+
+    @pytest.mark.parametrize("query,expected", [
+        ("How much damage does fireball do?", QueryComplexity.SIMPLE),
+        ("Roll initiative", QueryComplexity.SIMPLE),
+        ("Should I multiclass?", QueryComplexity.MODERATE),
+        ("How does counterspell work?", QueryComplexity.MODERATE),
+        ("Plan my level 1-20 wizard build", QueryComplexity.COMPLEX),
+        ("Design an encounter for my party", QueryComplexity.COMPLEX),
+    ])
+    def test_prompt_examples(self, query, expected):
+        """Test the examples from the remote classification prompt."""
+        assert classify_complexity(query).complexity == expected
+
+    def test_confidence(self):
+        """Test confidence is the probability of the chosen class."""
+        result = classify_complexity("What's my AC?")
+        assert 1 / 3 <= result.confidence <= 1
+        assert result.scores[result.complexity] == max(result.scores.values())
+
+    @pytest.mark.parametrize("split,floor", [("tune", 0.95), ("holdout", 0.7)])
+    def test_accuracy_floor(self, split, floor):
+        """Test accuracy does not regress below what it was when the weights were frozen.
+
+        The weights were tuned on the "tune" split, so only the "holdout"
+        figure estimates accuracy on new queries.
+        """
+        records = [json.loads(line) for line in QUERIES.read_text().splitlines() if line]
+        records = [r for r in records if r["split"] == split]
+        correct = sum(classify_complexity(r["query"]).complexity.value == r["label"] for r in records)
+        assert correct / len(records) >= floor
+
+
+class TestRouterClassification:
+    """Tests for classifier modes in GeminiRouter."""
+
+    def _router(self, mode):
+        from dnd_manager.ai.router import GeminiRouter
+
+        router = GeminiRouter(api_key="test", auto_classify=True, prompt_caching=False,
+                              classifier=mode, classifier_min_confidence=0.9)
+        router.classify_query_remote = AsyncMock(return_value=QueryComplexity.COMPLEX)
+        return router
+
+    def test_local(self):
+        """Test local mode never calls the remote classifier."""
+        router = self._router("local")
+        assert asyncio.run(router.classify_query("Should I multiclass?")) == QueryComplexity.MODERATE
+        router.classify_query_remote.assert_not_called()
+
+    def test_hybrid_falls_back_when_unsure(self):
+        """Test hybrid mode asks the remote classifier below the threshold."""
+        router = self._router("hybrid")
+        sure = "Roll 1d20 for initiative"
+        unsure = "How would grappling work against a huge creature?"
+        assert classify_complexity(sure).confidence >= 0.9 > classify_complexity(unsure).confidence
+
+        assert asyncio.run(router.classify_query(sure)) == QueryComplexity.SIMPLE
+        router.classify_query_remote.assert_not_called()
+        assert asyncio.run(router.classify_query(unsure)) == QueryComplexity.COMPLEX
+        router.classify_query_remote.assert_awaited_once_with(unsure)
+
+    def test_remote(self):
+        """Test remote mode always asks the remote classifier."""
+        router = self._router("remote")
+        assert asyncio.run(router.classify_query("Roll initiative")) == QueryComplexity.COMPLEX
+
+    def test_config_rejects_unknown_mode(self, tmp_path, monkeypatch):
+        """Test an unknown mode fails config validation."""
+        from dnd_manager.config import Config, ConfigManager, GeminiConfig
+
+        with pytest.raises(ValueError):
+            GeminiConfig(classifier="magic")
+        with pytest.raises(ValueError):
+            Config.model_validate({"ai": {"gemini": {"classifier": "magic"}}})
+
+        monkeypatch.setattr(Config, "get_config_path", classmethod(lambda cls: tmp_path / "config.yaml"))
+        manager = ConfigManager(config=Config())
+        assert not manager.set("ai.gemini.classifier", "magic")
+        assert manager.set("ai.gemini.classifier", "local")
+        assert manager.get("ai.gemini.classifier") == "local"
@@ -0,0 +1,138 @@
+"""Tests for fuzzy name resolution in lookups."""
+
+import pytest
+
+from dnd_manager.data.custom import CustomContentStore, CustomSpell
+from dnd_manager.data.fuzzy import NameIndex, best_match, normalize_name
+from dnd_manager.data.library import ContentType, HomebrewLibrary, LibraryContent
+
+
+class TestNameIndex:
+    """Tests for the trigram name index."""
+
+    @pytest.fixture
+    def index(self):
+        names = ["Magic Missile", "Magic Circle", "Fireball", "Delayed Blast Fireball",
+                 "Fire Bolt", "Cure Wounds", "Mass Cure Wounds", "Bigby's Hand"]
+        return NameIndex((name, i) for i, name in enumerate(names))
+
+    def test_normalize(self):
+        """Test names are compared without case or punctuation."""
+        assert normalize_name("  Bigby's   HAND!") == "bigby s hand"
+
+    def test_exact_first(self, index):
+        """Test a normalized exact match scores 1 and leads."""
+        matches = index.matches("cure WOUNDS")
+        assert (matches[0].name, matches[0].score) == ("Cure Wounds", 1.0)
+        assert matches[1].name == "Mass Cure Wounds"
+
+    @pytest.mark.parametrize("query,expected", [
+        ("Magic Misile", "Magic Missile"),
+        ("Fireball spell", "Fireball"),
+        ("bigbys hand", "Bigby's Hand"),
+    ])
+    def test_typos_resolve(self, index, query, expected):
+        """Test typos and extra words resolve to the intended name."""
+        match = best_match(index.matches(query))
+        assert match is not None and match.name == expected
+
+    def test_ambiguous_or_unrelated(self, index):
+        """Test no name is picked without a clear winner."""
+        assert best_match(index.matches("fire")) is None
+        assert index.matches("zzz") == []
+        assert index.matches("") == []
+
+    def test_limit(self, index):
+        """Test the suggestion limit."""
+        assert len(index.matches("magic", limit=1)) == 1
+
+
+class TestLookup:
+    """Tests for SemanticLayer.lookup and the lookup tools."""
+
+    @pytest.fixture
+    def layer(self, tmp_path, monkeypatch):
+        from dnd_manager.ai import semantic
+
+        store = CustomContentStore(tmp_path / "custom")
+        library = HomebrewLibrary(tmp_path / "library.db")
+        monkeypatch.setattr(semantic, "get_custom_content_store", lambda: store)
+        monkeypatch.setattr(semantic, "get_homebrew_library", lambda: library)
+        layer = semantic.SemanticLayer()
+        layer.store, layer.library = store, library
+        yield layer
+        library.close()
+
+    def test_exact(self, layer):
+        """Test exact names are found without fuzzy matching."""
+        result = layer.lookup("spells", "magic missile")
+        assert result.exact and result.name == "Magic Missile"
+
+    def test_fuzzy(self, layer):
+        """Test a misspelling resolves across collections."""
+        assert layer.lookup("spells", "Magic Misile").name == "Magic Missile"
+        assert layer.lookup("classes", "wizzard").name == "Wizard"
+        result = layer.lookup("feats", "great weapon master feat")
+        assert not result.exact
+        assert result.data["name"] == "Great Weapon Master"
+
+    def test_miss_has_suggestions(self, layer):
+        """Test an ambiguous name returns suggestions instead of a guess."""
+        result = layer.lookup("spells", "fire")
+        assert result.data is None
+        assert "Fire Bolt" in result.suggestions
+
+    def test_homebrew(self, layer):
+        """Test custom and installed library content is resolvable."""
+        layer.store.save("mine.yaml", type(layer.store.content)(spells=[CustomSpell(
+            name="Zephyr Lance", level=2, school="Evocation", casting_time="1 action",
+            range="60 feet", components="V, S", duration="Instantaneous",
+            description="A lance of wind.", classes=["Wizard"],
+        )]))
+        assert layer.lookup("spells", "zephyr lanse").data["source"] == "homebrew"
+
+        content = layer.library.add(LibraryContent(
+            content_type=ContentType.MONSTER, name="Glimmerwing Drake",
+            description="A small drake.", content_data={"cr": "2"},
+        ))
+        assert layer.lookup("monsters", "glimmerwing drake").data is None
+        layer.library.install(content.id)
+        result = layer.lookup("monsters", "glimmerwing drake")
+        assert result.exact and result.data["cr"] == "2"
+
+    def test_library_from_worker_threads(self, layer):
+        """Test each thread reads the library through its own connection."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        content = layer.library.add(LibraryContent(
+            content_type=ContentType.MONSTER, name="Glimmerwing Drake",
+            description="A small drake.", content_data={"cr": "2"},
+        ))
+        layer.library.install(content.id)
+
+        def read(_):
+            return layer.library._get_conn(), layer.lookup("monsters", "glimmerwing drake").data["cr"]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(read, range(16)))
+        assert {cr for _, cr in results} == {"2"}
+        conns = {id(conn) for conn, _ in results}
+        assert id(layer.library._get_conn()) not in conns
+        assert len(conns) <= 4
+
+        layer.library.close()
+        assert layer.library._thread_conns == []
+        assert layer.library.get(content.id).name == "Glimmerwing Drake"
+
+    def test_handler(self, layer, monkeypatch):
+        """Test the lookup tool reports the resolved name."""
+        from dnd_manager.ai.tools.handlers import ruleset_handlers
+
+        monkeypatch.setattr(ruleset_handlers, "get_semantic_layer", lambda: layer)
+        result = ruleset_handlers.handle_lookup_spell(None, "Fireball spell")
+        assert result["found"] and result["matched_name"] == "Fireball"
+        assert result["spell"]["name"] == "Fireball"
+        assert "note" in result
+
+        missing = ruleset_handlers.handle_lookup_spell(None, "fire")
+        assert not missing["found"] and missing["suggestions"]
@@ -0,0 +1,141 @@
+"""Tests for token-budgeted tool session history."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dnd_manager.ai.base import AIMessage, AIResponse, MessageRole, ToolResultBlock, ToolUseBlock
+from dnd_manager.ai.history import HistoryManager, estimate_tokens
+
+
+def _turn(n: int, payload_chars: int = 4000) -> list[AIMessage]:
+    """A user message, a tool call with a large result, and a reply."""
+    result = {"success": True, "data": "x" * payload_chars, "changes": [f"change {n}"]}
+    return [
+        AIMessage(role=MessageRole.USER, content=f"question {n}"),
+        AIMessage(role=MessageRole.ASSISTANT, content=[
+            ToolUseBlock(id=f"t{n}", name="lookup_spell", input={"name": "Fireball"}),
+        ]),
+        AIMessage(role=MessageRole.TOOL_RESULT, content=[
+            ToolResultBlock(tool_use_id=f"t{n}", content=json.dumps(result)),
+        ]),
+        AIMessage(role=MessageRole.ASSISTANT, content=f"answer {n}"),
+    ]
+
+
+def _history(turns: int, payload_chars: int = 4000) -> list[AIMessage]:
+    messages = [AIMessage(role=MessageRole.SYSTEM, content="System prompt")]
+    for n in range(turns):
+        messages += _turn(n, payload_chars)
+    return messages
+
+
+def _total(messages: list[AIMessage]) -> int:
+    return sum(estimate_tokens(msg) for msg in messages)
+
+
+class TestHistoryManager:
+    """Tests for compacting message histories."""
+
+    def test_under_budget_unchanged(self):
+        """Test nothing is done while the history fits."""
+        messages = _history(3)
+        compacted, report = HistoryManager(budget=100_000).compact(messages)
+        assert compacted is messages and report is None
+
+    def test_stubs_old_results(self):
+        """Test old tool results become stubs that keep success and changes."""
+        messages = _history(6)
+        original = [msg.content for msg in messages]
+        compacted, report = HistoryManager(budget=_total(messages) - 500, keep_recent_turns=2).compact(messages)
+
+        assert report is not None and report.stubbed_results >= 1
+        assert report.dropped_messages == 0
+        assert len(compacted) == len(messages)
+        stub = json.loads(compacted[3].content[0].content)
+        assert stub["success"] is True and stub["changes"] == ["change 0"]
+        assert "data" not in stub and "lookup_spell" in stub["omitted"]
+        # The input is left alone
+        assert [msg.content for msg in messages] == original
+
+    def test_system_and_recent_turns_pinned(self):
+        """Test the system prompt and the latest turns are never changed."""
+        messages = _history(6)
+        compacted, report = HistoryManager(budget=1000, keep_recent_turns=2).compact(messages)
+
+        assert report is not None
+        assert compacted[0] is messages[0]
+        assert compacted[-8:] == messages[-8:]
+        assert all(a is b for a, b in zip(compacted[-8:], messages[-8:]))
+
+    def test_drops_whole_turns(self):
+        """Test the oldest turns are dropped whole when stubs are not enough."""
+        messages = _history(6)
+        compacted, report = HistoryManager(budget=3000, keep_recent_turns=2).compact(messages)
+
+        assert report is not None and report.dropped_messages % 4 == 0
+        assert report.dropped_messages > 0
+        assert compacted[0].role == MessageRole.SYSTEM
+        assert compacted[1].role == MessageRole.USER
+        tool_uses = {b.id for m in compacted if isinstance(m.content, list)
+                     for b in m.content if isinstance(b, ToolUseBlock)}
+        tool_results = {b.tool_use_id for m in compacted if isinstance(m.content, list)
+                        for b in m.content if isinstance(b, ToolResultBlock)}
+        assert tool_uses == tool_results
+
+    def test_report_tokens_saved(self):
+        """Test the report matches the estimated sizes."""
+        messages = _history(6)
+        compacted, report = HistoryManager(budget=4000, keep_recent_turns=2).compact(messages)
+        assert report.tokens_before == _total(messages)
+        assert report.tokens_after == _total(compacted)
+        assert report.tokens_saved > 0
+        assert report.tokens_after <= int(4000 * HistoryManager.TARGET_RATIO)
+
+    def test_provider_budgets(self):
+        """Test budgets come from the provider name."""
+        assert HistoryManager.for_provider("ollama").budget < HistoryManager.for_provider("gemini").budget
+        assert HistoryManager.for_provider("unknown").budget > 0
+
+
+class TestSessionCompaction:
+    """Tests for history compaction in ToolSession."""
+
+    @pytest.fixture
+    def provider(self):
+        provider = MagicMock()
+        provider.name = "fake"
+        provider.chat_with_tools = AsyncMock(return_value=AIResponse(
+            content="Done", model="fake", provider="fake"))
+        return provider
+
+    def test_compacts_before_calls(self, provider):
+        """Test the history is compacted before the provider is called."""
+        from dnd_manager.ai.tools.session import ToolSession
+
+        session = ToolSession(provider=provider, system_prompt="Test", history_budget=3000,
+                              keep_recent_turns=1)
+        session._ensure_initialized()
+        session.messages += _history(4)[1:]
+
+        asyncio.run(session.chat("Next"))
+        assert _total(session.messages) <= 3000
+        assert session.messages[0].role == MessageRole.SYSTEM
+        assert [m.content for m in session.messages[-2:]] == ["Next", "Done"]
+        assert len(session.compactions) == 1
+        assert session.compactions[0].tokens_saved > 0
+
+    def test_disabled(self, provider):
+        """Test compaction can be turned off."""
+        from dnd_manager.ai.tools.session import ToolSession
+
+        session = ToolSession(provider=provider, system_prompt="Test", history_budget=100,
+                              compact_history=False)
+        session._ensure_initialized()
+        session.messages += _history(4)[1:]
+
+        asyncio.run(session.chat("Next"))
+        assert session.compactions == []
+        assert len(session.messages) == 1 + 16 + 2
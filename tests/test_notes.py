@@ -0,0 +1,605 @@
+"""Tests for session notes storage and search."""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from dnd_manager.storage import notes as notes_module
+from dnd_manager.storage.ann import ANN_AVAILABLE, IVFIndex
+from dnd_manager.storage.embedding_cache import EmbeddingCache
+from dnd_manager.storage.notes import (
+    EmbeddingEngine,
+    EmbeddingProvider,
+    SessionNote,
+    SessionNotesStore,
+)
+
+
+class FakeEmbeddingEngine:
+    """Deterministic bag-of-words embedder for tests."""
+
+    DIM = 32
+    model_id = "fake/crc32-bow"
+
+    def __init__(self):
+        self.provider = EmbeddingProvider.SENTENCE_TRANSFORMERS
+        self.calls = 0
+
+    def is_available(self) -> bool:
+        return True
+
+    def embed(self, text: str):
+        self.calls += 1
+        vec = [0.0] * self.DIM
+        for word in text.lower().split():
+            vec[zlib.crc32(word.encode()) % self.DIM] += 1.0
+        return vec
+
+    def embed_batch(self, texts):
+        self.batches = getattr(self, "batches", 0) + 1
+        return [self.embed(t) for t in texts]
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Notes store with the fake embedding engine."""
+    notes_store = SessionNotesStore(db_path=tmp_path / "notes.db")
+    notes_store.embedding_engine = FakeEmbeddingEngine()
+    yield notes_store
+    notes_store.close()
+
+
+def _add_sample_notes(store):
+    store.add(SessionNote(title="Dragon fight", content="the red dragon attacked the village"))
+    store.add(SessionNote(title="Shopping", content="bought rope and torches in town"))
+    store.add(SessionNote(title="Tavern", content="met a bard at the tavern"))
+
+
+class TestSemanticSearch:
+    """Tests for vector similarity search."""
+
+    def test_embeddings_stored_as_blobs(self, store):
+        """Test that embeddings are stored as float32 blobs with norms."""
+        note = store.add(SessionNote(title="Dragon", content="red dragon"))
+        row = store._get_conn().execute(
+            "SELECT embedding, embedding_vec, embedding_norm FROM session_notes WHERE id = ?",
+            (note.id,),
+        ).fetchone()
+        assert row["embedding"] is None
+        assert len(row["embedding_vec"]) == FakeEmbeddingEngine.DIM * 4
+        assert row["embedding_norm"] > 0
+        assert store.get(note.id).embedding == pytest.approx(note.embedding)
+
+    def test_best_match_first(self, store):
+        """Test that the most similar note ranks first."""
+        _add_sample_notes(store)
+        results = store.search_semantic("dragon attacked", limit=2)
+        assert len(results) == 2
+        assert results[0].note.title == "Dragon fight"
+        assert results[0].score >= results[1].score
+
+    def test_pure_python_fallback_matches_numpy(self, store, monkeypatch):
+        """Test that search works identically without numpy."""
+        _add_sample_notes(store)
+        expected = [(r.note.id, r.score) for r in store.search_semantic("bard tavern")]
+
+        monkeypatch.setattr(notes_module, "np", None)
+        store._invalidate_vectors()
+        actual = [(r.note.id, r.score) for r in store.search_semantic("bard tavern")]
+
+        assert [i for i, _ in actual] == [i for i, _ in expected]
+        assert [s for _, s in actual] == pytest.approx([s for _, s in expected], abs=1e-5)
+
+    def test_cache_invalidated_on_changes(self, store):
+        """Test that add/update/delete are visible to the next search."""
+        _add_sample_notes(store)
+        store.search_semantic("dragon")
+
+        goblin = store.add(SessionNote(title="Goblins", content="goblin ambush"))
+        assert store.search_semantic("goblin ambush", limit=1)[0].note.id == goblin.id
+
+        goblin.content = "kobold ambush"
+        store.update(goblin)
+        assert store.search_semantic("kobold", limit=1)[0].note.id == goblin.id
+
+        store.delete(goblin.id)
+        assert goblin.id not in [r.note.id for r in store.search_semantic("kobold")]
+
+
+class TestReindex:
+    """Tests for incremental embedding reindexing."""
+
+    def test_unchanged_notes_skipped(self, store):
+        """Test that notes embedded with the current model are not re-embedded."""
+        _add_sample_notes(store)
+        store.embedding_engine.calls = 0
+        assert store.reindex_embeddings() == 0
+        assert store.embedding_engine.calls == 0
+
+    def test_changed_text_and_model_reembedded(self, store):
+        """Test that edits made outside update() and model changes are detected."""
+        _add_sample_notes(store)
+        store._get_conn().execute("UPDATE session_notes SET content = 'changed' WHERE id = 1")
+        store._get_conn().commit()
+        assert store.reindex_embeddings() == 1
+
+        store.embedding_engine.model_id = "fake/other-model"
+        assert store.reindex_embeddings() == 3
+        assert store.reindex_embeddings(force=True) == 3
+
+    def test_batches_and_progress(self, store):
+        """Test that work is split into batches with progress reports."""
+        for i in range(7):
+            store.add(SessionNote(title=f"Note {i}", content="content"))
+        store.embedding_engine.model_id = "fake/other-model"
+
+        reports = []
+        assert store.reindex_embeddings(batch_size=3, progress=lambda d, t: reports.append((d, t))) == 7
+        assert store.embedding_engine.batches == 3
+        assert reports == [(0, 7), (3, 7), (6, 7), (7, 7)]
+
+    def test_cancel_is_resumable(self, store):
+        """Test that a cancelled run keeps finished batches and resumes."""
+        import threading
+        for i in range(6):
+            store.add(SessionNote(title=f"Note {i}", content="content"))
+        store.embedding_engine.model_id = "fake/other-model"
+
+        cancel = threading.Event()
+        done = store.reindex_embeddings(
+            batch_size=2, cancel=cancel, progress=lambda d, t: d >= 2 and cancel.set()
+        )
+        assert done == 2
+        assert store.reindex_embeddings(batch_size=2) == 4
+
+    def test_reindex_from_worker_thread(self, store):
+        """Test that reindexing works off the thread that owns the store."""
+        import threading
+        _add_sample_notes(store)
+        store.embedding_engine.model_id = "fake/other-model"
+        result = []
+        worker = threading.Thread(target=lambda: result.append(store.reindex_embeddings()))
+        worker.start()
+        worker.join()
+        assert result == [3]
+        assert store.search_semantic("dragon attacked", limit=1)[0].note.title == "Dragon fight"
+
+    @pytest.mark.asyncio
+    async def test_reindex_key_does_not_clash_with_letter_jump(self, store, monkeypatch):
+        """Test that "r" only jumps to a note and ctrl+r starts the reindex."""
+        from dnd_manager.app import DNDManagerApp
+        from dnd_manager.ui.screens.notes import SessionNotesScreen
+
+        store.add(SessionNote(title="Ambush", content="goblins"))
+        store.add(SessionNote(title="Rescue", content="the prisoner"))
+        started = []
+        monkeypatch.setattr(SessionNotesScreen, "action_reindex", lambda self: started.append(True))
+
+        app = DNDManagerApp()
+        async with app.run_test() as pilot:
+            screen = SessionNotesScreen()
+            screen._store = store
+            app.push_screen(screen)
+            await pilot.pause()
+            screen.set_focus(None)  # Letter keys go to the search box while it has focus
+
+            await pilot.press("r")
+            await pilot.pause()
+            assert screen.notes[screen.selected_index].title == "Rescue"
+            assert started == []
+
+            await pilot.press("ctrl+r")
+            await pilot.pause()
+            assert started == [True]
+
+    def test_embedding_writes_keep_fts_in_sync(self, store):
+        """Test that keyword search still works after embedding-only updates."""
+        _add_sample_notes(store)
+        store.reindex_embeddings(force=True)
+        results = store.search_text("bard")
+        assert [r.note.title for r in results] == ["Tavern"]
+
+
+class _StubOllamaHandler(BaseHTTPRequestHandler):
+    """Answers /api/embed (and legacy /api/embeddings) with length-based vectors."""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, so connection reuse is observable
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.requests.append((self.path, body))
+            server.connections.add(self.client_address)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        time.sleep(server.delay)
+        with server.lock:
+            server.active -= 1
+
+        if self.path == "/api/embed" and not server.legacy:
+            texts = body["input"] if isinstance(body["input"], list) else [body["input"]]
+            payload = {"model": body["model"], "embeddings": [[float(len(t)), 1.0] for t in texts]}
+        elif self.path == "/api/embeddings":
+            payload = {"embedding": [float(len(body["prompt"])), 1.0]}
+        else:
+            self._reply(404, b"404 page not found", "text/plain")
+            return
+        self._reply(200, json.dumps(payload).encode(), "application/json")
+
+    def _reply(self, status, data, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def ollama_server():
+    """Local stand-in for an Ollama server."""
+    pytest.importorskip("ollama")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubOllamaHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.connections = set()
+    server.active = server.max_active = 0
+    server.delay = 0.0
+    server.legacy = False
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _ollama_engine(server):
+    host = f"http://127.0.0.1:{server.server_address[1]}"
+    return EmbeddingEngine(EmbeddingProvider.OLLAMA, show_progress=False, ollama_host=host)
+
+
+class TestOllamaBatching:
+    """Tests for batched, pooled Ollama embedding requests."""
+
+    def test_batch_uses_few_requests(self, ollama_server):
+        """Test that texts are sent in OLLAMA_BATCH_SIZE chunks, in order."""
+        engine = _ollama_engine(ollama_server)
+        texts = ["x" * i for i in range(1, 71)]
+        embeddings = engine.embed_batch(texts)
+
+        assert [e[0] for e in embeddings] == [float(i) for i in range(1, 71)]
+        assert len(ollama_server.requests) == 3  # 32 + 32 + 6
+        assert all(path == "/api/embed" for path, _ in ollama_server.requests)
+
+    def test_connections_reused(self, ollama_server):
+        """Test that sequential calls share one keep-alive connection."""
+        engine = _ollama_engine(ollama_server)
+        for text in ("a", "bb", "ccc"):
+            assert engine.embed(text) == [float(len(text)), 1.0]
+        assert len(ollama_server.connections) == 1
+
+    def test_concurrency_bounded(self, ollama_server):
+        """Test that chunks run concurrently but within the limit."""
+        ollama_server.delay = 0.05
+        engine = _ollama_engine(ollama_server)
+        engine.OLLAMA_BATCH_SIZE = 2
+        engine.embed_batch([f"note {i}" for i in range(20)])
+        assert 1 < ollama_server.max_active <= engine.OLLAMA_MAX_CONCURRENCY
+
+    def test_async_batch(self, ollama_server):
+        """Test the asyncio variant with bounded pipelining."""
+        ollama_server.delay = 0.05
+        engine = _ollama_engine(ollama_server)
+        engine.OLLAMA_BATCH_SIZE = 2
+        texts = [f"{'y' * i}" for i in range(1, 21)]
+        embeddings = asyncio.run(engine.aembed_batch(texts))
+        assert [e[0] for e in embeddings] == [float(i) for i in range(1, 21)]
+        assert 1 < ollama_server.max_active <= engine.OLLAMA_MAX_CONCURRENCY
+
+    def test_legacy_server_fallback(self, ollama_server):
+        """Test that servers without /api/embed get per-text requests."""
+        ollama_server.legacy = True
+        engine = _ollama_engine(ollama_server)
+        assert engine.embed_batch(["a", "bb"]) == [[1.0, 1.0], [2.0, 1.0]]
+        assert [path for path, _ in ollama_server.requests] == [
+            "/api/embed", "/api/embeddings", "/api/embeddings",
+        ]
+
+    def test_unreachable_server(self):
+        """Test that connection failures yield None embeddings."""
+        pytest.importorskip("ollama")
+        engine = EmbeddingEngine(
+            EmbeddingProvider.OLLAMA, show_progress=False, ollama_host="http://127.0.0.1:9"
+        )
+        assert engine.embed_batch(["a", "b"]) == [None, None]
+
+    def test_store_add_many(self, ollama_server, tmp_path):
+        """Test that add_many embeds in batches and stores every note."""
+        with SessionNotesStore(db_path=tmp_path / "notes.db") as store:
+            store.embedding_engine = _ollama_engine(ollama_server)
+            notes = [SessionNote(title=f"n{i}", content="c" * i) for i in range(40)]
+            asyncio.run(store.add_many_async(notes[:20]))
+            store.add_many(notes[20:])
+
+            assert len(ollama_server.requests) == 2
+            assert store.get_stats()["notes_with_embeddings"] == 40
+            assert store.get(notes[5].id).embedding == [float(len("n5\n\n" + "c" * 5)), 1.0]
+
+
+class TestEmbeddingCache:
+    """Tests for the persistent embedding cache."""
+
+    def test_round_trip_and_persistence(self, tmp_path):
+        """Test that vectors survive reopening the cache."""
+        cache = EmbeddingCache(tmp_path / "cache.db")
+        cache.put("model-a", "k1", [0.5, 1.5])
+        cache.close()
+
+        cache = EmbeddingCache(tmp_path / "cache.db")
+        assert cache.get("k1") == [0.5, 1.5]
+        assert cache.get("k2") is None
+        cache.close()
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used entries are evicted first."""
+        cache = EmbeddingCache(tmp_path / "cache.db", max_entries=10)
+        for i in range(10):
+            cache.put("m", f"k{i}", [float(i)])
+            time.sleep(0.001)
+        cache.get("k0")  # Now most recently used
+        cache.put("m", "k10", [10.0])
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 9
+        assert cache.get("k0") == [0.0]
+        assert cache.get("k1") is None and cache.get("k2") is None
+        cache.close()
+
+    def test_hit_rate(self, tmp_path):
+        """Test session and lifetime hit statistics."""
+        cache = EmbeddingCache(tmp_path / "cache.db")
+        cache.put("m", "k1", [1.0])
+        cache.get_many(["k1", "k1", "k2", "k3"])
+        cache.close()
+
+        cache = EmbeddingCache(tmp_path / "cache.db")
+        cache.get("k1")
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 0, 1.0)
+        assert (stats["total_hits"], stats["total_misses"]) == (3, 2)
+        assert stats["total_hit_rate"] == pytest.approx(0.6)
+        cache.close()
+
+    def test_lookups_do_not_write(self, tmp_path):
+        """Test that lookup bookkeeping is buffered until close or the interval."""
+        cache = EmbeddingCache(tmp_path / "cache.db")
+        cache.put("m", "k1", [1.0])
+        writes = cache._conn.total_changes
+        for _ in range(5):
+            cache.get_many(["k1", "k2"])
+        assert cache._conn.total_changes == writes
+        assert cache.get_stats()["total_hits"] == 5
+
+        cache.FLUSH_INTERVAL = 0.0
+        cache.get("k1")
+        assert cache._conn.total_changes > writes
+        cache.close()
+
+        cache = EmbeddingCache(tmp_path / "cache.db")
+        stats = cache.get_stats()
+        assert (stats["total_hits"], stats["total_misses"]) == (6, 5)
+        cache.close()
+
+    def test_clear_by_model(self, tmp_path):
+        """Test clearing only one model's entries."""
+        cache = EmbeddingCache(tmp_path / "cache.db")
+        cache.put_many("a", {"k1": [1.0], "k2": [2.0]})
+        cache.put("b", "k3", [3.0])
+        assert cache.clear("a") == 2
+        assert cache.get_stats()["entries"] == 1
+        cache.close()
+
+    def test_engine_skips_cached_texts(self, ollama_server, tmp_path):
+        """Test that the engine only sends uncached, distinct texts."""
+        cache = EmbeddingCache(tmp_path / "cache.db")
+        engine = _ollama_engine(ollama_server)
+        engine.cache = cache
+
+        assert engine.embed("hello") == [5.0, 1.0]
+        assert engine.embed_batch(["hello", "hi", "hi"]) == [[5.0, 1.0], [2.0, 1.0], [2.0, 1.0]]
+        assert asyncio.run(engine.aembed_batch(["hi", "hey"])) == [[2.0, 1.0], [3.0, 1.0]]
+
+        inputs = [body["input"] for _, body in ollama_server.requests]
+        assert inputs == [["hello"], ["hi"], ["hey"]]
+        cache.close()
+
+    def test_cache_keyed_by_model(self, ollama_server, tmp_path):
+        """Test that another model does not reuse cached vectors."""
+        cache = EmbeddingCache(tmp_path / "cache.db")
+        engine = _ollama_engine(ollama_server)
+        engine.cache = cache
+        engine.embed("hello")
+        engine.OLLAMA_MODEL = "other-model"
+        engine.embed("hello")
+        assert len(ollama_server.requests) == 2
+        cache.close()
+
+    def test_store_stats(self, store):
+        """Test that the notes store reports cache statistics."""
+        stats = store.get_stats()["embedding_cache"]
+        assert stats["entries"] == 0
+        assert store.embedding_cache.db_path == store.db_path.parent / "embedding_cache.db"
+
+
+needs_numpy = pytest.mark.skipif(not ANN_AVAILABLE, reason="numpy not installed")
+
+
+@needs_numpy
+class TestIVFIndex:
+    """Tests for the approximate nearest-neighbour index."""
+
+    @pytest.fixture
+    def corpus(self):
+        import numpy as np
+        rng = np.random.default_rng(1)
+        centres = rng.standard_normal((20, 16))
+        labels = rng.integers(0, 20, size=2000)
+        return (centres[labels] + 0.3 * rng.standard_normal((2000, 16))).astype(np.float32)
+
+    def test_recall_against_exact(self, corpus):
+        """Test that IVF search finds nearly all exact top-10 neighbours."""
+        import numpy as np
+        index = IVFIndex.build(list(range(len(corpus))), corpus)
+        normalized = corpus / np.linalg.norm(corpus, axis=1, keepdims=True)
+
+        hits = 0
+        for query in corpus[:50]:
+            exact = set(np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:10])
+            hits += len(exact & {i for i, _ in index.search(query, 10)})
+        assert hits / 500 >= 0.9
+
+    def test_incremental_add_and_remove(self, corpus):
+        """Test that inserted vectors are found and removed ones are not."""
+        index = IVFIndex.build(list(range(100)), corpus[:100])
+        index.add(5000, corpus[500])
+        assert index.search(corpus[500], 1)[0][0] == 5000
+
+        index.remove(5000)
+        assert 5000 not in [i for i, _ in index.search(corpus[500], 10)]
+        index.remove(3)
+        assert 3 not in [i for i, _ in index.search(corpus[3], 10)]
+        assert len(index) == 99
+
+    def test_growth_triggers_retrain(self, corpus):
+        """Test that centroids are retrained once the corpus outgrows them."""
+        index = IVFIndex.build(list(range(20)), corpus[:20])
+        for i in range(20, 200):
+            index.add(i, corpus[i])
+        assert index.trained_size > 20
+        assert index.search(corpus[150], 1)[0][0] == 150
+
+    def test_save_and_load(self, corpus, tmp_path):
+        """Test that a saved index loads with the same results."""
+        index = IVFIndex.build(list(range(500)), corpus[:500])
+        index.remove(7)
+        index.generation = 42
+        index.save(tmp_path / "index.npz")
+
+        loaded = IVFIndex.load(tmp_path / "index.npz")
+        assert loaded.generation == 42
+        assert len(loaded) == 499
+        assert loaded.search(corpus[10], 5) == index.search(corpus[10], 5)
+
+    def test_load_missing_or_corrupt(self, tmp_path):
+        """Test that unusable index files are ignored."""
+        assert IVFIndex.load(tmp_path / "missing.npz") is None
+        (tmp_path / "bad.npz").write_bytes(b"not an index")
+        assert IVFIndex.load(tmp_path / "bad.npz") is None
+
+
+@needs_numpy
+class TestStoreANN:
+    """Tests for SessionNotesStore's use of the ANN index."""
+
+    @pytest.fixture
+    def ann_store(self, store, monkeypatch):
+        monkeypatch.setattr(SessionNotesStore, "ANN_MIN_NOTES", 3)
+        return store
+
+    def test_small_corpus_skips_ann(self, store):
+        """Test that no index is built below the threshold."""
+        _add_sample_notes(store)
+        store.search_semantic("dragon")
+        assert store._ann is None
+        assert not store.ann_path.exists()
+
+    def test_search_uses_ann(self, ann_store):
+        """Test that search builds, persists, and uses the index."""
+        _add_sample_notes(ann_store)
+        results = ann_store.search_semantic("dragon attacked", limit=2)
+        assert results[0].note.title == "Dragon fight"
+        assert ann_store._ann is not None
+        assert ann_store.ann_path.exists()
+
+    def test_index_tracks_changes(self, ann_store):
+        """Test that add/update/delete update the loaded index."""
+        _add_sample_notes(ann_store)
+        ann_store.search_semantic("dragon")
+
+        goblin = ann_store.add(SessionNote(title="Goblins", content="goblin ambush"))
+        assert ann_store.search_semantic("goblin ambush", limit=1)[0].note.id == goblin.id
+
+        goblin.content = "kobold ambush"
+        ann_store.update(goblin)
+        assert ann_store.search_semantic("kobold", limit=1)[0].note.id == goblin.id
+
+        ann_store.delete(goblin.id)
+        assert goblin.id not in [r.note.id for r in ann_store.search_semantic("kobold")]
+        assert ann_store._ann.generation == ann_store._get_generation()
+
+    def test_stale_index_file_rebuilt(self, ann_store, tmp_path):
+        """Test that an index saved before other writes is not trusted."""
+        _add_sample_notes(ann_store)
+        ann_store.search_semantic("dragon")
+        ann_store.close()
+
+        # Another process adds a note without touching the index file
+        with SessionNotesStore(db_path=tmp_path / "notes.db", use_ann=False) as other:
+            other.embedding_engine = FakeEmbeddingEngine()
+            goblin = other.add(SessionNote(title="Goblins", content="goblin ambush"))
+
+        with SessionNotesStore(db_path=tmp_path / "notes.db") as reopened:
+            reopened.embedding_engine = FakeEmbeddingEngine()
+            assert reopened.search_semantic("goblin ambush", limit=1)[0].note.id == goblin.id
+            assert reopened._ann.generation == reopened._get_generation()
+
+
+class TestSchemaMigration:
+    """Tests for upgrading databases from older versions."""
+
+    def test_json_embeddings_migrated(self, tmp_path):
+        """Test that JSON embeddings are converted to binary on open."""
+        db_path = tmp_path / "notes.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE session_notes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_date TEXT NOT NULL,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                campaign TEXT,
+                character_id TEXT,
+                tags TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                embedding TEXT
+            )
+        """)
+        conn.execute(
+            "INSERT INTO session_notes (session_date, title, content, tags, created_at, "
+            "updated_at, embedding) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ("2024-01-01", "Old", "old note", "[]", "2024-01-01T00:00:00",
+             "2024-01-01T00:00:00", json.dumps([3.0, 4.0])),
+        )
+        conn.commit()
+        conn.close()
+
+        with SessionNotesStore(db_path=db_path) as store:
+            row = store._get_conn().execute(
+                "SELECT embedding, embedding_norm FROM session_notes"
+            ).fetchone()
+            assert row["embedding"] is None
+            assert row["embedding_norm"] == pytest.approx(5.0)
+            assert store.get(1).embedding == [3.0, 4.0]
+            assert store.get_stats()["notes_with_embeddings"] == 1
+            version = store._get_conn().execute("PRAGMA user_version").fetchone()[0]
+            assert version == notes_module.NOTES_SCHEMA_VERSION
@@ -0,0 +1,100 @@
+"""Tests for composable catalog queries and paginated AI searches."""
+
+from dnd_manager.ai.semantic import SemanticLayer
+from dnd_manager.data.catalog import CatalogIndex, get_catalog
+from dnd_manager.data.query import Query
+
+
+class TestQuery:
+    """Tests for the query planner."""
+
+    def test_indexed_and_residual_filters(self):
+        """Test index lookups and predicates combine like a scan would."""
+        catalog = get_catalog()
+        results = (
+            Query(catalog.spells)
+            .where("class", "wizard")
+            .where("level", 1)
+            .filter(lambda s: s.ritual)
+            .all()
+        )
+        expected = [
+            s for s in catalog.spells.records
+            if "Wizard" in s.classes and s.level == 1 and s.ritual
+        ]
+        assert results == expected
+
+    def test_none_filters_are_ignored(self):
+        """Test optional arguments can be passed straight through."""
+        monsters = get_catalog().monsters
+        assert Query(monsters).where("type", None).between("cr", None, None).all() == list(monsters)
+
+    def test_range_keeps_canonical_order_unless_ordered(self):
+        """Test range results are reordered only when asked."""
+        monsters = get_catalog().monsters
+        canonical = Query(monsters).between("cr", 1, 3).all()
+        assert canonical == sorted(canonical, key=monsters.position)
+        by_cr = Query(monsters).between("cr", 1, 3).order_by("cr").all()
+        assert by_cr == list(monsters.between("cr", 1, 3))
+        assert by_cr == sorted(canonical, key=lambda m: m.cr_numeric)
+
+    def test_ranked_order_is_kept(self):
+        """Test seeding with search results keeps relevance order."""
+        catalog = get_catalog()
+        ranked = catalog.search("monsters", "dragon")
+        results = Query(catalog.monsters, ranked).between("cr", 10, None).all()
+        assert results == [m for m in ranked if m.cr_numeric >= 10]
+
+    def test_page_converts_only_the_page(self):
+        """Test offset/limit slicing happens before conversion."""
+        index = CatalogIndex([{"name": str(i), "n": i} for i in range(10)],
+                             name=lambda r: r["name"], ranges={"n": lambda r: r["n"]})
+        converted = []
+
+        def convert(record):
+            converted.append(record["n"])
+            return record["n"]
+
+        page = Query(index).between("n", 2, None).page(offset=3, limit=4, convert=convert)
+        assert page.items == [5, 6, 7, 8]
+        assert converted == [5, 6, 7, 8]
+        assert (page.total, page.offset, page.has_more) == (8, 3, True)
+        last = Query(index).page(offset=8, limit=4)
+        assert [r["n"] for r in last.items] == [8, 9] and not last.has_more
+
+
+class TestPagination:
+    """Tests for offset/limit in the SemanticLayer searches."""
+
+    def test_pages_cover_all_results(self):
+        """Test consecutive pages partition the full result list."""
+        layer = SemanticLayer()
+        everything = layer.search_spells(level=2, limit=1000)
+        names = []
+        offset = 0
+        while True:
+            page = layer.search_spells(level=2, limit=25, offset=offset)
+            assert page.total_count == everything.total_count
+            names.extend(s["name"] for s in page.data)
+            if not page.has_more:
+                break
+            offset += 25
+        assert names == [s["name"] for s in everything.data]
+        assert "showing 26-50" in layer.search_spells(level=2, limit=25, offset=25).summary
+
+    def test_filters(self):
+        """Test indexed filters in each search."""
+        layer = SemanticLayer()
+        assert all(m["type"] == "Undead" for m in layer.search_monsters(monster_type="undead").data)
+        assert all(i["rarity"] == "very_rare"
+                   for i in layer.search_magic_items(rarity="Very Rare").data)
+        feats = layer.search_feats(category="origin", limit=100)
+        assert feats.total_count and all(f["category"] == "origin" for f in feats.data)
+
+    def test_encounter_sorted_by_cr(self):
+        """Test encounter suggestions come lowest CR first."""
+        result = SemanticLayer().get_monsters_for_encounter(party_level=5)
+        crs = [m["cr_numeric"] for m in result.data]
+        assert crs == sorted(crs) and not result.has_more
+        page = SemanticLayer().get_monsters_for_encounter(party_level=5, limit=5, offset=5)
+        assert page.data == result.data[5:10]
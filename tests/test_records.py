@@ -0,0 +1,62 @@
+"""Tests for the frozen, slotted game data records."""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from dnd_manager.data.monsters import ALL_MONSTERS
+from dnd_manager.data.spells import ALL_SPELLS, Spell
+from dnd_manager.data.subclasses import ALL_SUBCLASSES
+
+
+def _spell(**overrides) -> Spell:
+    values = dict(
+        name="Test Bolt",
+        level=1,
+        school="Evo" + "cation",
+        casting_time="1 action",
+        range="60 feet",
+        components="V, S",
+        duration="Instantaneous",
+        description="A test spell.",
+        classes=["Wizard", "Sorcerer"],
+    )
+    values.update(overrides)
+    return Spell(**values)
+
+
+class TestFrozenRecords:
+    """Tests for construction-time freezing."""
+
+    def test_records_are_immutable(self):
+        """Test fields cannot be reassigned and there is no instance dict."""
+        spell = ALL_SPELLS[0]
+        with pytest.raises(FrozenInstanceError):
+            spell.name = "Renamed"
+        assert not hasattr(spell, "__dict__")
+
+    def test_lists_become_tuples(self):
+        """Test list arguments are stored as tuples."""
+        spell = _spell()
+        assert spell.classes == ("Wizard", "Sorcerer")
+        assert all(isinstance(m.traits, tuple) for m in ALL_MONSTERS)
+
+    def test_nested_lists_become_tuples(self):
+        """Test subclass spell lists are frozen at every level."""
+        subclass = next(s for s in ALL_SUBCLASSES if s.subclass_spells)
+        level, spells = subclass.subclass_spells[0]
+        assert isinstance(subclass.subclass_spells, tuple)
+        assert isinstance(level, int)
+        assert isinstance(spells, tuple)
+
+    def test_repeated_strings_are_interned(self):
+        """Test interned fields share one string object with the built-in data."""
+        spell = _spell()
+        builtin = next(s for s in ALL_SPELLS if s.school == "Evocation")
+        assert spell.school is builtin.school
+        wizard = next(s for s in ALL_SPELLS if "Wizard" in s.classes)
+        assert spell.classes[0] is wizard.classes[wizard.classes.index("Wizard")]
+
+    def test_equality_ignores_container_type(self):
+        """Test records built from lists and tuples compare equal."""
+        assert _spell(classes=["Wizard"]) == _spell(classes=("Wizard",))
@@ -0,0 +1,118 @@
+"""Tests for ranked full-text search over game data."""
+
+import pytest
+
+from dnd_manager.data.catalog import get_catalog
+from dnd_manager.data.search import TextIndex, tokenize
+
+
+class TestTextIndex:
+    """Tests for the generic inverted index."""
+
+    @pytest.fixture
+    def index(self):
+        records = [
+            {"name": "Fire Bolt", "description": "You hurl a mote of fire."},
+            {"name": "Shield", "description": "An invisible barrier of magical force."},
+            {"name": "Fireball", "description": "A bright streak flashes to a point."},
+            {"name": "Burning Hands", "description": "A thin sheet of flames. Fire damage."},
+        ]
+        return TextIndex(
+            records,
+            [(lambda r: r["name"], 3.0), (lambda r: r["description"], 1.0)],
+        )
+
+    def test_tokenize(self):
+        """Test tokens are case-folded words without punctuation or underscores."""
+        assert tokenize("Mordenkainen's Sword, very_rare +1") == [
+            "mordenkainen", "s", "sword", "very", "rare", "1",
+        ]
+
+    def test_prefix_matching(self, index):
+        """Test a query word matches terms it starts."""
+        names = [r["name"] for r in index.search("fire")]
+        assert set(names) == {"Fire Bolt", "Fireball", "Burning Hands"}
+        assert [r["name"] for r in index.search("shi")] == ["Shield"]
+
+    def test_ranking(self, index):
+        """Test name matches outrank description matches, exact before prefix."""
+        names = [r["name"] for r in index.search("fire")]
+        assert names == ["Fire Bolt", "Fireball", "Burning Hands"]
+
+    def test_all_words_must_match(self, index):
+        """Test multi-word queries are conjunctive."""
+        assert [r["name"] for r in index.search("fire dam")] == ["Burning Hands"]
+        assert index.search("fire shield") == []
+
+    def test_empty_and_missing(self, index):
+        """Test queries without words or matches return nothing."""
+        assert index.search("") == []
+        assert index.search("!!") == []
+        assert index.search("zzz") == []
+
+    def test_limit(self, index):
+        """Test the result limit."""
+        assert len(index.search("fire", limit=2)) == 2
+
+
+class TestCatalogSearch:
+    """Tests for the search helpers backed by the catalog."""
+
+    def test_index_is_built_once(self):
+        """Test each collection's text index is shared."""
+        catalog = get_catalog()
+        assert catalog.text_index("spells") is catalog.text_index("spells")
+
+    def test_search_spells(self):
+        """Test spell search finds name and description matches."""
+        from dnd_manager.data.spells import search_spells
+
+        results = search_spells("flames")
+        assert results[0].name == "Control Flames"
+        assert any("flame" not in s.name.lower() for s in results)
+        assert search_spells("FLAMES") == results
+
+    def test_name_substring_matches(self):
+        """Test a query inside a name finds it, as the old substring search did."""
+        from dnd_manager.data.spells import search_spells
+
+        assert "Fireball" in [s.name for s in search_spells("ball")]
+        assert search_spells("fireball")[0].name == "Fireball"
+
+    def test_name_matches_come_first(self):
+        """Test name matches are ranked ahead of description-only matches."""
+        from dnd_manager.ai.semantic import SemanticLayer
+        from dnd_manager.data.spells import search_spells
+
+        names = [s.name.lower() for s in search_spells("fire")]
+        named = sum("fire" in name for name in names)
+        assert named > 1
+        assert all("fire" in name for name in names[:named])
+        assert names[0].startswith("fire")
+
+        layer = SemanticLayer()
+        data = layer.search_spells(query="fire", limit=named).data
+        assert all("fire" in s["name"].lower() for s in data)
+
+    def test_module_helpers(self):
+        """Test the other collections are searchable through their modules."""
+        from dnd_manager.data.feats import search_talents
+        from dnd_manager.data.magic_items import search_magic_items
+        from dnd_manager.data.monsters import search_monsters
+        from dnd_manager.data.species import search_species
+        from dnd_manager.data.subclasses import search_subclasses
+
+        assert search_monsters("gob")[0].name == "Goblin"
+        assert all(m.monster_type.value == "Undead" for m in search_monsters("undead")[:3])
+        assert search_magic_items("potion")
+        assert search_species("elf")
+        assert search_subclasses("berserker")[0].name.startswith("Path of the Berserker")
+        assert all(f.category.startswith("tov_") for f in search_talents("spell"))
+
+    def test_semantic_search_uses_descriptions(self):
+        """Test the AI spell search matches description text."""
+        from dnd_manager.ai.semantic import SemanticLayer
+
+        result = SemanticLayer().search_spells(query="frightened", limit=50)
+        assert result.total_count > 0
+        assert any("frightened" not in s["name"].lower() for s in result.data)
@@ -0,0 +1,110 @@
+"""Tests for the precompiled SRD snapshot."""
+
+import pytest
+
+from dnd_manager.data import snapshot as snapshot_module
+from dnd_manager.data.snapshot import (
+    SNAPSHOT_PATH,
+    SRDSnapshot,
+    build_collections,
+    spell_for_ruleset,
+    write_snapshot,
+)
+from dnd_manager.data.spells import ALL_SPELLS
+
+
+@pytest.fixture(scope="module")
+def source_collections():
+    return build_collections()
+
+
+class TestShippedSnapshot:
+    """The committed snapshot must match the data modules it was built from."""
+
+    def test_snapshot_is_current(self):
+        """Test the fingerprint matches the current sources.
+
+        If this fails, regenerate with: python -m dnd_manager.data.snapshot
+        """
+        assert SNAPSHOT_PATH.exists()
+        assert SRDSnapshot.open(SNAPSHOT_PATH) is not None
+
+    @pytest.mark.parametrize("filename", ["spells.py", "records.py", "snapshot.py"])
+    def test_fingerprint_covers(self, filename, monkeypatch):
+        """Test editing a data module, the record base or the builder makes the snapshot stale."""
+        from pathlib import Path
+
+        before = snapshot_module.source_fingerprint()
+        read_bytes = Path.read_bytes
+        monkeypatch.setattr(Path, "read_bytes",
+                            lambda self: read_bytes(self) + (b"#" if self.name == filename else b""))
+        assert snapshot_module.source_fingerprint() != before
+
+    def test_snapshot_matches_source(self, source_collections):
+        """Test every collection round-trips to the records built from source."""
+        shipped = SRDSnapshot.open(SNAPSHOT_PATH, verify=False)
+        assert shipped is not None
+        assert shipped.collections == list(source_collections)
+        for name, records in source_collections.items():
+            assert shipped[name] == records, f"{name} differs from source"
+
+    def test_spell_variants_resolved(self):
+        """Test spells carry their Spell.for_ruleset versions."""
+        shipped = SRDSnapshot.open(SNAPSHOT_PATH)
+        by_name = {record["name"]: record for record in shipped["spells"]}
+
+        spell = next(s for s in ALL_SPELLS if s.variants)
+        record = by_name[spell.name]
+        for ruleset in spell.variants:
+            resolved = spell.for_ruleset(ruleset)
+            assert spell_for_ruleset(record, ruleset)["description"] == resolved.description
+            assert spell_for_ruleset(record, ruleset)["variants"] == {}
+        assert spell_for_ruleset(record, "tov") is record
+
+
+class TestSnapshotFile:
+    """Tests for writing and opening snapshot files."""
+
+    def test_write_and_open(self, tmp_path, source_collections):
+        """Test a freshly written snapshot loads lazily."""
+        path = tmp_path / "srd.bin"
+        assert write_snapshot(path) == path.stat().st_size
+
+        loaded = SRDSnapshot.open(path)
+        assert loaded.source == "snapshot"
+        assert loaded._cache == {}
+        assert loaded["monsters"] == source_collections["monsters"]
+        assert list(loaded._cache) == ["monsters"]
+        assert loaded["monsters"] is loaded["monsters"]
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing file yields None."""
+        assert SRDSnapshot.open(tmp_path / "missing.bin") is None
+
+    def test_corrupt_file(self, tmp_path):
+        """Test garbage is rejected instead of raising."""
+        path = tmp_path / "srd.bin"
+        path.write_bytes(b"not a snapshot at all, just some bytes" * 4)
+        assert SRDSnapshot.open(path) is None
+
+    def test_stale_file(self, tmp_path, monkeypatch):
+        """Test a snapshot built from other sources is ignored."""
+        path = tmp_path / "srd.bin"
+        write_snapshot(path)
+        monkeypatch.setattr(snapshot_module, "source_fingerprint", lambda: b"\x00" * 32)
+        assert SRDSnapshot.open(path) is None
+        assert SRDSnapshot.open(path, verify=False) is not None
+
+    def test_from_modules_fallback(self, source_collections):
+        """Test the module-backed fallback serves the same records."""
+        fallback = SRDSnapshot.from_modules()
+        assert fallback.source == "modules"
+        assert fallback["feats"] == source_collections["feats"]
+
+    def test_data_summary_uses_snapshot(self):
+        """Test the AI data summary builds from snapshot records."""
+        from dnd_manager.ai.semantic import SemanticLayer
+
+        summary = SemanticLayer().get_data_summary()
+        assert f"Spells: {len(ALL_SPELLS)} total" in summary
+        assert "Wizard" in summary
@@ -0,0 +1,141 @@
+"""Tests for the SQLite FTS5 mirror of the SRD."""
+
+import pytest
+
+from dnd_manager.data import srd_fts
+from dnd_manager.data.catalog import get_catalog
+from dnd_manager.data.snapshot import SRDSnapshot, get_snapshot
+from dnd_manager.data.srd_fts import SRDFullTextIndex, build_match_query, dataset_version
+
+pytestmark = pytest.mark.skipif(not srd_fts.fts5_available(), reason="SQLite built without FTS5")
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory):
+    fts = SRDFullTextIndex.open(tmp_path_factory.mktemp("fts"))
+    assert fts is not None
+    yield fts
+    fts.close()
+
+
+class TestMatchQuery:
+    """Tests for translating user input to FTS5 syntax."""
+
+    def test_words_become_prefixes(self):
+        """Test bare words are quoted prefix terms joined with AND."""
+        assert build_match_query("Fire dam") == '"fire"* AND "dam"*'
+
+    def test_phrases(self):
+        """Test quoted text becomes a phrase."""
+        assert build_match_query('"Bonus Action" heal') == '"bonus action" AND "heal"*'
+
+    def test_operators_are_not_syntax(self):
+        """Test FTS5 operators and punctuation are treated as words."""
+        assert build_match_query('name:fire OR NEAR(x') == '"name"* AND "fire"* AND "or"* AND "near"* AND "x"*'
+        assert build_match_query('"') is None
+        assert build_match_query("  !! ") is None
+
+
+class TestDatabase:
+    """Tests for building and versioning the database."""
+
+    def test_keyed_by_dataset_version(self, index):
+        """Test the file name carries the snapshot's version."""
+        assert dataset_version(get_snapshot()) in index.db_path.name
+
+    def test_reused_and_replaced(self, tmp_path):
+        """Test a current database is reused and other versions are removed."""
+        stale = tmp_path / "srd_fts-0-deadbeef.db"
+        stale.write_bytes(b"")
+        first = SRDFullTextIndex.open(tmp_path)
+        built_at = first.db_path.stat().st_mtime_ns
+        first.close()
+        assert not stale.exists()
+
+        second = SRDFullTextIndex.open(tmp_path)
+        assert second.db_path.stat().st_mtime_ns == built_at
+        second.close()
+
+    def test_read_only(self, index):
+        """Test the connection cannot modify the database."""
+        import sqlite3
+
+        with pytest.raises(sqlite3.OperationalError):
+            index._conn.execute("DELETE FROM srd_fts")
+
+    def test_cache_dir_override(self, tmp_path, monkeypatch):
+        """Test the default directory can be set from the environment."""
+        monkeypatch.setenv(srd_fts.CACHE_DIR_ENV, str(tmp_path / "cache"))
+        fts = SRDFullTextIndex.open()
+        assert fts.db_path.parent == tmp_path / "cache"
+        fts.close()
+
+    def test_no_version_disables(self, tmp_path):
+        """Test a dataset without a fingerprint is not mirrored."""
+        snapshot = SRDSnapshot({}, source="modules", fingerprint=None)
+        assert SRDFullTextIndex.open(tmp_path, snapshot=snapshot) is None
+
+
+class TestSearch:
+    """Tests for ranked FTS5 queries."""
+
+    def test_positions_map_to_records(self, index):
+        """Test every hit points at the catalog record of the same name."""
+        for match in index.search("fire", limit=None):
+            record = getattr(get_catalog(), match.collection).records[match.position]
+            assert record.name == match.name
+
+    def test_prefix_and_ranking(self, index):
+        """Test prefixes match and name hits rank first."""
+        results = index.search("cure wou")
+        assert [m.name for m in results[:2]] == ["Cure Wounds", "Mass Cure Wounds"]
+        assert index.search("gob")[0].name == "Goblin"
+
+    def test_phrase(self, index):
+        """Test a phrase only matches adjacent words."""
+        phrase = index.search('"bonus action" heal', limit=None)
+        words = index.search("bonus action heal", limit=None)
+        assert phrase
+        assert len(phrase) <= len(words)
+
+    def test_collections_and_snippet(self, index):
+        """Test filtering by collection and highlighted snippets."""
+        results = index.search("undead", collections=["monsters"], limit=5)
+        assert results
+        assert all(m.collection == "monsters" for m in results)
+        assert all(m.score > 0 for m in results)
+        spell = index.search("frightened", collections=["spells"], limit=1)[0]
+        assert "[frightened]" in spell.snippet.lower()
+
+
+class TestSemanticLayer:
+    """Tests for the SemanticLayer entry points."""
+
+    def test_full_text_search(self):
+        """Test the cross-collection AI query."""
+        from dnd_manager.ai.semantic import SemanticLayer
+
+        result = SemanticLayer().full_text_search("fire", limit=5)
+        assert result.query_type == "srd_search"
+        assert len(result.data) == 5
+        assert result.has_more
+        assert {"type", "name", "snippet", "score"} <= set(result.data[0])
+        kinds = {d["type"] for d in SemanticLayer().full_text_search("fire", limit=50).data}
+        assert {"spells", "magic_items"} <= kinds
+
+    def test_search_records_falls_back(self, monkeypatch):
+        """Test the in-memory index is used without FTS5."""
+        from dnd_manager.ai import semantic
+
+        layer = semantic.SemanticLayer()
+        with_fts = layer.search_records("spells", "cure wou", limit=2)
+        monkeypatch.setattr(semantic, "get_srd_fts", lambda: None)
+        assert layer.search_records("spells", "cure wou", limit=2) == with_fts
+        assert layer.full_text_search("goblin", ["monsters"]).data[0]["name"] == "Goblin"
+
+    def test_search_srd_tool(self):
+        """Test the AI tool handler."""
+        from dnd_manager.ai.tools.handlers.ruleset_handlers import handle_search_srd
+
+        result = handle_search_srd(None, query="berserker", collections=["subclasses"])
+        assert result["results"][0]["name"].startswith("Path of the Berserker")
@@ -6,6 +6,13 @@ from pathlib import Path
 from dnd_manager.storage.yaml_store import YAMLStore
 
 
+@pytest.fixture
+def store(tmp_path):
+    """Character store in a temporary directory."""
+    from dnd_manager.storage.yaml_store import CharacterStore
+    return CharacterStore(tmp_path / "characters")
+
+
 class TestFilenameSanitization:
     """Tests for filename sanitization security."""
 
@@ -128,3 +135,399 @@ class TestFilenameSanitization:
         assert YAMLStore._sanitize_filename(".hidden") == "hidden"
         assert YAMLStore._sanitize_filename("..") == "unnamed"
         assert YAMLStore._sanitize_filename("...") == "unnamed"
+
+
+class TestCharacterSummaryIndex:
+    """Tests for the persistent character summary index."""
+
+    def test_save_populates_index(self, store):
+        """Test that saving a character writes its summary to the index."""
+        store.save(store.create_new(name="Thorin", class_name="Fighter"))
+
+        entries = store._index.get_all()
+        assert "thorin.yaml" in entries
+        _, _, summary = entries["thorin.yaml"]
+        assert summary["name"] == "Thorin"
+        assert summary["class"] == "Fighter"
+
+    def test_unchanged_files_are_not_reparsed(self, store, monkeypatch):
+        """Test that listing uses cached summaries for unchanged files."""
+        store.save(store.create_new(name="Thorin"))
+        store.save(store.create_new(name="Gimli"))
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("unchanged file was reparsed")
+
+        monkeypatch.setattr(store, "load_path", fail_load)
+        info = store.get_character_info()
+        assert sorted(c["name"] for c in info) == ["Gimli", "Thorin"]
+
+    def test_changed_file_is_reparsed(self, store):
+        """Test that a file edited outside the store is revalidated."""
+        from dnd_manager.storage.yaml_store import YAMLStore
+        from dnd_manager.models.character import Character
+
+        char = store.create_new(name="Thorin")
+        store.save(char)
+
+        # Write a new level directly, bypassing the index
+        char.primary_class.level = 7
+        YAMLStore(store.directory, Character).save("Thorin", char, create_backup=False)
+
+        info = store.get_character_info()
+        assert info[0]["level"] == 7
+
+    def test_delete_and_missing_files_drop_rows(self, store):
+        """Test that deleted characters are removed from the index."""
+        store.save(store.create_new(name="Thorin"))
+        store.save(store.create_new(name="Gimli"))
+
+        store.delete("Thorin")
+        assert "thorin.yaml" not in store._index.get_all()
+
+        (store.directory / "gimli.yaml").unlink()
+        assert store.get_character_info() == []
+        assert store._index.get_all() == {}
+
+
+class TestYAMLSerialization:
+    """Tests for the shared YAML serialization helpers."""
+
+    def test_round_trip(self):
+        """Test that dumped data loads back unchanged."""
+        from dnd_manager.storage.serialization import dump_yaml, load_yaml
+
+        data = {"name": "Thorïn", "level": 5, "tags": ["dwarf", "fighter"], "hp": None}
+        assert load_yaml(dump_yaml(data, allow_unicode=True, sort_keys=False)) == data
+
+    def test_fallback_matches_fast_path(self):
+        """Test that the pure-Python codec reads what the default codec writes."""
+        import yaml
+        from dnd_manager.storage.serialization import dump_yaml, load_yaml
+
+        data = {"spells": {"1": ["Shield", "Magic Missile"]}, "notes": "multi\nline"}
+        text = dump_yaml(data, sort_keys=False)
+        assert load_yaml(text, loader=yaml.SafeLoader) == load_yaml(text)
+        assert dump_yaml(data, dumper=yaml.SafeDumper, sort_keys=False) == text
+
+    def test_unsafe_tags_rejected(self):
+        """Test that python-specific tags are not constructed."""
+        from dnd_manager.storage.serialization import YAMLError, load_yaml
+
+        with pytest.raises(YAMLError):
+            load_yaml("!!python/object/apply:os.system ['echo hi']")
+
+
+class TestSavePipeline:
+    """Tests for the single-serialization save path."""
+
+    def test_save_does_not_reparse(self, store, monkeypatch):
+        """Test that repeated saves never parse YAML."""
+        from dnd_manager.storage import yaml_store
+
+        char = store.create_new(name="Thorin")
+        store.save(char, create_backup=False)
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("save parsed YAML")
+
+        monkeypatch.setattr(yaml_store, "load_yaml", fail_load)
+        char.combat.hit_points.current = 1
+        store.save(char, create_backup=False)
+        assert not (store.directory / "thorin.yaml.tmp").exists()
+
+        monkeypatch.undo()
+        assert store.load("Thorin").name == "Thorin"
+
+    @pytest.mark.parametrize("corrupt", [False, True])
+    def test_load_then_save_does_not_reparse(self, store, monkeypatch, corrupt):
+        """Test that saving a character loaded by a fresh store skips the collision read."""
+        from dnd_manager.storage import yaml_store
+        from dnd_manager.storage.yaml_store import CharacterStore
+
+        char = store.create_new(name="Thorin")
+        store.save(char)
+        char.combat.hit_points.current = 2
+        store.save(char)
+        if corrupt:
+            (store.directory / "thorin.yaml").write_text("name: [unclosed")
+
+        # A new store (next session) has an empty name map
+        store = CharacterStore(store.directory)
+        char = store.load("Thorin")
+        assert char is not None
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("save parsed the existing file")
+
+        monkeypatch.setattr(yaml_store, "load_yaml", fail_load)
+        char.combat.hit_points.current = 1
+        store.save(char, create_backup=False)
+
+    def test_collision_detected_from_name_map(self, store):
+        """Test that a different name sanitizing to the same file is rejected."""
+        from dnd_manager.storage.yaml_store import FilenameCollisionError
+
+        store.save(store.create_new(name="Thorin"))
+
+        with pytest.raises(FilenameCollisionError):
+            store.save(store.create_new(name="Thorin!"))
+
+    def test_collision_detected_after_external_edit(self, store):
+        """Test that a stale name map entry falls back to reading the file."""
+        from dnd_manager.storage.yaml_store import FilenameCollisionError
+
+        store.save(store.create_new(name="Thorin"))
+
+        # Another process rewrites the file with a different logical name
+        path = store.directory / "thorin.yaml"
+        path.write_text(path.read_text().replace("name: Thorin", "name: Thorin?", 1))
+
+        with pytest.raises(FilenameCollisionError):
+            store.save(store.create_new(name="Thorin"))
+
+
+class TestBackupStore:
+    """Tests for the content-addressed backup store."""
+
+    def test_identical_snapshots_are_deduplicated(self, tmp_path):
+        """Test that snapshotting unchanged content writes nothing new."""
+        from dnd_manager.storage.backups import BackupStore
+
+        store = BackupStore(tmp_path / ".backups")
+        first = store.snapshot("thorin", b"name: Thorin\n", max_backups=3)
+        second = store.snapshot("thorin", b"name: Thorin\n", max_backups=3)
+
+        assert first == second
+        assert len(store.list_entries("thorin")) == 1
+        assert len(list((tmp_path / ".backups" / "thorin").glob("*.zz"))) == 1
+
+    def test_pruning_keeps_newest(self, tmp_path):
+        """Test that old snapshots and their blobs are pruned."""
+        from dnd_manager.storage.backups import BackupStore
+
+        store = BackupStore(tmp_path / ".backups")
+        for level in range(5):
+            store.snapshot("thorin", f"level: {level}\n".encode(), max_backups=2)
+
+        entries = store.list_entries("thorin")
+        assert [store.read(e) for e in entries] == [b"level: 4\n", b"level: 3\n"]
+        assert store.latest("thorin") == entries[0]
+        assert len(list((tmp_path / ".backups" / "thorin").glob("*.zz"))) == 2
+
+    def test_legacy_backups_imported(self, tmp_path):
+        """Test that old timestamped backup copies are migrated."""
+        import os
+        from dnd_manager.storage.backups import BackupStore
+
+        backup_dir = tmp_path / ".backups"
+        backup_dir.mkdir()
+        old = backup_dir / "thorin_20240101_120000.yaml"
+        new = backup_dir / "thorin_20240102_120000.yaml"
+        old.write_bytes(b"level: 1\n")
+        new.write_bytes(b"level: 2\n")
+        os.utime(old, (1_700_000_000, 1_700_000_000))
+        os.utime(new, (1_700_100_000, 1_700_100_000))
+
+        store = BackupStore(backup_dir)
+        assert store.read(store.latest("thorin")) == b"level: 2\n"
+        assert len(store.list_entries("thorin")) == 2
+        assert not old.exists() and not new.exists()
+
+    def test_legacy_scan_runs_once(self, tmp_path, monkeypatch):
+        """Test that the backup root is not rescanned for a file without backups."""
+        from dnd_manager.storage.backups import BackupStore
+
+        backup_dir = tmp_path / ".backups"
+        backup_dir.mkdir()
+        scans = []
+        iterdir = Path.iterdir
+        monkeypatch.setattr(Path, "iterdir", lambda self: scans.append(self) or iterdir(self))
+
+        for _ in range(3):
+            assert BackupStore(backup_dir).latest("thorin") is None
+            assert BackupStore(backup_dir).list_entries("thorin") == []
+        assert scans == [backup_dir]
+
+    def test_unchanged_saves_create_no_backup(self, store):
+        """Test that re-saving an unchanged character stores a single blob."""
+        from dnd_manager.storage.yaml_store import CharacterStore
+
+        char = store.create_new(name="Thorin")
+        store.save(char)
+        for _ in range(4):
+            store.save(char)
+        assert store.list_backups("Thorin") == []
+
+        char.primary_class.level = 2
+        store.save(char)
+        for _ in range(4):
+            store.save(char)
+        backups = store.list_backups("Thorin")
+        assert len(backups) == 1
+        assert len(list(backups[0].path.parent.glob("*.zz"))) == 1
+
+        # A fresh store (next session) skips unchanged saves of loaded characters
+        reloaded_store = CharacterStore(store.directory)
+        reloaded = reloaded_store.load("Thorin")
+        reloaded_store.save(reloaded)
+        assert len(store.list_backups("Thorin")) == 1
+        assert store.load("Thorin").primary_class.level == 2
+
+    def test_character_backup_and_restore(self, tmp_path):
+        """Test list_backups/restore_from_backup through CharacterStore."""
+        from dnd_manager.storage.yaml_store import CharacterStore
+
+        store = CharacterStore(tmp_path / "characters")
+        char = store.create_new(name="Thorin")
+        store.save(char)
+        char.primary_class.level = 2
+        store.save(char)
+        char.primary_class.level = 3
+        store.save(char)
+
+        backups = store.list_backups("Thorin")
+        assert len(backups) == 2
+        assert store.restore_from_backup("Thorin", backups[-1])
+        assert store.load("Thorin").primary_class.level == 1
+
+    def test_corrupted_file_recovered_from_backup(self, tmp_path):
+        """Test that a corrupted character file is restored from the newest backup."""
+        from dnd_manager.storage.yaml_store import CharacterStore
+
+        store = CharacterStore(tmp_path / "characters")
+        char = store.create_new(name="Thorin")
+        store.save(char)
+        char.combat.hit_points.current = 2
+        store.save(char)
+
+        path = store.directory / "thorin.yaml"
+        path.write_text("name: [unclosed")
+
+        result = store.load_with_details("Thorin")
+        assert result.success and result.recovered_from_backup
+        assert store.load("Thorin", try_recovery=False).name == "Thorin"
+
+
+class TestAutosaveQueue:
+    """Tests for the write-behind autosave queue."""
+
+    def test_rapid_saves_are_coalesced(self, store, monkeypatch):
+        """Test that many saves within the interval produce one write off-thread."""
+        import threading
+        from dnd_manager.storage.autosave import AutosaveQueue
+
+        writes = []
+        original_save = store.save
+
+        def counting_save(character, **kwargs):
+            writes.append((character.combat.hit_points.current, threading.current_thread()))
+            return original_save(character, **kwargs)
+
+        monkeypatch.setattr(store, "save", counting_save)
+
+        queue = AutosaveQueue(store, interval=60)
+        char = store.create_new(name="Thorin")
+        for hp in range(10, 0, -1):
+            char.combat.hit_points.current = hp
+            queue.schedule(char)
+
+        assert writes == []
+        assert queue.flush(timeout=5)
+        queue.close()
+
+        assert len(writes) == 1
+        assert writes[0][0] == 1
+        assert writes[0][1] is not threading.current_thread()
+        assert store.load("Thorin").combat.hit_points.current == 1
+
+    def test_journal_recovers_unsaved_changes(self, store):
+        """Test that a crash before the debounced write is recovered from the journal."""
+        import time
+        from dnd_manager.storage.autosave import AutosaveQueue
+
+        char = store.create_new(name="Thorin")
+        store.save(char)
+
+        crashed = AutosaveQueue(store, interval=60)
+        char.combat.hit_points.current = 3
+        crashed.schedule(char)
+
+        journal = crashed.journal_dir / "thorin.json"
+        deadline = time.monotonic() + 5
+        while not journal.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert journal.exists()
+        assert store.load("Thorin").combat.hit_points.current != 3
+
+        # Simulate restart: a fresh queue replays the journal
+        assert AutosaveQueue(store).recover() == 1
+        assert store.load("Thorin").combat.hit_points.current == 3
+        assert not journal.exists()
+
+    def test_journal_writes_are_debounced(self, store, monkeypatch):
+        """Test that a burst of mutations does not journal each one."""
+        from dnd_manager.models.character import Character
+        from dnd_manager.storage.autosave import AutosaveQueue
+
+        queue = AutosaveQueue(store, interval=60)
+        journaled = []
+        write_journal = queue._write_journal
+        monkeypatch.setattr(queue, "_write_journal",
+                            lambda key, snapshot: journaled.append(snapshot) or write_journal(key, snapshot))
+
+        char = store.create_new(name="Thorin")
+        for hp in range(100, 0, -1):
+            char.combat.hit_points.current = hp
+            queue.schedule(char)
+        assert queue.flush(timeout=5)
+        queue.close()
+
+        # The first snapshot is journaled at once, the last before the save
+        assert 1 <= len(journaled) <= 2
+        assert Character.model_validate_json(journaled[-1]).combat.hit_points.current == 1
+        assert store.load("Thorin").combat.hit_points.current == 1
+
+    def test_discard_drops_pending_save(self, store):
+        """Test that a discarded character is not written back after delete."""
+        from dnd_manager.storage.autosave import AutosaveQueue
+
+        queue = AutosaveQueue(store, interval=60)
+        queue.schedule(store.create_new(name="Thorin"))
+        queue.discard("Thorin")
+        queue.close()
+
+        assert not store.exists("Thorin")
+
+    def test_discard_waits_for_journal_write(self, store, monkeypatch):
+        """Test that a journal write racing discard does not resurrect a deleted character."""
+        import threading
+        from dnd_manager.storage.autosave import AutosaveQueue
+
+        store.save(store.create_new(name="Thorin"))
+        queue = AutosaveQueue(store, interval=60)
+        started, release = threading.Event(), threading.Event()
+        write_journal = queue._write_journal
+
+        def slow_write_journal(key, snapshot):
+            started.set()
+            release.wait(5)
+            write_journal(key, snapshot)
+
+        monkeypatch.setattr(queue, "_write_journal", slow_write_journal)
+        queue.schedule(store.load("Thorin"))
+        assert started.wait(5)
+
+        discarding = threading.Thread(target=queue.discard, args=("Thorin",))
+        discarding.start()
+        discarding.join(0.1)
+        assert discarding.is_alive()
+
+        release.set()
+        discarding.join(5)
+        assert not discarding.is_alive()
+        store.delete("Thorin")
+        queue.close()
+
+        assert AutosaveQueue(store).recover() == 0
+        assert not store.exists("Thorin")